@@ -148,7 +148,10 @@ if __name__ == '__main__':
           ],
           classifiers=__trove__,
           entry_points={
-              'console_scripts': ['ramstk = ramstk.__main__:the_one_ring'],
+              'console_scripts': [
+                  'ramstk = ramstk.__main__:the_one_ring',
+                  'ramstk-calc = ramstk.Calculate:main'
+              ],
               'gui_scripts': ['ramstk = ramstk.__main__:the_one_ring']
           },
           package_data={},
@@ -0,0 +1,702 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#       ramstk.Calculate.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Headless batch calculation of RAMSTK Program databases."""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy.engine.url import make_url  # pylint: disable=E0401
+
+# Import other RAMSTK modules.
+# pylint: disable=E0401
+from ramstk.Configuration import Configuration
+import ramstk.Utilities as Utilities
+from ramstk.dao.DAO import DAO
+from ramstk.dao.programdb.RAMSTKFunction import RAMSTKFunction
+from ramstk.dao.programdb.RAMSTKHardware import RAMSTKHardware
+from ramstk.dao.programdb.RAMSTKMode import RAMSTKMode
+from ramstk.modules.allocation import dtcAllocation
+from ramstk.modules.fmea import dtcFMEA
+from ramstk.modules.hardware import dtcHardwareBoM
+from ramstk.modules.hazops import dtcHazardAnalysis
+from ramstk.modules.revision import dtcRevision
+from ramstk.modules.similar_item import dtcSimilarItem
+from ramstk.modules.validation import dtcValidation
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
+
+# The modules that can be calculated, in the order they are calculated.  The
+# hardware is saved before the allocation is loaded so the allocation is
+# apportioned from the new hazard rates.
+MODULES = ('hardware', 'allocation', 'similar_item', 'fmea', 'hazops',
+           'validation')
+
+# The steps timed for each module.
+STEPS = ('load', 'calculate', 'save')
+
+# The Revision attributes that are set from the system-level Hardware
+# attributes after the hardware is calculated.  Each is (Revision attribute,
+# Hardware attribute).
+REVISION_ATTRIBUTES = (
+    ('availability_logistics', 'availability_logistics'),
+    ('availability_mission', 'availability_mission'),
+    ('cost', 'total_cost'),
+    ('cost_per_failure', 'cost_failure'),
+    ('cost_per_hour', 'cost_hour'),
+    ('hazard_rate_active', 'hazard_rate_active'),
+    ('hazard_rate_dormant', 'hazard_rate_dormant'),
+    ('hazard_rate_logistics', 'hazard_rate_logistics'),
+    ('hazard_rate_mission', 'hazard_rate_mission'),
+    ('mtbf_logistics', 'mtbf_logistics'),
+    ('mtbf_mission', 'mtbf_mission'),
+    ('n_parts', 'total_part_count'),
+    ('reliability_logistics', 'reliability_logistics'),
+    ('reliability_mission', 'reliability_mission'),
+)
+
+
+class BatchCalculator(object):
+    """
+    Calculate a RAMSTK Program database without the RAMSTK GUI.
+
+    Each module is loaded, calculated, and saved with the same data
+    controllers the RAMSTK application uses.  The changed records of a module
+    are saved in one transaction when the module is done.
+
+    :ivar dict dic_timing: the seconds spent in each step of each module.  Key
+                           is the module name, value is a dict with a key for
+                           each of the STEPS.
+    :ivar dict dic_errors: whether an error was encountered calculating each
+                           module.  Key is the module name.
+    :ivar dao: the data access object connected to the RAMSTK Program
+               database.
+    :type dao: :class:`ramstk.dao.DAO.DAO`
+    """
+
+    def __init__(self, configuration, **kwargs):
+        """
+        Initialize an instance of the batch calculator.
+
+        :param configuration: the RAMSTK Configuration() holding the loggers
+                              and calculation preferences.
+        :type configuration: :class:`ramstk.Configuration.Configuration`
+        :keyword int revision_id: the ID of the Revision to calculate.
+                                  Default is 1.
+        :keyword float hr_multiplier: the hazard rate multiplier.  Default is
+                                      the RAMSTK_HR_MULTIPLIER.
+        :keyword int n_workers: the number of worker processes to calculate
+                                the hardware piece parts with.  Default is
+                                the RAMSTK_CALC_WORKERS.
+        """
+        # Initialize private dictionary attributes.
+        self._dic_controllers = {}
+
+        # Initialize private list attributes.
+
+        # Initialize private scalar attributes.
+        self._configuration = configuration
+        self._hardware_tree = None
+        self._revision_id = kwargs.get('revision_id', 1)
+        self._hr_multiplier = float(
+            kwargs.get('hr_multiplier', configuration.RAMSTK_HR_MULTIPLIER))
+        self._n_workers = int(
+            kwargs.get('n_workers', configuration.RAMSTK_CALC_WORKERS))
+
+        # Initialize public dictionary attributes.
+        self.dic_timing = {}
+        self.dic_errors = {}
+
+        # Initialize public list attributes.
+
+        # Initialize public scalar attributes.
+        self.dao = DAO()
+
+    def _do_time(self, module, step, method, *args, **kwargs):
+        """
+        Call a method and add the time it took to the module step.
+
+        :param str module: the name of the module being calculated.
+        :param str step: the step of the module the method belongs to.
+        :param method: the method to call.
+        :return: whatever the method returns.
+        """
+        _start = time.time()
+        _result = method(*args, **kwargs)
+        self.dic_timing[module][step] += time.time() - _start
+
+        return _result
+
+    def _get_hardware(self, module):
+        """
+        Retrieve the Hardware BoM data controller, loading it if needed.
+
+        :param str module: the name of the module the load time is added to.
+        :return: the Hardware BoM data controller.
+        :rtype: :class:`ramstk.modules.hardware.dtcHardwareBoM`
+        """
+        if 'hardware' not in self._dic_controllers:
+            self._dic_controllers['hardware'] = dtcHardwareBoM(
+                self.dao, self._configuration, test=False)
+            self._hardware_tree = self._do_time(
+                module,
+                'load',
+                self._dic_controllers['hardware'].request_do_select_all,
+                revision_id=self._revision_id)
+
+        return self._dic_controllers['hardware']
+
+    def _get_hazard_rate(self, module, hardware_id):
+        """
+        Retrieve the logistics hazard rate of a hardware item.
+
+        :param str module: the name of the module the load time is added to.
+        :param int hardware_id: the ID of the hardware item.
+        :return: the logistics hazard rate or 0.0 if there is no such item.
+        :rtype: float
+        """
+        _dtc_hardware = self._get_hardware(module)
+
+        if self._hardware_tree.get_node(hardware_id) is None:
+            return 0.0
+
+        return _dtc_hardware.request_do_select(
+            hardware_id, table='reliability').hazard_rate_logistics
+
+    def _do_save(self, module, controllers):
+        """
+        Save the changed records of the data controllers in one transaction.
+
+        :param str module: the name of the module the save time is added to.
+        :param list controllers: the data controllers whose changed records
+                                 are to be saved.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _entities = []
+        for _controller in controllers:
+            _entities.extend(
+                self._do_time(module, 'save',
+                              _controller.request_do_select_modified))
+
+        return self._do_save_entities(module, _entities)
+
+    def _do_save_entities(self, module, entities):
+        """
+        Save a list of records in one transaction.
+
+        :param str module: the name of the module the save time is added to.
+        :param list entities: the RAMSTK Program database records to save.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _error_code = 0
+        _msg = ''
+
+        _start = time.time()
+        if entities:
+            _session = self.dao.db_get_session(
+                autoflush=True, autocommit=False, expire_on_commit=False)
+            _session.add_all(entities)
+            _error_code, _msg = self.dao.db_update(_session)
+            self.dao.db_close_session(_session)
+        self.dic_timing[module]['save'] += time.time() - _start
+
+        if _error_code != 0:
+            self._configuration.RAMSTK_DEBUG_LOG.error(_msg)
+
+        return _error_code != 0
+
+    def _do_calculate_hardware(self):
+        """
+        Calculate the hardware predictions and roll them up to each system.
+
+        The results of each system are copied to its Revision the same as the
+        Hardware module book does.
+
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _return = False
+
+        _dtc_hardware = self._get_hardware('hardware')
+        _dtc_revision = dtcRevision(self.dao, self._configuration, test=False)
+        self._do_time('hardware', 'load', _dtc_revision.request_do_select_all)
+
+        for _node in self._hardware_tree.children(self._hardware_tree.root):
+            _return = (self._do_time(
+                'hardware',
+                'calculate',
+                _dtc_hardware.request_do_calculate_all,
+                node_id=_node.identifier,
+                hr_multiplier=self._hr_multiplier,
+                n_workers=self._n_workers) or _return)
+
+            _sys_attributes = _dtc_hardware.request_get_attributes(
+                _node.identifier)
+            _revision_id = _sys_attributes['revision_id']
+            _rev_attributes = _dtc_revision.request_get_attributes(
+                _revision_id)
+            for _rev_key, _hw_key in REVISION_ATTRIBUTES:
+                _rev_attributes[_rev_key] = _sys_attributes[_hw_key]
+            _dtc_revision.request_set_attributes(_revision_id,
+                                                 _rev_attributes)
+
+        return (self._do_save('hardware', [_dtc_hardware, _dtc_revision])
+                or _return)
+
+    def _do_calculate_allocation(self):
+        """
+        Allocate the goal of each hardware item to its children.
+
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _return = False
+
+        _dtc_allocation = dtcAllocation(
+            self.dao, self._configuration, test=False)
+        _tree = self._do_time(
+            'allocation',
+            'load',
+            _dtc_allocation.request_do_select_all,
+            revision_id=self._revision_id)
+
+        # Each parent is allocated before its children so every child is
+        # apportioned from its parent's new goal.
+        for _node_id in _tree.expand_tree(_tree.root, sorting=False):
+            if _node_id != _tree.root and _tree.children(_node_id):
+                _return = (self._do_time('allocation', 'calculate',
+                                         _dtc_allocation.request_do_calculate,
+                                         _node_id) or _return)
+
+        return self._do_save('allocation', [_dtc_allocation]) or _return
+
+    def _do_calculate_similar_item(self):
+        """
+        Calculate the similar item hazard rates from the hardware hazard rates.
+
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _return = False
+
+        _dtc_similar_item = dtcSimilarItem(
+            self.dao, self._configuration, test=False)
+        _tree = self._do_time(
+            'similar_item',
+            'load',
+            _dtc_similar_item.request_do_select_all,
+            revision_id=self._revision_id)
+
+        # Only the items with a similar item method selected are calculated.
+        for _node in _tree.all_nodes():
+            if (_node.identifier != _tree.root
+                    and _node.data.method_id in [1, 2]):
+                _hazard_rate = self._get_hazard_rate('similar_item',
+                                                     _node.identifier)
+                _return = (self._do_time(
+                    'similar_item',
+                    'calculate',
+                    _dtc_similar_item.request_do_calculate,
+                    _node.identifier,
+                    hazard_rate=_hazard_rate) or _return)
+
+        return self._do_save('similar_item', [_dtc_similar_item]) or _return
+
+    def _do_calculate_fmea(self):
+        """
+        Calculate the RPN of each functional FMEA and the RPN and criticality
+        of each hardware FMECA.
+
+        Only the functions and hardware items with failure modes are loaded.
+
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _return = False
+        _entities = []
+
+        _start = time.time()
+        _qry_function_ids = self.dao.session.query(
+            RAMSTKFunction.function_id).filter(
+                RAMSTKFunction.revision_id == self._revision_id)
+        _qry_hardware_ids = self.dao.session.query(
+            RAMSTKHardware.hardware_id).filter(
+                RAMSTKHardware.revision_id == self._revision_id)
+        _function_ids = [
+            _row[0] for _row in self.dao.session.query(
+                RAMSTKMode.function_id).filter(
+                    RAMSTKMode.function_id.in_(_qry_function_ids)).distinct()
+        ]
+        _hardware_ids = [
+            _row[0] for _row in self.dao.session.query(
+                RAMSTKMode.hardware_id).filter(
+                    RAMSTKMode.hardware_id.in_(_qry_hardware_ids)).distinct()
+        ]
+        self.dic_timing['fmea']['load'] += time.time() - _start
+
+        for _functional, _parent_ids in [(True, _function_ids),
+                                         (False, _hardware_ids)]:
+            _dtc_fmea = dtcFMEA(
+                self.dao,
+                self._configuration,
+                test=False,
+                functional=_functional)
+            for _parent_id in sorted(_parent_ids):
+                self._do_time(
+                    'fmea',
+                    'load',
+                    _dtc_fmea.request_do_select_all,
+                    parent_id=_parent_id,
+                    functional=_functional)
+                if _functional:
+                    _item_hr = 0.0
+                else:
+                    _item_hr = self._get_hazard_rate('fmea', _parent_id)
+                _return = (self._do_time(
+                    'fmea',
+                    'calculate',
+                    _dtc_fmea.request_do_calculate,
+                    None,
+                    item_hr=_item_hr,
+                    criticality=not _functional,
+                    rpn=True) or _return)
+                _entities.extend(
+                    self._do_time('fmea', 'save',
+                                  _dtc_fmea.request_do_select_modified))
+
+        return self._do_save_entities('fmea', _entities) or _return
+
+    def _do_calculate_hazops(self):
+        """
+        Calculate the hazard risk indices of each hazard.
+
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _return = False
+
+        _dtc_hazops = dtcHazardAnalysis(
+            self.dao, self._configuration, test=False)
+        _tree = self._do_time(
+            'hazops',
+            'load',
+            _dtc_hazops.request_do_select_all,
+            revision_id=self._revision_id)
+
+        # The hardware item nodes have no data package.
+        for _node in _tree.all_nodes():
+            if _node.data is not None:
+                _return = (self._do_time('hazops', 'calculate',
+                                         _dtc_hazops.request_do_calculate,
+                                         _node.identifier) or _return)
+
+        return self._do_save('hazops', [_dtc_hazops]) or _return
+
+    def _do_calculate_validation(self):
+        """
+        Calculate the cost and time of each validation task and the program.
+
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _dtc_validation = dtcValidation(
+            self.dao, self._configuration, test=False)
+        self._do_time(
+            'validation',
+            'load',
+            _dtc_validation.request_do_select_all,
+            revision_id=self._revision_id)
+
+        self._do_time('validation', 'calculate',
+                      _dtc_validation.request_do_calculate_all)
+
+        _return = self._do_save('validation', [_dtc_validation])
+
+        # Today's program status holds the remaining time.
+        return (self._do_time('validation', 'save',
+                              _dtc_validation.request_do_update_status)
+                or _return)
+
+    def do_open(self, database):
+        """
+        Open the RAMSTK Program database to calculate.
+
+        :param str database: the RFC1738 URL of the RAMSTK Program database.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        self._dic_controllers = {}
+        self._hardware_tree = None
+        self.dic_timing = {}
+        self.dic_errors = {}
+
+        return self.dao.db_connect(database, program=True)
+
+    def do_close(self):
+        """
+        Close the RAMSTK Program database.
+
+        :return: None
+        :rtype: None
+        """
+        self._dic_controllers = {}
+        self._hardware_tree = None
+        # Nothing is open if the database couldn't be connected to.
+        if self.dao.session is not None:
+            self.dao.db_close()
+
+        return None
+
+    def do_calculate(self, modules=MODULES):
+        """
+        Calculate and save the modules of the open RAMSTK Program database.
+
+        The modules are always calculated in the order of MODULES.
+
+        :keyword list modules: the names of the modules to calculate.  Default
+                               is all the MODULES.
+        :return: False if successful or True if an error is encountered in
+                 any module.
+        :rtype: bool
+        """
+        _return = False
+
+        for _module in [_module for _module in MODULES if _module in modules]:
+            self.dic_timing[_module] = dict((_step, 0.0) for _step in STEPS)
+            # The module is in error until it finishes calculating.
+            self.dic_errors[_module] = True
+            self.dic_errors[_module] = getattr(
+                self, '_do_calculate_{0:s}'.format(_module))()
+            _return = _return or self.dic_errors[_module]
+
+        return _return
+
+    def get_report(self):
+        """
+        Format the time spent in each step of each module as a table.
+
+        :return: the timing report.
+        :rtype: str
+        """
+        _lines = [
+            '{0:<14s}{1:>10s}{2:>11s}{3:>10s}{4:>10s}  {5:s}'.format(
+                'Module', 'Load (s)', 'Calc (s)', 'Save (s)', 'Total (s)',
+                'Status')
+        ]
+        _totals = dict((_step, 0.0) for _step in STEPS)
+        for _module in [_module for _module in MODULES
+                        if _module in self.dic_timing]:
+            _timing = self.dic_timing[_module]
+            for _step in STEPS:
+                _totals[_step] += _timing[_step]
+            _lines.append(
+                '{0:<14s}{1:>10.3f}{2:>11.3f}{3:>10.3f}{4:>10.3f}  {5:s}'.
+                format(_module, _timing['load'], _timing['calculate'],
+                       _timing['save'], sum(_timing.values()),
+                       'ERROR' if self.dic_errors[_module] else 'OK'))
+        _lines.append(
+            '{0:<14s}{1:>10.3f}{2:>11.3f}{3:>10.3f}{4:>10.3f}'.format(
+                'Total', _totals['load'], _totals['calculate'],
+                _totals['save'], sum(_totals.values())))
+
+        return '\n'.join(_lines)
+
+
+def _get_uri(database):
+    """
+    Convert a path to a RAMSTK Program database to its RFC1738 URL.
+
+    :param str database: the path or RFC1738 URL of the database.
+    :return: the RFC1738 URL of the database.
+    :rtype: str
+    """
+    if '://' in database:
+        return database
+
+    return DAO.db_get_uri('sqlite', {'database': os.path.abspath(database)})
+
+
+def _is_missing(uri):
+    """
+    Check whether the SQLite database file of an RFC1738 URL is missing.
+
+    SQLite creates an empty database when a file that doesn't exist is
+    opened, so a missing file has to be caught before it is opened.
+
+    :param str uri: the RFC1738 URL of the database.
+    :return: True if the URL is of an SQLite database file that doesn't
+             exist or False otherwise.
+    :rtype: bool
+    """
+    _url = make_url(uri)
+
+    return (_url.get_backend_name() == 'sqlite'
+            and _url.database not in [None, '', ':memory:']
+            and not os.path.isfile(_url.database))
+
+
+def _do_calculate_program(configuration, database, modules, **kwargs):
+    """
+    Calculate one RAMSTK Program database and print its timing report.
+
+    An error opening or calculating the database is logged and reported
+    rather than raised so the next database is still calculated.
+
+    :param configuration: the RAMSTK Configuration() holding the loggers
+                          and calculation preferences.
+    :type configuration: :class:`ramstk.Configuration.Configuration`
+    :param str database: the path or RFC1738 URL of the RAMSTK Program
+                         database.
+    :param list modules: the names of the modules to calculate.
+    :return: False if successful or True if an error is encountered.
+    :rtype: bool
+    """
+    _error = ''
+    _open_time = 0.0
+    _uri = _get_uri(database)
+    _calculator = BatchCalculator(configuration, **kwargs)
+
+    print('Program: {0:s}'.format(database))
+    if _is_missing(_uri):
+        _error = 'the database does not exist.'
+    else:
+        _start = time.time()
+        try:
+            if _calculator.do_open(_uri):
+                _error = 'the database could not be opened.'
+            else:
+                _open_time = time.time() - _start
+                _calculator.do_calculate(modules)
+        except Exception as _exception:  # pylint: disable=broad-except
+            _error = str(_exception)
+        finally:
+            _calculator.do_close()
+
+    _return = _error != '' or any(_calculator.dic_errors.values())
+    if _error != '':
+        configuration.RAMSTK_DEBUG_LOG.error(
+            'RAMSTK ERROR: Calculating RAMSTK Program database {0:s}: '
+            '{1:s}'.format(database, _error))
+        print('Status: ERROR ({0:s})'.format(_error))
+
+    print('Open: {0:.3f} s'.format(_open_time))
+    print(_calculator.get_report())
+    print('')
+
+    return _return
+
+
+def _get_configuration(log_dir):
+    """
+    Read the user's RAMSTK configuration and create the loggers.
+
+    The RAMSTK defaults are used when the user has no configuration file.
+
+    :param str log_dir: the directory to write the logs to or None to use the
+                        RAMSTK_LOG_DIR when it can be written to.
+    :return: the RAMSTK configuration.
+    :rtype: :class:`ramstk.Configuration.Configuration`
+    """
+    _configuration = Configuration()
+    _configuration.set_site_variables()
+    _configuration.set_user_variables(first_run=False)
+    _configuration.get_user_configuration()
+
+    if log_dir is None:
+        log_dir = _configuration.RAMSTK_LOG_DIR
+        if not os.access(log_dir, os.W_OK):
+            log_dir = tempfile.gettempdir()
+    if not Utilities.dir_exists(log_dir):
+        os.makedirs(log_dir)
+    _configuration.RAMSTK_LOG_DIR = log_dir
+
+    _configuration.RAMSTK_DEBUG_LOG = Utilities.create_logger(
+        "RAMSTK.debug", logging.DEBUG, log_dir + '/RAMSTK_calc_debug.log')
+    _configuration.RAMSTK_USER_LOG = Utilities.create_logger(
+        "RAMSTK.user", logging.WARNING, log_dir + '/RAMSTK_calc_user.log')
+
+    return _configuration
+
+
+def main(argv=None):
+    """
+    Calculate one or more RAMSTK Program databases from the command line.
+
+    :keyword list argv: the command line arguments.  Default is sys.argv.
+    :return: 0 if every program was calculated, 1 otherwise.
+    :rtype: int
+    """
+    _parser = argparse.ArgumentParser(
+        prog='ramstk-calc',
+        description='Calculate and save RAMSTK Program databases without '
+        'the RAMSTK GUI.')
+    _parser.add_argument(
+        'databases',
+        nargs='+',
+        metavar='DATABASE',
+        help='the path or RFC1738 URL of a RAMSTK Program database.')
+    _parser.add_argument(
+        '-m',
+        '--modules',
+        default=','.join(MODULES),
+        help='comma separated modules to calculate (default: %(default)s).')
+    _parser.add_argument(
+        '-r',
+        '--revision',
+        type=int,
+        default=1,
+        help='the ID of the Revision to calculate (default: %(default)s).')
+    _parser.add_argument(
+        '-w',
+        '--workers',
+        type=int,
+        default=None,
+        help='the number of processes to calculate the hardware piece '
+        'parts with (default: the RAMSTK configuration).')
+    _parser.add_argument(
+        '--hr-multiplier',
+        type=float,
+        default=None,
+        help='the hazard rate multiplier (default: the RAMSTK '
+        'configuration).')
+    _parser.add_argument(
+        '--log-dir', default=None, help='the directory to write the logs to.')
+    _args = _parser.parse_args(argv)
+
+    _modules = [_module.strip() for _module in _args.modules.split(',')]
+    for _module in _modules:
+        if _module not in MODULES:
+            _parser.error('unknown module {0:s}; choose from {1:s}.'.format(
+                _module, ', '.join(MODULES)))
+
+    _configuration = _get_configuration(_args.log_dir)
+    _kwargs = {'revision_id': _args.revision}
+    if _args.workers is not None:
+        _kwargs['n_workers'] = _args.workers
+    if _args.hr_multiplier is not None:
+        _kwargs['hr_multiplier'] = _args.hr_multiplier
+
+    _return = 0
+    for _database in _args.databases:
+        if _do_calculate_program(_configuration, _database, _modules,
+                                 **_kwargs):
+            _return = 1
+
+    return _return
+
+
+if __name__ == '__main__':
+    sys.exit(main())
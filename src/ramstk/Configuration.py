@@ -157,15 +157,15 @@ class Configuration(object):
                              +----------+-------------------------------+
                              |   Key    | Information                   |
                              +==========+===============================+
-                             |   host   | Host name (MySQL only)        |
+                             |   host   | Host name (server only)       |
                              +----------+-------------------------------+
-                             |  socket  | Host port (MySQL only)        |
+                             |  socket  | Host port (server only)       |
                              +----------+-------------------------------+
                              | database | Database name                 |
                              +----------+-------------------------------+
-                             |   user   | User name (MySQL only)        |
+                             |   user   | User name (server only)       |
                              +----------+-------------------------------+
-                             | password | User password (MySQL only)    |
+                             | password | User password (server only)   |
                              +----------+-------------------------------+
     :cvar dict RAMSTK_PROG_INFO: Dictionary for RAMSTK Program database connection
                               information.  The information contained is:
@@ -173,15 +173,21 @@ class Configuration(object):
                               +----------+-------------------------------+
                               |   Key    | Information                   |
                               +==========+===============================+
-                              |   host   | Host name (MySQL only)        |
+                              |   host   | Host name (server only)       |
                               +----------+-------------------------------+
-                              |  socket  | Host port (MySQL only)        |
+                              |  socket  | Host port (server only)       |
                               +----------+-------------------------------+
                               | database | Database name                 |
                               +----------+-------------------------------+
-                              |   user   | User name (MySQL only)        |
+                              |   user   | User name (server only)       |
                               +----------+-------------------------------+
-                              | password | User password (MySQL only)    |
+                              | password | User password (server only)   |
+                              +----------+-------------------------------+
+                              |pool_size | Open connections (PostgreSQL  |
+                              |          | only, optional)               |
+                              +----------+-------------------------------+
+                              |   max_   | Connections beyond pool_size  |
+                              | overflow | (PostgreSQL only, optional)   |
                               +----------+-------------------------------+
     :cvar dict RAMSTK_TABPOS: Dictionary containing the location of tabs in the
                            three main gtk.Notebook() widgets.  Can be one of:
@@ -236,6 +242,10 @@ class Configuration(object):
                                    display without using scientific notation.
                                    Set to one to use scientific notation.
                                    Default value is *1000000.0*.
+    :cvar int RAMSTK_CALC_WORKERS: Number of worker processes used to
+                                calculate hardware piece parts.  Set to one
+                                to calculate everything in the RAMSTK
+                                process.  Default value is *1*.
     :cvar float RAMSTK_MTIME: The default mission time for new RAMSTK Programs.
     :cvar int RAMSTK_DEC_PLACES: Number of decimal places to show in numerical
                               results.  Default value is *6*.
@@ -289,11 +299,13 @@ class Configuration(object):
                                are:
 
                                * mysql
+                               * postgresql
                                * sqlite
 
     :cvar str RAMSTK_BACKEND: RAMSTK Program database backend to use.  Options are:
 
                            * mysql
+                           * postgresql
                            * sqlite
 
     :cvar str RAMSTK_LOCALE: The language locale to use with RAMSTK.  Default value
@@ -364,6 +376,7 @@ class Configuration(object):
     RAMSTK_BACKEND = ''
     RAMSTK_REPORT_SIZE = 'letter'
     RAMSTK_HR_MULTIPLIER = 1000000.0
+    RAMSTK_CALC_WORKERS = 1
     RAMSTK_DEC_PLACES = 6
     RAMSTK_MTIME = 100.0
     RAMSTK_GUI_LAYOUT = 'advanced'
@@ -549,6 +562,7 @@ class Configuration(object):
         _config.set('General', 'decimal', 6)
         _config.set('General', 'modesource', 1)
         _config.set('General', 'parallelcalcs', 'False')
+        _config.set('General', 'calcworkers', 1)
         _config.set('General', 'moduletabpos', 'top')
         _config.set('General', 'listtabpos', 'bottom')
         _config.set('General', 'worktabpos', 'bottom')
@@ -637,6 +651,10 @@ class Configuration(object):
             self.RAMSTK_PROG_INFO['user'] = _config.get('Backend', 'user')
             self.RAMSTK_PROG_INFO['password'] = _config.get(
                 'Backend', 'password')
+            for _option in ['pool_size', 'max_overflow']:
+                if _config.has_option('Backend', _option):
+                    self.RAMSTK_PROG_INFO[_option] = _config.getint(
+                        'Backend', _option)
 
             self.RAMSTK_DATA_DIR = _config.get('Directories', 'datadir')
             self.RAMSTK_ICON_DIR = _config.get('Directories', 'icondir')
@@ -648,6 +666,13 @@ class Configuration(object):
             self.RAMSTK_DEC_PLACES = _config.get('General', 'decimal')
             self.RAMSTK_MTIME = _config.get('General', 'calcreltime')
             self.RAMSTK_MODE_SOURCE = _config.get('General', 'modesource')
+            # Configuration files written before calcworkers was added
+            # calculate in a single process.
+            try:
+                self.RAMSTK_CALC_WORKERS = _config.getint(
+                    'General', 'calcworkers')
+            except ConfigParser.NoOptionError:
+                self.RAMSTK_CALC_WORKERS = 1
             self.RAMSTK_TABPOS['listbook'] = _config.get(
                 'General', 'listtabpos')
             self.RAMSTK_TABPOS['modulebook'] = _config.get(
@@ -708,6 +733,7 @@ class Configuration(object):
             _config.add_section('General')
             _config.set('General', 'reportsize', self.RAMSTK_REPORT_SIZE)
             _config.set('General', 'parallelcalcs', 'False')
+            _config.set('General', 'calcworkers', self.RAMSTK_CALC_WORKERS)
             _config.set('General', 'frmultiplier', self.RAMSTK_HR_MULTIPLIER)
             _config.set('General', 'calcreltime', self.RAMSTK_MTIME)
             _config.set('General', 'autoaddlistitems', 'False')
@@ -730,6 +756,10 @@ class Configuration(object):
             _config.set('Backend', 'user', self.RAMSTK_PROG_INFO['user'])
             _config.set('Backend', 'password',
                         self.RAMSTK_PROG_INFO['password'])
+            for _option in ['pool_size', 'max_overflow']:
+                if _option in self.RAMSTK_PROG_INFO:
+                    _config.set('Backend', _option,
+                                self.RAMSTK_PROG_INFO[_option])
 
             _config.add_section('Directories')
             _config.set('Directories', 'datadir', self.RAMSTK_DATA_DIR)
@@ -208,12 +208,17 @@ class Model(object):
 
         return _error_code, _msg
 
-    def do_open_program(self, database):
+    def do_open_program(self, database, **kwargs):
         """
         Open an RAMSTK Program database for analyses.
 
         :param str database: the RFC1738 URL path to the database to connect
                              with.
+        :keyword int pool_size: the number of connections to keep open to a
+                                PostgreSQL server.
+        :keyword int max_overflow: the number of connections to a PostgreSQL
+                                   server that may be opened beyond the
+                                   pool_size.
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
@@ -221,7 +226,7 @@ class Model(object):
         _msg = 'RAMSTK SUCCESS: Opening RAMSTK Program database {0:s}.'.\
             format(database)
 
-        if not self.program_dao.db_connect(database):
+        if not self.program_dao.db_connect(database, program=True, **kwargs):
             program_session = self.program_dao.RAMSTK_SESSION
             program_session.configure(
                 bind=self.program_dao.engine,
@@ -242,15 +247,27 @@ class Model(object):
 
         return None
 
-    def do_save_program(self):
+    def do_save_program(self, **kwargs):
         """
         Save the open RAMSTK Program database.
 
+        :keyword list entities: the changed records of the RAMSTK Program
+                                modules.  They are saved in the same
+                                transaction as the program session.
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
+        _entities = kwargs.get('entities', [])
+
+        self.program_session.add_all(_entities)
         _error_code, _msg = self.program_dao.db_update(self.program_session)
 
+        # The records belong to the module data models, so they are handed
+        # back rather than left in the program session.
+        for _entity in _entities:
+            if _entity in self.program_session:
+                self.program_session.expunge(_entity)
+
         return _error_code, _msg
 
     def do_delete_program(self):
@@ -624,11 +641,9 @@ class RAMSTK(object):
         self.loaded = False
 
         # Connect to the RAMSTK Common database.
-        _database = None
-        if self.RAMSTK_CONFIGURATION.RAMSTK_COM_BACKEND == 'sqlite':
-            _database = self.RAMSTK_CONFIGURATION.RAMSTK_COM_BACKEND + \
-                        ':///' + \
-                        self.RAMSTK_CONFIGURATION.RAMSTK_COM_INFO['database']
+        _database = DAO.db_get_uri(
+            self.RAMSTK_CONFIGURATION.RAMSTK_COM_BACKEND,
+            self.RAMSTK_CONFIGURATION.RAMSTK_COM_INFO)
         _dao = DAO()
         _dao.db_connect(_database)
 
@@ -691,11 +706,9 @@ class RAMSTK(object):
         :rtype: bool
         """
         _return = False
-        _database = None
-
-        if self.RAMSTK_CONFIGURATION.RAMSTK_BACKEND == 'sqlite':
-            _database = self.RAMSTK_CONFIGURATION.RAMSTK_BACKEND + ':///' + \
-                self.RAMSTK_CONFIGURATION.RAMSTK_PROG_INFO['database']
+        _database = DAO.db_get_uri(
+            self.RAMSTK_CONFIGURATION.RAMSTK_BACKEND,
+            self.RAMSTK_CONFIGURATION.RAMSTK_PROG_INFO)
 
         _error_code, _msg = self.ramstk_model.do_create_program(_database)
         if _error_code == 0:
@@ -728,15 +741,21 @@ class RAMSTK(object):
         """
         _return = False
 
-        _database = None
+        _database = DAO.db_get_uri(
+            self.RAMSTK_CONFIGURATION.RAMSTK_BACKEND,
+            self.RAMSTK_CONFIGURATION.RAMSTK_PROG_INFO)
 
-        if self.RAMSTK_CONFIGURATION.RAMSTK_BACKEND == 'sqlite':
-            _database = self.RAMSTK_CONFIGURATION.RAMSTK_BACKEND + ':///' + \
-                self.RAMSTK_CONFIGURATION.RAMSTK_PROG_INFO['database']
+        # Pass the connection pool settings, if there are any, through to the
+        # PostgreSQL engine.
+        _pool = dict(
+            (_key, int(self.RAMSTK_CONFIGURATION.RAMSTK_PROG_INFO[_key]))
+            for _key in ['pool_size', 'max_overflow']
+            if _key in self.RAMSTK_CONFIGURATION.RAMSTK_PROG_INFO)
 
         # If the database was successfully opened, create an instance of each
         # of the slave data controllers.
-        _error_code, _msg = self.ramstk_model.do_open_program(_database)
+        _error_code, _msg = self.ramstk_model.do_open_program(
+            _database, **_pool)
         if _error_code == 0:
             pub.sendMessage('requestOpen')
             self.dic_controllers['revision'] = dtcRevision(
@@ -879,7 +898,23 @@ class RAMSTK(object):
             format(self.RAMSTK_CONFIGURATION.RAMSTK_PROG_INFO['database'])
         self.dic_books['modulebook'].statusbar.push(2, _message)
 
-        _error_code, _msg = self.ramstk_model.do_save_program()
+        # Only the records changed since the last save are written and they
+        # are all written in one transaction.
+        _entities = []
+        for _module in [
+                'revision', 'function', 'requirement', 'hardware',
+                'validation', 'profile', 'definition', 'ffmea',
+                'stakeholder', 'allocation', 'hazops', 'similaritem',
+                'dfmeca', 'pof'
+        ]:
+            try:
+                _entities.extend(
+                    self.dic_controllers[_module].request_do_select_modified())
+            except KeyError:
+                pass
+
+        _error_code, _msg = self.ramstk_model.do_save_program(
+            entities=_entities)
 
         if _error_code == 0:
             self.RAMSTK_CONFIGURATION.RAMSTK_USER_LOG.info(_msg)
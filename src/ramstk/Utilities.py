@@ -200,6 +200,32 @@ def none_to_string(string):
     return _return
 
 
+def pack_node_id(ids, bits=21):
+    """
+    Pack database IDs into a single treelib Node ID.
+
+    Each ID occupies its own field of bits in the Node ID, the first ID in the
+    lowest bits, so the Node ID of a lone ID is the ID itself and Node IDs
+    packed from different IDs can't collide.  Three 21-bit fields fit in a
+    signed 64-bit integer.
+
+    :param list ids: the database IDs to pack.
+    :param int bits: the number of bits each ID occupies.
+    :return: _node_id; the packed Node ID.
+    :rtype: int
+    :raise: OutOfRangeError if an ID doesn't fit in its field.
+    """
+    _node_id = 0
+    for _idx, _id in enumerate(ids):
+        if not 0 <= _id < 1 << bits:
+            raise OutOfRangeError(
+                'RAMSTK ERROR: ID {0:d} is outside the range 0 - {1:d} that '
+                'can be packed into a Node ID.'.format(_id, (1 << bits) - 1))
+        _node_id |= _id << (_idx * bits)
+
+    return _node_id
+
+
 def ordinal_to_date(ordinal):
     """
     Convert ordinal dates to date strings in ISO-8601 format.
@@ -9,12 +9,375 @@
 
 import gettext
 
+import numpy as np
+
 from . import (Capacitor, Connection, Crystal, Filter, Fuse, Inductor,
                IntegratedCircuit, Lamp, Meter, Relay, Resistor, Semiconductor,
                Switch)
 
 _ = gettext.gettext
 
+# The attributes used to select the MIL-HDBK-217F parts count base hazard rate
+# and quality factor.  Hardware items sharing the same values for all of these
+# attributes share the same parts count results.
+PART_COUNT_KEYS = ('category_id', 'subcategory_id', 'specification_id',
+                   'type_id', 'family_id', 'technology_id', 'n_elements',
+                   'application_id', 'construction_id', 'quality_id',
+                   'environment_active_id')
+
+# The attributes set by the MIL-HDBK-217F parts count calculations.
+PART_COUNT_RESULTS = ('lambda_b', 'piQ', 'hazard_rate_active')
+
+
+# First key is the category ID; second key is the active environment ID;
+# third key is the dormant environment ID.
+HR_DORMANT = {
+    1: {
+        1: {
+            2: 0.08
+        },
+        2: {
+            2: 0.08
+        },
+        3: {
+            2: 0.08
+        },
+        4: {
+            2: 0.05,
+            3: 0.06
+        },
+        5: {
+            2: 0.05,
+            3: 0.06
+        },
+        6: {
+            1: 0.06,
+            2: 0.04
+        },
+        7: {
+            1: 0.06,
+            2: 0.04
+        },
+        8: {
+            1: 0.06,
+            2: 0.04
+        },
+        9: {
+            1: 0.06,
+            2: 0.04
+        },
+        10: {
+            1: 0.06,
+            2: 0.04
+        },
+        11: {
+            2: 0.3,
+            4: 0.1
+        }
+    },
+    2: {
+        1: {
+            2: (0.04, 0.05)
+        },
+        2: {
+            2: (0.04, 0.05)
+        },
+        3: {
+            2: (0.04, 0.05)
+        },
+        4: {
+            2: (0.03, 0.03),
+            3: (0.04, 0.05)
+        },
+        5: {
+            2: (0.03, 0.03),
+            3: (0.04, 0.05)
+        },
+        6: {
+            1: (0.05, 0.06),
+            2: (0.01, 0.02)
+        },
+        7: {
+            1: (0.05, 0.06),
+            2: (0.01, 0.02)
+        },
+        8: {
+            1: (0.05, 0.06),
+            2: (0.01, 0.02)
+        },
+        9: {
+            1: (0.05, 0.06),
+            2: (0.01, 0.02)
+        },
+        10: {
+            1: (0.05, 0.06),
+            2: (0.01, 0.02)
+        },
+        11: {
+            2: (0.8, 1.0),
+            4: (0.2, 0.2)
+        }
+    },
+    3: {
+        1: {
+            2: 0.2
+        },
+        2: {
+            2: 0.2
+        },
+        3: {
+            2: 0.2
+        },
+        4: {
+            2: 0.06,
+            3: 0.1
+        },
+        5: {
+            2: 0.06,
+            3: 0.1
+        },
+        6: {
+            1: 0.06,
+            2: 0.2
+        },
+        7: {
+            1: 0.06,
+            2: 0.2
+        },
+        8: {
+            1: 0.06,
+            2: 0.2
+        },
+        9: {
+            1: 0.06,
+            2: 0.2
+        },
+        10: {
+            1: 0.06,
+            2: 0.2
+        },
+        11: {
+            2: 1.0,
+            4: 0.5
+        }
+    },
+    4: {
+        1: {
+            2: 0.1
+        },
+        2: {
+            2: 0.1
+        },
+        3: {
+            2: 0.1
+        },
+        4: {
+            2: 0.04,
+            3: 0.1
+        },
+        5: {
+            2: 0.04,
+            3: 0.1
+        },
+        6: {
+            1: 0.1,
+            2: 0.03
+        },
+        7: {
+            1: 0.1,
+            2: 0.03
+        },
+        8: {
+            1: 0.1,
+            2: 0.03
+        },
+        9: {
+            1: 0.1,
+            2: 0.03
+        },
+        10: {
+            1: 0.1,
+            2: 0.03
+        },
+        11: {
+            2: 0.4,
+            4: 0.2
+        }
+    },
+    5: {
+        1: {
+            2: 0.2
+        },
+        2: {
+            2: 0.2
+        },
+        3: {
+            2: 0.2
+        },
+        4: {
+            2: 0.3,
+            3: 0.3
+        },
+        5: {
+            2: 0.3,
+            3: 0.3
+        },
+        6: {
+            1: 0.2,
+            2: 0.2
+        },
+        7: {
+            1: 0.2,
+            2: 0.2
+        },
+        8: {
+            1: 0.2,
+            2: 0.2
+        },
+        9: {
+            1: 0.2,
+            2: 0.2
+        },
+        10: {
+            1: 0.2,
+            2: 0.2
+        },
+        11: {
+            2: 1.0,
+            4: 0.5
+        }
+    },
+    6: {
+        1: {
+            2: 0.2
+        },
+        2: {
+            2: 0.2
+        },
+        3: {
+            2: 0.2
+        },
+        4: {
+            2: 0.08,
+            3: 0.3
+        },
+        5: {
+            2: 0.08,
+            3: 0.3
+        },
+        6: {
+            1: 0.2,
+            2: 0.04
+        },
+        7: {
+            1: 0.2,
+            2: 0.04
+        },
+        8: {
+            1: 0.2,
+            2: 0.04
+        },
+        9: {
+            1: 0.2,
+            2: 0.04
+        },
+        10: {
+            1: 0.2,
+            2: 0.04
+        },
+        11: {
+            2: 0.9,
+            4: 0.4
+        }
+    },
+    7: {
+        1: {
+            2: 0.4
+        },
+        2: {
+            2: 0.4
+        },
+        3: {
+            2: 0.4
+        },
+        4: {
+            2: 0.2,
+            3: 0.4
+        },
+        5: {
+            2: 0.2,
+            3: 0.4
+        },
+        6: {
+            1: 0.2,
+            2: 0.1
+        },
+        7: {
+            1: 0.2,
+            2: 0.1
+        },
+        8: {
+            1: 0.2,
+            2: 0.1
+        },
+        9: {
+            1: 0.2,
+            2: 0.1
+        },
+        10: {
+            1: 0.2,
+            2: 0.1
+        },
+        11: {
+            2: 1.0,
+            4: 0.8
+        }
+    },
+    8: {
+        1: {
+            2: 0.005
+        },
+        2: {
+            2: 0.005
+        },
+        3: {
+            2: 0.005
+        },
+        4: {
+            2: 0.003,
+            3: 0.008
+        },
+        5: {
+            2: 0.003,
+            3: 0.008
+        },
+        6: {
+            1: 0.0005,
+            2: 0.003
+        },
+        7: {
+            1: 0.0005,
+            2: 0.003
+        },
+        8: {
+            1: 0.0005,
+            2: 0.003
+        },
+        9: {
+            1: 0.0005,
+            2: 0.003
+        },
+        10: {
+            1: 0.0005,
+            2: 0.003
+        },
+        11: {
+            2: 0.03,
+            4: 0.02
+        }
+    }
+}
+
 
 def calculate(**attributes):
     """
@@ -59,6 +422,96 @@ def calculate(**attributes):
     return attributes, _msg
 
 
+def calculate_batch(parts):
+    """
+    Calculate the hazard rates for a list of hardware items.
+
+    The results are the same as calling calculate() for each hardware item,
+    but the stress ratios, dormant hazard rates, and adjusted active hazard
+    rates are calculated over NumPy arrays.  Parts count results are looked up
+    once for each unique combination of the PART_COUNT_KEYS attributes.  The
+    part stress models depend on continuous attributes so they are still
+    calculated one hardware item at a time.
+
+    The parts may also be a RAMSTKAttributeRows() list, in which case the
+    attributes are read from and written to its columns directly.
+
+    :param list parts: the list of hardware attribute dicts to calculate.  Each
+                       dict is updated in place.
+    :return: (parts, _msg); the list of hardware attribute dicts with updated
+             values and the error messages, if any.
+    :rtype: (list, str)
+    """
+    if not parts:
+        return parts, ''
+
+    _do_calculate_batch_stress_ratios(parts)
+
+    _hazard_rate_method_id = _get_batch_array(parts, 'hazard_rate_method_id')
+    _lst_keys = _get_batch_keys(parts, PART_COUNT_KEYS)
+    _dic_part_count = {}
+    for _index in np.flatnonzero(_hazard_rate_method_id == 1).tolist():
+        _dic_part_count.setdefault(_lst_keys[_index], []).append(_index)
+    for _index in np.flatnonzero(_hazard_rate_method_id == 2).tolist():
+        _part = parts[_index]
+        _attributes = _part.copy()
+        _results, __ = do_calculate_217f_part_stress(**_attributes)
+        # Only the attributes the model calculated are set on the part.
+        _part.update(
+            dict((_key, _value) for _key, _value in _results.iteritems()
+                 if _value is not _attributes.get(_key, _results)))
+
+    for _indices in _dic_part_count.values():
+        # Results left as None were not set by the parts count calculation so
+        # each hardware item keeps its own value.
+        _attributes = parts[_indices[0]].copy()
+        for _attribute in PART_COUNT_RESULTS:
+            _attributes[_attribute] = None
+        _attributes, __ = do_calculate_217f_part_count(**_attributes)
+        _results = [(_attribute, _attributes[_attribute])
+                    for _attribute in PART_COUNT_RESULTS
+                    if _attributes[_attribute] is not None]
+        for _index in _indices:
+            parts[_index].update(_results)
+
+    _lst_msg = _do_calculate_batch_dormant_hazard_rate(parts)
+
+    _category_id = _get_batch_array(parts, 'category_id')
+    for _index in np.flatnonzero((_category_id > 0)
+                                 & (_category_id < 9)).tolist():
+        _part = parts[_index]
+        _attributes = do_check_overstress(**_part.copy())
+        _part['overstress'] = _attributes['overstress']
+        _part['reason'] = _attributes['reason']
+
+    _hazard_rate = _get_batch_array(parts, 'hazard_rate_active')
+    _add_adj_factor = _get_batch_array(parts, 'add_adj_factor')
+    _mult_adj_factor = _get_batch_array(parts, 'mult_adj_factor')
+    _duty_cycle = _get_batch_array(parts, 'duty_cycle')
+    _quantity = _get_batch_array(parts, 'quantity')
+
+    for _index in np.flatnonzero(_mult_adj_factor <= 0.0):
+        _lst_msg[_index] = _lst_msg[_index] + 'RAMSTK WARNING: ' \
+            'Multiplicative adjustment factor is 0.0 when calculating ' \
+            'hardware item, hardware ID: ' \
+            '{0:d}.\n'.format(parts[_index]['hardware_id'])
+    for _index in np.flatnonzero(_duty_cycle <= 0.0):
+        _lst_msg[_index] = _lst_msg[_index] + 'RAMSTK WARNING: Duty cycle ' \
+            'is 0.0 when calculating hardware item, hardware ID: ' \
+            '{0:d}.\n'.format(parts[_index]['hardware_id'])
+    for _index in np.flatnonzero(_quantity < 1):
+        _lst_msg[_index] = _lst_msg[_index] + 'RAMSTK WARNING: Quantity is ' \
+            'less than 1 when calculating hardware item, hardware ID: ' \
+            '{0:d}.\n'.format(parts[_index]['hardware_id'])
+
+    _hazard_rate = (_hazard_rate + _add_adj_factor) * \
+        (_duty_cycle / 100.0) * _mult_adj_factor * _quantity
+
+    _set_batch_array(parts, 'hazard_rate_active', _hazard_rate)
+
+    return parts, ''.join(_lst_msg)
+
+
 def do_calculate_217f_part_count(**attributes):
     """
     Calculate the part count hazard rate for a hardware item.
@@ -175,376 +628,31 @@ def do_calculate_dormant_hazard_rate(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    # First key is the category ID; second key is the active environment ID;
-    # third key is the dormant environment ID.
-    _dic_hr_dormant = {
-        1: {
-            1: {
-                2: 0.08
-            },
-            2: {
-                2: 0.08
-            },
-            3: {
-                2: 0.08
-            },
-            4: {
-                2: 0.05,
-                3: 0.06
-            },
-            5: {
-                2: 0.05,
-                3: 0.06
-            },
-            6: {
-                1: 0.06,
-                2: 0.04
-            },
-            7: {
-                1: 0.06,
-                2: 0.04
-            },
-            8: {
-                1: 0.06,
-                2: 0.04
-            },
-            9: {
-                1: 0.06,
-                2: 0.04
-            },
-            10: {
-                1: 0.06,
-                2: 0.04
-            },
-            11: {
-                2: 0.3,
-                4: 0.1
-            }
-        },
-        2: {
-            1: {
-                2: [0.04, 0.05]
-            },
-            2: {
-                2: [0.04, 0.05]
-            },
-            3: {
-                2: [0.04, 0.05]
-            },
-            4: {
-                2: [0.03, 0.03],
-                3: [0.04, 0.05]
-            },
-            5: {
-                2: [0.03, 0.03],
-                3: [0.04, 0.05]
-            },
-            6: {
-                1: [0.05, 0.06],
-                2: [0.01, 0.02]
-            },
-            7: {
-                1: [0.05, 0.06],
-                2: [0.01, 0.02]
-            },
-            8: {
-                1: [0.05, 0.06],
-                2: [0.01, 0.02]
-            },
-            9: {
-                1: [0.05, 0.06],
-                2: [0.01, 0.02]
-            },
-            10: {
-                1: [0.05, 0.06],
-                2: [0.01, 0.02]
-            },
-            11: {
-                2: [0.8, 1.0],
-                4: [0.2, 0.2]
-            }
-        },
-        3: {
-            1: {
-                2: 0.2
-            },
-            2: {
-                2: 0.2
-            },
-            3: {
-                2: 0.2
-            },
-            4: {
-                2: 0.06,
-                3: 0.1
-            },
-            5: {
-                2: 0.06,
-                3: 0.1
-            },
-            6: {
-                1: 0.06,
-                2: 0.2
-            },
-            7: {
-                1: 0.06,
-                2: 0.2
-            },
-            8: {
-                1: 0.06,
-                2: 0.2
-            },
-            9: {
-                1: 0.06,
-                2: 0.2
-            },
-            10: {
-                1: 0.06,
-                2: 0.2
-            },
-            11: {
-                2: 1.0,
-                4: 0.5
-            }
-        },
-        4: {
-            1: {
-                2: 0.1
-            },
-            2: {
-                2: 0.1
-            },
-            3: {
-                2: 0.1
-            },
-            4: {
-                2: 0.04,
-                3: 0.1
-            },
-            5: {
-                2: 0.04,
-                3: 0.1
-            },
-            6: {
-                1: 0.1,
-                2: 0.03
-            },
-            7: {
-                1: 0.1,
-                2: 0.03
-            },
-            8: {
-                1: 0.1,
-                2: 0.03
-            },
-            9: {
-                1: 0.1,
-                2: 0.03
-            },
-            10: {
-                1: 0.1,
-                2: 0.03
-            },
-            11: {
-                2: 0.4,
-                4: 0.2
-            }
-        },
-        5: {
-            1: {
-                2: 0.2
-            },
-            2: {
-                2: 0.2
-            },
-            3: {
-                2: 0.2
-            },
-            4: {
-                2: 0.3,
-                3: 0.3
-            },
-            5: {
-                2: 0.3,
-                3: 0.3
-            },
-            6: {
-                1: 0.2,
-                2: 0.2
-            },
-            7: {
-                1: 0.2,
-                2: 0.2
-            },
-            8: {
-                1: 0.2,
-                2: 0.2
-            },
-            9: {
-                1: 0.2,
-                2: 0.2
-            },
-            10: {
-                1: 0.2,
-                2: 0.2
-            },
-            11: {
-                2: 1.0,
-                4: 0.5
-            }
-        },
-        6: {
-            1: {
-                2: 0.2
-            },
-            2: {
-                2: 0.2
-            },
-            3: {
-                2: 0.2
-            },
-            4: {
-                2: 0.08,
-                3: 0.3
-            },
-            5: {
-                2: 0.08,
-                3: 0.3
-            },
-            6: {
-                1: 0.2,
-                2: 0.04
-            },
-            7: {
-                1: 0.2,
-                2: 0.04
-            },
-            8: {
-                1: 0.2,
-                2: 0.04
-            },
-            9: {
-                1: 0.2,
-                2: 0.04
-            },
-            10: {
-                1: 0.2,
-                2: 0.04
-            },
-            11: {
-                2: 0.9,
-                4: 0.4
-            }
-        },
-        7: {
-            1: {
-                2: 0.4
-            },
-            2: {
-                2: 0.4
-            },
-            3: {
-                2: 0.4
-            },
-            4: {
-                2: 0.2,
-                3: 0.4
-            },
-            5: {
-                2: 0.2,
-                3: 0.4
-            },
-            6: {
-                1: 0.2,
-                2: 0.1
-            },
-            7: {
-                1: 0.2,
-                2: 0.1
-            },
-            8: {
-                1: 0.2,
-                2: 0.1
-            },
-            9: {
-                1: 0.2,
-                2: 0.1
-            },
-            10: {
-                1: 0.2,
-                2: 0.1
-            },
-            11: {
-                2: 1.0,
-                4: 0.8
-            }
-        },
-        8: {
-            1: {
-                2: 0.005
-            },
-            2: {
-                2: 0.005
-            },
-            3: {
-                2: 0.005
-            },
-            4: {
-                2: 0.003,
-                3: 0.008
-            },
-            5: {
-                2: 0.003,
-                3: 0.008
-            },
-            6: {
-                1: 0.0005,
-                2: 0.003
-            },
-            7: {
-                1: 0.0005,
-                2: 0.003
-            },
-            8: {
-                1: 0.0005,
-                2: 0.003
-            },
-            9: {
-                1: 0.0005,
-                2: 0.003
-            },
-            10: {
-                1: 0.0005,
-                2: 0.003
-            },
-            11: {
-                2: 0.03,
-                4: 0.02
-            }
-        }
-    }
     _msg = ''
 
     try:
         if attributes['category_id'] == 2:
             # [1, 2] = diodes, else transistors.
             if attributes['subcategory_id'] in [1, 2]:
-                attributes['hazard_rate_dormant'] = \
-                    (_dic_hr_dormant[attributes['category_id']][attributes['environment_active_id']]
-                     [attributes['environment_dormant_id']][0] *
-                     attributes['hazard_rate_active'])
+                attributes['hazard_rate_dormant'] = (
+                    HR_DORMANT[attributes['category_id']][
+                        attributes['environment_active_id']][
+                            attributes['environment_dormant_id']][0] *
+                    attributes['hazard_rate_active'])
             elif attributes['subcategory_id'] in [3, 4, 5, 6, 7, 8, 9]:
-                attributes['hazard_rate_dormant'] = \
-                    (_dic_hr_dormant[attributes['category_id']][attributes['environment_active_id']]
-                     [attributes['environment_dormant_id']][1] *
-                     attributes['hazard_rate_active'])
+                attributes['hazard_rate_dormant'] = (
+                    HR_DORMANT[attributes['category_id']][
+                        attributes['environment_active_id']][
+                            attributes['environment_dormant_id']][1] *
+                    attributes['hazard_rate_active'])
             else:
                 attributes['hazard_rate_dormant'] = 0.0
         else:
-            attributes['hazard_rate_dormant'] = \
-                    (_dic_hr_dormant[attributes['category_id']][attributes['environment_active_id']]
-                     [attributes['environment_dormant_id']] *
-                     attributes['hazard_rate_active'])
+            attributes['hazard_rate_dormant'] = (
+                HR_DORMANT[attributes['category_id']][
+                    attributes['environment_active_id']][
+                        attributes['environment_dormant_id']] *
+                attributes['hazard_rate_active'])
     except KeyError:
         attributes['hazard_rate_dormant'] = 0.0
         _msg = 'RAMSTK ERROR: Unknown active and/or dormant environment ID for ' \
@@ -613,3 +721,182 @@ def do_check_overstress(**attributes):
         attributes = Connection.overstressed(**attributes)
 
     return attributes
+
+
+def _get_batch_array(parts, attribute):
+    """
+    Collect one attribute of a list of hardware items into a NumPy array.
+
+    :param list parts: the list of hardware attribute dicts.
+    :param str attribute: the name of the attribute to collect.
+    :return: _array; the float array of attribute values.
+    :rtype: :class:`numpy.ndarray`
+    """
+    try:
+        return parts.get_column(attribute).astype(float)
+    except AttributeError:
+        return np.array([_part[attribute] for _part in parts], dtype=float)
+
+
+def _get_batch_keys(parts, attributes):
+    """
+    Collect several attributes of a list of hardware items into tuples.
+
+    :param list parts: the list of hardware attribute dicts.
+    :param list attributes: the names of the attributes to collect.
+    :return: _lst_keys; the tuple of attribute values of each hardware item.
+    :rtype: list
+    """
+    try:
+        return zip(*[
+            parts.get_column(_attribute).tolist()
+            for _attribute in attributes
+        ])
+    except AttributeError:
+        return [
+            tuple(_part[_attribute] for _attribute in attributes)
+            for _part in parts
+        ]
+
+
+def _set_batch_array(parts, attribute, values):
+    """
+    Set one attribute of a list of hardware items from a NumPy array.
+
+    :param list parts: the list of hardware attribute dicts.  Each dict is
+                       updated in place.
+    :param str attribute: the name of the attribute to set.
+    :param values: the value of the attribute for each hardware item.
+    :type values: :class:`numpy.ndarray`
+    :return: None
+    :rtype: None
+    """
+    try:
+        parts.set_column(attribute, values)
+    except AttributeError:
+        for _part, _value in zip(parts, values.tolist()):
+            _part[attribute] = _value
+
+
+def _do_calculate_batch_stress_ratios(parts):
+    """
+    Calculate the stress ratios for a list of hardware items.
+
+    Zero rated values are handled the same as do_calculate_stress_ratios().
+
+    :param list parts: the list of hardware attribute dicts.  Each dict is
+                       updated in place.
+    :return: None
+    :rtype: None
+    """
+    _current_rated = _get_batch_array(parts, 'current_rated')
+    _power_rated = _get_batch_array(parts, 'power_rated')
+    _voltage_rated = _get_batch_array(parts, 'voltage_rated')
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        _current_ratio = np.where(
+            _current_rated != 0.0,
+            _get_batch_array(parts, 'current_operating') / _current_rated,
+            _get_batch_array(parts, 'current_ratio'))
+        _power_ratio = np.where(
+            _power_rated != 0.0,
+            _get_batch_array(parts, 'power_operating') / _power_rated, 1.0)
+        _voltage_ratio = np.where(
+            _voltage_rated != 0.0,
+            (_get_batch_array(parts, 'voltage_ac_operating') +
+             _get_batch_array(parts, 'voltage_dc_operating')) /
+            _voltage_rated, 1.0)
+
+    _set_batch_array(parts, 'current_ratio', _current_ratio)
+    _set_batch_array(parts, 'power_ratio', _power_ratio)
+    _set_batch_array(parts, 'voltage_ratio', _voltage_ratio)
+
+
+def _do_calculate_batch_dormant_hazard_rate(parts):
+    """
+    Calculate the dormant hazard rates for a list of hardware items.
+
+    The conversion factor is looked up once for each unique combination of
+    category, subcategory, and active and dormant environment.
+
+    :param list parts: the list of hardware attribute dicts.  Each dict is
+                       updated in place.
+    :return: _lst_msg; the error message, if any, for each hardware item.
+    :rtype: list
+    """
+    _dic_factors = {}
+    _lst_factor = []
+    _lst_no_factor = []
+    _lst_msg = []
+    for _index, _key in enumerate(
+            _get_batch_keys(parts, [
+                'category_id', 'subcategory_id', 'environment_active_id',
+                'environment_dormant_id'
+            ])):
+        try:
+            _factor = _dic_factors[_key]
+        except KeyError:
+            try:
+                _factor = _get_dormant_factor(*_key)
+            except KeyError:
+                _factor = KeyError
+            _dic_factors[_key] = _factor
+
+        if _factor is KeyError:
+            _lst_msg.append(
+                'RAMSTK ERROR: Unknown active and/or dormant environment ID '
+                'for hardware item.  Hardware ID: {0:d}, active environment '
+                'ID: {1:d}, and dormant environment ID: {2:d}.\n'.format(
+                    parts[_index]['hardware_id'], _key[2], _key[3]))
+        else:
+            _lst_msg.append('')
+
+        # Items without a conversion factor get a dormant hazard rate of
+        # exactly 0.0 rather than 0.0 times their active hazard rate.
+        if _factor is None or _factor is KeyError:
+            _lst_factor.append(0.0)
+            _lst_no_factor.append(True)
+        else:
+            _lst_factor.append(_factor)
+            _lst_no_factor.append(False)
+
+    _no_factor = np.array(_lst_no_factor, dtype=bool)
+    _factor = np.array(_lst_factor, dtype=float)
+    _hazard_rate = np.where(
+        _no_factor, 0.0,
+        _factor * _get_batch_array(parts, 'hazard_rate_active'))
+
+    _set_batch_array(parts, 'hazard_rate_dormant', _hazard_rate)
+
+    return _lst_msg
+
+
+def _get_dormant_factor(category_id, subcategory_id, environment_active_id,
+                        environment_dormant_id):
+    """
+    Select the dormant hazard rate conversion factor for a hardware item.
+
+    :param int category_id: the hardware item's category ID.
+    :param int subcategory_id: the hardware item's subcategory ID.
+    :param int environment_active_id: the active environment ID.
+    :param int environment_dormant_id: the dormant environment ID.
+    :return: _factor; the conversion factor or None if the hardware item has
+             no dormant hazard rate.
+    :rtype: float
+    :raise: KeyError if the active or dormant environment ID is unknown.
+    """
+    _factor = None
+
+    if category_id == 2:
+        # [1, 2] = diodes, else transistors.
+        if subcategory_id in [1, 2]:
+            _factor = HR_DORMANT[category_id][environment_active_id][
+                environment_dormant_id][0]
+        elif subcategory_id in [3, 4, 5, 6, 7, 8, 9]:
+            _factor = HR_DORMANT[category_id][environment_active_id][
+                environment_dormant_id][1]
+    else:
+        _factor = HR_DORMANT[category_id][environment_active_id][
+            environment_dormant_id]
+
+    return _factor
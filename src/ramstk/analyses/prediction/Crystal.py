@@ -12,6 +12,23 @@ import gettext
 _ = gettext.gettext
 
 
+# Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
+# Index is the environment ID.
+PART_COUNT_LAMBDA_B = (
+    0.032, 0.096, 0.32, 0.19, 0.51, 0.38, 0.54, 0.70, 0.90, 0.74, 0.016,
+    0.42, 1.0, 16.0
+)
+
+PART_COUNT_PI_Q = (1.0, 2.1)
+
+PART_STRESS_PI_E = (
+    1.0, 3.0, 10.0, 6.0, 16.0, 12.0, 17.0, 22.0, 28.0, 23.0, 0.5, 13.0,
+    32.0, 500.0
+)
+
+PART_STRESS_PI_Q = (1.0, 3.4)
+
+
 def calculate_217f_part_count(**attributes):
     """
     Calculate the part count hazard rate for a crystal.
@@ -23,25 +40,18 @@ def calculate_217f_part_count(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    # Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
-    # Index is the environment ID.
-    _lst_lambda_b = [
-        0.032, 0.096, 0.32, 0.19, 0.51, 0.38, 0.54, 0.70, 0.90, 0.74, 0.016,
-        0.42, 1.0, 16.0
-    ]
-    _lst_piQ = [1.0, 2.1]
     _msg = ''
 
     # Select the base hazard rate.
     try:
-        attributes['lambda_b'] = _lst_lambda_b[
+        attributes['lambda_b'] = PART_COUNT_LAMBDA_B[
             attributes['environment_active_id'] - 1]
     except IndexError:
         attributes['lambda_b'] = 0.0
 
     # Select the piQ.
     try:
-        attributes['piQ'] = _lst_piQ[attributes['quality_id'] - 1]
+        attributes['piQ'] = PART_COUNT_PI_Q[attributes['quality_id'] - 1]
     except IndexError:
         attributes['piQ'] = 0.0
 
@@ -78,11 +88,6 @@ def calculate_217f_part_stress(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    _lst_piE = [
-        1.0, 3.0, 10.0, 6.0, 16.0, 12.0, 17.0, 22.0, 28.0, 23.0, 0.5, 13.0,
-        32.0, 500.0
-    ]
-    _lst_piQ = [1.0, 3.4]
     _msg = ''
 
     # Calculate the base hazard rate.
@@ -95,7 +100,7 @@ def calculate_217f_part_stress(**attributes):
 
     # Determine the quality factor (piQ).
     try:
-        attributes['piQ'] = _lst_piQ[attributes['quality_id'] - 1]
+        attributes['piQ'] = PART_STRESS_PI_Q[attributes['quality_id'] - 1]
     except (KeyError, IndexError):
         attributes['piQ'] = 0.0
 
@@ -105,7 +110,8 @@ def calculate_217f_part_stress(**attributes):
 
     # Determine the environmental factor (piE).
     try:
-        attributes['piE'] = _lst_piE[attributes['environment_active_id'] - 1]
+        attributes['piE'] = PART_STRESS_PI_E[
+            attributes['environment_active_id'] - 1]
     except IndexError:
         attributes['piE'] = 0.0
 
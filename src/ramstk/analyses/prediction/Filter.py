@@ -12,6 +12,35 @@ import gettext
 _ = gettext.gettext
 
 
+# Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
+# Type ID is the key.  Index is the environment ID.
+PART_COUNT_LAMBDA_B = {
+    1: (
+        0.022, 0.044, 0.13, 0.088, 0.20, 0.15, 0.20, 0.24, 0.29, 0.24,
+        0.018, 0.15, 0.33, 2.6
+    ),
+    2: (
+        0.12, 0.24, 0.72, 0.48, 1.1, 0.84, 1.1, 1.3, 1.6, 1.3, 0.096, 0.84,
+        1.8, 1.4
+    ),
+    3: (
+        0.27, 0.54, 1.6, 1.1, 2.4, 1.9, 2.4, 3.0, 3.5, 3.0, 0.22, 1.9, 4.1,
+        32.0
+    )
+}
+
+PART_COUNT_PI_Q = (1.0, 2.9)
+
+PART_STRESS_LAMBDA_B = {1: 0.022, 2: 0.12, 3: 0.12, 4: 0.27}
+
+PART_STRESS_PI_E = (
+    1.0, 2.0, 6.0, 4.0, 9.0, 7.0, 9.0, 11.0, 13.0, 11.0, 0.8, 7.0, 15.0,
+    120.0
+)
+
+PART_STRESS_PI_Q = (1.0, 2.9)
+
+
 def calculate_217f_part_count(**attributes):
     """
     Calculate the part count hazard rate for a filter.
@@ -23,35 +52,18 @@ def calculate_217f_part_count(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    # Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
-    # Type ID is the key.  Index is the environment ID.
-    _dic_lambda_b = {
-        1: [
-            0.022, 0.044, 0.13, 0.088, 0.20, 0.15, 0.20, 0.24, 0.29, 0.24,
-            0.018, 0.15, 0.33, 2.6
-        ],
-        2: [
-            0.12, 0.24, 0.72, 0.48, 1.1, 0.84, 1.1, 1.3, 1.6, 1.3, 0.096, 0.84,
-            1.8, 1.4
-        ],
-        3: [
-            0.27, 0.54, 1.6, 1.1, 2.4, 1.9, 2.4, 3.0, 3.5, 3.0, 0.22, 1.9, 4.1,
-            32.0
-        ]
-    }
-    _lst_piQ = [1.0, 2.9]
     _msg = ''
 
     # Select the base hazard rate.
     try:
-        attributes['lambda_b'] = _dic_lambda_b[attributes['type_id']][
+        attributes['lambda_b'] = PART_COUNT_LAMBDA_B[attributes['type_id']][
             attributes['environment_active_id'] - 1]
     except (KeyError, IndexError):
         attributes['lambda_b'] = 0.0
 
     # Select the piQ.
     try:
-        attributes['piQ'] = _lst_piQ[attributes['quality_id'] - 1]
+        attributes['piQ'] = PART_COUNT_PI_Q[attributes['quality_id'] - 1]
     except IndexError:
         attributes['piQ'] = 0.0
 
@@ -88,17 +100,11 @@ def calculate_217f_part_stress(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    _dic_lambda_b = {1: 0.022, 2: 0.12, 3: 0.12, 4: 0.27}
-    _lst_piE = [
-        1.0, 2.0, 6.0, 4.0, 9.0, 7.0, 9.0, 11.0, 13.0, 11.0, 0.8, 7.0, 15.0,
-        120.0
-    ]
-    _lst_piQ = [1.0, 2.9]
     _msg = ''
 
     # Determine the base hazard rate.
     try:
-        attributes['lambda_b'] = _dic_lambda_b[attributes['type_id']]
+        attributes['lambda_b'] = PART_STRESS_LAMBDA_B[attributes['type_id']]
     except (KeyError, IndexError):
         attributes['lambda_b'] = 0.0
 
@@ -109,7 +115,7 @@ def calculate_217f_part_stress(**attributes):
 
     # Determine the quality factor (piQ).
     try:
-        attributes['piQ'] = _lst_piQ[attributes['quality_id'] - 1]
+        attributes['piQ'] = PART_STRESS_PI_Q[attributes['quality_id'] - 1]
     except (KeyError, IndexError):
         attributes['piQ'] = 0.0
 
@@ -119,7 +125,8 @@ def calculate_217f_part_stress(**attributes):
 
     # Determine the environmental factor (piE).
     try:
-        attributes['piE'] = _lst_piE[attributes['environment_active_id'] - 1]
+        attributes['piE'] = PART_STRESS_PI_E[
+            attributes['environment_active_id'] - 1]
     except IndexError:
         attributes['piE'] = 0.0
 
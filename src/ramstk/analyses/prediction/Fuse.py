@@ -12,6 +12,19 @@ import gettext
 _ = gettext.gettext
 
 
+# Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
+# Index is the environment ID.
+PART_COUNT_LAMBDA_B = (
+    0.01, 0.02, 0.06, 0.05, 0.11, 0.09, 0.12, 0.15, 0.18, 0.18, 0.009, 0.1,
+    0.21, 2.3
+)
+
+PART_STRESS_PI_E = (
+    1.0, 2.0, 8.0, 5.0, 11.0, 9.0, 12.0, 15.0, 18.0, 16.0, 0.9, 10.0, 21.0,
+    230.0
+)
+
+
 def calculate_217f_part_count(**attributes):
     """
     Calculate the part count hazard rate for a fuse.
@@ -23,17 +36,11 @@ def calculate_217f_part_count(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    # Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
-    # Index is the environment ID.
-    _lst_lambda_b = [
-        0.01, 0.02, 0.06, 0.05, 0.11, 0.09, 0.12, 0.15, 0.18, 0.18, 0.009, 0.1,
-        0.21, 2.3
-    ]
     _msg = ''
 
     # Select the base hazard rate.
     try:
-        attributes['lambda_b'] = _lst_lambda_b[
+        attributes['lambda_b'] = PART_COUNT_LAMBDA_B[
             attributes['environment_active_id'] - 1]
     except IndexError:
         attributes['lambda_b'] = 0.0
@@ -64,15 +71,12 @@ def calculate_217f_part_stress(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    _lst_piE = [
-        1.0, 2.0, 8.0, 5.0, 11.0, 9.0, 12.0, 15.0, 18.0, 16.0, 0.9, 10.0, 21.0,
-        230.0
-    ]
     _msg = ''
 
     # Determine the environmental factor (piE).
     try:
-        attributes['piE'] = _lst_piE[attributes['environment_active_id'] - 1]
+        attributes['piE'] = PART_STRESS_PI_E[
+            attributes['environment_active_id'] - 1]
     except IndexError:
         attributes['piE'] = 0.0
 
@@ -14,6 +14,92 @@ from math import exp
 _ = gettext.gettext
 
 
+# Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
+# First key is the subcategory_id.  Current subcategory IDs are:
+#
+#    1. Mechanical
+#    2. Solid-State
+#
+# These keys return a list of base hazard rate lists.  The proper internal
+# list is selected by the type ID.  The hazard rate in to use is selected
+# from the list depending on the active environment.
+PART_COUNT_LAMBDA_B = {
+    1: ((
+        0.13, 0.28, 2.1, 1.1, 3.8, 1.1, 1.4, 1.9, 2.0, 7.0, 0.66, 3.5,
+        10.0, 0.0
+    ), (
+        0.43, 0.89, 6.9, 3.6, 12.0, 3.4, 4.4, 6.2, 6.7, 22.0, 0.21, 11.0,
+        32.0, 0.0
+    ), (
+        0.13, 0.26, 2.1, 1.1, 3.8, 1.1, 1.4, 1.9, 2.0, 7.0, 0.66, 3.5,
+        10.0, 0.0
+    ), (
+        0.11, 0.23, 1.8, 0.92, 3.3, 0.96, 1.2, 2.1, 2.3, 6.5, 0.54, 3.0,
+        9.0, 0.0
+    ), (
+        0.29, 0.60, 4.8, 2.4, 8.2, 2.3, 2.9, 4.1, 4.5, 15.0, 0.14, 7.6,
+        22.0, 0.0
+    ), (
+        0.88, 1.8, 14.0, 7.4, 26.0, 7.1, 9.1, 13.0, 14.0, 46.0, 0.44, 24.0,
+        67.0, 0.0
+    )),
+    2: ((
+        0.40, 1.2, 4.8, 2.4, 6.8, 4.8, 7.6, 8.4, 13.0, 9.2, 0.16, 4.8,
+        13.0, 240.0
+    ), (
+        0.50, 1.5, 6.0, 3.0, 8.5, 5.0, 9.5, 11.0, 16.0, 12.0, 0.20, 5.0,
+        17.0, 300.0
+    ))
+}
+
+# List containing piQ values for parts count method.  The list positions
+# corrspond to the following quality levels:
+#
+#   0. Established reliability (mechanical only)
+#   1. MIL-SPEC
+#   2. Non-MIL
+#
+# The quality_id attribute is used to select the proper value of piQ.
+PART_COUNT_PI_Q = {1: (0.6, 3.0, 9.0), 2: (0.0, 1.0, 4.0)}
+
+PART_STRESS_FACTORS = {
+    1: ((0.00555, 352.0, 15.7), (0.0054, 377.0, 10.4)),
+    2: (0.4, 0.5, 0.5)
+}
+
+PART_STRESS_PI_C = {1: (1.0, 1.5, 1.75, 2.0, 2.5, 3.0, 4.25, 5.5, 8.0)}
+
+PART_STRESS_PI_F = {
+    1: [[[4.0, 8.0], [6.0, 18.0], [1.0, 3.0], [4.0, 8.0], [7.0, 14.0],
+         [7.0, 14.0]]],
+    2:
+    [[[3.0, 6.0], [5.0, 10.0],
+      [6.0, 12.0]], [[5.0, 10.0], [2.0, 6.0], [6.0, 12.0], [100.0, 100.0],
+                     [10.0, 20.0]], [[10.0, 20.0], [100.0, 100.0]],
+     [[6.0, 12.0], [1.0, 3.0]], [[25.0, 0.0], [6.0, 0.0]], [[10.0, 20.0]],
+     [[9.0, 12.0]], [[10.0, 20.0], [5.0, 10.0], [5.0, 10.0]]],
+    3: [[[20.0, 40.0], [5.0, 10.0]], [[3.0, 6.0], [1.0, 3.0], [2.0, 6.0],
+                                      [3.0, 6.0], [2.0, 6.0], [2.0, 6.0]]],
+    4: [[[7.0, 14.0], [12.0, 24.0], [10.0, 20.0], [5.0, 10.0]]]
+}
+
+PART_STRESS_PI_Q = {1: (0.1, 0.3, 0.45, 0.6, 1.0, 1.5, 3.0), 2: (1.0, 4.0)}
+
+PART_STRESS_PI_E = {
+    1: ((
+        1.0, 2.0, 15.0, 8.0, 27.0, 7.0, 9.0, 11.0, 12.0, 46.0, 0.50, 25.0,
+        66.0, 0.0
+    ), (
+        2.0, 5.0, 44.0, 24.0, 78.0, 15.0, 20.0, 28.0, 38.0, 140.0, 1.0,
+        72.0, 200.0, 0.0
+    )),
+    2: (
+        1.0, 3.0, 12.0, 6.0, 17.0, 12.0, 19.0, 21.0, 32.0, 23.0, 0.4, 12.0,
+        33.0, 590.0
+    )
+}
+
+
 def calculate_217f_part_count(**attributes):
     """
     Calculate the part count hazard rate for a relay.
@@ -27,57 +113,9 @@ def calculate_217f_part_count(**attributes):
     """
     _msg = ''
 
-    # Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
-    # First key is the subcategory_id.  Current subcategory IDs are:
-    #
-    #    1. Mechanical
-    #    2. Solid-State
-    #
-    # These keys return a list of base hazard rate lists.  The proper internal
-    # list is selected by the type ID.  The hazard rate in to use is selected
-    # from the list depending on the active environment.
-    _dic_lambda_b = {
-        1: [[
-            0.13, 0.28, 2.1, 1.1, 3.8, 1.1, 1.4, 1.9, 2.0, 7.0, 0.66, 3.5,
-            10.0, 0.0
-        ], [
-            0.43, 0.89, 6.9, 3.6, 12.0, 3.4, 4.4, 6.2, 6.7, 22.0, 0.21, 11.0,
-            32.0, 0.0
-        ], [
-            0.13, 0.26, 2.1, 1.1, 3.8, 1.1, 1.4, 1.9, 2.0, 7.0, 0.66, 3.5,
-            10.0, 0.0
-        ], [
-            0.11, 0.23, 1.8, 0.92, 3.3, 0.96, 1.2, 2.1, 2.3, 6.5, 0.54, 3.0,
-            9.0, 0.0
-        ], [
-            0.29, 0.60, 4.8, 2.4, 8.2, 2.3, 2.9, 4.1, 4.5, 15.0, 0.14, 7.6,
-            22.0, 0.0
-        ], [
-            0.88, 1.8, 14.0, 7.4, 26.0, 7.1, 9.1, 13.0, 14.0, 46.0, 0.44, 24.0,
-            67.0, 0.0
-        ]],
-        2: [[
-            0.40, 1.2, 4.8, 2.4, 6.8, 4.8, 7.6, 8.4, 13.0, 9.2, 0.16, 4.8,
-            13.0, 240.0
-        ], [
-            0.50, 1.5, 6.0, 3.0, 8.5, 5.0, 9.5, 11.0, 16.0, 12.0, 0.20, 5.0,
-            17.0, 300.0
-        ]]
-    }
-
-    # List containing piQ values for parts count method.  The list positions
-    # corrspond to the following quality levels:
-    #
-    #   0. Established reliability (mechanical only)
-    #   1. MIL-SPEC
-    #   2. Non-MIL
-    #
-    # The quality_id attribute is used to select the proper value of piQ.
-    _dic_piQ = {1: [0.6, 3.0, 9.0], 2: [0.0, 1.0, 4.0]}
-
     # Select the base hazard rate.
     try:
-        _lst_base_hr = _dic_lambda_b[attributes['subcategory_id']][
+        _lst_base_hr = PART_COUNT_LAMBDA_B[attributes['subcategory_id']][
             attributes['type_id'] - 1]
     except (KeyError, IndexError):
         _lst_base_hr = [0.0]
@@ -90,7 +128,7 @@ def calculate_217f_part_count(**attributes):
 
     # Select the piQ.
     try:
-        attributes['piQ'] = _dic_piQ[attributes['subcategory_id']][
+        attributes['piQ'] = PART_COUNT_PI_Q[attributes['subcategory_id']][
             attributes['quality_id'] - 1]
     except (KeyError, IndexError):
         attributes['piQ'] = 0.0
@@ -131,53 +169,21 @@ def calculate_217f_part_stress(**attributes):  # pylint: disable=R0912
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    _dic_factors = {
-        1: [[0.00555, 352.0, 15.7], [0.0054, 377.0, 10.4]],
-        2: [0.4, 0.5, 0.5]
-    }
-    _dic_piC = {1: [1.0, 1.5, 1.75, 2.0, 2.5, 3.0, 4.25, 5.5, 8.0]}
-    _dic_piF = {
-        1: [[[4.0, 8.0], [6.0, 18.0], [1.0, 3.0], [4.0, 8.0], [7.0, 14.0],
-             [7.0, 14.0]]],
-        2:
-        [[[3.0, 6.0], [5.0, 10.0],
-          [6.0, 12.0]], [[5.0, 10.0], [2.0, 6.0], [6.0, 12.0], [100.0, 100.0],
-                         [10.0, 20.0]], [[10.0, 20.0], [100.0, 100.0]],
-         [[6.0, 12.0], [1.0, 3.0]], [[25.0, 0.0], [6.0, 0.0]], [[10.0, 20.0]],
-         [[9.0, 12.0]], [[10.0, 20.0], [5.0, 10.0], [5.0, 10.0]]],
-        3: [[[20.0, 40.0], [5.0, 10.0]], [[3.0, 6.0], [1.0, 3.0], [2.0, 6.0],
-                                          [3.0, 6.0], [2.0, 6.0], [2.0, 6.0]]],
-        4: [[[7.0, 14.0], [12.0, 24.0], [10.0, 20.0], [5.0, 10.0]]]
-    }
-    _dic_piQ = {1: [0.1, 0.3, 0.45, 0.6, 1.0, 1.5, 3.0], 2: [1.0, 4.0]}
-    _dic_piE = {
-        1: [[
-            1.0, 2.0, 15.0, 8.0, 27.0, 7.0, 9.0, 11.0, 12.0, 46.0, 0.50, 25.0,
-            66.0, 0.0
-        ], [
-            2.0, 5.0, 44.0, 24.0, 78.0, 15.0, 20.0, 28.0, 38.0, 140.0, 1.0,
-            72.0, 200.0, 0.0
-        ]],
-        2: [
-            1.0, 3.0, 12.0, 6.0, 17.0, 12.0, 19.0, 21.0, 32.0, 23.0, 0.4, 12.0,
-            33.0, 590.0
-        ]
-    }
     _msg = ''
 
     # Calculate the base hazard rate.
     if attributes['subcategory_id'] == 1:
-        _f0 = _dic_factors[attributes['subcategory_id']][attributes['type_id']
-                                                         - 1][0]
-        _f1 = _dic_factors[attributes['subcategory_id']][attributes['type_id']
-                                                         - 1][1]
-        _f2 = _dic_factors[attributes['subcategory_id']][attributes['type_id']
-                                                         - 1][2]
+        _f0 = PART_STRESS_FACTORS[attributes['subcategory_id']][
+            attributes['type_id'] - 1][0]
+        _f1 = PART_STRESS_FACTORS[attributes['subcategory_id']][
+            attributes['type_id'] - 1][1]
+        _f2 = PART_STRESS_FACTORS[attributes['subcategory_id']][
+            attributes['type_id'] - 1][2]
         attributes['lambda_b'] = _f0 * exp(
             ((attributes['temperature_active'] + 273.0) / _f1)**_f2)
     elif attributes['subcategory_id'] == 2:
-        attributes['lambda_b'] = _dic_factors[attributes['subcategory_id']][
-            attributes['type_id'] - 1]
+        attributes['lambda_b'] = PART_STRESS_FACTORS[
+            attributes['subcategory_id']][attributes['type_id'] - 1]
     else:
         attributes['lambda_b'] = 0.0
 
@@ -199,7 +205,7 @@ def calculate_217f_part_stress(**attributes):  # pylint: disable=R0912
 
     # Determine the contact form factor (piC).
     if attributes['subcategory_id'] == 1:
-        attributes['piC'] = _dic_piC[attributes['subcategory_id']][
+        attributes['piC'] = PART_STRESS_PI_C[attributes['subcategory_id']][
             attributes['contact_form_id'] - 1]
 
     # Determine cycling factor (piCYC).
@@ -221,13 +227,13 @@ def calculate_217f_part_stress(**attributes):  # pylint: disable=R0912
             _quality = 0
         else:
             _quality = 1
-        attributes['piF'] = _dic_piF[attributes['contact_rating_id']][
+        attributes['piF'] = PART_STRESS_PI_F[attributes['contact_rating_id']][
             attributes['application_id'] - 1][attributes['construction_id'] -
                                               1][_quality]
 
     # Determine the quality factor (piQ).
     try:
-        attributes['piQ'] = _dic_piQ[attributes['subcategory_id']][
+        attributes['piQ'] = PART_STRESS_PI_Q[attributes['subcategory_id']][
             attributes['quality_id'] - 1]
     except (KeyError, IndexError):
         attributes['piQ'] = 0.0
@@ -239,14 +245,14 @@ def calculate_217f_part_stress(**attributes):  # pylint: disable=R0912
     # Determine the environmental factor (piE).
     if attributes['subcategory_id'] == 1:
         try:
-            attributes['piE'] = _dic_piE[1][_quality][
+            attributes['piE'] = PART_STRESS_PI_E[1][_quality][
                 attributes['environment_active_id'] - 1]
         except IndexError:
             attributes['piE'] = 0.0
     else:
         try:
-            attributes['piE'] = _dic_piE[2][attributes['environment_active_id']
-                                            - 1]
+            attributes['piE'] = PART_STRESS_PI_E[2][
+                attributes['environment_active_id'] - 1]
         except (KeyError, IndexError):
             attributes['piE'] = 0.0
 
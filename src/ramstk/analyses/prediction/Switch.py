@@ -14,6 +14,78 @@ from math import exp
 _ = gettext.gettext
 
 
+# Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
+# First key is the subcategory_id.  Current subcategory IDs are:
+#
+#    1. Toggle or pushbutton
+#    2. Sensitive
+#    3. Rotary
+#    4. Thumbwheel
+#    5. Circuit breaker
+#
+# These keys return a list of base hazard rates.  The hazard rate to use is
+# selected from the list depending on the active environment.
+PART_COUNT_LAMBDA_B = {
+    1: (
+        0.0010, 0.0030, 0.018, 0.0080, 0.029, 0.010, 0.018, 0.013, 0.022,
+        0.046, 0.0005, 0.025, 0.067, 1.2
+    ),
+    2: (
+        0.15, 0.44, 2.7, 1.2, 4.3, 1.5, 2.7, 1.9, 3.3, 6.8, 0.74, 3.7, 9.9,
+        180.0
+    ),
+    3: (
+        0.33, 0.99, 5.9, 2.6, 9.5, 3.3, 5.9, 4.3, 7.2, 15.0, 0.16, 8.2,
+        22.0, 390.0
+    ),
+    4: (
+        0.56, 1.7, 10.0, 4.5, 16.0, 5.6, 10.0, 7.3, 12.0, 26.0, 0.26, 14.0,
+        38.0, 670.0
+    ),
+    5: {
+        1: (
+            0.11, 0.23, 1.7, 0.91, 3.1, 0.8, 1.0, 1.3, 1.4, 5.2, 0.057,
+            2.8, 7.5, 0.0
+        ),
+        2: (
+            0.060, 0.12, 0.90, 0.48, 1.6, 0.42, 0.54, 0.66, 0.72, 2.8,
+            0.030, 1.5, 4.0, 0.0
+        )
+    }
+}
+
+# List containing piQ values for parts count method.  The list positions
+# corrspond to the following quality levels:
+#
+#   0. MIL-SPEC
+#   1. Non-MIL
+#
+# The quality_id attribute is used to select the proper value of piQ.
+PART_COUNT_PI_Q = {
+    1: (1.0, 20.0),
+    2: (1.0, 20.0),
+    3: (1.0, 50.0),
+    4: (1.0, 10.0),
+    5: (1.0, 8.4)
+}
+
+PART_STRESS_FACTORS = {
+    2: ((0.1, 0.00045, 0.0009), (0.1, 0.23, 0.63)),
+    3: ((0.0067, 0.00003, 0.00003), (0.1, 0.02, 0.06)),
+    4: ((0.0067, 0.062), (0.086, 0.089))
+}
+
+PART_STRESS_LAMBDA_B = {
+    1: ((0.00045, 0.034), (0.0027, 0.04)),
+    5: (0.02, 0.038, 0.038)
+}
+
+PART_STRESS_PI_C = {
+    1: (1.0, 1.5, 1.7, 2.0, 2.5, 3.0, 4.2, 5.5, 8.0),
+    5: (1.0, 2.0, 3.0, 4.0)
+}
+
+
 def calculate_217f_part_count(**attributes):
     """
     Calculate the part count hazard rate for a switch.
@@ -27,68 +99,13 @@ def calculate_217f_part_count(**attributes):
     """
     _msg = ''
 
-    # Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
-    # First key is the subcategory_id.  Current subcategory IDs are:
-    #
-    #    1. Toggle or pushbutton
-    #    2. Sensitive
-    #    3. Rotary
-    #    4. Thumbwheel
-    #    5. Circuit breaker
-    #
-    # These keys return a list of base hazard rates.  The hazard rate to use is
-    # selected from the list depending on the active environment.
-    _dic_lambda_b = {
-        1: [
-            0.0010, 0.0030, 0.018, 0.0080, 0.029, 0.010, 0.018, 0.013, 0.022,
-            0.046, 0.0005, 0.025, 0.067, 1.2
-        ],
-        2: [
-            0.15, 0.44, 2.7, 1.2, 4.3, 1.5, 2.7, 1.9, 3.3, 6.8, 0.74, 3.7, 9.9,
-            180.0
-        ],
-        3: [
-            0.33, 0.99, 5.9, 2.6, 9.5, 3.3, 5.9, 4.3, 7.2, 15.0, 0.16, 8.2,
-            22.0, 390.0
-        ],
-        4: [
-            0.56, 1.7, 10.0, 4.5, 16.0, 5.6, 10.0, 7.3, 12.0, 26.0, 0.26, 14.0,
-            38.0, 670.0
-        ],
-        5: {
-            1: [
-                0.11, 0.23, 1.7, 0.91, 3.1, 0.8, 1.0, 1.3, 1.4, 5.2, 0.057,
-                2.8, 7.5, 0.0
-            ],
-            2: [
-                0.060, 0.12, 0.90, 0.48, 1.6, 0.42, 0.54, 0.66, 0.72, 2.8,
-                0.030, 1.5, 4.0, 0.0
-            ]
-        }
-    }
-
-    # List containing piQ values for parts count method.  The list positions
-    # corrspond to the following quality levels:
-    #
-    #   0. MIL-SPEC
-    #   1. Non-MIL
-    #
-    # The quality_id attribute is used to select the proper value of piQ.
-    _dic_piQ = {
-        1: [1.0, 20.0],
-        2: [1.0, 20.0],
-        3: [1.0, 50.0],
-        4: [1.0, 10.0],
-        5: [1.0, 8.4]
-    }
-
     # Select the base hazard rate.
     try:
         if attributes['subcategory_id'] == 5:
-            _lst_base_hr = _dic_lambda_b[attributes['subcategory_id']][
+            _lst_base_hr = PART_COUNT_LAMBDA_B[attributes['subcategory_id']][
                 attributes['construction_id']]
         else:
-            _lst_base_hr = _dic_lambda_b[attributes['subcategory_id']]
+            _lst_base_hr = PART_COUNT_LAMBDA_B[attributes['subcategory_id']]
     except KeyError:
         _lst_base_hr = [0.0]
 
@@ -100,7 +117,7 @@ def calculate_217f_part_count(**attributes):
 
     # Select the piQ.
     try:
-        attributes['piQ'] = _dic_piQ[attributes['subcategory_id']][
+        attributes['piQ'] = PART_COUNT_PI_Q[attributes['subcategory_id']][
             attributes['quality_id'] - 1]
     except (KeyError, IndexError):
         attributes['piQ'] = 0.0
@@ -142,32 +159,19 @@ def calculate_217f_part_stress(**attributes):  # pylint: disable=R0912
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    _dic_factors = {
-        2: [[0.1, 0.00045, 0.0009], [0.1, 0.23, 0.63]],
-        3: [[0.0067, 0.00003, 0.00003], [0.1, 0.02, 0.06]],
-        4: [[0.0067, 0.062], [0.086, 0.089]]
-    }
-    _dic_lambda_b = {
-        1: [[0.00045, 0.034], [0.0027, 0.04]],
-        5: [0.02, 0.038, 0.038]
-    }
-    _dic_piC = {
-        1: [1.0, 1.5, 1.7, 2.0, 2.5, 3.0, 4.2, 5.5, 8.0],
-        5: [1.0, 2.0, 3.0, 4.0]
-    }
     _msg = ''
 
     # Calculate the base hazard rate.
     if attributes['subcategory_id'] == 1:
-        attributes['lambda_b'] = _dic_lambda_b[1][attributes[
+        attributes['lambda_b'] = PART_STRESS_LAMBDA_B[1][attributes[
             'construction_id']][attributes['quality_id'] - 1]
     elif attributes['subcategory_id'] in [2, 3]:
         try:
-            _lambda_bE = _dic_factors[attributes['subcategory_id']][
+            _lambda_bE = PART_STRESS_FACTORS[attributes['subcategory_id']][
                 attributes['quality_id'] - 1][0]
-            _lambda_bC = _dic_factors[attributes['subcategory_id']][
+            _lambda_bC = PART_STRESS_FACTORS[attributes['subcategory_id']][
                 attributes['quality_id'] - 1][1]
-            _lambda_b0 = _dic_factors[attributes['subcategory_id']][
+            _lambda_b0 = PART_STRESS_FACTORS[attributes['subcategory_id']][
                 attributes['quality_id'] - 1][2]
         except (IndexError, KeyError):
             _lambda_bE = 0.0
@@ -181,9 +185,9 @@ def calculate_217f_part_stress(**attributes):  # pylint: disable=R0912
                 _lambda_bE + attributes['n_elements'] * _lambda_b0)
     elif attributes['subcategory_id'] == 4:
         try:
-            _lambda_b1 = _dic_factors[attributes['subcategory_id']][
+            _lambda_b1 = PART_STRESS_FACTORS[attributes['subcategory_id']][
                 attributes['quality_id'] - 1][0]
-            _lambda_b2 = _dic_factors[attributes['subcategory_id']][
+            _lambda_b2 = PART_STRESS_FACTORS[attributes['subcategory_id']][
                 attributes['quality_id'] - 1][1]
         except (IndexError, KeyError):
             _lambda_b1 = 0.0
@@ -191,7 +195,8 @@ def calculate_217f_part_stress(**attributes):  # pylint: disable=R0912
         attributes['lambda_b'] = (
             _lambda_b1 + attributes['n_elements'] * _lambda_b2)
     elif attributes['subcategory_id'] == 5:
-        attributes['lambda_b'] = _dic_lambda_b[5][attributes['application_id']]
+        attributes['lambda_b'] = PART_STRESS_LAMBDA_B[5][
+            attributes['application_id']]
     else:
         attributes['lambda_b'] = 0.0
 
@@ -247,8 +252,8 @@ def calculate_217f_part_stress(**attributes):  # pylint: disable=R0912
 
     # Determine the contact form and quantity factor (piC).
     if attributes['subcategory_id'] in [1, 5]:
-        attributes['piC'] = _dic_piC[attributes['subcategory_id']][attributes[
-            'contact_form_id']]
+        attributes['piC'] = PART_STRESS_PI_C[attributes['subcategory_id']][
+            attributes['contact_form_id']]
 
     # Determine the use factor (piU).
     if attributes['subcategory_id'] == 5:
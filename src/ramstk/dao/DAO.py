@@ -7,16 +7,17 @@
 """Data Access Object (DAO) Package."""
 
 import gettext
+from binascii import hexlify
+from io import BytesIO
 
-from sqlalchemy import create_engine, exc, MetaData
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, exc, LargeBinary, MetaData
+from sqlalchemy.engine.url import URL, make_url
+from sqlalchemy.orm import object_mapper, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 # Import tables objects for the RAMSTK Common database.
-from .RAMSTKCommonDB import create_common_db
-from .RAMSTKProgramDB import create_program_db
-
-RAMSTK_BASE = declarative_base()
+from .RAMSTKCommonDB import RAMSTK_BASE, create_common_db
+from .RAMSTKProgramDB import create_program_db, create_program_indices
 
 # Add localization support.
 _ = gettext.gettext
@@ -32,6 +33,37 @@ class DAO(object):
 
     RAMSTK_SESSION = sessionmaker()
 
+    # The PRAGMAs run on every new connection to an SQLite database file.
+    # WAL lets readers work while a transaction is being written and makes
+    # each commit an append to the log.  NORMAL synchronous is still safe in
+    # WAL mode.  The cache (in KiB when negative) and the memory map keep the
+    # pages of a large program in memory across queries.
+    SQLITE_PRAGMAS = (
+        ('journal_mode', 'WAL'),
+        ('synchronous', 'NORMAL'),
+        ('cache_size', -65536),
+        ('mmap_size', 268435456),
+        ('temp_store', 'MEMORY'),
+    )
+
+    # The connections to an SQLite database file are pooled so the PRAGMAs
+    # and the page cache outlive each session.  Each session needs its own
+    # connection so one session's rollback can't undo another's unit of
+    # work.  SQLite writes one transaction at a time, so only a few
+    # connections are kept open and a session waits for one to be returned
+    # rather than opening more than SQLITE_MAX_OVERFLOW extra.
+    SQLITE_POOL_SIZE = 5
+    SQLITE_MAX_OVERFLOW = 25
+
+    # The connections to a PostgreSQL server are pooled and shared by every
+    # session of the DAO.  Each connection is pinged before it is checked out
+    # and replaced after POSTGRES_POOL_RECYCLE seconds so a server restart or
+    # an idle timeout doesn't surface as an error in the middle of an
+    # analysis.
+    POSTGRES_POOL_SIZE = 10
+    POSTGRES_MAX_OVERFLOW = 20
+    POSTGRES_POOL_RECYCLE = 3600
+
     # Define public class scalar attributes.
     engine = None
     metadata = None
@@ -46,6 +78,10 @@ class DAO(object):
         # Initialize private list instance attributes.
 
         # Initialize private scalar instance attributes.
+        # The session shared by every data model write between db_begin() and
+        # db_commit() and the number of db_begin() calls still open.
+        self._unit_of_work = None
+        self._uow_depth = 0
 
         # Initialize public dictionary instance attributes.
 
@@ -53,18 +89,57 @@ class DAO(object):
 
         # Initialize public scalar instance attributes.
 
-    def db_connect(self, database):
+    def db_connect(self, database, **kwargs):
         """
         Connect to the database using settings from the configuration file.
 
         :param str database: the absolute path to the database to connect to.
+        :keyword int pool_size: the number of connections to keep open to a
+                                PostgreSQL server.
+        :keyword int max_overflow: the number of connections to a PostgreSQL
+                                   server that may be opened beyond the
+                                   pool_size.
+        :keyword bool program: whether the database is a RAMSTK Program
+                               database.  Any missing secondary indices are
+                               added to a RAMSTK Program database when it is
+                               opened.  Default is False.
         :return: False if successful, True if an error occurs.
         :rtype: bool
         """
         self.database = database
-        self.engine = create_engine(self.database, echo=False)
+
+        _url = make_url(self.database)
+        if (_url.get_backend_name() == 'sqlite'
+                and _url.database not in [None, '', ':memory:']):
+            self.engine = create_engine(
+                self.database,
+                echo=False,
+                poolclass=QueuePool,
+                pool_size=self.SQLITE_POOL_SIZE,
+                max_overflow=self.SQLITE_MAX_OVERFLOW,
+                connect_args={'check_same_thread': False})
+            event.listen(self.engine, 'connect', self._do_set_pragmas)
+        elif _url.get_backend_name() == 'postgresql':
+            self.engine = create_engine(
+                self.database,
+                echo=False,
+                poolclass=QueuePool,
+                pool_size=kwargs.get('pool_size', self.POSTGRES_POOL_SIZE),
+                max_overflow=kwargs.get('max_overflow',
+                                        self.POSTGRES_MAX_OVERFLOW),
+                pool_recycle=self.POSTGRES_POOL_RECYCLE,
+                pool_pre_ping=True)
+        else:
+            self.engine = create_engine(self.database, echo=False)
         self.metadata = MetaData(self.engine)
 
+        # Bring older RAMSTK Program databases up to date.
+        if kwargs.get('program', False):
+            try:
+                create_program_indices(self.engine)
+            except (exc.SQLAlchemyError, exc.DBAPIError) as error:
+                print error
+
         self.session = self.RAMSTK_SESSION(
             bind=self.engine,
             autoflush=True,
@@ -73,6 +148,50 @@ class DAO(object):
 
         return False
 
+    @staticmethod
+    def db_get_uri(backend, info):
+        """
+        Build the RFC1738 URL of a database from its connection information.
+
+        :param str backend: the database backend to use; sqlite, postgres, or
+                            postgresql.
+        :param dict info: the connection information; RAMSTK_COM_INFO or
+                          RAMSTK_PROG_INFO from the Configuration.
+        :return: the URL of the database or None if the backend isn't
+                 supported.
+        :rtype: str
+        """
+        _uri = None
+
+        if backend == 'sqlite':
+            _uri = backend + ':///' + info['database']
+        elif backend in ['postgres', 'postgresql']:
+            _port = info.get('socket', None)
+            _uri = str(
+                URL('postgresql+psycopg2',
+                    username=info.get('user', None) or None,
+                    password=info.get('password', None) or None,
+                    host=info.get('host', None) or None,
+                    port=int(_port) if _port else None,
+                    database=info['database']))
+
+        return _uri
+
+    @staticmethod
+    def _do_set_pragmas(connection, record):  # pylint: disable=unused-argument
+        """
+        Apply the SQLITE_PRAGMAS to a new SQLite connection.
+
+        :param connection: the DBAPI connection that was just opened.
+        :param record: the SQLAlchemy pool record of the connection.
+        :return: None
+        :rtype: None
+        """
+        _cursor = connection.cursor()
+        for _pragma, _value in DAO.SQLITE_PRAGMAS:
+            _cursor.execute('PRAGMA {0:s}={1!s}'.format(_pragma, _value))
+        _cursor.close()
+
     def db_close(self):
         """
         Close the current session.
@@ -80,6 +199,10 @@ class DAO(object):
         :return: False if successful, True if an error occurs.
         :rtype: bool
         """
+        if self._unit_of_work is not None:
+            self._unit_of_work.close()
+            self._unit_of_work = None
+            self._uow_depth = 0
         self.session.close()
         self.RAMSTK_SESSION.close_all()
         self.engine.dispose()
@@ -90,6 +213,128 @@ class DAO(object):
 
         return False
 
+    def db_begin(self):
+        """
+        Begin a unit of work.
+
+        Until the matching db_commit(), db_get_session() returns the same
+        session to every data model.  Inserts, updates, and deletes are
+        flushed as they are made so new records get their IDs and errors are
+        reported where they occur, but nothing is committed until the unit of
+        work is.  Calls may be nested; only the outermost db_commit()
+        commits.
+
+        :return: the SQLAlchemy session of the unit of work.
+        :rtype: :class:`sqlalchemy.orm.Session`
+        """
+        if self._unit_of_work is None:
+            self._unit_of_work = self.RAMSTK_SESSION(
+                bind=self.engine,
+                autoflush=True,
+                autocommit=False,
+                expire_on_commit=False,
+                info={
+                    'unit_of_work': True,
+                    'rolled_back': False
+                })
+        self._uow_depth += 1
+
+        return self._unit_of_work
+
+    def db_commit(self):
+        """
+        Commit the unit of work started with db_begin().
+
+        :return: (_error_code, _msg); the error code and associated error
+                                      message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = "RAMSTK SUCCESS: Updating the RAMSTK Program database."
+
+        if self._unit_of_work is None:
+            return _error_code, _msg
+
+        self._uow_depth -= 1
+        if self._uow_depth > 0:
+            return _error_code, _msg
+
+        _session = self._unit_of_work
+        self._unit_of_work = None
+
+        try:
+            _session.commit()
+        except (exc.SQLAlchemyError, exc.DBAPIError) as error:
+            print error
+            _session.rollback()
+            _session.info['rolled_back'] = True
+
+        # A failed flush rolls back everything done before it in the unit of
+        # work, so the unit of work failed even if the commit didn't.
+        if _session.info['rolled_back']:
+            _error_code = 1
+            _msg = "RAMSTK ERROR: Updating the RAMSTK Program database."
+
+        _session.close()
+
+        return _error_code, _msg
+
+    def db_get_session(self, **kwargs):
+        """
+        Retrieve a session for writing to the RAMSTK Program database.
+
+        :return: the session of the unit of work if one has begun, otherwise
+                 a new session created with the keyword arguments passed.
+        :rtype: :class:`sqlalchemy.orm.Session`
+        """
+        if self._unit_of_work is not None:
+            return self._unit_of_work
+
+        return self.RAMSTK_SESSION(bind=self.engine, **kwargs)
+
+    def db_close_session(self, session):
+        """
+        Close a session retrieved with db_get_session().
+
+        The session of a unit of work is left open until db_commit().
+
+        :param session: the session to close.
+        :type session: :class:`sqlalchemy.orm.Session`
+        :return: None
+        :rtype: None
+        """
+        if session is not self._unit_of_work:
+            session.close()
+
+    @staticmethod
+    def _db_commit(session):
+        """
+        Commit the session or, in a unit of work, flush it.
+
+        :param session: the SQLAlchemy session to commit.
+        :type session: :class:`sqlalchemy.orm.Session`
+        :return: None
+        :rtype: None
+        """
+        if session.info.get('unit_of_work', False):
+            session.flush()
+        else:
+            session.commit()
+
+    @staticmethod
+    def _db_rollback(session):
+        """
+        Roll back the session and note it if the session is a unit of work.
+
+        :param session: the SQLAlchemy session to roll back.
+        :type session: :class:`sqlalchemy.orm.Session`
+        :return: None
+        :rtype: None
+        """
+        session.rollback()
+        if session.info.get('unit_of_work', False):
+            session.info['rolled_back'] = True
+
     def _db_table_create(self, table):
         """
         Check if the passed table exists and create it if not.
@@ -154,11 +399,52 @@ class DAO(object):
             print "Bad program database URI: {0:s}".format(database)
             return True
 
+    @staticmethod
+    def _get_add_error(error):
+        """
+        Convert an exception raised while adding an item to an error code.
+
+        :param error: the exception raised while adding the item.
+        :return: (_error_code, _msg); the error code and associated error
+                                      message.
+        :rtype: (int, str)
+        """
+        _error = '{0:s}'.format(error)
+
+        if isinstance(error, ValueError):
+            _error_code = 4
+            _msg = ('RAMSTK ERROR: Date field did not contain Python '
+                    'date object: {0:s}').format(_error)
+        elif 'Could not locate a bind' in _error:
+            _error_code = 2
+            _msg = ('RAMSTK ERROR: No database open when attempting '
+                    'to insert record.')
+        elif ('PRIMARY KEY must be unique' in _error
+              or 'UNIQUE constraint failed:' in _error
+              or 'duplicate key value violates unique constraint' in _error):
+            _error_code = 3
+            _msg = ('RAMSTK ERROR: Primary key error: '
+                    '{0:s}').format(_error)
+        elif 'Date type only accepts Python date objects as input' in _error:
+            _error_code = 4
+            _msg = ('RAMSTK ERROR: Date field did not contain Python '
+                    'date object: {0:s}').format(_error)
+        else:
+            print _error
+            _error_code = 1
+            _msg = ('RAMSTK ERROR: Adding one or more items to the RAMSTK '
+                    'Program database.')
+
+        return _error_code, _msg
+
     @staticmethod
     def db_add(item, session):
         """
         Add a new item to the RAMSTK Program database.
 
+        Each item is committed individually.  Use db_add_many() to add a large
+        number of items in a single transaction.
+
         :param item: the object to add to the RAMSTK Program database.
         :param session: the SQLAlchemy scoped_session instance used to
                         communicate with the RAMSTK Program database.
@@ -170,37 +456,187 @@ class DAO(object):
         _error_code = 0
         _msg = "RAMSTK SUCCESS: Adding one or more items to the RAMSTK Program " \
                "database."
-        # TODO: Determine if the add_many option can work with Foreign Keys.
+
         for _item in item:
             try:
                 session.add(_item)
-                session.commit()
-            except (exc.SQLAlchemyError, exc.DBAPIError) as error:
-                _error = '{0:s}'.format(error)
-                session.rollback()
-                if 'Could not locate a bind' in _error:
-                    _error_code = 2
-                    _msg = ('RAMSTK ERROR: No database open when attempting '
-                            'to insert record.')
-                elif ('PRIMARY KEY must be unique' in _error) or (
-                        'UNIQUE constraint failed:' in _error):
-                    _error_code = 3
-                    _msg = ('RAMSTK ERROR: Primary key error: '
-                            '{0:s}').format(_error)
-                elif 'Date type only accepts Python date objects as input' in _error:
-                    _error_code = 4
-                    _msg = ('RAMSTK ERROR: Date field did not contain Python '
-                            'date object: {0:s}').format(_error)
-                else:
-                    print _error
-                    _error_code = 1
-                    _msg = (
-                        'RAMSTK ERROR: Adding one or more items to the RAMSTK '
-                        'Program database.')
+                DAO._db_commit(session)
+            except (exc.SQLAlchemyError, exc.DBAPIError) as _error:
+                DAO._db_rollback(session)
+                _error_code, _msg = DAO._get_add_error(_error)
             except ValueError as _error:
-                _error_code = 4
-                _msg = ('RAMSTK ERROR: Date field did not contain Python '
-                        'date object: {0:s}').format(_error)
+                _error_code, _msg = DAO._get_add_error(_error)
+
+        return _error_code, _msg
+
+    @staticmethod
+    def db_add_many(items, session, chunk_size=1000):
+        """
+        Add a list of new items to the RAMSTK Program database.
+
+        The items are sorted into table dependency order (e.g., RAMSTKHardware
+        before RAMSTKReliability) and flushed chunk_size items at a time so
+        each table's rows are written with a single executemany() per chunk.
+        Everything is committed as one transaction.  If any chunk fails, the
+        transaction is rolled back and the items are added one at a time with
+        db_add() so the error code for the offending record(s) is reported
+        and the remaining records are still saved.
+
+        :param list items: the objects to add to the RAMSTK Program database.
+        :param session: the SQLAlchemy scoped_session instance used to
+                        communicate with the RAMSTK Program database.
+        :type session: :class:`sqlalchemy.orm.scoped_session`
+        :keyword int chunk_size: the number of items to flush at one time.
+        :return: (_error_code, _msg); the error code and associated error
+                                      message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = "RAMSTK SUCCESS: Adding one or more items to the RAMSTK Program " \
+               "database."
+
+        # Objects that aren't RAMSTK table objects sort first.  sorted() is
+        # stable so the items in each table keep the order they were passed
+        # in.
+        _order = dict((_table, _idx) for _idx, _table in enumerate(
+            RAMSTK_BASE.metadata.sorted_tables))
+        _items = sorted(
+            items,
+            key=lambda _item: _order.get(getattr(_item, '__table__', None),
+                                         -1))
+
+        try:
+            for _idx in range(0, len(_items), chunk_size):
+                session.add_all(_items[_idx:_idx + chunk_size])
+                session.flush()
+            DAO._db_commit(session)
+        except (exc.SQLAlchemyError, exc.DBAPIError, ValueError):
+            DAO._db_rollback(session)
+            _error_code, _msg = DAO.db_add(_items, session)
+
+        return _error_code, _msg
+
+    @staticmethod
+    def _get_copy_value(value, binary=False):
+        """
+        Format a value as a field of a PostgreSQL COPY text format row.
+
+        :param value: the value to format.
+        :keyword bool binary: whether the value is for a bytea column.
+        :return: the value escaped for COPY; None is the NULL marker.
+        :rtype: str
+        """
+        if value is None:
+            return '\\N'
+        elif binary:
+            if isinstance(value, unicode):
+                value = value.encode('utf-8')
+            _value = '\\x' + hexlify(value)
+        elif isinstance(value, bool):
+            # PostgreSQL reads 1 and 0 as both an integer and a boolean.
+            _value = str(int(value))
+        elif isinstance(value, unicode):
+            _value = value.encode('utf-8')
+        elif isinstance(value, float):
+            _value = repr(value)
+        else:
+            _value = str(value)
+
+        return _value.replace('\\', '\\\\').replace('\t', '\\t').replace(
+            '\n', '\\n').replace('\r', '\\r')
+
+    @staticmethod
+    def db_copy_many(items, session):
+        """
+        Add a list of new items to a RAMSTK Program database using COPY.
+
+        On a PostgreSQL database the rows of each table are streamed to the
+        server with one COPY ... FROM STDIN per table rather than an INSERT
+        per row.  COPY doesn't hand back the keys it assigns, so every item
+        must have its primary key set; the sequence behind each key is moved
+        past the largest key afterwards so later inserts don't collide.  The
+        items are not added to the session.
+
+        On any other database, if an item has no primary key, or if the COPY
+        fails, the items are added with db_add_many() instead.
+
+        :param list items: the objects to add to the RAMSTK Program database.
+        :param session: the SQLAlchemy scoped_session instance used to
+                        communicate with the RAMSTK Program database.
+        :type session: :class:`sqlalchemy.orm.scoped_session`
+        :return: (_error_code, _msg); the error code and associated error
+                                      message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = "RAMSTK SUCCESS: Adding one or more items to the RAMSTK " \
+               "Program database."
+
+        _dialect = session.get_bind().dialect
+        if _dialect.name != 'postgresql' or _dialect.driver != 'psycopg2':
+            return DAO.db_add_many(items, session)
+
+        _dic_items = {}
+        for _item in items:
+            _table = getattr(_item, '__table__', None)
+            if _table is None or None in [
+                    getattr(_item, object_mapper(_item).get_property_by_column(
+                        _column).key) for _column in _table.primary_key
+            ]:
+                return DAO.db_add_many(items, session)
+            _dic_items.setdefault(_table, []).append(_item)
+
+        _preparer = _dialect.identifier_preparer
+        try:
+            _cursor = session.connection().connection.cursor()
+            for _table in [
+                    _table for _table in RAMSTK_BASE.metadata.sorted_tables
+                    if _table in _dic_items
+            ]:
+                _mapper = object_mapper(_dic_items[_table][0])
+                _columns = list(_table.columns)
+                _keys = [
+                    _mapper.get_property_by_column(_column).key
+                    for _column in _columns
+                ]
+
+                # Apply the column defaults an INSERT would have applied.
+                _buffer = BytesIO()
+                for _item in _dic_items[_table]:
+                    _row = []
+                    for _column, _key in zip(_columns, _keys):
+                        _value = getattr(_item, _key)
+                        if _value is None and _column.default is not None:
+                            if _column.default.is_scalar:
+                                _value = _column.default.arg
+                            elif _column.default.is_callable:
+                                _value = _column.default.arg(None)
+                        _row.append(
+                            DAO._get_copy_value(
+                                _value,
+                                binary=isinstance(_column.type, LargeBinary)))
+                    _buffer.write('\t'.join(_row) + '\n')
+                _buffer.seek(0)
+
+                _cursor.copy_expert(
+                    'COPY {0:s} ({1:s}) FROM STDIN'.format(
+                        _preparer.format_table(_table), ', '.join([
+                            _preparer.format_column(_column)
+                            for _column in _columns
+                        ])), _buffer)
+
+                for _column in _table.primary_key:
+                    _cursor.execute(
+                        'SELECT setval(pg_get_serial_sequence(%s, %s), '
+                        '(SELECT MAX({0:s}) FROM {1:s}))'.format(
+                            _preparer.format_column(_column),
+                            _preparer.format_table(_table)),
+                        (_table.name, _column.name))
+            _cursor.close()
+            DAO._db_commit(session)
+        except (exc.SQLAlchemyError, exc.DBAPIError, _dialect.dbapi.Error):
+            DAO._db_rollback(session)
+            _error_code, _msg = DAO.db_add_many(items, session)
 
         return _error_code, _msg
 
@@ -220,10 +656,10 @@ class DAO(object):
         _msg = "RAMSTK SUCCESS: Updating the RAMSTK Program database."
 
         try:
-            session.commit()
+            DAO._db_commit(session)
         except (exc.SQLAlchemyError, exc.DBAPIError) as error:
             print error
-            session.rollback()
+            DAO._db_rollback(session)
             _error_code = 1
             _msg = "RAMSTK ERROR: Updating the RAMSTK Program database."
 
@@ -248,10 +684,10 @@ class DAO(object):
 
         try:
             session.delete(item)
-            session.commit()
+            DAO._db_commit(session)
         except (exc.SQLAlchemyError, exc.DBAPIError) as error:
             print error
-            session.rollback()
+            DAO._db_rollback(session)
             _error_code = 1
             _msg = "RAMSTK ERROR: Deleting an item from the RAMSTK Program database."
 
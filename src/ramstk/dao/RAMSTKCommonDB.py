@@ -684,6 +684,7 @@ def create_common_db(**kwargs):
                          RAMSTKMeasurement, RAMSTKMethod, RAMSTKModel,
                          RAMSTKRPN, RAMSTKStakeholders, RAMSTKStatus,
                          RAMSTKSubCategory, RAMSTKType, RAMSTKUser)
+    from ramstk.dao.RAMSTKProgramDB import create_database
 
     __test = kwargs['test']
     uri = kwargs['database']
@@ -699,6 +700,7 @@ def create_common_db(**kwargs):
         _expire_date = date.today() + timedelta(days=30)
 
     # Create and populate the RAMSTK Common test database.
+    create_database(uri)
     engine = create_engine(uri, echo=False)
     session = scoped_session(sessionmaker())
 
@@ -6,12 +6,118 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """RAMSTKProgramDB File."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine.url import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 RAMSTK_BASE = declarative_base()
 
+# The secondary indices of the RAMSTK Program database.  Each is (index name,
+# table, columns) and matches the filter of the query a module uses to load
+# its records.
+RAMSTK_PROGRAM_INDICES = (
+    ('idx_action_cause', 'ramstk_action', ('fld_cause_id', )),
+    ('idx_allocation_revision', 'ramstk_allocation', ('fld_revision_id', )),
+    ('idx_cause_mechanism', 'ramstk_cause', ('fld_mechanism_id', )),
+    ('idx_cause_mode', 'ramstk_cause', ('fld_mode_id', )),
+    ('idx_control_cause', 'ramstk_control', ('fld_cause_id', )),
+    ('idx_environment_phase', 'ramstk_environment', ('fld_phase_id', )),
+    ('idx_failure_definition_revision', 'ramstk_failure_definition',
+     ('fld_revision_id', )),
+    ('idx_function_revision', 'ramstk_function', ('fld_revision_id', )),
+    ('idx_growth_test_test', 'ramstk_growth_test', ('fld_test_id', )),
+    ('idx_hardware_revision_parent', 'ramstk_hardware',
+     ('fld_revision_id', 'fld_parent_id')),
+    ('idx_hazard_analysis_revision_hardware', 'ramstk_hazard_analysis',
+     ('fld_revision_id', 'fld_hardware_id')),
+    ('idx_matrix_revision_type', 'ramstk_matrix',
+     ('fld_revision_id', 'fld_matrix_type')),
+    ('idx_mechanism_mode', 'ramstk_mechanism', ('fld_mode_id', )),
+    ('idx_mission_revision', 'ramstk_mission', ('fld_revision_id', )),
+    ('idx_mission_phase_mission', 'ramstk_mission_phase',
+     ('fld_mission_id', )),
+    ('idx_mode_function', 'ramstk_mode', ('fld_function_id', )),
+    ('idx_mode_hardware', 'ramstk_mode', ('fld_hardware_id', )),
+    ('idx_op_load_mechanism', 'ramstk_op_load', ('fld_mechanism_id', )),
+    ('idx_op_stress_load', 'ramstk_op_stress', ('fld_load_id', )),
+    ('idx_program_status_revision', 'ramstk_program_status',
+     ('fld_revision_id', )),
+    ('idx_requirement_revision', 'ramstk_requirement', ('fld_revision_id', )),
+    ('idx_similar_item_revision', 'ramstk_similar_item',
+     ('fld_revision_id', )),
+    ('idx_stakeholder_revision', 'ramstk_stakeholder', ('fld_revision_id', )),
+    ('idx_survival_revision', 'ramstk_survival', ('fld_revision_id', )),
+    ('idx_survival_data_survival_time', 'ramstk_survival_data',
+     ('fld_survival_id', 'fld_right_interval')),
+    ('idx_test_revision', 'ramstk_test', ('fld_revision_id', )),
+    ('idx_test_method_load', 'ramstk_test_method', ('fld_load_id', )),
+    ('idx_validation_revision', 'ramstk_validation', ('fld_revision_id', )),
+)
+
+
+def create_database(uri):
+    """
+    Create the database on a PostgreSQL server if it doesn't exist yet.
+
+    SQLite creates the database file on the first connect, so nothing is done
+    for any other backend.
+
+    :param str uri: the RFC1738 URL of the database to create.
+    :return: True if the database was created, False otherwise.
+    :rtype: bool
+    """
+    _url = make_url(uri)
+    if _url.get_backend_name() != 'postgresql':
+        return False
+
+    # CREATE DATABASE can't run in a transaction or while connected to the
+    # database being created, so use the server's maintenance database.
+    _database = _url.database
+    _url.database = 'postgres'
+    _engine = create_engine(_url, isolation_level='AUTOCOMMIT')
+    try:
+        _exists = _engine.execute(
+            text('SELECT 1 FROM pg_database WHERE datname = :name'),
+            name=_database).scalar()
+        if not _exists:
+            _engine.execute('CREATE DATABASE {0:s}'.format(
+                _engine.dialect.identifier_preparer.quote(_database)))
+    finally:
+        _engine.dispose()
+
+    return not _exists
+
+
+def create_program_indices(engine):
+    """
+    Add any missing secondary indices to a RAMSTK Program database.
+
+    Indices are only added to the tables in the database.  It is safe to
+    call every time a RAMSTK Program database is opened to bring older
+    RAMSTK Program databases up to date.
+
+    :param engine: the SQLAlchemy engine connected to the database.
+    :return: the number of indices added.
+    :rtype: int
+    """
+    _inspector = inspect(engine)
+    _tables = set(_inspector.get_table_names())
+
+    _n_added = 0
+    for _name, _table, _columns in RAMSTK_PROGRAM_INDICES:
+        if _table not in _tables:
+            continue
+        if _name in [
+                _index['name'] for _index in _inspector.get_indexes(_table)
+        ]:
+            continue
+        engine.execute('CREATE INDEX {0:s} ON {1:s} ({2:s})'.format(
+            _name, _table, ', '.join(_columns)))
+        _n_added += 1
+
+    return _n_added
+
 
 def create_program_db(**kwargs):
     """Create and populate a RAMSTK Program database."""
@@ -33,6 +139,7 @@ def create_program_db(**kwargs):
     uri = kwargs['database']
 
     # Create and populate the RAMSTK Program test database.
+    create_database(uri)
     engine = create_engine(uri, echo=False)
     session = scoped_session(sessionmaker())
 
@@ -82,6 +189,7 @@ def create_program_db(**kwargs):
     RAMSTKTestMethod.__table__.create(bind=engine)
     RAMSTKUnits.__table__.create(bind=engine)
     RAMSTKValidation.__table__.create(bind=engine)
+    create_program_indices(engine)
 
     # Add an entry for the Program Information.
     _record = RAMSTKProgramInfo()
@@ -130,6 +238,7 @@ def do_create_test_database(database):
         RAMSTKUnits, RAMSTKValidation)
 
     # Create and populate the RAMSTK Program test database.
+    create_database(database)
     engine = create_engine(database, echo=False)
     session = scoped_session(sessionmaker())
 
@@ -179,6 +288,7 @@ def do_create_test_database(database):
     RAMSTKTestMethod.__table__.create(bind=engine)
     RAMSTKUnits.__table__.create(bind=engine)
     RAMSTKValidation.__table__.create(bind=engine)
+    create_program_indices(engine)
 
     _program_info = RAMSTKProgramInfo()
     _program_info.revision_prefix = "REV"
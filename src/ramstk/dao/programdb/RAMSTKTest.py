@@ -86,7 +86,8 @@ class RAMSTKTest(RAMSTK_BASE):
 
     # Define the relationships to other tables in the RAMSTK Program database.
     revision = relationship('RAMSTKRevision', back_populates='test')
-    growth = relationship('RAMSTKGrowthTest', back_populates='test')
+    growth = relationship(
+        'RAMSTKGrowthTest', back_populates='test', cascade='all,delete')
 
     def get_attributes(self):
         """
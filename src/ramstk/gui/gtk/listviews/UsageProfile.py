@@ -556,7 +556,7 @@ class ListView(RAMSTKListView):
             gtk.gdk.Pixbuf, gobject.TYPE_INT, gobject.TYPE_STRING,
             gobject.TYPE_STRING, gobject.TYPE_STRING, gobject.TYPE_FLOAT,
             gobject.TYPE_FLOAT, gobject.TYPE_FLOAT, gobject.TYPE_FLOAT,
-            gobject.TYPE_INT, gobject.TYPE_INT, gobject.TYPE_STRING)
+            gobject.TYPE_INT64, gobject.TYPE_INT, gobject.TYPE_STRING)
         self.treeview.set_model(_model)
 
         for i in range(10):
@@ -170,7 +170,9 @@ class ModuleView(RAMSTKModuleView):
         if not self._dtc_data_controller.request_do_calculate_all(
                 node_id=self._hardware_id,
                 hr_multiplier=self._mdcRAMSTK.RAMSTK_CONFIGURATION.
-                RAMSTK_HR_MULTIPLIER):
+                RAMSTK_HR_MULTIPLIER,
+                n_workers=self._mdcRAMSTK.RAMSTK_CONFIGURATION.
+                RAMSTK_CALC_WORKERS):
             # Update Revision attributes with system-level attribute values.
             _sys_attributes = self._dtc_data_controller.request_get_attributes(
                 1)
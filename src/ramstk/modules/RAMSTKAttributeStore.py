@@ -0,0 +1,891 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.modules.RAMSTKAttributeStore.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Datamodels Package RAMSTKAttributeStore."""
+
+from collections import MutableMapping, Sequence
+from itertools import izip
+from operator import itemgetter
+
+import numpy as np
+from sqlalchemy import Float, Integer, inspect
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2017 Doyle "weibullguy" Rowland'
+
+# Marks an attribute a record does not have.
+_MISSING = object()
+
+
+def _is_integer(value):
+    """
+    Check whether a value can be held in an integer column.
+
+    :param value: the value to check.
+    :return: True if the value is an integer or an integral float.
+    :rtype: bool
+    """
+    return (isinstance(value, (int, long, np.integer, np.bool_))
+            or (isinstance(value, (float, np.floating))
+                and float(value).is_integer()))
+
+
+def _is_float(value):
+    """
+    Check whether a value can be held in a float column.
+
+    :param value: the value to check.
+    :return: True if the value is an integer or a float.
+    :rtype: bool
+    """
+    return isinstance(value,
+                      (int, long, float, np.integer, np.floating, np.bool_))
+
+
+class RAMSTKAttributes(MutableMapping):
+    """
+    This is the {attribute:value} view of one record in a store.
+
+    A RAMSTKAttributes() holds no values.  Each value is read from and
+    written to the columns of the RAMSTKAttributeStore() the record belongs
+    to so the view can be used anywhere an attribute dict is used.
+
+    :ivar record_id: the ID of the record.
+    """
+
+    __slots__ = ('_store', 'record_id')
+
+    def __init__(self, store, record_id):
+        """
+        Initialize a RAMSTKAttributes instance.
+
+        :param store: the RAMSTKAttributeStore() the record belongs to.
+        :type store:
+            :class:`ramstk.modules.RAMSTKAttributeStore.RAMSTKAttributeStore`
+        :param int record_id: the ID of the record.
+        """
+        self._store = store
+        self.record_id = record_id
+
+    def __getitem__(self, key):
+        """Return the value of an attribute of the record."""
+        return self._store.get_value(self.record_id, key)
+
+    def __setitem__(self, key, value):
+        """Set the value of an attribute of the record."""
+        self._store.set_value(self.record_id, key, value)
+
+    def __delitem__(self, key):
+        """Remove an attribute from the record."""
+        self[key]  # pylint: disable=pointless-statement
+        self._store.set_value(self.record_id, key, _MISSING)
+
+    def __iter__(self):
+        """Iterate over the names of the attributes of the record."""
+        return iter(self.keys())
+
+    def __len__(self):
+        """Return the number of attributes of the record."""
+        return len(self.keys())
+
+    def __repr__(self):
+        """Return the record as a dict would."""
+        return repr(dict(self.items()))
+
+    def copy(self):
+        """
+        Copy the attributes of the record into a dict.
+
+        :return: the {attribute:value} dict.
+        :rtype: dict
+        """
+        return self._store.get_dict(self.record_id)
+
+    def keys(self):
+        """
+        Return the names of the attributes of the record.
+
+        :return: the list of attribute names.
+        :rtype: list
+        """
+        return [_key for _key, __ in self.items()]
+
+    def items(self):
+        """
+        Return the (attribute, value) pairs of the record.
+
+        :return: the list of (attribute, value) pairs.
+        :rtype: list
+        """
+        return self._store.get_items(self.record_id)
+
+    def update(self, *args, **kwargs):
+        """Set the value of several attributes of the record."""
+        # Writing the record to itself leaves it unchanged.
+        if len(args) == 1 and args[0] is self:
+            args = ()
+        elif len(args) == 1 and isinstance(args[0], dict):
+            self._store.set_items(self.record_id, args[0].iteritems())
+            args = ()
+
+        if args or kwargs:
+            MutableMapping.update(self, *args, **kwargs)
+
+
+class RAMSTKAttributeStore(object):
+    """
+    This is a columnar store of {attribute:value} records.
+
+    Each numeric attribute is held in one NumPy array and each text attribute
+    in one list of shared strings, with one row per record.  The records are
+    indexed by their ID.  Attributes that are Integer or Float columns of the
+    RAMSTK Program database tables passed to the store use int64 or float64
+    arrays.  A column falls back to a list when a record has a value the
+    array can not hold, such as None.
+
+    The loaded int64 and float64 columns are the columns of one column-major
+    block per type so reading a whole record is a single NumPy operation.
+
+    Some attributes can be left out when the records are loaded and read from
+    the database on first access instead.  See do_set_loader().
+    """
+
+    def __init__(self, tables=()):
+        """
+        Initialize a RAMSTKAttributeStore instance.
+
+        :param tuple tables: the RAMSTK Program database tables whose columns
+                             set the type of the attributes.
+        """
+        # Initialize private dictionary attributes.
+        self._dic_block = {}
+        self._dic_column = {}
+        self._dic_dtype = {}
+        self._dic_index = {}
+        self._dic_strings = {}
+
+        # Initialize private list attributes.
+        # Each block is an [attribute names, 2-D array] pair.  A name is None
+        # once its column no longer uses the block.
+        self._lst_blocks = []
+        # The (attribute, column) pairs of the arrays that are not part of a
+        # block and of the lists.  They are rebuilt whenever a column is
+        # replaced.
+        self._lst_arrays = None
+        self._lst_lists = None
+        self._lst_record_id = []
+
+        # Initialize private scalar attributes.
+        self._capacity = 0
+        self._loader = None
+        self._n_deleted = 0
+        # The attributes that are loaded on first access and the IDs of the
+        # records they have not been loaded for yet.
+        self._set_lazy_keys = frozenset()
+        self._set_unloaded = set()
+
+        for _table in tables:
+            for _column in inspect(_table).column_attrs:
+                _type = _column.columns[0].type
+                if isinstance(_type, Integer):
+                    self._dic_dtype[_column.key] = np.int64
+                elif isinstance(_type, Float):
+                    self._dic_dtype[_column.key] = np.float64
+
+    def __contains__(self, record_id):
+        """Check whether the store has a record."""
+        return record_id in self._dic_index
+
+    def __len__(self):
+        """Return the number of records in the store."""
+        return len(self._dic_index)
+
+    def _do_intern(self, value):
+        """
+        Return the copy of a string shared by every record in the store.
+
+        :param value: the value to intern.
+        :return: the shared copy of the value if it is a string, otherwise
+                 the value.
+        """
+        if isinstance(value, basestring):
+            value = self._dic_strings.setdefault(value, value)
+
+        return value
+
+    def _do_make_column(self, key, values):
+        """
+        Make the column holding a list of attribute values.
+
+        :param str key: the name of the attribute.
+        :param list values: the value of the attribute for each row.
+        :return: _column; the array or list of values.
+        """
+        _dtype = self._dic_dtype.get(key, None)
+        if values and isinstance(values[0], basestring):
+            return [self._do_intern(_value) for _value in values]
+        _column = np.array(values)
+
+        if _column.ndim != 1 or _column.dtype.kind not in 'biuf':
+            return [self._do_intern(_value) for _value in values]
+        elif _dtype is np.int64 and _column.dtype.kind == 'f':
+            # Keep the floats stored in an integer field rather than
+            # truncating them.
+            if np.all(np.floor(_column) == _column):
+                _column = _column.astype(np.int64)
+        elif _dtype is not None:
+            _column = _column.astype(_dtype)
+        elif _column.dtype.kind == 'b':
+            _column = _column.astype(np.int64)
+
+        return _column
+
+    def _do_set_column(self, key, column):
+        """
+        Add or replace the column holding an attribute.
+
+        :param str key: the name of the attribute.
+        :param column: the array or list of values.
+        :return: None
+        :rtype: None
+        """
+        try:
+            _block, _index = self._dic_block.pop(key)
+            self._lst_blocks[_block][0][_index] = None
+        except KeyError:
+            pass
+
+        self._dic_column[key] = column
+        self._lst_arrays = None
+        self._lst_lists = None
+
+    def _do_set_blocks(self, blocks):
+        """
+        Replace the blocks and the columns that use them.
+
+        :param list blocks: the [attribute names, 2-D array] pair of each
+                            block.
+        :return: None
+        :rtype: None
+        """
+        self._dic_block = {}
+        self._lst_blocks = blocks
+        for _block, (_keys, _array) in enumerate(blocks):
+            for _index, _key in enumerate(_keys):
+                if _key is not None:
+                    self._dic_block[_key] = (_block, _index)
+                    self._dic_column[_key] = _array[:, _index]
+
+    def _get_columns(self):
+        """
+        Return the arrays that are not part of a block and the lists.
+
+        :return: (_lst_arrays, _lst_lists); the (attribute, column) pairs of
+                 the arrays and of the lists.
+        :rtype: (list, list)
+        """
+        if self._lst_arrays is None:
+            self._lst_arrays = []
+            self._lst_lists = []
+            for _key, _column in self._dic_column.iteritems():
+                if isinstance(_column, list):
+                    self._lst_lists.append((_key, _column))
+                elif _key not in self._dic_block:
+                    self._lst_arrays.append((_key, _column))
+
+        return self._lst_arrays, self._lst_lists
+
+    def _do_add_column(self, key):
+        """
+        Add an attribute no record has to the store.
+
+        :param str key: the name of the attribute.
+        :return: _column; the list of values.
+        :rtype: list
+        """
+        _column = [_MISSING] * self._capacity
+        self._do_set_column(key, _column)
+
+        return _column
+
+    def _do_promote_column(self, key, value):
+        """
+        Convert a column so it can hold a value.
+
+        :param str key: the name of the attribute.
+        :param value: the value the column must hold.
+        :return: _column; the converted column.
+        """
+        _column = self._dic_column[key]
+        if (_column.dtype.kind == 'i'
+                and isinstance(value, (float, np.floating))):
+            _column = _column.astype(np.float64)
+        else:
+            _column = _column.tolist()
+        self._do_set_column(key, _column)
+
+        return _column
+
+    def _do_copy_rows(self, store, rows):
+        """
+        Copy rows of this store into the columns of a store.
+
+        :param store: the RAMSTKAttributeStore() to copy into.  This may be
+                      the same store.
+        :param rows: the rows to copy, in the order they are copied.
+        :type rows: :class:`numpy.ndarray`
+        :return: None
+        :rtype: None
+        """
+        # pylint: disable=protected-access
+        _lst_arrays, _lst_lists = self._get_columns()
+        _lst_blocks = [[list(_keys), np.asfortranarray(_array[rows])]
+                       for _keys, _array in self._lst_blocks]
+        _lst_columns = [(_key, _column[rows]) for _key, _column in _lst_arrays]
+        _lst_columns.extend((_key, [_column[_row] for _row in rows])
+                            for _key, _column in _lst_lists)
+
+        store._dic_column = {}
+        store._do_set_blocks(_lst_blocks)
+        for _key, _column in _lst_columns:
+            store._do_set_column(_key, _column)
+        store._capacity = len(rows)
+
+    def do_load(self, records):
+        """
+        Replace the records in the store.
+
+        :param records: the (record ID, {attribute:value} dict) pair of each
+                        record to load.
+        :return: None
+        :rtype: None
+        """
+        self._dic_block = {}
+        self._dic_column = {}
+        self._dic_index = {}
+        self._dic_strings = {}
+        self._lst_blocks = []
+        self._lst_arrays = None
+        self._lst_lists = None
+        self._lst_record_id = []
+        self._set_lazy_keys = frozenset()
+        self._set_unloaded = set()
+        self._loader = None
+        self._n_deleted = 0
+
+        # Each record is read into a row of values in the order of the
+        # attribute names seen so far, then the rows are turned into columns.
+        _lst_keys = []
+        _lst_rows = []
+        _get_values = None
+        for _row, (_record_id, _attributes) in enumerate(records):
+            self._dic_index[_record_id] = _row
+            self._lst_record_id.append(_record_id)
+            try:
+                # The record has the same attributes as the last one when it
+                # has as many and none are missing.
+                if len(_attributes) != len(_lst_keys) or len(_lst_keys) < 2:
+                    raise KeyError
+                _lst_rows.append(_get_values(_attributes))
+            except KeyError:
+                _lst_keys.extend(
+                    _key for _key in _attributes.keys()
+                    if _key not in _lst_keys)
+                _get_values = itemgetter(*_lst_keys)
+                _lst_rows.append(
+                    tuple(
+                        _attributes.get(_key, _MISSING)
+                        for _key in _lst_keys))
+
+        self._capacity = len(self._lst_record_id)
+        for _row, _values in enumerate(_lst_rows):
+            if len(_values) < len(_lst_keys):
+                _lst_rows[_row] = _values + (_MISSING, ) * (
+                    len(_lst_keys) - len(_values))
+        _lst_columns = zip(*_lst_rows) if _lst_rows else []
+        _lst_rows = None
+
+        _dic_keys = {}
+        for _key, _values in zip(_lst_keys, _lst_columns):
+            _column = self._do_make_column(_key, _values)
+            self._dic_column[_key] = _column
+            if not isinstance(_column, list):
+                _dic_keys.setdefault(_column.dtype, []).append(_key)
+
+        _lst_blocks = []
+        for _dtype, _keys in _dic_keys.iteritems():
+            _array = np.empty((self._capacity, len(_keys)),
+                              dtype=_dtype,
+                              order='F')
+            for _index, _key in enumerate(_keys):
+                _array[:, _index] = self._dic_column[_key]
+            _lst_blocks.append([_keys, _array])
+        self._do_set_blocks(_lst_blocks)
+
+    def do_set_loader(self, keys, loader):
+        """
+        Load some attributes of every record on first access.
+
+        The attributes are added to the store for every record in the store,
+        but their values are only read when one of them is first read or
+        written for a record.  The loader is then passed a list of record IDs
+        and must set the attributes of each of those records with
+        set_items().
+
+        :param list keys: the names of the attributes to load on first
+                          access.
+        :param loader: the callable that loads the attributes.
+        :return: None
+        :rtype: None
+        """
+        _dic_keys = {}
+        for _key in keys:
+            if _key in self._dic_column:
+                continue
+            _dtype = self._dic_dtype.get(_key, None)
+            if _dtype is None:
+                self._do_add_column(_key)
+            else:
+                _dic_keys.setdefault(_dtype, []).append(_key)
+
+        # The typed attributes get a block of their own so whole records are
+        # still read a block at a time.
+        _lst_blocks = list(self._lst_blocks)
+        for _dtype, _keys in _dic_keys.iteritems():
+            _lst_blocks.append([
+                _keys,
+                np.zeros((self._capacity, len(_keys)), dtype=_dtype,
+                         order='F')
+            ])
+        self._do_set_blocks(_lst_blocks)
+        self._lst_arrays = None
+        self._lst_lists = None
+
+        self._set_lazy_keys = frozenset(keys)
+        self._set_unloaded = set(self._dic_index)
+        self._loader = loader
+
+    def do_fetch(self, record_ids=None):
+        """
+        Load the attributes of records that have not been accessed yet.
+
+        :keyword list record_ids: the IDs of the records to load.  Default is
+                                  every record in the store.
+        :return: None
+        :rtype: None
+        """
+        if not self._set_unloaded:
+            return
+
+        if record_ids is None:
+            _lst_record_id = list(self._set_unloaded)
+        else:
+            _lst_record_id = [
+                _record_id for _record_id in record_ids
+                if _record_id in self._set_unloaded
+            ]
+
+        if _lst_record_id:
+            # The records are marked loaded first so the loader can set their
+            # attributes.
+            self._set_unloaded.difference_update(_lst_record_id)
+            try:
+                self._loader(_lst_record_id)
+            except Exception:
+                self._set_unloaded.update(_lst_record_id)
+                raise
+
+    def do_insert(self, record_id, attributes):
+        """
+        Add a record to the store.
+
+        :param int record_id: the ID of the record to add.
+        :param dict attributes: the {attribute:value} dict of the record.
+        :return: the view of the new record.
+        :rtype: :class:`ramstk.modules.RAMSTKAttributeStore.RAMSTKAttributes`
+        """
+        _row = len(self._lst_record_id)
+        if _row == self._capacity:
+            self._do_grow(max(_row, 8))
+
+        self._dic_index[record_id] = _row
+        self._lst_record_id.append(record_id)
+
+        _record = RAMSTKAttributes(self, record_id)
+        for _key in self._dic_column.keys():
+            if _key not in attributes:
+                self.set_value(record_id, _key, _MISSING)
+        _record.update(attributes)
+
+        return _record
+
+    def _do_grow(self, size):
+        """
+        Add empty rows to the end of every column.
+
+        The space for new records is doubled each time so adding many records
+        does not copy every column each time.
+
+        :param int size: the number of rows to add.
+        :return: None
+        :rtype: None
+        """
+        _capacity = self._capacity + size
+        _lst_arrays, _lst_lists = self._get_columns()
+
+        _lst_blocks = []
+        for _keys, _array in self._lst_blocks:
+            _new = np.zeros((_capacity, _array.shape[1]),
+                            dtype=_array.dtype,
+                            order='F')
+            _new[:self._capacity] = _array
+            _lst_blocks.append([_keys, _new])
+        self._do_set_blocks(_lst_blocks)
+
+        for _key, _column in _lst_arrays:
+            self._do_set_column(
+                _key,
+                np.concatenate((_column, np.zeros(size, dtype=_column.dtype))))
+        for _key, _column in _lst_lists:
+            _column.extend([_MISSING] * size)
+
+        self._capacity = _capacity
+
+    def do_delete(self, record_id):
+        """
+        Remove a record from the store.
+
+        :param int record_id: the ID of the record to remove.
+        :return: None
+        :rtype: None
+        """
+        _row = self._dic_index.pop(record_id)
+        self._set_unloaded.discard(record_id)
+        self._lst_record_id[_row] = None
+        self._n_deleted += 1
+
+        # The rows of removed records are only reclaimed once they are the
+        # majority of the store.
+        if self._n_deleted > len(self._dic_index) + 64:
+            _rows = self._get_rows(None)
+            self._do_copy_rows(self, _rows)
+            self._lst_record_id = [self._lst_record_id[_row] for _row in _rows]
+            self._dic_index = dict(
+                (_record_id, _row)
+                for _row, _record_id in enumerate(self._lst_record_id))
+            self._n_deleted = 0
+
+    def get_row(self, record_id):
+        """
+        Return the {attribute:value} view of a record.
+
+        :param int record_id: the ID of the record.
+        :return: the view of the record.
+        :rtype: :class:`ramstk.modules.RAMSTKAttributeStore.RAMSTKAttributes`
+        :raise: KeyError if the store has no record with the ID.
+        """
+        self._dic_index[record_id]  # pylint: disable=pointless-statement
+
+        return RAMSTKAttributes(self, record_id)
+
+    def get_value(self, record_id, key):
+        """
+        Return the value of one attribute of a record.
+
+        :param int record_id: the ID of the record.
+        :param str key: the name of the attribute.
+        :return: the value of the attribute.
+        :raise: KeyError if the record does not have the attribute.
+        """
+        if record_id in self._set_unloaded and key in self._set_lazy_keys:
+            self.do_fetch([record_id])
+
+        _column = self._dic_column[key]
+        _row = self._dic_index[record_id]
+
+        if isinstance(_column, list):
+            _value = _column[_row]
+            if _value is _MISSING:
+                raise KeyError(key)
+        else:
+            _value = _column.item(_row)
+
+        return _value
+
+    def set_value(self, record_id, key, value):
+        """
+        Set the value of one attribute of a record.
+
+        :param int record_id: the ID of the record.
+        :param str key: the name of the attribute.
+        :param value: the value of the attribute.
+        :return: None
+        :rtype: None
+        """
+        if record_id in self._set_unloaded and key in self._set_lazy_keys:
+            self.do_fetch([record_id])
+
+        _row = self._dic_index[record_id]
+        try:
+            _column = self._dic_column[key]
+        except KeyError:
+            _column = self._do_add_column(key)
+
+        if isinstance(_column, list):
+            _column[_row] = self._do_intern(value)
+            return
+
+        if _column.dtype.kind == 'i':
+            _valid = _is_integer(value)
+        else:
+            _valid = _is_float(value)
+
+        if not _valid:
+            _column = self._do_promote_column(key, value)
+            self.set_value(record_id, key, value)
+        else:
+            try:
+                _column[_row] = value
+            except OverflowError:
+                _column = self._do_promote_column(key, value)
+                _column[_row] = value
+
+    def get_items(self, record_id):
+        """
+        Return the (attribute, value) pairs of a record.
+
+        :param int record_id: the ID of the record.
+        :return: the list of (attribute, value) pairs.
+        :rtype: list
+        """
+        if record_id in self._set_unloaded:
+            self.do_fetch([record_id])
+
+        _row = self._dic_index[record_id]
+        _lst_arrays, _lst_lists = self._get_columns()
+
+        _lst_items = []
+        for _keys, _array in self._lst_blocks:
+            if None in _keys:
+                _lst_items.extend(
+                    _item for _item in zip(_keys, _array[_row].tolist())
+                    if _item[0] is not None)
+            else:
+                _lst_items.extend(zip(_keys, _array[_row].tolist()))
+        _lst_items.extend((_key, _column.item(_row))
+                          for _key, _column in _lst_arrays)
+        _lst_items.extend((_key, _column[_row])
+                          for _key, _column in _lst_lists
+                          if _column[_row] is not _MISSING)
+
+        return _lst_items
+
+    def get_dict(self, record_id):
+        """
+        Return the {attribute:value} dict of a record.
+
+        :param int record_id: the ID of the record.
+        :return: the {attribute:value} dict.
+        :rtype: dict
+        """
+        if record_id in self._set_unloaded:
+            self.do_fetch([record_id])
+
+        _row = self._dic_index[record_id]
+        _lst_arrays, _lst_lists = self._get_columns()
+
+        _attributes = {}
+        for _keys, _array in self._lst_blocks:
+            _attributes.update(izip(_keys, _array[_row].tolist()))
+        _attributes.pop(None, None)
+        _attributes.update((_key, _column.item(_row))
+                           for _key, _column in _lst_arrays)
+        _attributes.update((_key, _column[_row])
+                           for _key, _column in _lst_lists
+                           if _column[_row] is not _MISSING)
+
+        return _attributes
+
+    def set_items(self, record_id, items):
+        """
+        Set the value of several attributes of a record.
+
+        :param int record_id: the ID of the record.
+        :param list items: the (attribute, value) pairs to set.
+        :return: None
+        :rtype: None
+        """
+        if record_id in self._set_unloaded:
+            self.do_fetch([record_id])
+
+        _row = self._dic_index[record_id]
+        for _key, _value in items:
+            _column = self._dic_column.get(_key, None)
+            # Floats set in float columns are by far the most common case so
+            # they skip the checks in set_value().
+            if (type(_value) is float and isinstance(_column, np.ndarray)
+                    and _column.dtype.kind == 'f'):
+                _column[_row] = _value
+            else:
+                self.set_value(record_id, _key, _value)
+
+    def get_column(self, key, record_ids=None):
+        """
+        Return the values of one attribute of several records.
+
+        :param str key: the name of the attribute.
+        :keyword list record_ids: the IDs of the records in the order the
+                                  values are returned.  Default is every
+                                  record in the order they were added.
+        :return: the array of values.
+        :rtype: :class:`numpy.ndarray`
+        """
+        if key in self._set_lazy_keys:
+            self.do_fetch(record_ids)
+
+        _rows = self._get_rows(record_ids)
+        _column = self._dic_column[key]
+
+        if isinstance(_column, list):
+            _column = np.array([_column[_row] for _row in _rows],
+                               dtype=object)
+            if any(_value is _MISSING for _value in _column):
+                raise KeyError(key)
+        else:
+            _column = _column[_rows]
+
+        return _column
+
+    def set_column(self, key, values, record_ids=None):
+        """
+        Set the values of one attribute of several records.
+
+        :param str key: the name of the attribute.
+        :param values: the value for each record.
+        :type values: :class:`numpy.ndarray`
+        :keyword list record_ids: the IDs of the records in the same order as
+                                  the values.  Default is every record in the
+                                  order they were added.
+        :return: None
+        :rtype: None
+        """
+        if key in self._set_lazy_keys:
+            self.do_fetch(record_ids)
+
+        _rows = self._get_rows(record_ids)
+        _column = self._dic_column.get(key, None)
+        values = np.asarray(values)
+
+        if (isinstance(_column, np.ndarray) and values.dtype.kind in 'biuf'
+                and (_column.dtype.kind == 'f'
+                     or values.dtype.kind in 'biu')):
+            _column[_rows] = values
+        else:
+            if record_ids is None:
+                record_ids = [self._lst_record_id[_row] for _row in _rows]
+            for _record_id, _value in zip(record_ids, values.tolist()):
+                self.set_value(_record_id, key, _value)
+
+    def _get_rows(self, record_ids):
+        """
+        Return the rows of several records.
+
+        :param list record_ids: the IDs of the records or None for every
+                                record.
+        :return: the array of row indices.
+        :rtype: :class:`numpy.ndarray`
+        """
+        if record_ids is None:
+            if self._n_deleted == 0:
+                return np.arange(len(self._lst_record_id))
+            return np.array(
+                [
+                    _row for _row, _record_id in enumerate(
+                        self._lst_record_id) if _record_id is not None
+                ],
+                dtype=np.int64)
+
+        return np.array([self._dic_index[_record_id]
+                         for _record_id in record_ids],
+                        dtype=np.int64)
+
+    def do_select_rows(self, record_ids):
+        """
+        Copy several records into a new store.
+
+        Changes to the copies do not change the records in this store.
+
+        :param list record_ids: the IDs of the records to copy.
+        :return: the copied records in the order of the IDs passed.
+        :rtype: :class:`RAMSTKAttributeRows`
+        """
+        # pylint: disable=protected-access
+        self.do_fetch(record_ids)
+
+        _store = RAMSTKAttributeStore()
+        _store._dic_dtype = self._dic_dtype
+        _store._dic_strings = self._dic_strings
+        self._do_copy_rows(_store, self._get_rows(record_ids))
+        _store._lst_record_id = list(record_ids)
+        _store._dic_index = dict(
+            (_record_id, _row) for _row, _record_id in enumerate(record_ids))
+
+        return RAMSTKAttributeRows(_store)
+
+
+class RAMSTKAttributeRows(Sequence):
+    """
+    This is a list of the records in a store.
+
+    Indexing the list returns the RAMSTKAttributes() view of a record, so the
+    list can be used wherever a list of attribute dicts is used.  The
+    get_column() and set_column() methods read and write all the records at
+    once.
+    """
+
+    def __init__(self, store):
+        """
+        Initialize a RAMSTKAttributeRows instance.
+
+        :param store: the RAMSTKAttributeStore() holding the records.
+        :type store:
+            :class:`ramstk.modules.RAMSTKAttributeStore.RAMSTKAttributeStore`
+        """
+        self._store = store
+        # pylint: disable=protected-access
+        self._lst_record_id = store._lst_record_id
+
+    def __getitem__(self, index):
+        """Return the view of the record at an index."""
+        return RAMSTKAttributes(self._store, self._lst_record_id[index])
+
+    def __len__(self):
+        """Return the number of records."""
+        return len(self._lst_record_id)
+
+    def get_column(self, key):
+        """
+        Return the values of one attribute of every record.
+
+        :param str key: the name of the attribute.
+        :return: the array of values in the order of the records.
+        :rtype: :class:`numpy.ndarray`
+        """
+        return self._store.get_column(key)
+
+    def set_column(self, key, values):
+        """
+        Set the values of one attribute of every record.
+
+        :param str key: the name of the attribute.
+        :param values: the value for each record in the order of the records.
+        :type values: :class:`numpy.ndarray`
+        :return: None
+        :rtype: None
+        """
+        self._store.set_column(key, values)
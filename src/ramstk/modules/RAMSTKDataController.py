@@ -109,6 +109,15 @@ class RAMSTKDataController(object):
         """
         return self._dtm_data_model.do_select_all(**kwargs)
 
+    def request_do_select_modified(self, **kwargs):
+        """
+        Request the RAMSTK Program database records changed since last saved.
+
+        :return: the changed RAMSTK Program database records.
+        :rtype: list
+        """
+        return self._dtm_data_model.do_select_modified(**kwargs)
+
     def request_get_attributes(self, node_id):
         """
         Request attributes from the record associated with the Node ID.
@@ -6,8 +6,9 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Datamodels Package RAMSTKDataMatrix."""
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import and_, func
+from sqlalchemy import and_, bindparam, exc, func
 
 # Import other RAMSTK modules.
 from ramstk.dao import RAMSTKMatrix
@@ -84,6 +85,173 @@ class RAMSTKDataMatrix(object):
         self.n_row = 1
         self.n_col = 1
 
+    def _do_select_headings(self, session, revision_id, matrix_type,
+                            **kwargs):
+        r"""
+        Select the row and column headings for the matrix.
+
+        :param session: the SQLAlchemy session to use for the queries.
+        :param int revision_id: the ID of the Revision the desired Matrix is
+                                associated with.
+        :param str matrix_type: the type of the Matrix to select the headings
+                                for.
+        :param \**kwargs: See do_select_all().
+        :return: (_lst_row_ids, _lst_column_ids); the row and column item IDs
+                 in the order they were selected.
+        :rtype: (list, list)
+        """
+        try:
+            _rkey = kwargs['rkey']
+        except KeyError:
+            _rkey = 'rkey'
+        try:
+            _ckey = kwargs['ckey']
+        except KeyError:
+            _ckey = 'ckey'
+        try:
+            _rheader = kwargs['rheader']
+        except KeyError:
+            _rheader = 0
+        try:
+            _cheader = kwargs['cheader']
+        except KeyError:
+            _cheader = 0
+
+        _lst_row_ids = []
+        _lst_column_ids = []
+
+        self.n_col = 0
+        self.n_row = 0
+
+        # Retrieve the dictionary of row headings.  The key is the row table's
+        # module ID.  The value is the row table field with string data
+        # (typically the code, description, or name field).
+        for _row in session.query(self._row_table).filter(
+                self._row_table.revision_id == revision_id).all():
+            _attributes = _row.get_attributes()
+            self.dic_row_hdrs[_attributes[_rkey]] = _attributes[_rheader]
+            _lst_row_ids.append(_attributes[_rkey])
+
+            self.n_row += 1
+
+        # Retrieve the dictionary of column headings.  The key is the column
+        # table's module ID.  The value is the column table field with string
+        # data (typically the code, description, or name field).
+        for _column in session.query(self._column_table).filter(
+                self._column_table.revision_id == revision_id).all():
+            _attributes = _column.get_attributes()
+            try:
+                self.dic_column_hdrs[
+                    _attributes[_ckey]] = _attributes[_cheader]
+                _lst_column_ids.append(_attributes[_ckey])
+            except TypeError:
+                print 'FIXME: Handle TypeError in ' \
+                      'RAMSTKDataMatrix.do_select_all().  Tuple indices must ' \
+                      'be integers, not str.  This will be fixed when all ' \
+                      'the RAMSTK database tables are converted to return ' \
+                      'dicts from the get_attributes() method.  Matrix {0:s} ' \
+                      'is not working.  See issue #59'.format(matrix_type)
+
+            self.n_col += 1
+
+        return _lst_row_ids, _lst_column_ids
+
+    @staticmethod
+    def _do_get_matrix_id(session, matrix_type):
+        """
+        Retrieve the Matrix ID to use for new cells of the Matrix type.
+
+        :param session: the SQLAlchemy session to use for the queries.
+        :param str matrix_type: the type of the Matrix.
+        :return: _matrix_id; the ID of the Matrix.
+        :rtype: int
+        """
+        try:
+            _matrix_id = session.query(RAMSTKMatrix).filter(
+                RAMSTKMatrix.matrix_type == matrix_type).first().matrix_id
+        except AttributeError:
+            _matrix_id = session.query(
+                func.max(RAMSTKMatrix.matrix_id).label("last_id")).one()
+            try:
+                _matrix_id = int(_matrix_id.last_id) + 1
+            except TypeError:
+                _matrix_id = 1
+
+        return _matrix_id
+
+    @staticmethod
+    def _do_select_stored_cells(session, revision_id, matrix_type):
+        """
+        Select the cells of the Matrix stored in the RAMSTK Program database.
+
+        :param session: the SQLAlchemy session to use for the query.
+        :param int revision_id: the Revision ID the matrix is associated with.
+        :param str matrix_type: the type of the Matrix.
+        :return: _dic_stored; the (matrix ID, value) of every stored cell keyed
+                 by the (column item ID, row item ID) of the cell.
+        :rtype: dict
+        """
+        _dic_stored = {}
+        for _cell in session.query(
+                RAMSTKMatrix.column_item_id, RAMSTKMatrix.row_item_id,
+                RAMSTKMatrix.matrix_id, RAMSTKMatrix.value).filter(
+                    and_(RAMSTKMatrix.revision_id == revision_id,
+                         RAMSTKMatrix.matrix_type == matrix_type)).all():
+            _dic_stored[(_cell[0], _cell[1])] = (_cell[2], _cell[3])
+
+        return _dic_stored
+
+    def _do_write_cells(self,
+                        session,
+                        matrix_type,
+                        inserts,
+                        updates,
+                        deletes=None):
+        """
+        Write new, changed, and removed cells to the RAMSTK Program database.
+
+        :param session: the SQLAlchemy session to use for the writes.
+        :param str matrix_type: the type of the Matrix being written.
+        :param list inserts: the list of RAMSTKMatrix attribute dicts for the
+                             cells to insert.
+        :param list updates: the list of RAMSTKMatrix attribute dicts for the
+                             cells to update.
+        :keyword list deletes: the list of RAMSTKMatrix primary key dicts for
+                               the cells to delete.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        if deletes is None:
+            deletes = []
+
+        try:
+            session.bulk_insert_mappings(RAMSTKMatrix, inserts)
+            session.bulk_update_mappings(RAMSTKMatrix, updates)
+            if deletes:
+                session.execute(
+                    RAMSTKMatrix.__table__.delete().where(
+                        and_(
+                            RAMSTKMatrix.revision_id == bindparam(
+                                'b_revision_id'),
+                            RAMSTKMatrix.matrix_id == bindparam('b_matrix_id'),
+                            RAMSTKMatrix.column_item_id == bindparam(
+                                'b_column_item_id'),
+                            RAMSTKMatrix.row_item_id == bindparam(
+                                'b_row_item_id'))), deletes)
+            _error_code, _msg = self.dao.db_update(session)
+        except (exc.SQLAlchemyError, exc.DBAPIError) as _error:
+            print _error
+            session.rollback()
+            _error_code = 6
+            _msg = 'RAMSTK ERROR: Updating Matrix {0:s}.'.format(matrix_type)
+
+        if _error_code == 0:
+            _msg = 'RAMSTK SUCCESS: Updating Matrix {0:s}.  Wrote {1:d} ' \
+                   'cells.'.format(matrix_type,
+                                   len(inserts) + len(updates) + len(deletes))
+
+        return _error_code, _msg
+
     def do_create(self, revision_id, matrix_type, rkey='rkey', ckey='ckey'):
         """
         Create or refresh a data matrix.
@@ -103,8 +271,8 @@ class RAMSTKDataMatrix(object):
         _lst_value = []
         _dic_column = {}
 
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        _session = self.dao.db_get_session(
+            autoflush=False, expire_on_commit=False)
 
         # Iterate over the rows (records from the "row" table) and then the
         # columns (records from the "column" table) to create, ultimately, a
@@ -116,12 +284,13 @@ class RAMSTKDataMatrix(object):
             _lst_row_id.append(_attributes[rkey])
             _lst_value.append(0)
 
-            for _column in _session.query(self._column_table).filter(
-                    self._column_table.revision_id == revision_id).all():
-                _attributes = _column.get_attributes()
-                _column_id = _attributes[ckey]
-                _dic_column[_column_id] = pd.Series(
-                    _lst_value, index=_lst_row_id)
+        for _column in _session.query(self._column_table).filter(
+                self._column_table.revision_id == revision_id).all():
+            _attributes = _column.get_attributes()
+            _column_id = _attributes[ckey]
+            _dic_column[_column_id] = pd.Series(_lst_value, index=_lst_row_id)
+
+        self.dao.db_close_session(_session)
 
         self.dtf_matrix = pd.DataFrame(_dic_column)
 
@@ -169,23 +338,6 @@ class RAMSTKDataMatrix(object):
         :return: False if successful or True if an error occurs.
         :rtype: bool
         """
-        try:
-            _rkey = kwargs['rkey']
-        except KeyError:
-            _rkey = 'rkey'
-        try:
-            _ckey = kwargs['ckey']
-        except KeyError:
-            _ckey = 'ckey'
-        try:
-            _rheader = kwargs['rheader']
-        except KeyError:
-            _rheader = 0
-        try:
-            _cheader = kwargs['cheader']
-        except KeyError:
-            _cheader = 0
-
         _return = False
 
         _session = self.dao.RAMSTK_SESSION(
@@ -196,37 +348,7 @@ class RAMSTKDataMatrix(object):
         _lst_value = []
         _dic_column = {}
 
-        self.n_col = 0
-        self.n_row = 0
-
-        # Retrieve the dictionary of row headings.  The key is the row table's
-        # module ID.  The value is the row table field with string data
-        # (typically the code, description, or name field).
-        for _row in _session.query(self._row_table).filter(
-                self._row_table.revision_id == revision_id).all():
-            _attributes = _row.get_attributes()
-            self.dic_row_hdrs[_attributes[_rkey]] = _attributes[_rheader]
-
-            self.n_row += 1
-
-        # Retrieve the dictionary of column headings.  The key is the column
-        # table's module ID.  The value is the column table field with string
-        # data (typically the code, description, or name field).
-        for _column in _session.query(self._column_table).filter(
-                self._column_table.revision_id == revision_id).all():
-            _attributes = _column.get_attributes()
-            try:
-                self.dic_column_hdrs[
-                    _attributes[_ckey]] = _attributes[_cheader]
-            except TypeError:
-                print 'FIXME: Handle TypeError in ' \
-                      'RAMSTKDataMatrix.do_select_all().  Tuple indices must ' \
-                      'be integers, not str.  This will be fixed when all ' \
-                      'the RAMSTK database tables are converted to return ' \
-                      'dicts from the get_attributes() method.  Matrix {0:s} ' \
-                      'is not working.  See issue #59'.format(matrix_type)
-
-            self.n_col += 1
+        self._do_select_headings(_session, revision_id, matrix_type, **kwargs)
 
         # Retrieve the matrix values for the desired Matrix ID.
         for _matrix in _session.query(RAMSTKMatrix).filter(
@@ -335,64 +457,432 @@ class RAMSTKDataMatrix(object):
         """
         Update the Matrix associated with Matrix type.
 
+        The cells stored in the RAMSTK Program database are retrieved with a
+        single query and compared to the Matrix in memory.  Only the cells
+        that are new or whose value has changed are written and they are
+        written as one batch of INSERTs and one batch of UPDATEs in a single
+        transaction.
+
         :param int revision_id: the Revision ID the matrix is associated with.
         :param str matrix_type: the type of the Matrix to update.
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
         _error_code = 0
-        _msg = 'RAMSTK SUCCESS: Updating Matrix {0:s}.'.format(matrix_type)
+        _msg = ''
 
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine,
-            autoflush=True,
-            autocommit=False,
-            expire_on_commit=False)
+        _session = self.dao.db_get_session(
+            autoflush=True, autocommit=False, expire_on_commit=False)
 
-        try:
-            _matrix_id = _session.query(RAMSTKMatrix).filter(
-                RAMSTKMatrix.matrix_type == matrix_type).first().matrix_id
-        except AttributeError:
-            _matrix_id = _session.query(
-                func.max(RAMSTKMatrix.matrix_id).label("last_id")).one()
-            try:
-                _matrix_id = int(_matrix_id.last_id) + 1
-            except TypeError:
-                _matrix_id = 1
+        _matrix_id = self._do_get_matrix_id(_session, matrix_type)
+        _dic_stored = self._do_select_stored_cells(_session, revision_id,
+                                                   matrix_type)
 
+        _lst_insert = []
+        _lst_update = []
         for _column_item_id in list(self.dtf_matrix.columns):
-            for _row_item_id in list(self.dtf_matrix.index):
-                _entity = _session.query(RAMSTKMatrix).filter(
+            for _row_item_id, _value in self.dtf_matrix[
+                    _column_item_id].iteritems():
+                _cell = {
+                    'revision_id': revision_id,
+                    'matrix_id': _matrix_id,
+                    'column_item_id': int(_column_item_id),
+                    'row_item_id': int(_row_item_id),
+                    'value': int(_value)
+                }
+                try:
+                    _cell['matrix_id'], _stored_value = _dic_stored[(
+                        _cell['column_item_id'], _cell['row_item_id'])]
+                    if _stored_value != _cell['value']:
+                        _lst_update.append(_cell)
+                except KeyError:
+                    # If there is no corresponding record in RAMSTKMatrix,
+                    # then create a new RAMSTKMatrix record.
+                    _cell['matrix_type'] = matrix_type
+                    _lst_insert.append(_cell)
+
+        _error_code, _msg = self._do_write_cells(_session, matrix_type,
+                                                 _lst_insert, _lst_update)
+
+        self.dao.db_close_session(_session)
+
+        return _error_code, _msg
+
+
+class RAMSTKSparseDataMatrix(RAMSTKDataMatrix):
+    """
+    The RAMSTK sparse Data Matrix model.
+
+    Almost every cell in a traceability Matrix is zero.  The sparse Matrix
+    stores only the non-zero cells in a dict-of-keys indexed by the (column
+    item ID, row item ID) of the cell.  Loading, inserting, deleting, and
+    selecting therefore scale with the number of non-zero cells rather than
+    with the number of rows times the number of columns.  Only the non-zero
+    cells are stored in the RAMSTK Program database as well; the rows and
+    columns are the records in the row and column tables.
+
+    The dense :class:`pd.DataFrame` is only built when the dtf_matrix
+    attribute is read (e.g., by a Matrix View).  Any changes made to that
+    DataFrame are folded back into the sparse cells the next time the Matrix
+    is changed or saved.
+
+    :ivar dict dic_cells: the non-zero cells in the Matrix.  Key is the
+                          (column item ID, row item ID) of the cell; value is
+                          the value of the cell.
+    """
+
+    def __init__(self, dao, row_table, column_table):
+        """Initialize a sparse Matrix data model instance."""
+        # Initialize private dictionary attributes.
+
+        # Initialize private list attributes.
+        self._lst_column_ids = []
+        self._lst_row_ids = []
+
+        # Initialize private scalar attributes.
+        self._dtf_dense = None
+        self._set_column_ids = set()
+        self._set_row_ids = set()
+
+        # Initialize public dictionary attributes.
+        self.dic_cells = {}
+
+        RAMSTKDataMatrix.__init__(self, dao, row_table, column_table)
+
+    @property
+    def dtf_matrix(self):
+        """
+        Build the dense representation of the Matrix.
+
+        :return: the dense Matrix or None if the Matrix hasn't been selected.
+        :rtype: :class:`pd.DataFrame`
+        """
+        if self._dtf_dense is None and (self._lst_row_ids
+                                        or self._lst_column_ids):
+            _dic_row_idx = dict((_row_id, _idx)
+                                for _idx, _row_id in enumerate(
+                                    self._lst_row_ids))
+            _dic_column_idx = dict((_column_id, _idx)
+                                   for _idx, _column_id in enumerate(
+                                       self._lst_column_ids))
+
+            _values = np.zeros(
+                (len(self._lst_row_ids), len(self._lst_column_ids)),
+                dtype=int)
+            for (_column_id, _row_id), _value in self.dic_cells.iteritems():
+                _values[_dic_row_idx[_row_id],
+                        _dic_column_idx[_column_id]] = _value
+
+            self._dtf_dense = pd.DataFrame(
+                _values,
+                index=list(self._lst_row_ids),
+                columns=list(self._lst_column_ids))
+
+        return self._dtf_dense
+
+    @dtf_matrix.setter
+    def dtf_matrix(self, matrix):
+        """
+        Replace the contents of the Matrix with a dense Matrix.
+
+        :param matrix: the dense Matrix to store or None to clear the Matrix.
+        :type matrix: :class:`pd.DataFrame`
+        """
+        self._do_set_ids([], [])
+        self.dic_cells = {}
+        self._dtf_dense = matrix
+        self._do_fold_dense()
+
+    def _do_set_ids(self, row_ids, column_ids):
+        """
+        Set the row and column item IDs of the Matrix.
+
+        The IDs are kept in a list for their order and in a set so checking
+        whether a row or column is in the Matrix doesn't scan the list.
+
+        :param list row_ids: the row item IDs in display order.
+        :param list column_ids: the column item IDs in display order.
+        :return: None
+        :rtype: None
+        """
+        self._lst_row_ids = list(row_ids)
+        self._lst_column_ids = list(column_ids)
+        self._set_row_ids = set(self._lst_row_ids)
+        self._set_column_ids = set(self._lst_column_ids)
+
+        return None
+
+    def _do_fold_dense(self):
+        """
+        Fold the dense Matrix, if it has been built, into the sparse cells.
+
+        :return: None
+        :rtype: None
+        """
+        if self._dtf_dense is not None:
+            _values = self._dtf_dense.fillna(0).values
+            self._do_set_ids([int(_id) for _id in self._dtf_dense.index],
+                             [int(_id) for _id in self._dtf_dense.columns])
+            self.dic_cells = {}
+            for _row_idx, _column_idx in zip(*np.nonzero(_values)):
+                self.dic_cells[(self._lst_column_ids[_column_idx],
+                                self._lst_row_ids[_row_idx])] = int(
+                                    _values[_row_idx, _column_idx])
+
+            self._dtf_dense = None
+
+        return None
+
+    def do_create(self, revision_id, matrix_type, rkey='rkey', ckey='ckey'):
+        """
+        Create or refresh a sparse data matrix.
+
+        Every cell of the refreshed Matrix is zero so any non-zero cells
+        stored for the Matrix are deleted.
+
+        :param int revision_id: the ID of the Revision the desired Matrix is
+                                associated with.
+        :param str matrix_type: the type of the Matrix to select all rows and
+                                all columns for.
+        :keyword int rkey: the key in the row table attributes containing the
+                           module ID.
+        :keyword int ckey: the key in the column table attributes containing
+                           the module ID.
+        """
+        _return = False
+
+        _session = self.dao.db_get_session(
+            autoflush=False, expire_on_commit=False)
+
+        self._dtf_dense = None
+        self.dic_cells = {}
+        self._do_set_ids(
+            sorted(
+                _row.get_attributes()[rkey]
+                for _row in _session.query(self._row_table).filter(
+                    self._row_table.revision_id == revision_id).all()),
+            sorted(
+                _column.get_attributes()[ckey]
+                for _column in _session.query(self._column_table).filter(
+                    self._column_table.revision_id == revision_id).all()))
+
+        self.dao.db_close_session(_session)
+
+        self.do_update(revision_id, matrix_type)
+
+        return _return
+
+    def do_select(self, col, row):
+        """
+        Select the value from the cell identified by col and row.
+
+        :param str col: the column item ID of the cell.
+        :param str row: the row item ID of the cell.
+        :return: the value in the cell at (col, row).
+        :rtype: int
+        :raise: KeyError if the column or row doesn't exist.
+        """
+        if self._dtf_dense is not None:
+            return self._dtf_dense[col][row]
+
+        if col not in self._set_column_ids or row not in self._set_row_ids:
+            raise KeyError((col, row))
+
+        return self.dic_cells.get((col, row), 0)
+
+    def do_select_all(self, revision_id, matrix_type, **kwargs):
+        r"""
+        Select everything needed to build the sparse matrix.
+
+        The rows and columns are the records in the row and column tables
+        that are selected for the headings.  Only the non-zero cells are
+        retrieved from the RAMSTK Program database.
+
+        :param int revision_id: the ID of the Revision the desired Matrix is
+                                associated with.
+        :param str matrix_type: the type of the Matrix to select all rows and
+                                all columns for.
+        :param \**kwargs: See RAMSTKDataMatrix.do_select_all().
+        :return: False if successful or True if an error occurs.
+        :rtype: bool
+        """
+        _return = False
+
+        _session = self.dao.RAMSTK_SESSION(
+            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+
+        _lst_row_ids, _lst_column_ids = self._do_select_headings(
+            _session, revision_id, matrix_type, **kwargs)
+
+        self._dtf_dense = None
+        self._do_set_ids(sorted(_lst_row_ids), sorted(_lst_column_ids))
+        self.dic_cells = dict(
+            ((_cell[0], _cell[1]), _cell[2]) for _cell in _session.query(
+                RAMSTKMatrix.column_item_id, RAMSTKMatrix.row_item_id,
+                RAMSTKMatrix.value).filter(
                     and_(RAMSTKMatrix.revision_id == revision_id,
                          RAMSTKMatrix.matrix_type == matrix_type,
-                         RAMSTKMatrix.column_item_id == int(_column_item_id),
-                         RAMSTKMatrix.row_item_id == int(
-                             _row_item_id))).first()
-
-                try:
-                    # If there is no corresponding record in RAMSTKMatrix, then
-                    # create a new RAMSTKMatrix record and add it.
-                    if _entity is None:
-                        _entity = RAMSTKMatrix()
-                        _entity.revision_id = revision_id
-                        _entity.matrix_id = _matrix_id
-                        _entity.matrix_type = matrix_type
-                        _entity.column_item_id = int(_column_item_id)
-                        _entity.row_item_id = int(_row_item_id)
-
-                    _entity.value = int(
-                        self.dtf_matrix[_column_item_id][_row_item_id])
-                    _session.add(_entity)
-                    _error_code, _msg = self.dao.db_update(_session)
-
-                except AttributeError:
-                    _error_code = 6
-                    _msg = 'RAMSTK ERROR: Attempted to save non-existent ' \
-                           'entity with Column ID {0:s} and Row ID {1:s} to ' \
-                           'Matrix {2:s}.'.format(
-                               str(_column_item_id), str(_row_item_id),
-                               matrix_type)
+                         RAMSTKMatrix.value != 0)).all()
+            if _cell[0] in self._set_column_ids
+            and _cell[1] in self._set_row_ids)
 
         _session.close()
 
+        return _return
+
+    def do_insert(self, item_id, heading, row=True):
+        """
+        Insert a row or a column into the sparse matrix.
+
+        :param int item_id: the ID of the row or column item to insert into the
+                            Matrix (this is the module ID associated with the
+                            row or column to be inserted).
+        :param str heading: the heading for the new row or column.
+        :keyword bool row: indicates whether to insert a row (default) or a
+                           column.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = 'RAMSTK SUCCESS: Inserting a row or column into the matrix.'
+
+        self._do_fold_dense()
+
+        if row:
+            if item_id in self._set_row_ids:
+                _error_code = 6
+                _msg = 'RAMSTK ERROR: Attempting to insert row {0:d} into a ' \
+                       'matrix already containing a row {0:d}.'.format(item_id)
+            else:
+                self.dic_row_hdrs[item_id] = heading
+                self._lst_row_ids.append(item_id)
+                self._set_row_ids.add(item_id)
+                self.n_row = len(self._lst_row_ids)
+        else:
+            if item_id in self._set_column_ids:
+                _error_code = 6
+                _msg = 'RAMSTK ERROR: Inserting column into matrix.  Column ' \
+                       '{0:d} already exists or adjacent column {1:d} does ' \
+                       'NOT exist.'.format(item_id, self.n_col)
+            else:
+                self.dic_column_hdrs[item_id] = heading
+                self._lst_column_ids.append(item_id)
+                self._set_column_ids.add(item_id)
+                self.n_col = len(self._lst_column_ids)
+
+        return _error_code, _msg
+
+    def do_delete(self, item_id, row=True):
+        """
+        Delete a column or row from the sparse Matrix.
+
+        :param int item_id: the ID of the row or column item to delete from the
+                            Matrix.
+        :param bool row: indicates whether to delete a row (default) or a
+                         column identified by identifier.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = 'RAMSTK SUCCESS: Removing a row or column from the matrix.'
+
+        self._do_fold_dense()
+
+        if row:
+            try:
+                self._set_row_ids.remove(item_id)
+                self._lst_row_ids.remove(item_id)
+                self.dic_cells = dict((_key, _value) for _key, _value in
+                                      self.dic_cells.iteritems()
+                                      if _key[1] != item_id)
+                self.dic_row_hdrs.pop(item_id)
+                self.n_row = len(self._lst_row_ids)
+            except (KeyError, ValueError):
+                _error_code = 6
+                _msg = 'RAMSTK ERROR: Attempted to drop non-existent row ' \
+                       '{0:d} from the matrix.'.format(item_id)
+        else:
+            try:
+                self._set_column_ids.remove(item_id)
+                self._lst_column_ids.remove(item_id)
+                self.dic_cells = dict((_key, _value) for _key, _value in
+                                      self.dic_cells.iteritems()
+                                      if _key[0] != item_id)
+                self.dic_column_hdrs.pop(item_id)
+                self.n_col = len(self._lst_column_ids)
+            except (KeyError, ValueError):
+                _error_code = 6
+                _msg = 'RAMSTK ERROR: Attempted to drop non-existent column ' \
+                       '{0:d} from the matrix.'.format(item_id)
+
+        return _error_code, _msg
+
+    def do_update(self, revision_id, matrix_type):
+        """
+        Update the sparse Matrix associated with Matrix type.
+
+        Only non-zero cells are stored.  Non-zero cells that aren't stored are
+        inserted, stored cells whose non-zero value changed are updated, and
+        stored cells that became zero are deleted.
+
+        :param int revision_id: the Revision ID the matrix is associated with.
+        :param str matrix_type: the type of the Matrix to update.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        self._do_fold_dense()
+
+        _session = self.dao.db_get_session(
+            autoflush=True, autocommit=False, expire_on_commit=False)
+
+        _matrix_id = self._do_get_matrix_id(_session, matrix_type)
+        _dic_stored = self._do_select_stored_cells(_session, revision_id,
+                                                   matrix_type)
+
+        _lst_update = []
+        _lst_delete = []
+        for (_column_id, _row_id), (_stored_matrix_id,
+                                    _stored_value) in _dic_stored.iteritems():
+            if (_column_id not in self._set_column_ids
+                    or _row_id not in self._set_row_ids):
+                continue
+
+            _value = self.dic_cells.get((_column_id, _row_id), 0)
+            if _value == _stored_value:
+                continue
+            elif _value == 0:
+                _lst_delete.append({
+                    'b_revision_id': revision_id,
+                    'b_matrix_id': _stored_matrix_id,
+                    'b_column_item_id': _column_id,
+                    'b_row_item_id': _row_id
+                })
+            else:
+                _lst_update.append({
+                    'revision_id': revision_id,
+                    'matrix_id': _stored_matrix_id,
+                    'column_item_id': _column_id,
+                    'row_item_id': _row_id,
+                    'value': _value
+                })
+
+        _lst_insert = [{
+            'revision_id': revision_id,
+            'matrix_id': _matrix_id,
+            'matrix_type': matrix_type,
+            'column_item_id': _key[0],
+            'row_item_id': _key[1],
+            'value': _value
+        } for _key, _value in self.dic_cells.iteritems()
+                       if _key not in _dic_stored]
+
+        _error_code, _msg = self._do_write_cells(
+            _session,
+            matrix_type,
+            _lst_insert,
+            _lst_update,
+            deletes=_lst_delete)
+
+        self.dao.db_close_session(_session)
+
         return _error_code, _msg
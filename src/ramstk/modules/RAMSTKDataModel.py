@@ -6,7 +6,13 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Datamodels Package RAMSTKDataModel."""
 
-from treelib import tree, Tree  # pylint: disable=E0401
+from sqlalchemy import inspect  # pylint: disable=E0401
+from sqlalchemy.exc import NoInspectionAvailable  # pylint: disable=E0401
+from sqlalchemy.orm.attributes import \
+    set_committed_value  # pylint: disable=E0401
+from treelib import tree  # pylint: disable=E0401
+
+from .RAMSTKTree import RAMSTKTree
 
 __author__ = 'Doyle Rowland'
 __email__ = 'doyle.rowland@reliaqual.com'
@@ -18,8 +24,8 @@ class RAMSTKDataModel(object):  # pragma: no cover
     """
     This is the meta-class for all RAMSTK Data Models.
 
-    :ivar tree: the :class:`treelib.Tree` that will contain the
-                structure of the RAMSTK module being modeled..
+    :ivar tree: the :class:`ramstk.modules.RAMSTKTree.RAMSTKTree` that will
+                contain the structure of the RAMSTK module being modeled..
     :ivar dao: the :class:`ramstk.dao.DAO` object used to communicate
                with the RAMSTK Program database.
     """
@@ -33,6 +39,9 @@ class RAMSTKDataModel(object):  # pragma: no cover
         :type dao: :class:`ramstk.dao.DAO.DAO`
         """
         # Initialize private dictionary attributes.
+        # The post-order of each subtree requested from do_get_post_order(),
+        # keyed by the Node ID at the top of the subtree.
+        self._dic_post_order = {}
 
         # Initialize private list attributes.
 
@@ -45,7 +54,7 @@ class RAMSTKDataModel(object):  # pragma: no cover
 
         # Initialize public scalar attributes.
         self.dao = dao
-        self.tree = Tree()
+        self.tree = RAMSTKTree()
         self.last_id = None
 
         # Add the root to the Tree().  This is neccessary to allow multiple
@@ -82,6 +91,8 @@ class RAMSTKDataModel(object):  # pragma: no cover
         :return: an SQLAlchemy session instance.
         :rtype:
         """
+        self._dic_post_order = {}
+
         _root = self.tree.root
         for _node in self.tree.children(_root):
             self.tree.remove_node(_node.identifier)
@@ -95,16 +106,24 @@ class RAMSTKDataModel(object):  # pragma: no cover
 
         :param list entities: the list of RAMSTK<MODULE> entities to add to the
                               RAMSTK Program database.
+        :keyword bool copy: whether to bulk load the entities with the
+                            DAO.db_copy_many().  Default is False.
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
         _entities = kwargs['entities']
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        _copy = kwargs.get('copy', False)
+        self._dic_post_order = {}
 
-        _error_code, _msg = self.dao.db_add(_entities, _session)
+        _session = self.dao.db_get_session(
+            autoflush=False, expire_on_commit=False)
 
-        _session.close()
+        if _copy:
+            _error_code, _msg = self.dao.db_copy_many(_entities, _session)
+        else:
+            _error_code, _msg = self.dao.db_add_many(_entities, _session)
+
+        self.dao.db_close_session(_session)
 
         return _error_code, _msg
 
@@ -119,23 +138,67 @@ class RAMSTKDataModel(object):  # pragma: no cover
         """
         _msg = ''
 
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        _session = self.dao.db_get_session(
+            autoflush=False, expire_on_commit=False)
 
         try:
             _entity = self.tree.get_node(node_id).data
             _error_code, _msg = self.dao.db_delete(_entity, _session)
 
             if _error_code == 0:
+                self._dic_post_order = {}
                 self.tree.remove_node(node_id)
 
         except AttributeError:
             _error_code = 2005
 
-        _session.close()
+        self.dao.db_close_session(_session)
 
         return _error_code, _msg
 
+    def do_get_post_order(self, node_id=0):
+        """
+        Retrieve the Node IDs of a subtree with every child before its parent.
+
+        The order is built without recursion the first time it is requested
+        and reused until do_select_all(), do_insert(), or do_delete() changes
+        the tree.  Roll-ups iterate it forward; top-down calculations iterate
+        it in reverse.  The subtree of the Node ID at index i is the
+        contiguous slice ending at i with length _lst_size[i], so a reverse
+        walk can skip a subtree by stepping back _lst_size[i] places.
+
+        :param int node_id: the Node ID at the top of the subtree.
+        :return: (_lst_node_id, _lst_size); the Node IDs in post-order and the
+                 number of nodes in the subtree of each.
+        :rtype: (list, list)
+        """
+        try:
+            return self._dic_post_order[node_id]
+        except KeyError:
+            pass
+
+        # The stack pops the last child first so reversing the visit order
+        # gives a post-order with the siblings in tree order.
+        _lst_node_id = []
+        _stack = [node_id]
+        while _stack:
+            _node_id = _stack.pop()
+            _lst_node_id.append(_node_id)
+            _stack.extend(self.tree.get_node(_node_id).fpointer)
+        _lst_node_id.reverse()
+
+        _dic_size = {}
+        _lst_size = []
+        for _node_id in _lst_node_id:
+            _size = 1 + sum(_dic_size[_child_id] for _child_id in
+                            self.tree.get_node(_node_id).fpointer)
+            _dic_size[_node_id] = _size
+            _lst_size.append(_size)
+
+        self._dic_post_order[node_id] = (_lst_node_id, _lst_size)
+
+        return _lst_node_id, _lst_size
+
     def do_update(self, node_id):
         """
         Update the RAMSTK<MODULE> instance in the RAMSTK Program database.
@@ -148,11 +211,8 @@ class RAMSTKDataModel(object):  # pragma: no cover
         _error_code = 0
         _msg = ''
 
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine,
-            autoflush=True,
-            autocommit=False,
-            expire_on_commit=False)
+        _session = self.dao.db_get_session(
+            autoflush=True, autocommit=False, expire_on_commit=False)
 
         try:
             _entity = self.tree.get_node(node_id).data
@@ -164,6 +224,79 @@ class RAMSTKDataModel(object):  # pragma: no cover
             _msg = ('RAMSTK ERROR: Attempted to save non-existent '
                     'entity with Node ID {0:s}.').format(str(node_id))
 
-        _session.close()
+        self.dao.db_close_session(_session)
 
         return _error_code, _msg
+
+    def do_select_modified(self, node_id=None):
+        """
+        Retrieve the RAMSTK<MODULE> instances changed since they were saved.
+
+        SQLAlchemy tracks the attributes set on each instance, so only the
+        instances that were edited (or never saved) are returned.  An
+        attribute set to the value it already had is not an edit.
+
+        :param int node_id: the Node ID at the top of the subtree to search.
+                            Defaults to the whole tree.
+        :return: the changed RAMSTK<MODULE> instances.
+        :rtype: list
+        """
+        _lst_entities = []
+
+        for _node_id in self.tree.expand_tree(node_id, sorting=False):
+            _entity = self.tree.get_node(_node_id).data
+            try:
+                _state = inspect(_entity)
+            except NoInspectionAvailable:
+                continue
+            if _state.transient:
+                _lst_entities.append(_entity)
+            elif _state.modified:
+                _dic_values = _state.dict
+                if any(_dic_values.get(_key) != _value
+                       for _key, _value in _state.committed_state.iteritems()):
+                    _lst_entities.append(_entity)
+                else:
+                    # Make the unchanged values the committed values so the
+                    # instance isn't compared again on the next save.
+                    for _key in _state.committed_state.keys():
+                        set_committed_value(_entity, _key,
+                                            _dic_values.get(_key))
+
+        return _lst_entities
+
+    def do_update_many(self, entities):
+        """
+        Update a list of RAMSTK<MODULE> instances in one transaction.
+
+        :param list entities: the RAMSTK<MODULE> instances to update in the
+                              RAMSTK Program database.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = ''
+
+        if entities:
+            _session = self.dao.db_get_session(
+                autoflush=True, autocommit=False, expire_on_commit=False)
+
+            _session.add_all(entities)
+            _error_code, _msg = self.dao.db_update(_session)
+
+            self.dao.db_close_session(_session)
+
+        return _error_code, _msg
+
+    def do_update_all(self, **kwargs):  # pylint: disable=unused-argument
+        """
+        Update the changed RAMSTK<MODULE> instances in the RAMSTK database.
+
+        Only the instances returned by do_select_modified() are saved, all in
+        one session and one transaction, so the database work is proportional
+        to what was edited rather than to the size of the tree.
+
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        return self.do_update_many(self.do_select_modified())
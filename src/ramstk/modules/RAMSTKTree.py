@@ -0,0 +1,545 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.modules.RAMSTKTree.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Datamodels Package RAMSTKTree."""
+
+from array import array
+from copy import deepcopy
+
+from treelib import Tree  # pylint: disable=E0401
+from treelib.tree import (DuplicatedNodeIdError, LinkPastRootNodeError,
+                          LoopError, MultipleRootError, NodeIDAbsentError)
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2017 Doyle "weibullguy" Rowland'
+
+
+class RAMSTKNode(object):
+    """
+    This is a node in a RAMSTKTree().
+
+    A RAMSTKNode() only carries its payload.  The links to the parent and
+    children nodes are held in the arrays of the RAMSTKTree() the node
+    belongs to and are presented as the treelib.Node() bpointer and fpointer
+    attributes.
+
+    :ivar identifier: the Node ID of the node.
+    :ivar tag: the tag (label) of the node.
+    :ivar data: the RAMSTK<MODULE> payload of the node.
+    """
+
+    __slots__ = ('_tree', '_index', 'identifier', 'tag', 'data')
+
+    # The Node is always expanded when the tree is displayed.
+    expanded = True
+
+    def __init__(self, tree, index, tag, identifier, data):
+        """
+        Initialize a RAMSTKNode instance.
+
+        :param tree: the RAMSTKTree() the node belongs to.
+        :type tree: :class:`ramstk.modules.RAMSTKTree.RAMSTKTree`
+        :param int index: the index of the node in the RAMSTKTree() arrays.
+        :param str tag: the tag of the node.
+        :param identifier: the Node ID of the node.
+        :param data: the payload of the node.
+        """
+        self._tree = tree
+        self._index = index
+        self.identifier = identifier
+        self.tag = tag
+        self.data = data
+
+    def __lt__(self, other):
+        """Sort nodes by tag as treelib does."""
+        return self.tag < other.tag
+
+    def __repr__(self):
+        """Return the same representation as a treelib.Node()."""
+        return "RAMSTKNode(tag={0!r}, identifier={1!r}, data={2!r})".format(
+            self.tag, self.identifier, self.data)
+
+    @property
+    def bpointer(self):
+        """Return the Node ID of the parent node or None for the root."""
+        _parent = self._tree._lst_parent[self._index]
+
+        if _parent < 0:
+            return None
+
+        return self._tree._lst_node[_parent].identifier
+
+    @property
+    def fpointer(self):
+        """Return the list of Node IDs of the children nodes."""
+        _lst_node = self._tree._lst_node
+
+        return [
+            _lst_node[_child].identifier
+            for _child in self._tree._lst_children[self._index] or []
+        ]
+
+    def is_leaf(self):
+        """Return True if the node has no children."""
+        return not self._tree._lst_children[self._index]
+
+    def is_root(self):
+        """Return True if the node has no parent."""
+        return self._tree._lst_parent[self._index] < 0
+
+
+class RAMSTKTree(Tree):
+    """
+    This is an array-backed tree for RAMSTK data models.
+
+    A RAMSTKTree() is a drop-in replacement for the parts of treelib.Tree()
+    used by RAMSTK.  Each node is a RAMSTKNode() assigned an integer index
+    when it is created.  The parent of each node is kept in an array of
+    indices and the children in a list of indices, which is only created for
+    nodes that have children.  The nodes themselves have no per-node
+    dictionary or child list so a large Hardware BoM or FMEA needs a fraction
+    of the memory a treelib.Tree() needs and children() doesn't look up each
+    child Node ID.  The read-only treelib.Tree() methods (show(), depth(),
+    leaves(), etc.) are inherited and work through the RAMSTKNode() bpointer
+    and fpointer attributes.
+    """
+
+    def __init__(self):
+        """Initialize an empty RAMSTKTree instance."""
+        Tree.__init__(self)
+
+        # Initialize private list attributes.
+        # The RAMSTKNode() at each index or None if the node was removed.
+        self._lst_node = []
+        # The index of the parent of the node at each index.  The root, and
+        # nodes that were removed, have a parent index of -1.
+        self._lst_parent = array('l')
+        # The list of the indices of the children of the node at each index
+        # or None if the node has no children.
+        self._lst_children = []
+
+    def create_node(self, tag=None, identifier=None, parent=None, data=None):
+        """
+        Create a node as the last child of the parent node.
+
+        :param str tag: the tag of the new node.  Defaults to the identifier.
+        :param identifier: the Node ID of the new node.
+        :param parent: the Node ID of the parent node or None to create the
+                       root.
+        :param data: the payload of the new node.
+        :return: _node; the new node.
+        :rtype: :class:`ramstk.modules.RAMSTKTree.RAMSTKNode`
+        :raise: treelib.tree.DuplicatedNodeIdError if the Node ID is already
+                in the tree.
+        :raise: treelib.tree.MultipleRootError if parent is None and the tree
+                already has a root.
+        :raise: treelib.tree.NodeIDAbsentError if the parent isn't in the
+                tree.
+        """
+        if identifier in self._nodes:
+            raise DuplicatedNodeIdError(
+                "Can't create node with ID '{0!s}'".format(identifier))
+
+        if parent is None:
+            if self.root is not None:
+                raise MultipleRootError("A tree takes one root merely.")
+            _parent = -1
+        else:
+            try:
+                _parent = self._nodes[parent]._index
+            except KeyError:
+                raise NodeIDAbsentError(
+                    "Parent node '{0!s}' is not in the tree".format(parent))
+
+        _index = len(self._lst_node)
+        _node = RAMSTKNode(self, _index, identifier if tag is None else tag,
+                           identifier, data)
+        self._lst_node.append(_node)
+        self._lst_parent.append(_parent)
+        self._lst_children.append(None)
+        self._nodes[identifier] = _node
+
+        if _parent < 0:
+            self.root = identifier
+        elif self._lst_children[_parent] is None:
+            self._lst_children[_parent] = [_index]
+        else:
+            self._lst_children[_parent].append(_index)
+
+        return _node
+
+    def add_node(self, node, parent=None):
+        """
+        Add a copy of a treelib.Node() or RAMSTKNode() to the tree.
+
+        :param node: the node to add.
+        :param parent: the Node ID of the parent node.
+        :return: None
+        :rtype: None
+        """
+        self.create_node(
+            tag=node.tag, identifier=node.identifier, parent=parent,
+            data=node.data)
+
+        return None
+
+    def children(self, nid):
+        """
+        Retrieve the children nodes of Node ID.
+
+        :param nid: the Node ID to retrieve the children of.
+        :return: the list of children nodes in the order they were added.
+        :rtype: list
+        :raise: treelib.tree.NodeIDAbsentError if the Node ID isn't in the
+                tree.
+        """
+        _lst_node = self._lst_node
+
+        return [
+            _lst_node[_child]
+            for _child in self._lst_children[self._get_index(nid)] or []
+        ]
+
+    def is_branch(self, nid):
+        """
+        Retrieve the Node IDs of the children of Node ID.
+
+        :param nid: the Node ID to retrieve the children of.
+        :return: the list of the children Node IDs.
+        :rtype: list
+        :raise: treelib.tree.NodeIDAbsentError if the Node ID isn't in the
+                tree.
+        """
+        return [_node.identifier for _node in self.children(nid)]
+
+    def parent(self, nid):
+        """
+        Retrieve the parent node of Node ID.
+
+        :param nid: the Node ID to retrieve the parent of.
+        :return: the parent node or None if Node ID is the root.
+        :rtype: :class:`ramstk.modules.RAMSTKTree.RAMSTKNode`
+        :raise: treelib.tree.NodeIDAbsentError if the Node ID isn't in the
+                tree.
+        """
+        _parent = self._lst_parent[self._get_index(nid)]
+
+        return None if _parent < 0 else self._lst_node[_parent]
+
+    def expand_tree(self, nid=None, mode=Tree.DEPTH, filter=None, key=None,
+                    reverse=False, sorting=True):
+        """
+        Iterate the Node IDs of the subtree at Node ID.
+
+        Unsorted, unfiltered depth-first traversals walk the arrays directly.
+        All other traversals use treelib.Tree.expand_tree().
+
+        :param nid: the Node ID at the top of the subtree.  Defaults to the
+                    root.
+        :return: generator of the Node IDs.
+        :rtype: generator
+        """
+        # pylint: disable=redefined-builtin
+        if sorting or filter is not None or mode != self.DEPTH:
+            for _nid in Tree.expand_tree(self, nid, mode, filter, key, reverse,
+                                         sorting):
+                yield _nid
+            return
+
+        _lst_children = self._lst_children
+        _stack = [self._get_index(self.root if nid is None else nid)]
+        while _stack:
+            _index = _stack.pop()
+            yield self._lst_node[_index].identifier
+            if _lst_children[_index]:
+                _stack.extend(reversed(_lst_children[_index]))
+
+    def is_ancestor(self, ancestor, grandchild):
+        """
+        Check whether Node ID ancestor is above Node ID grandchild.
+
+        :param ancestor: the Node ID of the possible ancestor.
+        :param grandchild: the Node ID of the possible descendant.
+        :return: True if ancestor is a parent, grandparent, etc. of
+                 grandchild.
+        :rtype: bool
+        :raise: treelib.tree.NodeIDAbsentError if either Node ID isn't in the
+                tree.
+        """
+        _ancestor = self._get_index(ancestor)
+        _parent = self._lst_parent[self._get_index(grandchild)]
+        while _parent >= 0:
+            if _parent == _ancestor:
+                return True
+            _parent = self._lst_parent[_parent]
+
+        return False
+
+    def move_node(self, source, destination):
+        """
+        Move the subtree at Node ID source to be the last child of destination.
+
+        :param source: the Node ID of the node to move.
+        :param destination: the Node ID of the new parent node.
+        :return: None
+        :rtype: None
+        :raise: treelib.tree.NodeIDAbsentError if either Node ID isn't in the
+                tree.
+        :raise: treelib.tree.LoopError if destination is source or one of its
+                successors.
+        """
+        _index = self._get_index(source)
+        _parent = self._get_index(destination)
+
+        if _index == _parent or self.is_ancestor(source, destination):
+            raise LoopError
+
+        self._lst_children[self._lst_parent[_index]].remove(_index)
+        self._lst_parent[_index] = _parent
+        if self._lst_children[_parent] is None:
+            self._lst_children[_parent] = [_index]
+        else:
+            self._lst_children[_parent].append(_index)
+
+        return None
+
+    def remove_node(self, identifier):
+        """
+        Remove the node with Node ID and all of its successors.
+
+        :param identifier: the Node ID of the node to remove.
+        :return: the number of nodes removed.
+        :rtype: int
+        :raise: treelib.tree.NodeIDAbsentError if the Node ID isn't in the
+                tree.
+        """
+        if identifier is None:
+            return 0
+
+        _index = self._get_index(identifier)
+        _parent = self._lst_parent[_index]
+        if _parent < 0:
+            self.root = None
+        else:
+            self._lst_children[_parent].remove(_index)
+
+        _count = 0
+        _stack = [_index]
+        while _stack:
+            _index = _stack.pop()
+            _node = self._lst_node[_index]
+            _stack.extend(self._lst_children[_index] or [])
+            del self._nodes[_node.identifier]
+            self._lst_node[_index] = None
+            self._lst_parent[_index] = -1
+            self._lst_children[_index] = None
+            _count += 1
+
+        self._do_reclaim()
+
+        return _count
+
+    def link_past_node(self, nid):
+        """
+        Remove the node with Node ID and give its children to its parent.
+
+        The children become the last children of the parent, in order, as
+        they do in treelib.Tree.link_past_node().
+
+        :param nid: the Node ID of the node to link past.
+        :return: None
+        :rtype: None
+        :raise: treelib.tree.NodeIDAbsentError if the Node ID isn't in the
+                tree.
+        :raise: treelib.tree.LinkPastRootNodeError if the Node ID is the root.
+        """
+        _index = self._get_index(nid)
+        _parent = self._lst_parent[_index]
+        if _parent < 0:
+            raise LinkPastRootNodeError("Cannot link past the root node, "
+                                        "delete it with remove_node()")
+
+        _lst_children = self._lst_children[_index] or []
+        for _child in _lst_children:
+            self._lst_parent[_child] = _parent
+        self._lst_children[_parent].extend(_lst_children)
+        self._lst_children[_parent].remove(_index)
+
+        del self._nodes[nid]
+        self._lst_node[_index] = None
+        self._lst_parent[_index] = -1
+        self._lst_children[_index] = None
+
+        self._do_reclaim()
+
+        return None
+
+    def paste(self, nid, new_tree, deep=False):
+        """
+        Add the nodes of another tree under the node with Node ID.
+
+        The root of new_tree becomes the last child of Node ID.  The new nodes
+        share the payload of the nodes in new_tree unless deep is True.
+
+        :param nid: the Node ID of the node to paste new_tree under.
+        :param new_tree: the treelib.Tree() or RAMSTKTree() to paste.
+        :keyword bool deep: whether to copy the payload of the nodes.
+        :return: None
+        :rtype: None
+        :raise: treelib.tree.NodeIDAbsentError if the Node ID isn't in the
+                tree.
+        :raise: ValueError if new_tree has a Node ID already in the tree.
+        """
+        if nid is None:
+            raise OSError("First parameter can't be None")
+
+        self._get_index(nid)
+
+        _set_joint = set(new_tree.nodes) & set(self._nodes)
+        if _set_joint:
+            raise ValueError(
+                'Duplicated nodes {0!s} exists.'.format(list(_set_joint)))
+
+        if new_tree.root is None:
+            return None
+
+        for _nid in new_tree.expand_tree(sorting=False):
+            _node = new_tree[_nid]
+            self.create_node(
+                tag=_node.tag,
+                identifier=_nid,
+                parent=nid if _nid == new_tree.root else _node.bpointer,
+                data=deepcopy(_node.data) if deep else _node.data)
+
+        return None
+
+    def remove_subtree(self, nid):
+        """
+        Remove the subtree at Node ID and return it as a new RAMSTKTree().
+
+        :param nid: the Node ID of the node to remove.
+        :return: _tree; the removed nodes or an empty tree if nid is None.
+        :rtype: :class:`ramstk.modules.RAMSTKTree.RAMSTKTree`
+        :raise: treelib.tree.NodeIDAbsentError if the Node ID isn't in the
+                tree.
+        """
+        _tree = self.subtree(nid)
+        self.remove_node(nid)
+
+        return _tree
+
+    def subtree(self, nid):
+        """
+        Create a new RAMSTKTree() from the subtree at Node ID.
+
+        The new tree shares the payload of the nodes, but not the nodes.
+
+        :param nid: the Node ID that will be the root of the new tree.
+        :return: _tree; the new tree.
+        :rtype: :class:`ramstk.modules.RAMSTKTree.RAMSTKTree`
+        :raise: treelib.tree.NodeIDAbsentError if the Node ID isn't in the
+                tree.
+        """
+        _tree = RAMSTKTree()
+        if nid is None:
+            return _tree
+
+        for _nid in self.expand_tree(nid, sorting=False):
+            _node = self._nodes[_nid]
+            _tree.create_node(
+                tag=_node.tag,
+                identifier=_nid,
+                parent=None if _nid == nid else _node.bpointer,
+                data=_node.data)
+
+        return _tree
+
+    def update_node(self, nid, **attrs):
+        """
+        Update the identifier, tag, or data of the node with Node ID.
+
+        :param nid: the Node ID of the node to update.
+        :return: None
+        :rtype: None
+        :raise: treelib.tree.NodeIDAbsentError if the Node ID isn't in the
+                tree.
+        """
+        _node = self._lst_node[self._get_index(nid)]
+        for _attr, _value in attrs.items():
+            if _attr == 'identifier':
+                del self._nodes[nid]
+                self._nodes[_value] = _node
+                if self.root == nid:
+                    self.root = _value
+            setattr(_node, _attr, _value)
+
+        return None
+
+    def _get_index(self, nid):
+        """
+        Retrieve the array index of Node ID.
+
+        :param nid: the Node ID to retrieve the index of.
+        :return: the index of the node.
+        :rtype: int
+        :raise: treelib.tree.NodeIDAbsentError if the Node ID isn't in the
+                tree.
+        """
+        try:
+            return self._nodes[nid]._index
+        except KeyError:
+            raise NodeIDAbsentError(
+                "Node '{0!s}' is not in the tree".format(nid))
+
+    def _do_reclaim(self):
+        """
+        Compact the arrays once the removed nodes are the majority.
+
+        This keeps repeatedly emptying and reloading a tree from growing the
+        arrays.
+
+        :return: None
+        :rtype: None
+        """
+        if len(self._lst_node) > 2 * len(self._nodes) + 64:
+            self._do_compact()
+
+        return None
+
+    def _do_compact(self):
+        """
+        Drop the slots of removed nodes from the arrays.
+
+        The remaining nodes keep their relative order.
+
+        :return: None
+        :rtype: None
+        """
+        _lst_new = [-1] * len(self._lst_node)
+        _lst_node = []
+        for _index, _node in enumerate(self._lst_node):
+            if _node is not None:
+                _lst_new[_index] = len(_lst_node)
+                _node._index = len(_lst_node)  # pylint: disable=W0212
+                _lst_node.append(_node)
+
+        _lst_parent = array('l')
+        _lst_children = []
+        for _index, _new in enumerate(_lst_new):
+            if _new >= 0:
+                _parent = self._lst_parent[_index]
+                _children = self._lst_children[_index]
+                _lst_parent.append(_lst_new[_parent] if _parent >= 0 else -1)
+                _lst_children.append([_lst_new[_child] for _child in _children]
+                                     if _children else None)
+
+        self._lst_node = _lst_node
+        self._lst_parent = _lst_parent
+        self._lst_children = _lst_children
+
+        return None
@@ -1,3 +1,6 @@
+from .RAMSTKTree import RAMSTKNode, RAMSTKTree
+from .RAMSTKAttributeStore import (RAMSTKAttributes, RAMSTKAttributeRows,
+                                   RAMSTKAttributeStore)
 from .RAMSTKDataModel import RAMSTKDataModel
-from .RAMSTKDataMatrix import RAMSTKDataMatrix
+from .RAMSTKDataMatrix import RAMSTKDataMatrix, RAMSTKSparseDataMatrix
 from .RAMSTKDataController import RAMSTKDataController
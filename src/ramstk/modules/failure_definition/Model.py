@@ -146,22 +146,13 @@ class FailureDefinitionDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the failure "
-                        "definition table did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = ("RAMSTK SUCCESS: Updating all records in the failure "
                     "definition table.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more records in the failure "
+                    "definition table did not update.")
 
         return _error_code, _msg
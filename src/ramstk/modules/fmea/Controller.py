@@ -84,7 +84,7 @@ class FMEADataController(RAMSTKDataController):
             self._configuration.RAMSTK_DEBUG_LOG.error(_msg)
 
         return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
-                                                      None)
+                                                      'editedFMEA')
 
     def request_do_delete(self, node_id):
         """
@@ -98,7 +98,7 @@ class FMEADataController(RAMSTKDataController):
         _error_code, _msg = self._dtm_data_model.do_delete(node_id)
 
         return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
-                                                      None)
+                                                      'editedFMEA')
 
     def request_do_update(self, node_id):
         """
@@ -111,7 +111,7 @@ class FMEADataController(RAMSTKDataController):
         _error_code, _msg = self._dtm_data_model.do_update(node_id)
 
         return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
-                                                      None)
+                                                      'editedFMEA')
 
     def request_do_update_all(self, **kwargs):
         """
@@ -123,7 +123,7 @@ class FMEADataController(RAMSTKDataController):
         _error_code, _msg = self._dtm_data_model.do_update_all(**kwargs)
 
         return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
-                                                      None)
+                                                      'editedFMEA')
 
     def request_do_calculate(self, node_id, **kwargs):  # pylint: disable=unused-argument
         """
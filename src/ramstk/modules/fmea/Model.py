@@ -154,23 +154,14 @@ class ModeDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the FMEA modes "
-                        "table did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = ("RAMSTK SUCCESS: Updating all records in the FMEA modes "
                     "table.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more records in the FMEA modes "
+                    "table did not update.")
 
         return _error_code, _msg
 
@@ -312,24 +303,15 @@ class MechanismDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the FMEA "
-                        "mechanisms table did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = (
                 "RAMSTK SUCCESS: Updating all records in the FMEA mechanisms "
                 "table.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more records in the FMEA "
+                    "mechanisms table did not update.")
 
         return _error_code, _msg
 
@@ -474,23 +456,14 @@ class CauseDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the FMEA causes "
-                        "table did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = ("RAMSTK SUCCESS: Updating all records in the FMEA causes "
                     "table.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more records in the FMEA causes "
+                    "table did not update.")
 
         return _error_code, _msg
 
@@ -635,25 +608,16 @@ class ControlDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more records in the FMEA controls "
-                    "table did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = (
                 "RAMSTK SUCCESS: Updating all records in the FMEA controls "
                 "table.")
+        else:
+            _msg = (
+                "RAMSTK ERROR: One or more records in the FMEA controls "
+                "table did not update.")
 
         return _error_code, _msg
 
@@ -799,24 +763,15 @@ class ActionDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more records in the FMEA actions "
-                    "table did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = ("RAMSTK SUCCESS: Updating all records in the FMEA actions "
                     "table.")
+        else:
+            _msg = (
+                "RAMSTK ERROR: One or more records in the FMEA actions "
+                "table did not update.")
 
         return _error_code, _msg
 
@@ -885,7 +840,10 @@ class FMEADataModel(RAMSTKDataModel):
         Retrieve and build the FMEA tree for Parent ID.
 
         The Parent ID is one of Function ID (functional FMEA) or Hardware ID
-        (hardware FMEA).
+        (hardware FMEA).  Each level of the FMEA is retrieved with a single
+        query filtered on the IDs of the level above it, so the whole FMEA is
+        loaded with at most five queries.  The Node IDs are then assembled
+        in memory from the parent-child keys.
 
         :return: tree; the FMEA treelib Tree().
         :rtype: :class:`treelib.Tree`
@@ -893,135 +851,116 @@ class FMEADataModel(RAMSTKDataModel):
         _parent_id = kwargs['parent_id']
         self._functional = kwargs['functional']
 
-        RAMSTKDataModel.do_select_all(self)
-
-        _modes = self.dtm_mode.do_select_all(
-            parent_id=_parent_id, functional=self._functional).nodes
-
-        for _key in _modes:
-            _mode = _modes[_key].data
-            if _mode is not None:
-                _node_id = '0.' + str(_mode.mode_id)
-                self.tree.create_node(
-                    tag=_mode.description,
-                    identifier=_node_id,
-                    parent=0,
-                    data=_mode)
-                if self._functional:
-                    self._do_add_causes(_mode.mode_id, _node_id, True)
-                else:
-                    self._do_add_mechanisms(_mode.mode_id, _node_id)
-
-        return self.tree
-
-    def _do_add_mechanisms(self, mode_id, parent_id):
-        """
-        Add the failure mechanisms to the FMEA tree for Mode ID.
-
-        :param int mode_id: the Mode ID to add the failure mechanisms to.
-        :param str parent_id: the Node ID to add the failure mechanisms to.
-        :return: False if successful or True if an error is encountered.
-        :rtype: bool
-        """
-        _return = False
-
-        _mechanisms = self.dtm_mechanism.do_select_all(parent_id=mode_id).nodes
-        for _key in _mechanisms:
-            _mechanism = _mechanisms[_key].data
-            if _mechanism is not None:
-                _node_id = parent_id + '.' + str(_mechanism.mechanism_id)
-                self.tree.create_node(
-                    tag=_mechanism.description,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_mechanism)
-
-                self._do_add_causes(_mechanism.mechanism_id, _node_id, False)
-
-        return _return
-
-    def _do_add_causes(self, parent_id, parent_node, functional):
-        """
-        Add the failure causes to the FMEA tree for Mechanism ID.
-
-        :param int parent_id: the Mode ID (functional FMEA) or Mechanism ID
-                              (hardware FMEA) to add the failure causes to.
-        :param str parent_node: the Node ID to add the failure causes to.
-        :return: False if successful or True if an error is encountered.
-        :rtype: bool
-        """
-        _return = False
-
-        _causes = self.dtm_cause.do_select_all(
-            parent_id=parent_id, functional=functional).nodes
-        for _key in _causes:
-            _cause = _causes[_key].data
-            if _cause is not None:
-                _node_id = parent_node + '.' + str(_cause.cause_id)
-                self.tree.create_node(
-                    tag=_cause.description,
-                    identifier=_node_id,
-                    parent=parent_node,
-                    data=_cause)
+        _session = RAMSTKDataModel.do_select_all(self)
 
-                self._do_add_controls(_cause.cause_id, _node_id)
-                self._do_add_actions(_cause.cause_id, _node_id)
+        if self._functional:
+            _qry_modes = _session.query(RAMSTKMode).filter(
+                RAMSTKMode.function_id == _parent_id)
+        else:
+            _qry_modes = _session.query(RAMSTKMode).filter(
+                RAMSTKMode.hardware_id == _parent_id)
+        _modes = _qry_modes.order_by(RAMSTKMode.mode_id).all()
 
-        return _return
+        _mode_ids = _qry_modes.with_entities(RAMSTKMode.mode_id)
+        if self._functional:
+            _mechanisms = []
+            _qry_causes = _session.query(RAMSTKCause).filter(
+                RAMSTKCause.mode_id.in_(_mode_ids))
+        else:
+            _qry_mechanisms = _session.query(RAMSTKMechanism).filter(
+                RAMSTKMechanism.mode_id.in_(_mode_ids))
+            _mechanisms = _qry_mechanisms.order_by(
+                RAMSTKMechanism.mechanism_id).all()
+            _qry_causes = _session.query(RAMSTKCause).filter(
+                RAMSTKCause.mechanism_id.in_(
+                    _qry_mechanisms.with_entities(
+                        RAMSTKMechanism.mechanism_id)))
+        _causes = _qry_causes.order_by(RAMSTKCause.cause_id).all()
+
+        _cause_ids = _qry_causes.with_entities(RAMSTKCause.cause_id)
+        _controls = _session.query(RAMSTKControl).filter(
+            RAMSTKControl.cause_id.in_(_cause_ids)).order_by(
+                RAMSTKControl.control_id).all()
+        _actions = _session.query(RAMSTKAction).filter(
+            RAMSTKAction.cause_id.in_(_cause_ids)).order_by(
+                RAMSTKAction.action_id).all()
 
-    def _do_add_controls(self, cause_id, parent_id):
-        """
-        Add the control methods to the FMEA tree for Mode ID or Cause ID.
+        _session.close()
 
-        :param int cause_id: the Mode ID (functional FMEA) or Cause ID
-                             (hardware FMEA) to add the control methods to.
-        :param str parent_id: the Node ID to add the control methods to.
-        :return: False if successful or True if an error is encountered.
-        :rtype: bool
-        """
-        _return = False
+        # Map each database ID to the Node ID of the entity so the children
+        # can be attached without going back to the database.  The last ID of
+        # each child data model is used when adding new entities to the FMEA.
+        # pylint: disable=attribute-defined-outside-init
+        # It is defined in RAMSTKDataModel.__init__
+        _dic_mode_node = {}
+        for _mode in _modes:
+            _node_id = '0.' + str(_mode.mode_id)
+            self._do_add_node(_mode, _mode.description, _node_id, 0)
+            _dic_mode_node[_mode.mode_id] = _node_id
+            self.dtm_mode.last_id = max(self.dtm_mode.last_id, _mode.mode_id)
 
-        _controls = self.dtm_control.do_select_all(parent_id=cause_id).nodes
+        _dic_mechanism_node = {}
+        for _mechanism in _mechanisms:
+            _parent_node = _dic_mode_node[_mechanism.mode_id]
+            _node_id = _parent_node + '.' + str(_mechanism.mechanism_id)
+            self._do_add_node(_mechanism, _mechanism.description, _node_id,
+                              _parent_node)
+            _dic_mechanism_node[_mechanism.mechanism_id] = _node_id
+            self.dtm_mechanism.last_id = max(self.dtm_mechanism.last_id,
+                                            _mechanism.mechanism_id)
+
+        _dic_cause_node = {}
+        for _cause in _causes:
+            if self._functional:
+                _parent_node = _dic_mode_node[_cause.mode_id]
+            else:
+                _parent_node = _dic_mechanism_node[_cause.mechanism_id]
+            _node_id = _parent_node + '.' + str(_cause.cause_id)
+            self._do_add_node(_cause, _cause.description, _node_id,
+                              _parent_node)
+            _dic_cause_node[_cause.cause_id] = _node_id
+            self.dtm_cause.last_id = max(self.dtm_cause.last_id,
+                                        _cause.cause_id)
+
+        # Since Controls and Actions are at the same level in the FMEA tree,
+        # we append a 'c' or an 'a' to the ID to differentiate them.
+        for _control in _controls:
+            _parent_node = _dic_cause_node[_control.cause_id]
+            _node_id = _parent_node + '.' + str(_control.control_id) + 'c'
+            self._do_add_node(_control, _control.description, _node_id,
+                              _parent_node)
+            self.dtm_control.last_id = max(self.dtm_control.last_id,
+                                          _control.control_id)
 
-        for _key in _controls:
-            _control = _controls[_key].data
-            if _control is not None:
-                # Since Controls and Actions are at the same level in the FMEA
-                # tree, we prepend a zero to the Control ID to differentiate it
-                # from an Action.
-                _node_id = parent_id + '.' + str(_control.control_id) + 'c'
-                self.tree.create_node(
-                    tag=_control.description,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_control)
+        for _action in _actions:
+            _parent_node = _dic_cause_node[_action.cause_id]
+            _node_id = _parent_node + '.' + str(_action.action_id) + 'a'
+            self._do_add_node(_action, _action.action_category, _node_id,
+                              _parent_node)
+            self.dtm_action.last_id = max(self.dtm_action.last_id,
+                                         _action.action_id)
 
-        return _return
+        return self.tree
 
-    def _do_add_actions(self, cause_id, parent_id):
+    def _do_add_node(self, entity, tag, node_id, parent_id):
         """
-        Add the action to the FMEA tree for Mode ID or Cause ID.
+        Add an entity retrieved from the database to the FMEA tree.
 
-        :param int cause_id: the Mode ID (functional FMEA) or Cause ID
-                             (hardware FMEA) to add the action to.
-        :param str parent_id: the Node ID to add the action to.
-        :return: False if successful or True if an error is encountered.
-        :rtype: bool
+        :param entity: the RAMSTK<MODULE> entity to add to the FMEA tree.
+        :param str tag: the tag to use for the new node.
+        :param str node_id: the Node ID to add the entity as.
+        :param parent_id: the Node ID of the parent node.
+        :return: None
+        :rtype: None
         """
-        _return = False
-
-        _actions = self.dtm_action.do_select_all(parent_id=cause_id).nodes
-        for _key in _actions:
-            _action = _actions[_key].data
-            if _action is not None:
-                _node_id = parent_id + '.' + str(_action.action_id) + 'a'
-                self.tree.create_node(
-                    tag=_action.action_category,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_action)
+        # We get and then set the attributes to replace any None values
+        # (NULL fields in the database) with their default value.
+        _attributes = entity.get_attributes()
+        entity.set_attributes(_attributes)
+        self.tree.create_node(
+            tag=tag, identifier=node_id, parent=parent_id, data=entity)
 
-        return _return
+        return None
 
     def do_insert(self, **kwargs):
         """
@@ -1157,24 +1096,13 @@ class FMEADataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _err_code, _debug_msg = self.do_update(_node.identifier)
-
-                if _err_code != 0:
-                    _error_code = 1
-                    _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more line items in the FMEA did "
-                        "not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = ("RAMSTK SUCCESS: Updating all line items in the FMEA.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more line items in the FMEA did "
+                    "not update.")
 
         return _error_code, _msg
 
@@ -12,7 +12,7 @@ from pubsub import pub
 
 # Import other RAMSTK modules.
 from ramstk.modules import RAMSTKDataController
-from ramstk.modules import RAMSTKDataMatrix
+from ramstk.modules import RAMSTKDataMatrix, RAMSTKSparseDataMatrix
 from ramstk.dao import RAMSTKFunction, RAMSTKHardware, RAMSTKSoftware
 from . import dtmFunction
 
@@ -49,8 +49,8 @@ class FunctionDataController(RAMSTKDataController):
         # Initialize private list attributes.
 
         # Initialize private scalar attributes.
-        self._dmx_fctn_hw_matrix = RAMSTKDataMatrix(dao, RAMSTKFunction,
-                                                    RAMSTKHardware)
+        self._dmx_fctn_hw_matrix = RAMSTKSparseDataMatrix(
+            dao, RAMSTKFunction, RAMSTKHardware)
         self._dmx_fctn_sw_matrix = RAMSTKDataMatrix(dao, RAMSTKFunction,
                                                     RAMSTKSoftware)
 
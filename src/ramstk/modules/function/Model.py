@@ -177,22 +177,21 @@ class FunctionDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the function "
-                        "table did not update.")
+        _lst_functions = self.do_select_modified()
+        _error_code, _msg = self.do_update_many(_lst_functions)
 
+        # If there was no error and we're not running a test, let anyone
+        # who cares know the Functions were updated.
         if _error_code == 0:
+            if not self._test:
+                for _function in _lst_functions:
+                    pub.sendMessage(
+                        'updated_function',
+                        attributes=_function.get_attributes())
             _msg = ("RAMSTK SUCCESS: Updating all records in the function "
                     "table.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more records in the function "
+                    "table did not update.")
 
         return _error_code, _msg
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.modules.growth.Controller.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Reliability Growth Package Data Controller Module."""
+
+from pubsub import pub
+
+# Import other RAMSTK modules.
+from ramstk.modules import RAMSTKDataController
+from . import dtmGrowth
+
+
+class GrowthDataController(RAMSTKDataController):
+    """
+    Provide an interface between Growth data models and RAMSTK views.
+
+    A single Growth data controller can manage one or more Growth data
+    models.
+    """
+
+    def __init__(self, dao, configuration, **kwargs):
+        """
+        Initialize a Growth data controller instance.
+
+        :param dao: the data access object used to communicate with the
+                    connected RAMSTK Program database.
+        :type dao: :py:class:`ramstk.dao.DAO.DAO`
+        :param configuration: the RAMSTK configuration instance.
+        :type configuration: :py:class:`ramstk.Configuration.Configuration`
+        """
+        RAMSTKDataController.__init__(
+            self,
+            configuration,
+            model=dtmGrowth(dao),
+            ramstk_module='growth',
+            **kwargs)
+
+        # Initialize private dictionary attributes.
+
+        # Initialize private list attributes.
+
+        # Initialize private scalar attributes.
+
+        # Initialize public dictionary attributes.
+
+        # Initialize public list attributes.
+
+        # Initialize public scalar attributes.
+
+    def request_do_select_all(self, **kwargs):
+        """
+        Retrieve the Growth test treelib Tree() from the Data Model.
+
+        The tests and phases left out of the tree because their IDs can't be
+        packed into a Node ID are written to the debug log.
+
+        :param int revision_id: the Revision ID to retrieve the Growth tests
+                                for.
+        :return: tree; the treelib Tree() of Growth tests and their phases.
+        :rtype: :class:`treelib.Tree`
+        """
+        _tree = self._dtm_data_model.do_select_all(**kwargs)
+
+        for _msg in self._dtm_data_model.lst_skipped:
+            self._configuration.RAMSTK_DEBUG_LOG.error(_msg)
+
+        return _tree
+
+    def request_do_insert(self, **kwargs):
+        """
+        Request to add a Growth test or phase.
+
+        :keyword int revision_id: the Revision ID to add a Growth test to.
+        :keyword int test_id: the Test ID to add a phase to.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _error_code, _msg = self._dtm_data_model.do_insert(**kwargs)
+
+        if _error_code == 0:
+            self._configuration.RAMSTK_USER_LOG.info(_msg)
+
+            if not self._test:
+                pub.sendMessage('insertedGrowth')
+        else:
+            _msg = _msg + '  Failed to add a new Growth test or phase to ' \
+                          'the RAMSTK Program database.'
+            self._configuration.RAMSTK_DEBUG_LOG.error(_msg)
+
+        return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
+                                                      None)
+
+    def request_do_delete(self, node_id):
+        """
+        Request to delete a Growth test or phase.
+
+        :param int node_id: the PyPubSub Tree() ID of the Growth test or phase
+                            to delete.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _error_code, _msg = self._dtm_data_model.do_delete(node_id)
+
+        return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
+                                                      'deletedGrowth')
+
+    def request_do_update(self, node_id):
+        """
+        Request to update a Growth test or phase.
+
+        :param int node_id: the PyPubSub Tree() ID of the Growth test or phase
+                            to update.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _error_code, _msg = self._dtm_data_model.do_update(node_id)
+
+        return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
+                                                      'savedGrowth')
+
+    def request_do_update_all(self, **kwargs):
+        """
+        Request to update all Growth tests and phases.
+
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _error_code, _msg = self._dtm_data_model.do_update_all(**kwargs)
+
+        return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
+                                                      None)
+
+    def request_do_calculate_plan(self, node_id):
+        """
+        Request the idealized and planned growth of a Growth test.
+
+        :param int node_id: the PyPubSub Tree() ID of the Growth test to plan.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _error_code, _msg = self._dtm_data_model.do_calculate_plan(node_id)
+
+        return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
+                                                      'plannedGrowth')
+
+    def request_do_calculate(self, node_id, **kwargs):
+        """
+        Request the observed growth of a Growth test be assessed.
+
+        :param int node_id: the PyPubSub Tree() ID of the Growth test to
+                            assess.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _error_code, _msg = self._dtm_data_model.do_calculate(
+            node_id, **kwargs)
+
+        return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
+                                                      'calculatedGrowth')
@@ -0,0 +1,438 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.modules.growth.Model.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Reliability Growth Package Data Model Module."""
+
+import numpy as np  # pylint: disable=E0401
+from treelib import tree  # pylint: disable=E0401
+
+# Import other RAMSTK modules.
+from ramstk.Utilities import OutOfRangeError, pack_node_id
+from ramstk.modules import RAMSTKDataModel
+from ramstk.dao import RAMSTKGrowthTest, RAMSTKTest
+from ramstk.statistics.Bounds import calculate_crow_bounds
+from ramstk.statistics.Growth import (
+    calculate_crow_amsaa_grouped, calculate_crow_amsaa_mean,
+    calculate_planned_growth)
+
+# The number of bits each database ID occupies in a Growth Node ID.
+_ID_BITS = 21
+
+
+class GrowthDataModel(RAMSTKDataModel):
+    """
+    Contain the attributes and methods of a Reliability Growth test.
+
+    The Growth data model contains the RAMSTKTest records of a Revision with
+    the RAMSTKGrowthTest phases of each as its children:
+
+        * Test 1
+            - Phase 1.1
+            - Phase 1.2
+        * Test 2
+            - Phase 2.1
+
+    The Node ID of a Test is the Test ID and the Node ID of a phase packs the
+    Test ID and Phase ID into a single integer (see do_make_node_id()).
+    """
+
+    _tag = 'Growth Tests'
+
+    def __init__(self, dao):
+        """
+        Initialize a Growth data model instance.
+
+        :param dao: the data access object for communicating with the RAMSTK
+                    Program database.
+        :type dao: :class:`ramstk.dao.DAO.DAO`
+        """
+        RAMSTKDataModel.__init__(self, dao)
+
+        # Initialize private dictionary attributes.
+
+        # Initialize private list attributes.
+
+        # Initialize private scalar attributes.
+
+        # Initialize public dictionary attributes.
+        self.dic_curves = {}
+
+        # Initialize public list attributes.
+        # The messages of the tests and phases left out of the tree by the
+        # last do_select_all() because their IDs can't be packed into a Node
+        # ID.
+        self.lst_skipped = []
+
+        # Initialize public scalar attributes.
+
+    def do_select_all(self, **kwargs):
+        """
+        Retrieve all the Growth tests from the RAMSTK Program database.
+
+        A test or phase whose ID can't be packed into a Node ID is left out of
+        the tree, a test with its phases, and the reason is added to
+        lst_skipped.
+
+        :param int revision_id: the ID of the Revision to retrieve the Growth
+                                tests for.
+        :return: tree; the treelib Tree() of Growth tests and their phases.
+        :rtype: :py:class:`treelib.Tree`
+        """
+        _revision_id = kwargs['revision_id']
+        _session = RAMSTKDataModel.do_select_all(self)
+
+        # pylint: disable=attribute-defined-outside-init
+        # It is defined in RAMSTKDataModel.__init__
+        self.lst_skipped = []
+        for _test in _session.query(RAMSTKTest).filter(
+                RAMSTKTest.revision_id == _revision_id).all():
+            try:
+                _test_id = self.do_make_node_id(_test.test_id)
+            except OutOfRangeError as _error:
+                self.lst_skipped.append(_error.message)
+                continue
+            self.tree.create_node(
+                _test.name, _test_id, parent=0, data=_test)
+            self.last_id = max(self.last_id, _test.test_id)
+
+        # Load the phases of every Test in one query.
+        for _phase in _session.query(RAMSTKGrowthTest).join(RAMSTKTest).filter(
+                RAMSTKTest.revision_id == _revision_id).order_by(
+                    RAMSTKGrowthTest.phase_id).all():
+            if not self.tree.contains(_phase.test_id):
+                continue
+            try:
+                _phase_id = self.do_make_node_id(_phase.test_id,
+                                                 _phase.phase_id)
+            except OutOfRangeError as _error:
+                self.lst_skipped.append(_error.message)
+                continue
+            self.tree.create_node(
+                'Phase {0:d}'.format(_phase.phase_id),
+                _phase_id,
+                parent=_phase.test_id,
+                data=_phase)
+
+        _session.close()
+
+        return self.tree
+
+    @staticmethod
+    def do_make_node_id(test_id, phase_id=0):
+        """
+        Pack the Test and Phase IDs into a Growth Node ID.
+
+        :param int test_id: the Test ID.
+        :param int phase_id: the Growth phase ID.
+        :return: _node_id; the Node ID in the Growth tree.
+        :rtype: int
+        :raise: OutOfRangeError if an ID doesn't fit in 21 bits.
+        """
+        return pack_node_id([test_id, phase_id], bits=_ID_BITS)
+
+    def do_select_phases(self, node_id):
+        """
+        Retrieve the phases of a Growth test in phase order.
+
+        :param int node_id: the Node ID of the Growth test.
+        :return: the RAMSTKGrowthTest instances of the Growth test.
+        :rtype: list
+        """
+        return [
+            self.tree.get_node(_node_id).data
+            for _node_id in self.tree.get_node(node_id).fpointer
+        ]
+
+    def do_insert(self, **kwargs):
+        """
+        Add a Growth test or phase to the RAMSTK Program database.
+
+        A new Growth test is added with its first phase.
+
+        :keyword int revision_id: the Revision ID to add a Growth test to.
+        :keyword int test_id: the Test ID to add a phase to.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _test_id = kwargs.get('test_id', None)
+        if _test_id is None:
+            _test = RAMSTKTest()
+            _test.revision_id = kwargs['revision_id']
+            _error_code, _msg = self._do_insert_node(_test, 0)
+            if _error_code != 0:
+                return _error_code, _msg
+
+            self.last_id = _test.test_id
+            _test_id = _test.test_id
+
+        _test = self.do_select(_test_id)
+        if _test is None:
+            return 2105, ('RAMSTK ERROR: Attempted to add a phase to '
+                          'non-existent Growth test ID '
+                          '{0:d}.').format(_test_id)
+
+        _phase = RAMSTKGrowthTest()
+        _phase.test_id = _test_id
+        _error_code, _msg = self._do_insert_node(_phase, _test_id)
+
+        if _error_code == 0:
+            _test.n_phases = len(self.tree.get_node(_test_id).fpointer)
+
+        return _error_code, _msg
+
+    def _do_insert_node(self, entity, parent_id):
+        """
+        Add a Growth test or phase to the RAMSTK Program database and tree.
+
+        The entity is added in a unit of work so it can be deleted before it
+        is committed if its ID can't be packed into a Node ID.
+
+        :param entity: the RAMSTKTest or RAMSTKGrowthTest to add.
+        :param int parent_id: the Node ID of the parent; 0 for a Growth test.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _session = self.dao.db_begin()
+        try:
+            _error_code, _msg = RAMSTKDataModel.do_insert(
+                self, entities=[
+                    entity,
+                ])
+
+            if _error_code == 0 and parent_id == 0:
+                _tag = entity.name
+                _node_id = self.do_make_node_id(entity.test_id)
+            elif _error_code == 0:
+                _tag = 'Phase {0:d}'.format(entity.phase_id)
+                _node_id = self.do_make_node_id(parent_id, entity.phase_id)
+        except OutOfRangeError as _error:
+            self.dao.db_delete(entity, _session)
+            _error_code = 2105
+            _msg = _error.message
+        finally:
+            _code, _commit_msg = self.dao.db_commit()
+
+        if _error_code == 0 and _code != 0:
+            _error_code = _code
+            _msg = _commit_msg
+        elif _error_code == 0:
+            self.tree.create_node(
+                _tag, _node_id, parent=parent_id, data=entity)
+
+        return _error_code, _msg
+
+    def do_delete(self, node_id):
+        """
+        Remove a Growth test or phase from the RAMSTK Program database.
+
+        :param int node_id: the Node ID of the Growth test or phase to remove.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        try:
+            _parent_id = self.tree.parent(node_id).identifier
+        except tree.NodeIDAbsentError:
+            _parent_id = None
+
+        _error_code, _msg = RAMSTKDataModel.do_delete(self, node_id)
+
+        # pylint: disable=attribute-defined-outside-init
+        # It is defined in RAMSTKDataModel.__init__
+        if _error_code != 0:
+            _error_code = 2005
+            _msg = _msg + '  RAMSTK ERROR: Attempted to delete non-existent ' \
+                          'Growth test entity with Node ID ' \
+                          '{0:d}.'.format(node_id)
+        else:
+            if _parent_id:
+                self.do_select(_parent_id).n_phases = len(
+                    self.tree.get_node(_parent_id).fpointer)
+            self.dic_curves.pop(node_id, None)
+            self.last_id = max([0] + self.tree.get_node(0).fpointer)
+
+        return _error_code, _msg
+
+    def do_update(self, node_id):
+        """
+        Update the Growth test or phase to the RAMSTK Program database.
+
+        :param int node_id: the Node ID of the Growth test or phase to save.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code, _msg = RAMSTKDataModel.do_update(self, node_id)
+
+        if _error_code != 0:
+            _error_code = 2207
+            _msg = 'RAMSTK ERROR: Attempted to save non-existent Growth ' \
+                   'test entity with Node ID {0:d}.'.format(node_id)
+
+        return _error_code, _msg
+
+    def do_update_all(self, **kwargs):  # pylint: disable=unused-argument
+        """
+        Update all Growth tests and phases to the RAMSTK Program database.
+
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
+
+        if _error_code == 0:
+            _msg = ("RAMSTK SUCCESS: Updating all records in the growth "
+                    "test tables.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more records in the growth test "
+                    "tables did not update.")
+
+        return _error_code, _msg
+
+    def do_calculate_plan(self, node_id):
+        """
+        Calculate the idealized and planned growth of every test phase.
+
+        The initial MTBF and t1 are the first phase's planned initial MTBF and
+        test time.  The idealized curve grows at the test's average growth
+        rate and each phase is planned at its own growth rate, or at the
+        average growth rate when it has none.  All phases are calculated at
+        once.
+
+        :param int node_id: the Node ID of the Growth test to plan.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _test = self.do_select(node_id)
+        if not isinstance(_test, RAMSTKTest):
+            return 2105, ('RAMSTK ERROR: Attempted to plan non-existent '
+                          'Growth test ID {0:s}.').format(str(node_id))
+
+        _phases = self.do_select_phases(node_id)
+        if not _phases or _phases[0].p_mi <= 0.0 or \
+                _phases[0].p_test_time <= 0.0:
+            return 2105, ('RAMSTK ERROR: Growth test ID {0:d} needs a first '
+                          'phase with a positive initial MTBF and test '
+                          'time.').format(node_id)
+
+        _mtbf_initial = _phases[0].p_mi
+        _t1 = _phases[0].p_test_time
+        _phase_times = np.array([_phase.p_test_time for _phase in _phases])
+        _growth_rates = np.array([_phase.p_growth_rate for _phase in _phases])
+        _growth_rates = np.where(_growth_rates > 0.0, _growth_rates,
+                                 _test.avg_growth)
+
+        (_i_num_fails, _i_mi, _i_mf, _i_ma) = calculate_planned_growth(
+            _test.avg_growth, _mtbf_initial, _t1, _phase_times)
+        (_p_num_fails, _p_mi, _p_mf, _p_ma) = calculate_planned_growth(
+            _growth_rates, _mtbf_initial, _t1, _phase_times)
+
+        for _idx, _phase in enumerate(_phases):
+            _phase.i_num_fails = int(round(_i_num_fails[_idx]))
+            _phase.i_mi = float(_i_mi[_idx])
+            _phase.i_mf = float(_i_mf[_idx])
+            _phase.i_ma = float(_i_ma[_idx])
+            _phase.p_num_fails = int(round(_p_num_fails[_idx]))
+            _phase.p_mi = float(_p_mi[_idx])
+            _phase.p_mf = float(_p_mf[_idx])
+            _phase.p_ma = float(_p_ma[_idx])
+        _test.ttt = float(_phase_times.sum())
+
+        return 0, 'RAMSTK SUCCESS: Planning Growth test ID {0:d}.'.format(
+            node_id)
+
+    def do_calculate(self, node_id, **kwargs):
+        """
+        Assess the observed growth of a Growth test with the Crow-AMSAA model.
+
+        The phases with observed test time are the intervals of a grouped
+        Crow-AMSAA fit.  The parameters and their Crow bounds, and the
+        cumulative MTBF with its Crow bounds and the instantaneous MTBF at the
+        end of testing are set on the RAMSTKTest.  The observed MTBF of each
+        phase are set on the RAMSTKGrowthTest.  The cumulative MTBF and its
+        Crow bounds at the end of each phase are stored in dic_curves by the
+        Test ID with a row per phase of (time, failures, lower bound,
+        cumulative MTBF, upper bound, instantaneous MTBF).
+
+        :param int node_id: the Node ID of the Growth test to assess.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        # pylint: disable=unused-argument
+        _test = self.do_select(node_id)
+        if not isinstance(_test, RAMSTKTest):
+            return 2105, ('RAMSTK ERROR: Attempted to calculate non-existent '
+                          'Growth test ID {0:s}.').format(str(node_id))
+
+        _phases = [
+            _phase for _phase in self.do_select_phases(node_id)
+            if _phase.o_test_time > 0.0
+        ]
+        _test_times = np.array([_phase.o_test_time for _phase in _phases])
+        _n_failures = np.array(
+            [_phase.o_num_fails for _phase in _phases], dtype=float)
+
+        _times = np.cumsum(_test_times)
+        _cum_failures = np.cumsum(_n_failures)
+        if _phases:
+            _lambda, _beta = calculate_crow_amsaa_grouped(_times, _n_failures)
+        else:
+            _lambda, _beta = np.nan, np.nan
+
+        if not np.isfinite(_beta):
+            return 2105, ('RAMSTK ERROR: Growth test ID {0:d} needs failures '
+                          'in at least two phases to calculate.').format(
+                              node_id)
+
+        _time = _times[-1]
+        _n_total = _cum_failures[-1]
+        _confidence = _test.confidence
+
+        _test.cum_time = float(_time)
+        _test.cum_failures = int(_n_total)
+        _test.scale = float(_lambda)
+        _test.shape = float(_beta)
+        (_test.scale_ll, _test.scale_ul) = [
+            float(_bound) for _bound in calculate_crow_bounds(
+                _n_total, _time, _lambda, _beta, _confidence, 2, data=1)
+        ]
+        (_test.shape_ll, _test.shape_ul) = [
+            float(_bound) for _bound in calculate_crow_bounds(
+                _n_total, _time, _lambda, _beta, _confidence, 1, data=1)
+        ]
+
+        # The instantaneous MTBF at the start and end of every phase and the
+        # Crow bounds at the end of every phase are each one array operation.
+        _cum_mean, _inst_mean = calculate_crow_amsaa_mean(
+            np.concatenate(([0.0], _times)), _lambda, _beta)
+        _cum_mean = _cum_mean[1:]
+        # The instantaneous MTBF at time zero is infinite when beta > 1, so
+        # 0.0 is stored for it instead.
+        _inst_mean = np.where(np.isfinite(_inst_mean), _inst_mean, 0.0)
+        _intensity_ll, _intensity_ul = calculate_crow_bounds(
+            _cum_failures, _times, _lambda, _beta, _confidence, 3, data=1)
+        with np.errstate(divide='ignore'):
+            _cum_mean_ll = 1.0 / np.asarray(_intensity_ul)
+            _cum_mean_ul = 1.0 / np.asarray(_intensity_ll)
+
+        _test.cum_mean = float(_cum_mean[-1])
+        _test.cum_mean_ll = float(_cum_mean_ll[-1])
+        _test.cum_mean_ul = float(_cum_mean_ul[-1])
+        _test.inst_mean = float(_inst_mean[-1])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            _mtbf_a = np.where(_n_failures > 0.0, _test_times / _n_failures,
+                               0.0)
+        for _idx, _phase in enumerate(_phases):
+            _phase.o_growth_rate = float(1.0 - _beta)
+            _phase.o_mi = float(_inst_mean[_idx])
+            _phase.o_mf = float(_inst_mean[_idx + 1])
+            _phase.o_ma = float(_mtbf_a[_idx])
+
+        self.dic_curves[node_id] = np.column_stack(
+            (_times, _cum_failures, _cum_mean_ll, _cum_mean, _cum_mean_ul,
+             _inst_mean[1:]))
+
+        return 0, 'RAMSTK SUCCESS: Calculating Growth test ID {0:d}.'.format(
+            node_id)
@@ -0,0 +1,2 @@
+from .Model import GrowthDataModel as dtmGrowth
+from .Controller import GrowthDataController as dtcGrowth
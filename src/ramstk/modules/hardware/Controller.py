@@ -605,13 +605,29 @@ class HardwareBoMDataController(RAMSTKDataController):
         return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
                                                       None)
 
+    def request_do_prefetch(self, node_ids):
+        """
+        Request the design attributes of Hardware items be loaded.
+
+        This is used to load the rows about to be displayed when the Hardware
+        BoM was selected with lazy=True.
+
+        :param list node_ids: the IDs of the Hardware items to load.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        self._dtm_data_model.do_prefetch(node_ids)
+
+        return False
+
     def request_get_attributes(self, node_id):
         """
         Get the attributes of the record associated with Node ID and table.
 
         :param int node_id: the ID of the Hardware item to get attributes for.
-        :return: attributes; the {attribute:value} dict.
-        :rtype: dict
+        :return: attributes; the {attribute:value} view of the Hardware item.
+                 Values set in the view are set in the Hardware BoM.
+        :rtype: :class:`ramstk.modules.RAMSTKAttributes`
         """
         try:
             _attributes = self._dtm_data_model.tree.get_node(node_id).data
@@ -624,6 +640,20 @@ class HardwareBoMDataController(RAMSTKDataController):
         """
         Set the attributes of the record associated with the Node ID.
 
+        :param int node_id: the ID of the record in the RAMSTK Program database
+                            table whose attributes are to be set.
+        :param dict attributes: the dictionary of attributes and values.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        self._dtm_data_model.do_set_dirty(node_id)
+
+        return self._do_set_attributes(node_id, attributes)
+
+    def _do_set_attributes(self, node_id, attributes):
+        """
+        Set the attributes of the record without marking it for recalculation.
+
         :param int node_id: the ID of the record in the RAMSTK Program database
                             table whose attributes are to be set.
         :param dict attributes: the dictionary of attributes and values.
@@ -631,40 +661,18 @@ class HardwareBoMDataController(RAMSTKDataController):
         :rtype: bool
         """
         _return = False
+        _tables = ('general', 'electrical_design', 'mechanical_design',
+                   'mil_hdbk_f', 'nswc', 'reliability')
 
         # Set the overall BoM attributes.
-        self._dtm_data_model.tree.get_node(node_id).data = attributes
+        self._dtm_data_model.tree.get_node(node_id).data.update(attributes)
 
         # Set the attributes for the individual tables.
-        _error_code, _msg = self._dtm_data_model.dtm_hardware.do_select(
-            node_id).set_attributes(attributes)
-        _return = (_return or RAMSTKDataController.do_handle_results(
-            self, _error_code, _msg, None))
-
-        _error_code, _msg = self._dtm_data_model.dtm_design_electric.do_select(
-            node_id).set_attributes(attributes)
-        _return = (_return or RAMSTKDataController.do_handle_results(
-            self, _error_code, _msg, None))
-
-        _error_code, _msg = self._dtm_data_model.dtm_design_mechanic.do_select(
-            node_id).set_attributes(attributes)
-        _return = (_return or RAMSTKDataController.do_handle_results(
-            self, _error_code, _msg, None))
-
-        _error_code, _msg = self._dtm_data_model.dtm_mil_hdbk_f.do_select(
-            node_id).set_attributes(attributes)
-        _return = (_return or RAMSTKDataController.do_handle_results(
-            self, _error_code, _msg, None))
-
-        _error_code, _msg = self._dtm_data_model.dtm_nswc.do_select(
-            node_id).set_attributes(attributes)
-        _return = (_return or RAMSTKDataController.do_handle_results(
-            self, _error_code, _msg, None))
-
-        _error_code, _msg = self._dtm_data_model.dtm_reliability.do_select(
-            node_id).set_attributes(attributes)
-        _return = (_return or RAMSTKDataController.do_handle_results(
-            self, _error_code, _msg, None))
+        for _table in _tables:
+            _error_code, _msg = self._dtm_data_model.do_select(
+                node_id, table=_table).set_attributes(attributes)
+            _return = (_return or RAMSTKDataController.do_handle_results(
+                self, _error_code, _msg, None))
 
         return _return
 
@@ -690,23 +698,14 @@ class HardwareBoMDataController(RAMSTKDataController):
         _error_code = 0
         _msg = ''
 
-        # Create the composite reference designators in the Hardware model.
-        if self._dtm_data_model.dtm_hardware.do_make_composite_ref_des(
-                node_id):
+        # Create the composite reference designators in the Hardware BoM
+        # model.
+        if self._dtm_data_model.do_make_composite_ref_des(node_id):
             _error_code = 3005
             _msg = 'RAMSTK ERROR: Failed to create all composite reference ' \
                    'designators for Node ID {0:d} and ' \
                    'children.'.format(node_id)
 
-        # If that was successful, update the BoM attributes.
-        if _error_code == 0:
-            for _node_id in self._dtm_data_model.tree.nodes:
-                if _node_id != 0:
-                    _attributes = self.request_get_attributes(_node_id)
-                    _comp_ref_des = self._dtm_data_model.dtm_hardware.do_select(
-                        _node_id).comp_ref_des
-                    _attributes['comp_ref_des'] = _comp_ref_des
-
         return _error_code, _msg
 
     def request_do_calculate(self, node_id, **kwargs):
@@ -734,6 +733,8 @@ class HardwareBoMDataController(RAMSTKDataController):
         Request to calculate the hardware item.
 
         :param int node_id: the Hardware ID to calculate.
+        :keyword int n_workers: the number of worker processes to calculate
+                                the piece parts with.  Default value is 1.
         :return: False if successful or True if an error is encountered.
         :rtype: bool
         """
@@ -742,10 +743,11 @@ class HardwareBoMDataController(RAMSTKDataController):
         self._dtm_data_model.do_calculate_all(**kwargs)
 
         if not self._test:
-            for _node_id in self._dtm_data_model.tree.nodes:
-                if _node_id != 0:
-                    _attributes = self.request_get_attributes(_node_id)
-                    self.request_set_attributes(_node_id, _attributes)
+            # Only the hardware items that were recalculated have new values.
+            _error_code, _msg = self._dtm_data_model.do_set_calculated(
+                self._dtm_data_model.do_select_calculated())
+            _return = RAMSTKDataController.do_handle_results(
+                self, _error_code, _msg, None)
 
             pub.sendMessage('calculatedAllHardware')
         else:
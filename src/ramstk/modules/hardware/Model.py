@@ -6,17 +6,114 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Hardware Package Data Model."""
 
+from collections import OrderedDict
 from math import exp
+from multiprocessing import Pool
+import numpy as np
+from sqlalchemy import inspect
 from treelib.exceptions import DuplicatedNodeIdError, NodeIDAbsentError
 
 # Import other RAMSTK modules.
 from ramstk.analyses.prediction import Component
-from ramstk.modules import RAMSTKDataModel
+from ramstk.modules import RAMSTKAttributeStore, RAMSTKDataModel
 from ramstk.dao import (RAMSTKHardware, RAMSTKDesignElectric,
                      RAMSTKDesignMechanic, RAMSTKMilHdbkF, RAMSTKNSWC,
                      RAMSTKReliability)
 
 
+def _do_select_by_hardware(session, table, **kwargs):
+    """
+    Select the records from a table that is keyed by hardware ID.
+
+    :param session: the SQLAlchemy session to use for the query.
+    :param table: the RAMSTK Program database table to select the records
+                  from.  The table must have a hardware_id field.
+    :keyword int hardware_id: the ID of the hardware item to select the
+                              record(s) for.  A list of IDs selects the
+                              records of each hardware item in the list.
+    :keyword int revision_id: the ID of the revision to select the records
+                              for.  When passed, the records for every
+                              hardware item in the revision are selected with
+                              a single query and hardware_id is ignored.
+    :return: the list of records selected.
+    :rtype: list
+    """
+    _query = session.query(table)
+
+    if kwargs.get('revision_id', None) is not None:
+        _query = _query.join(
+            RAMSTKHardware,
+            RAMSTKHardware.hardware_id == table.hardware_id).filter(
+                RAMSTKHardware.revision_id == kwargs['revision_id'])
+    elif isinstance(kwargs['hardware_id'], list):
+        _query = _query.filter(table.hardware_id.in_(kwargs['hardware_id']))
+    else:
+        _query = _query.filter(table.hardware_id == kwargs['hardware_id'])
+
+    return _query.all()
+
+
+def _is_changed(entity):
+    """
+    Check whether a record has changes that have not been saved.
+
+    An attribute set to the value it already had is not a change.
+
+    :param entity: the SQLAlchemy instance of the record.
+    :return: True if the record has changed or False otherwise.
+    :rtype: bool
+    """
+    _state = inspect(entity)
+    _dic_values = _state.dict
+
+    return _state.transient or any(
+        _dic_values.get(_key) != _value
+        for _key, _value in _state.committed_state.iteritems())
+
+
+class _Record(object):  # pylint: disable=too-few-public-methods
+    """Hold the columns of a row read without its SQLAlchemy instance."""
+
+    def __init__(self, row):
+        """
+        Initialize a _Record instance.
+
+        :param row: the row of column values to hold.
+        :type row: :class:`sqlalchemy.util.KeyedTuple`
+        """
+        self.__dict__.update(row._asdict())
+
+
+def _do_calculate_parts(records):
+    """
+    Calculate a chunk of hardware piece parts in a worker process.
+
+    :param tuple records: the hazard rate multiplier and the list of hardware
+                          attribute dicts to calculate.
+    :return: the cumulative results of each hardware item, in the same order
+             as the attribute dicts passed.  The order of each result is the
+             same as the list returned by do_calculate_all().
+    :rtype: list
+    """
+    _hr_multiplier, _lst_attributes = records
+    _lst_results = []
+
+    for _attributes in _lst_attributes:
+        # pylint: disable=protected-access
+        _attributes = HardwareBoMDataModel._do_calculate_attributes(
+            _attributes, _hr_multiplier)
+        _lst_results.append([
+            0.0 + _attributes['hazard_rate_active'],
+            0.0 + _attributes['hazard_rate_dormant'],
+            0.0 + _attributes['hazard_rate_software'],
+            0.0 + _attributes['total_cost'],
+            int(_attributes['total_part_count']),
+            0.0 + _attributes['total_power_dissipation']
+        ])
+
+    return _lst_results
+
+
 class HardwareBoMDataModel(RAMSTKDataModel):
     """
     Contain the attributes and methods of a Hardware Bill of Materials (BoM).
@@ -105,10 +202,44 @@ class HardwareBoMDataModel(RAMSTKDataModel):
         RAMSTKDataModel.__init__(self, dao)
 
         # Initialize private dictionary attributes.
+        # The cumulative results of the last calculation of each hardware
+        # item, keyed by hardware ID.  A hardware item without an entry is
+        # dirty and will be recalculated by do_calculate_all().
+        self._dic_cum_results = {}
+        # The IDs of the hardware items whose records are in the data model
+        # trees, least recently used first.
+        self._dic_record_cache = OrderedDict()
+        # The IDs of the hardware items whose calculated attributes are in
+        # the attribute store but not in their record, keyed by table.  The
+        # records are not in their data model trees.
+        self._dic_unsaved = {'general': set(), 'reliability': set()}
 
         # Initialize private list attributes.
+        # The IDs of the hardware items whose attributes were changed by the
+        # last call to do_calculate_all().
+        self._lst_calculated = []
+        # The attributes that only come from the design tables.
+        self._lst_design_keys = []
+        # The IDs of the hardware items whose records had changes that had
+        # not been saved when they were evicted from the record cache.  Their
+        # records are kept in the data model trees until they are saved.
+        self._set_modified = set()
 
         # Initialize private scalar attributes.
+        self._cache_size = 500
+        self._hr_multiplier = None
+        self._lazy = False
+        # The number of hardware items in the modified set that triggers the
+        # next check for records that have been saved.
+        self._n_sweep = 500
+        self._revision_id = None
+        # The aggregate attributes of every hardware item.  The data of each
+        # tree node is the RAMSTKAttributes() view of its row in the store.
+        # The store is the only copy of the records that have not been
+        # selected with do_select().
+        self._attribute_store = RAMSTKAttributeStore(
+            tables=(RAMSTKHardware, RAMSTKDesignElectric, RAMSTKDesignMechanic,
+                    RAMSTKMilHdbkF, RAMSTKNSWC, RAMSTKReliability))
 
         # Initialize public dictionary attributes.
 
@@ -122,6 +253,30 @@ class HardwareBoMDataModel(RAMSTKDataModel):
         self.dtm_nswc = NSWCDataModel(dao)
         self.dtm_reliability = ReliabilityDataModel(dao)
 
+        # The design tables in the order their attributes are merged.
+        self._dic_design = OrderedDict([
+            ('electrical_design', (self.dtm_design_electric,
+                                   RAMSTKDesignElectric)),
+            ('mechanical_design', (self.dtm_design_mechanic,
+                                   RAMSTKDesignMechanic)),
+            ('mil_hdbk_f', (self.dtm_mil_hdbk_f, RAMSTKMilHdbkF)),
+            ('nswc', (self.dtm_nswc, RAMSTKNSWC)),
+        ])
+        # All the tables in the order their attributes are merged.
+        self._dic_tables = OrderedDict(
+            [('general', (self.dtm_hardware, RAMSTKHardware))] +
+            self._dic_design.items() +
+            [('reliability', (self.dtm_reliability, RAMSTKReliability))])
+        _lst_keys = [
+            _column.key for _table in (RAMSTKHardware, RAMSTKReliability)
+            for _column in inspect(_table).column_attrs
+        ]
+        for __, _table in self._dic_design.values():
+            for _column in inspect(_table).column_attrs:
+                if _column.key not in _lst_keys:
+                    _lst_keys.append(_column.key)
+                    self._lst_design_keys.append(_column.key)
+
     def do_select(self, node_id, **kwargs):
         """
         Retrieve the instance of the RAMSTK<MODULE> model for the Node ID passed.
@@ -140,86 +295,380 @@ class HardwareBoMDataModel(RAMSTKDataModel):
         :return: the instance of the RAMSTK<MODULE> class that was requested
                  or None if the requested Node ID does not exist.
         """
-        _table = kwargs['table']
-        if _table == 'general':
-            _entity = self.dtm_hardware.do_select(node_id)
-        elif _table == 'electrical_design':
-            _entity = self.dtm_design_electric.do_select(node_id)
-        elif _table == 'mechanical_design':
-            _entity = self.dtm_design_mechanic.do_select(node_id)
-        elif _table == 'mil_hdbk_f':
-            _entity = self.dtm_mil_hdbk_f.do_select(node_id)
-        elif _table == 'nswc':
-            _entity = self.dtm_nswc.do_select(node_id)
-        elif _table == 'reliability':
-            _entity = self.dtm_reliability.do_select(node_id)
+        _dtm = self._dic_tables[kwargs['table']][0]
+
+        # The record is read from the RAMSTK Program database if it is not in
+        # its data model tree.  The least recently used records are then
+        # removed from the trees until there are no more than the cache size.
+        _entity = _dtm.do_select(node_id)
+        if _entity is None and node_id in self._attribute_store:
+            self._do_load_records(kwargs['table'], [node_id])
+            _entity = _dtm.do_select(node_id)
+
+        if _entity is not None:
+            self._set_modified.discard(node_id)
+            self._dic_record_cache.pop(node_id, None)
+            self._dic_record_cache[node_id] = True
+            self._do_evict_records()
 
         return _entity
 
+    def _do_evict_records(self):
+        """
+        Remove the least recently used records from the data model trees.
+
+        The least recently used hardware items are taken off the front of the
+        record cache until it holds no more than the cache size, so each call
+        only looks at the hardware items it evicts.  An evicted hardware item
+        whose records have changes that have not been saved is moved to the
+        modified set rather than removed.  The attributes are kept in the
+        attribute store so removing a record only removes the SQLAlchemy
+        instance.
+
+        :return: None
+        :rtype: None
+        """
+        while len(self._dic_record_cache) > max(self._cache_size, 1):
+            _hardware_id, __ = self._dic_record_cache.popitem(last=False)
+            if self._is_modified(_hardware_id):
+                self._set_modified.add(_hardware_id)
+            else:
+                self._do_remove_records(_hardware_id)
+
+        # The records in the modified set may be saved outside this data
+        # model, so the set is checked again each time it doubles in size.
+        if len(self._set_modified) > self._n_sweep:
+            self._do_evict_modified()
+
+    def _do_evict_modified(self):
+        """
+        Remove the records in the modified set that have been saved.
+
+        :return: None
+        :rtype: None
+        """
+        for _hardware_id in [
+                _hardware_id for _hardware_id in self._set_modified
+                if not self._is_modified(_hardware_id)
+        ]:
+            self._do_remove_records(_hardware_id)
+
+        self._n_sweep = max(2 * len(self._set_modified), self._cache_size)
+
+    def _is_modified(self, hardware_id):
+        """
+        Check whether the records of a hardware item have unsaved changes.
+
+        :param int hardware_id: the ID of the hardware item.
+        :return: True if a record of the hardware item has changed or False
+                 otherwise.
+        :rtype: bool
+        """
+        return any(
+            _is_changed(_entity)
+            for _entity in self._get_records(hardware_id))
+
+    def _do_load_records(self, table, hardware_ids):
+        """
+        Read the records of hardware items into their data model tree.
+
+        The records are read with one query per 500 hardware items.  The
+        calculated attributes of a hardware item in the unsaved set of the
+        table are then set in its record from the attribute store.
+
+        :param str table: the RAMSTK Program database table to read the
+                          records from.
+        :param list hardware_ids: the IDs of the hardware items to read.
+        :return: None
+        :rtype: None
+        """
+        _dtm = self._dic_tables[table][0]
+        _set_unsaved = self._dic_unsaved.get(table, set())
+
+        for _index in range(0, len(hardware_ids), 500):
+            _dtm.do_select_all(hardware_id=hardware_ids[_index:_index + 500])
+
+        for _hardware_id in hardware_ids:
+            _entity = _dtm.do_select(_hardware_id)
+            if _hardware_id in _set_unsaved and _entity is not None:
+                _entity.set_attributes(self.tree.get_node(_hardware_id).data)
+            _set_unsaved.discard(_hardware_id)
+
+    def _get_records(self, hardware_id):
+        """
+        Return the records of a hardware item that are in the trees.
+
+        :param int hardware_id: the ID of the hardware item.
+        :return: the RAMSTKHardware, RAMSTKDesignElectric,
+                 RAMSTKDesignMechanic, RAMSTKMilHdbkF, RAMSTKNSWC, and
+                 RAMSTKReliability instances that are in their data model
+                 trees.
+        :rtype: list
+        """
+        return [
+            _entity for _entity in (_dtm.do_select(hardware_id)
+                                    for _dtm, __ in self._dic_tables.values())
+            if _entity is not None
+        ]
+
+    def _do_remove_records(self, hardware_id):
+        """
+        Remove the records of a hardware item from the data model trees.
+
+        The records of the child hardware items in the hardware tree are
+        linked to the parent of the hardware item rather than removed.
+
+        :param int hardware_id: the ID of the hardware item.
+        :return: None
+        :rtype: None
+        """
+        for _dtm, __ in self._dic_tables.values():
+            if _dtm.do_select(hardware_id) is not None:
+                _dtm.tree.link_past_node(hardware_id)
+        self._dic_record_cache.pop(hardware_id, None)
+        self._set_modified.discard(hardware_id)
+
+    def _do_query_columns(self, session, table, hardware_ids=None):
+        """
+        Build the query of the columns of a table keyed by hardware ID.
+
+        The query returns the rows of column values without building the
+        SQLAlchemy instances.  A few hardware items are selected by ID and
+        many by revision.
+
+        :param session: the SQLAlchemy session to use for the query.
+        :param table: the RAMSTK Program database table to query.
+        :keyword list hardware_ids: the IDs of the hardware items to select.
+                                    Default is every hardware item in the
+                                    revision.
+        :return: _query; the query.
+        :rtype: :class:`sqlalchemy.orm.Query`
+        """
+        _query = session.query(*[
+            _column.class_attribute
+            for _column in inspect(table).column_attrs
+        ])
+        if hardware_ids is not None and len(hardware_ids) <= 500:
+            _query = _query.filter(table.hardware_id.in_(hardware_ids))
+        elif table is RAMSTKHardware:
+            _query = _query.filter(
+                RAMSTKHardware.revision_id == self._revision_id)
+        else:
+            _query = _query.join(
+                RAMSTKHardware,
+                RAMSTKHardware.hardware_id == table.hardware_id).filter(
+                    RAMSTKHardware.revision_id == self._revision_id)
+
+        return _query
+
+    def _do_read_attributes(self, session, tables):
+        """
+        Read the attributes of every hardware item in the revision.
+
+        The columns of each table are read with one query in hardware ID
+        order, a chunk of rows at a time, and the rows of each hardware item
+        are merged.  The get_attributes() method of each table is applied to
+        its rows so the attributes are the same as those of the SQLAlchemy
+        instances.
+
+        :param session: the SQLAlchemy session to use for the queries.
+        :param list tables: the RAMSTK Program database tables to read in the
+                            order their attributes are merged.  The first
+                            table must be RAMSTKHardware.
+        :return: the (hardware ID, {attribute:value} dict) pair of each
+                 hardware item.
+        :rtype: generator
+        """
+        _lst_readers = []
+        for _table in tables:
+            _rows = iter(
+                self._do_query_columns(session, _table).order_by(
+                    _table.hardware_id).yield_per(1000))
+            _lst_readers.append(
+                [_table.get_attributes.__func__, _rows,
+                 next(_rows, None)])
+        _get_hardware, _rows, _row = _lst_readers.pop(0)
+        _set_hardware = RAMSTKHardware.set_attributes.__func__
+
+        while _row is not None:
+            # We get and then set the attributes to replace any None values
+            # (NULL fields in the database) with their default value.
+            _record = _Record(_row)
+            _set_hardware(_record, _get_hardware(_record))
+            _attributes = _get_hardware(_record)
+
+            for _reader in _lst_readers:
+                _get_attributes, _other_rows, _other_row = _reader
+                while (_other_row is not None
+                       and _other_row.hardware_id < _row.hardware_id):
+                    _other_row = next(_other_rows, None)
+                if (_other_row is not None
+                        and _other_row.hardware_id == _row.hardware_id):
+                    _attributes.update(_get_attributes(_other_row))
+                _reader[2] = _other_row
+
+            yield _row.hardware_id, _attributes
+
+            _row = next(_rows, None)
+
+    def _do_load_design(self, hardware_ids):
+        """
+        Read the design attributes of hardware items into the attribute store.
+
+        This is the loader of the attribute store when the design records are
+        loaded lazily.  The columns of the records are read with one query per
+        design table, without building the SQLAlchemy instances.  A design
+        record that is in its design data model tree is used in place of the
+        record in the database.  A hardware item without a record in a design
+        table does not have the attributes of that table.
+
+        :param list hardware_ids: the IDs of the hardware items to load.
+        :return: None
+        :rtype: None
+        """
+        _lst_found = []
+        _set_hardware_id = set(hardware_ids)
+
+        _session = self.dao.RAMSTK_SESSION(
+            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+
+        for _dtm, _table in self._dic_design.values():
+            _lst_keys = [
+                _column.key for _column in inspect(_table).column_attrs
+            ]
+            _lst_records = [
+                _record for _record in self._do_query_columns(
+                    _session, _table, hardware_ids)
+                if _record.hardware_id in _set_hardware_id
+            ]
+            _lst_record_id = [_record.hardware_id for _record in _lst_records]
+            _lst_found.append((_lst_keys, set(_lst_record_id)))
+            if not _lst_records:
+                continue
+
+            for _row, _record_id in enumerate(_lst_record_id):
+                _entity = _dtm.do_select(_record_id)
+                if _entity is not None:
+                    _lst_records[_row] = [
+                        getattr(_entity, _key) for _key in _lst_keys
+                    ]
+
+            # The attributes are set a column at a time.  The tables are set
+            # in order so an attribute in more than one design table has the
+            # same value as when the records are loaded eagerly.
+            for _key, _values in zip(_lst_keys, zip(*_lst_records)):
+                if _key != 'hardware_id':
+                    self._attribute_store.set_column(_key, _values,
+                                                     _lst_record_id)
+
+        _session.close()
+
+        for _hardware_id in hardware_ids:
+            if all(_hardware_id in _found for __, _found in _lst_found):
+                continue
+            _set_keys = set()
+            for _lst_keys, _found in _lst_found:
+                if _hardware_id in _found:
+                    _set_keys.update(_lst_keys)
+            _attributes = self._attribute_store.get_row(_hardware_id)
+            for _key in self._lst_design_keys:
+                if _key not in _set_keys:
+                    _attributes.pop(_key, None)
+
+    def do_prefetch(self, node_ids):
+        """
+        Load the design attributes of hardware items before they are used.
+
+        This is used to load the rows about to be displayed in the
+        background when the design records are loaded lazily.  It does
+        nothing for hardware items that are already loaded.
+
+        :param list node_ids: the IDs of the hardware items to load.
+        :return: None
+        :rtype: None
+        """
+        self._attribute_store.do_fetch([
+            _node_id for _node_id in node_ids
+            if _node_id in self._attribute_store
+        ])
+
     def do_select_all(self, **kwargs):
         """
         Retrieve all the Hardware BoM data from the RAMSTK Program database.
 
+        The attributes of the hardware items are read into the attribute
+        store.  The SQLAlchemy instances of the records are only built when
+        they are selected with do_select().
+
         :param int revision_id: the Revision ID to select the Hardware BoM for.
+        :keyword bool lazy: whether to load the attributes of the design
+                            tables (electrical design, mechanical design,
+                            MIL-HDBK-217F, and NSWC) on first access rather
+                            than now.  Default is False.
+        :keyword int cache_size: the number of hardware items whose records
+                                 are kept in the data model trees after they
+                                 are selected.  Default is 500.
         :return: tree; the Tree() of data models.
         :rtype: :class:`treelib.Tree`
         """
         _revision_id = kwargs['revision_id']
-        for _node in self.dtm_hardware.do_select_all(
-                revision_id=_revision_id).all_nodes()[1:]:
-            _data = {}
-            _hardware_id = _node.data.hardware_id
-            _data = _node.data.get_attributes()
-            try:
-                _electrical = self.dtm_design_electric.do_select_all(
-                    hardware_id=_hardware_id)
-                _data.update(
-                    _electrical.nodes[_hardware_id].data.get_attributes())
-            except KeyError:
-                pass
-
-            try:
-                _mechanical = self.dtm_design_mechanic.do_select_all(
-                    hardware_id=_hardware_id)
-                _data.update(
-                    _mechanical.nodes[_hardware_id].data.get_attributes())
-            except KeyError:
-                pass
+        self._revision_id = _revision_id
+        self._dic_cum_results = {}
+        self._dic_record_cache = OrderedDict()
+        self._dic_unsaved = {'general': set(), 'reliability': set()}
+        self._set_modified = set()
+        self._cache_size = int(kwargs.get('cache_size', 500))
+        self._n_sweep = self._cache_size
+        self._lazy = kwargs.get('lazy', False)
+
+        RAMSTKDataModel.do_select_all(self).close()
+        for _dtm, __ in self._dic_tables.values():
+            RAMSTKDataModel.do_select_all(_dtm).close()
+
+        # Retrieve the records from each of the tables in a single query per
+        # table rather than one query per table per hardware item.
+        _tables = [RAMSTKHardware]
+        if not self._lazy:
+            _tables.extend(_table for __, _table in self._dic_design.values())
+        _tables.append(RAMSTKReliability)
 
-            try:
-                _mil_hdbk_f = self.dtm_mil_hdbk_f.do_select_all(
-                    hardware_id=_hardware_id)
-                _data.update(
-                    _mil_hdbk_f.nodes[_hardware_id].data.get_attributes())
-            except KeyError:
-                pass
-
-            try:
-                _nswc = self.dtm_nswc.do_select_all(hardware_id=_hardware_id)
-                _data.update(_nswc.nodes[_hardware_id].data.get_attributes())
-            except KeyError:
-                pass
-
-            try:
-                _reliability = self.dtm_reliability.do_select_all(
-                    hardware_id=_hardware_id)
-                _data.update(
-                    _reliability.nodes[_hardware_id].data.get_attributes())
-            except KeyError:
-                pass
-
-            try:
-                self.tree.create_node(
-                    _node.data.comp_ref_des,
-                    _hardware_id,
-                    parent=_node.data.parent_id,
-                    data=_data)
-
-                # pylint: disable=attribute-defined-outside-init
-                # It is defined in RAMSTKDataModel.__init__
-                self.last_id = max(self.last_id, _hardware_id)
-            except DuplicatedNodeIdError:
-                pass
+        _session = self.dao.RAMSTK_SESSION(
+            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        self._attribute_store.do_load(
+            self._do_read_attributes(_session, _tables))
+        _session.close()
+        if self._lazy:
+            self._attribute_store.do_set_loader(self._lst_design_keys,
+                                                self._do_load_design)
+
+        # The hardware items are added in hardware ID order so a child that
+        # has a lower ID than its parent is added on a later pass.  A hardware
+        # item whose parent is not in the revision is left out.
+        _lst_nodes = zip(
+            self._attribute_store.get_column('hardware_id').tolist(),
+            self._attribute_store.get_column('parent_id').tolist(),
+            self._attribute_store.get_column('comp_ref_des').tolist())
+        while _lst_nodes:
+            _lst_orphans = []
+            for _hardware_id, _parent_id, _comp_ref_des in _lst_nodes:
+                try:
+                    self.tree.create_node(
+                        _comp_ref_des,
+                        _hardware_id,
+                        parent=_parent_id,
+                        data=self._attribute_store.get_row(_hardware_id))
+
+                    # pylint: disable=attribute-defined-outside-init
+                    # It is defined in RAMSTKDataModel.__init__
+                    self.last_id = max(self.last_id, _hardware_id)
+                except NodeIDAbsentError:
+                    _lst_orphans.append(
+                        (_hardware_id, _parent_id, _comp_ref_des))
+            if len(_lst_orphans) == len(_lst_nodes):
+                for _hardware_id, __, __ in _lst_orphans:
+                    self._attribute_store.do_delete(_hardware_id)
+                _lst_orphans = []
+            _lst_nodes = _lst_orphans
 
         return self.tree
 
@@ -236,79 +685,106 @@ class HardwareBoMDataModel(RAMSTKDataModel):
         _error_code = 0
         _error_msg = ''
         _msg = ''
+        _data = {}
+        _hardware_id = None
 
-        _parent = self.dtm_hardware.do_select(_parent_id)
+        # Selecting the parent also puts it in the hardware tree so the new
+        # hardware item can be added under it.
+        _parent = self.do_select(_parent_id, table='general')
         try:
             _parent_is_part = _parent.part
         except AttributeError:
             _parent_is_part = 0
 
-        if _parent_is_part == 1 and _part == 0:
-            _error_code = 3006
-            _msg = ("RAMSTK ERROR: You can not have a hardware assembly as a "
-                    "child of a component/piece part.")
-        elif _parent_is_part == 1 and _part == 1:
-            _error_code = 3006
-            _msg = (
-                "RAMSTK ERROR: You can not have a component/piece part as a "
-                "child of another component/piece part.")
-        else:
-            _error_code, _error_msg = self.dtm_hardware.do_insert(
-                revision_id=_revision_id, parent_id=_parent_id, part=_part)
-
-        if _error_code != 0:
-            _msg = _msg + _error_msg + '\n'
-        else:
-            _data = {}
-            _hardware_id = self.dtm_hardware.last_id
-            _hardware = self.dtm_hardware.do_select(_hardware_id)
-            _data = _hardware.get_attributes()
-
-            _error_code, _error_msg = self.dtm_design_electric.do_insert(
-                hardware_id=_hardware_id)
-            if _error_code != 0:
-                _msg = _msg + _error_msg + '\n'
-            else:
-                _electrical = self.dtm_design_electric.do_select(_hardware_id)
-                _data.update(_electrical.get_attributes())
-
-            _error_code, _error_msg = self.dtm_design_mechanic.do_insert(
-                hardware_id=_hardware_id)
-            if _error_code != 0:
-                _msg = _msg + _error_msg + '\n'
+        # The records of all six tables are added in one transaction, which
+        # is ended even if one of the inserts raises an exception.
+        self.dao.db_begin()
+        try:
+            if _parent_is_part == 1 and _part == 0:
+                _error_code = 3006
+                _msg = ("RAMSTK ERROR: You can not have a hardware assembly "
+                        "as a child of a component/piece part.")
+            elif _parent_is_part == 1 and _part == 1:
+                _error_code = 3006
+                _msg = ("RAMSTK ERROR: You can not have a component/piece "
+                        "part as a child of another component/piece part.")
             else:
-                _mechanical = self.dtm_design_mechanic.do_select(_hardware_id)
-                _data.update(_mechanical.get_attributes())
+                _error_code, _error_msg = self.dtm_hardware.do_insert(
+                    revision_id=_revision_id,
+                    parent_id=_parent_id,
+                    part=_part)
 
-            _error_code, _error_msg = self.dtm_mil_hdbk_f.do_insert(
-                hardware_id=_hardware_id)
             if _error_code != 0:
                 _msg = _msg + _error_msg + '\n'
             else:
-                _mil_hdbk_f = self.dtm_mil_hdbk_f.do_select(_hardware_id)
-                _data.update(_mil_hdbk_f.get_attributes())
+                _hardware_id = self.dtm_hardware.last_id
+                _hardware = self.dtm_hardware.do_select(_hardware_id)
+                _data = _hardware.get_attributes()
+
+                _error_code, _error_msg = \
+                    self.dtm_design_electric.do_insert(
+                        hardware_id=_hardware_id)
+                if _error_code != 0:
+                    _msg = _msg + _error_msg + '\n'
+                else:
+                    _electrical = self.dtm_design_electric.do_select(
+                        _hardware_id)
+                    _data.update(_electrical.get_attributes())
+
+                _error_code, _error_msg = \
+                    self.dtm_design_mechanic.do_insert(
+                        hardware_id=_hardware_id)
+                if _error_code != 0:
+                    _msg = _msg + _error_msg + '\n'
+                else:
+                    _mechanical = self.dtm_design_mechanic.do_select(
+                        _hardware_id)
+                    _data.update(_mechanical.get_attributes())
+
+                _error_code, _error_msg = self.dtm_mil_hdbk_f.do_insert(
+                    hardware_id=_hardware_id)
+                if _error_code != 0:
+                    _msg = _msg + _error_msg + '\n'
+                else:
+                    _mil_hdbk_f = self.dtm_mil_hdbk_f.do_select(_hardware_id)
+                    _data.update(_mil_hdbk_f.get_attributes())
 
-            _error_code, _error_msg = self.dtm_nswc.do_insert(
-                hardware_id=_hardware_id)
-            if _error_code != 0:
-                _msg = _msg + _error_msg + '\n'
-            else:
-                _nswc = self.dtm_nswc.do_select(_hardware_id)
-                _data.update(_nswc.get_attributes())
+                _error_code, _error_msg = self.dtm_nswc.do_insert(
+                    hardware_id=_hardware_id)
+                if _error_code != 0:
+                    _msg = _msg + _error_msg + '\n'
+                else:
+                    _nswc = self.dtm_nswc.do_select(_hardware_id)
+                    _data.update(_nswc.get_attributes())
 
-            _error_code, _error_msg = self.dtm_reliability.do_insert(
-                hardware_id=_hardware_id)
-            if _error_code != 0:
-                _msg = _msg + _error_msg + '\n'
-            else:
-                _reliability = self.dtm_reliability.do_select(_hardware_id)
-                _data.update(_reliability.get_attributes())
+                _error_code, _error_msg = self.dtm_reliability.do_insert(
+                    hardware_id=_hardware_id)
+                if _error_code != 0:
+                    _msg = _msg + _error_msg + '\n'
+                else:
+                    _reliability = self.dtm_reliability.do_select(
+                        _hardware_id)
+                    _data.update(_reliability.get_attributes())
+        finally:
+            _code, _commit_msg = self.dao.db_commit()
 
+        if _code != 0:
+            _error_code = _code
+            _msg = _msg + _commit_msg + '\n'
+            # The records were rolled back so they are removed from the data
+            # model trees rather than added to the BoM.
+            if _hardware_id is not None:
+                self._do_remove_records(_hardware_id)
+        elif _hardware_id is not None:
             self.tree.create_node(
                 _hardware.comp_ref_des,
                 _hardware_id,
                 parent=_hardware.parent_id,
-                data=_data)
+                data=self._attribute_store.do_insert(_hardware_id, _data))
+            self._dic_post_order = {}
+            self.do_set_dirty(_hardware_id)
+            self._dic_record_cache[_hardware_id] = True
+            self._do_evict_records()
 
             # pylint: disable=attribute-defined-outside-init
             # It is defined in RAMSTKDataModel.__init__
@@ -333,34 +809,36 @@ class HardwareBoMDataModel(RAMSTKDataModel):
         _error_code = 0
         _msg = ''
 
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        _session = self.dao.db_get_session(
+            autoflush=False, expire_on_commit=False)
 
         # Delete the RAMSTKHardware entry.  Other RAMSTK Program database tables will
         # delete their entries based on CASCADE behavior.
-        try:
-            _hardware = self.dtm_hardware.tree.get_node(node_id).data
-            if _hardware is not None:
-                _error_code, _msg = self.dao.db_delete(_hardware, _session)
-        except AttributeError:
+        _hardware = self.do_select(node_id, table='general')
+        if _hardware is not None:
+            _error_code, _msg = self.dao.db_delete(_hardware, _session)
+        else:
             _error_code = 2005
             _msg = ('RAMSTK ERROR: Attempted to delete non-existent Hardware '
                     'BoM record ID {0:s}.').format(str(node_id))
 
-        _session.close()
+        self.dao.db_close_session(_session)
 
         # pylint: disable=attribute-defined-outside-init
         # It is defined in RAMSTKDataModel.__init__
         if _error_code == 0:
-            self.tree.remove_node(node_id)
+            self.do_set_dirty(node_id)
             # CASCADE DELETE removes the records from the database.  Now they
             # need to be reomved from the data model trees.
-            self.dtm_hardware.tree.remove_node(node_id)
-            self.dtm_design_electric.tree.remove_node(node_id)
-            self.dtm_design_mechanic.tree.remove_node(node_id)
-            self.dtm_mil_hdbk_f.tree.remove_node(node_id)
-            self.dtm_nswc.tree.remove_node(node_id)
-            self.dtm_reliability.tree.remove_node(node_id)
+            for _node_id in self.tree.expand_tree(node_id):
+                self._dic_cum_results.pop(_node_id, None)
+                for _set_unsaved in self._dic_unsaved.values():
+                    _set_unsaved.discard(_node_id)
+                if _node_id in self._attribute_store:
+                    self._attribute_store.do_delete(_node_id)
+                self._do_remove_records(_node_id)
+            self._dic_post_order = {}
+            self.tree.remove_node(node_id)
             self.last_id = max(self.tree.nodes.keys())
 
         return _error_code, _msg
@@ -376,69 +854,170 @@ class HardwareBoMDataModel(RAMSTKDataModel):
         _error_code = 0
         _msg = ''
 
-        _code, _message = self.dtm_hardware.do_update(node_id)
-        if _code != 0:
-            _error_code += _code
-            _msg = _msg + _message + '\n'
-
-        _code, _message = self.dtm_reliability.do_update(node_id)
-        if _code != 0:
-            _error_code += _code
-            _msg = _msg + _message + '\n'
+        _lst_dtm = [self.dtm_hardware, self.dtm_reliability]
+        _lst_dtm.extend(_dtm for _dtm, __ in self._dic_design.values())
 
-        _code, _message = self.dtm_design_electric.do_update(node_id)
-        if _code != 0:
-            _error_code += _code
-            _msg = _msg + _message + '\n'
+        self._do_load_unsaved([node_id])
 
-        _code, _message = self.dtm_design_mechanic.do_update(node_id)
-        if _code != 0:
-            _error_code += _code
-            _msg = _msg + _message + '\n'
+        # The records of all six tables are saved in one transaction, which
+        # is ended even if one of the updates raises an exception.
+        self.dao.db_begin()
+        try:
+            for _dtm in _lst_dtm:
+                _code, _message = self._do_update_record(_dtm, node_id)
+                if _code != 0:
+                    _error_code += _code
+                    _msg = _msg + _message + '\n'
+        finally:
+            _code, _message = self.dao.db_commit()
 
-        _code, _message = self.dtm_mil_hdbk_f.do_update(node_id)
         if _code != 0:
             _error_code += _code
             _msg = _msg + _message + '\n'
 
-        _code, _message = self.dtm_nswc.do_update(node_id)
-        if _code != 0:
-            _error_code += _code
-            _msg = _msg + _message + '\n'
+        if (node_id in self._set_modified
+                and not self._is_modified(node_id)):
+            self._do_remove_records(node_id)
 
         if _error_code == 0:
             _msg = 'RAMSTK SUCCESS: Updating the RAMSTK Program database.'
 
         return _error_code, _msg
 
-    def do_update_all(self, **kwargs):  # pylint: disable=unused-argument
+    def _do_update_record(self, dtm, node_id):
         """
-        Update all RAMSTKHardware table records in the RAMSTK Program database.
+        Update a record of a hardware item in the RAMSTK Program database.
 
+        A record that is not in its data model tree has not been changed so
+        there is nothing to save.
+
+        :param dtm: the data model of the table the record is in.
+        :param int node_id: the Hardware ID of the record to save.
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
+        if dtm.do_select(node_id) is None and node_id in self._attribute_store:
+            return 0, ''
 
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
+        return dtm.do_update(node_id)
+
+    def do_select_modified(self, node_id=None):
+        """
+        Retrieve the Hardware BoM records changed since they were saved.
+
+        The records are the SQLAlchemy instances in the hardware, design, and
+        reliability data models, not the attribute dicts in the BoM tree.
+
+        :param int node_id: the Hardware ID at the top of the subtree to
+                            search.  Defaults to the whole BoM.
+        :return: the changed RAMSTKHardware, RAMSTKDesignElectric,
+                 RAMSTKDesignMechanic, RAMSTKMilHdbkF, RAMSTKNSWC, and
+                 RAMSTKReliability instances.
+        :rtype: list
+        """
+        _lst_dtm = [self.dtm_hardware, self.dtm_reliability]
+        _lst_dtm.extend(_dtm for _dtm, __ in self._dic_design.values())
+
+        if node_id is None:
+            self._do_load_unsaved()
+        else:
+            _hardware_ids = set(self.tree.expand_tree(node_id, sorting=False))
+            self._do_load_unsaved(_hardware_ids)
+
+        _lst_entities = []
+        for _dtm in _lst_dtm:
+            _lst_entities.extend(_dtm.do_select_modified())
+
+        if node_id is not None:
+            _lst_entities = [
+                _entity for _entity in _lst_entities
+                if _entity.hardware_id in _hardware_ids
+            ]
+
+        return _lst_entities
+
+    def _do_load_unsaved(self, hardware_ids=None):
+        """
+        Read the records of the unsaved hardware items so they can be saved.
 
-                _msg = _msg + _debug_msg + '\n'
+        The records are read in bulk and kept in the modified set until they
+        are saved.
+
+        :keyword hardware_ids: the IDs of the hardware items to read the
+                               records of if they are unsaved.  Default is
+                               every unsaved hardware item.
+        :return: None
+        :rtype: None
+        """
+        for _table, _set_unsaved in self._dic_unsaved.items():
+            _lst_hardware_id = sorted(
+                _set_unsaved if hardware_ids is None else _set_unsaved.
+                intersection(hardware_ids))
+            self._do_load_records(_table, _lst_hardware_id)
+            self._set_modified.update(
+                _hardware_id for _hardware_id in _lst_hardware_id
+                if _hardware_id not in self._dic_record_cache)
+
+    def do_update_all(self, **kwargs):  # pylint: disable=unused-argument
+        """
+        Update all RAMSTKHardware table records in the RAMSTK Program database.
+
+        The changed records of all six tables are saved in one transaction.
+
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more line items in the hardware "
-                        "bill of materials did not update.")
+        self._do_evict_modified()
 
         if _error_code == 0:
             _msg = (
                 "RAMSTK SUCCESS: Updating all records in the hardware bill "
                 "of materials.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more line items in the hardware "
+                    "bill of materials did not update.")
 
         return _error_code, _msg
 
+    def do_make_composite_ref_des(self, node_id=1):
+        """
+        Make the composite reference designators.
+
+        The composite reference designator of a hardware item that changes is
+        also set in its RAMSTKHardware record so it is saved with the next
+        update.
+
+        :keyword int node_id: the ID of the node to start making the composite
+                              reference designators.
+        :return: False if successful or True if an error is encountered
+        :rtype: bool
+        """
+        _return = False
+
+        # The parent of each hardware item is visited before the hardware
+        # item so its composite reference designator has already been made.
+        for _node_id in self.tree.expand_tree(node_id, sorting=False):
+            _attributes = self.tree.get_node(_node_id).data
+            _parent = self.tree.parent(_node_id).data
+
+            _pref_des = ''
+            if _parent is not None:
+                _pref_des = _parent['comp_ref_des']
+
+            if _pref_des != '':
+                _comp_ref_des = _pref_des + ':' + _attributes['ref_des']
+            else:
+                _comp_ref_des = _attributes['ref_des']
+
+            if _comp_ref_des != _attributes['comp_ref_des']:
+                _attributes['comp_ref_des'] = _comp_ref_des
+                self.do_select(
+                    _node_id, table='general').comp_ref_des = _comp_ref_des
+
+        return _return
+
     def do_calculate(self, node_id, **kwargs):
         """
         Calculate RAMS attributes for the hardware item.
@@ -451,35 +1030,54 @@ class HardwareBoMDataModel(RAMSTKDataModel):
         _attributes = self.tree.get_node(node_id).data
 
         if _attributes is not None:
-            if _attributes['category_id'] > 0:
-                _attributes, __ = Component.calculate(**_attributes)
-            else:
-                # If the assembly is to be assessed, set the attributes that
-                # are the sum of the child attributes to zero.  Without doing
-                # this, they will increment each time the system is calculated.
-                if _attributes['hazard_rate_type_id'] in [0, 1]:
-                    _attributes['hazard_rate_active'] = 0.0
-                    _attributes['hazard_rate_dormant'] = 0.0
-                    _attributes['hazard_rate_software'] = 0.0
-                    _attributes['total_part_count'] = 0
-                    _attributes['total_power_dissipation'] = 0.0
-
-                if _attributes['cost_type_id'] in [0, 2]:
-                    _attributes['total_cost'] = 0.0
-
-            _attributes['hazard_rate_active'] = (
-                _attributes['hazard_rate_active'] / _hr_multiplier)
-            _attributes['hazard_rate_dormant'] = (
-                _attributes['hazard_rate_dormant'] / _hr_multiplier)
-            _attributes['hazard_rate_software'] = (
-                _attributes['hazard_rate_software'] / _hr_multiplier)
-
-            _attributes = self._do_calculate_reliability_metrics(_attributes)
-            _attributes = self._do_calculate_cost_metrics(_attributes)
-            _attributes = self._do_calculate_metric_variances(_attributes)
+            _attributes = self._do_calculate_attributes(
+                _attributes, _hr_multiplier)
 
         return _attributes
 
+    @staticmethod
+    def _do_calculate_attributes(attributes, hr_multiplier):
+        """
+        Calculate RAMS attributes for a hardware item's attribute dict.
+
+        :param dict attributes: the attributes of the hardware item being
+                                calculated.
+        :param float hr_multiplier: the hazard rate multiplier.
+        :return: attributes; the attributes dict with updated values.
+        :rtype: dict
+        """
+        if attributes['category_id'] > 0:
+            attributes, __ = Component.calculate(**attributes)
+        else:
+            # If the assembly is to be assessed, set the attributes that
+            # are the sum of the child attributes to zero.  Without doing
+            # this, they will increment each time the system is calculated.
+            if attributes['hazard_rate_type_id'] in [0, 1]:
+                attributes['hazard_rate_active'] = 0.0
+                attributes['hazard_rate_dormant'] = 0.0
+                attributes['hazard_rate_software'] = 0.0
+                attributes['total_part_count'] = 0
+                attributes['total_power_dissipation'] = 0.0
+
+            if attributes['cost_type_id'] in [0, 2]:
+                attributes['total_cost'] = 0.0
+
+        attributes['hazard_rate_active'] = (
+            attributes['hazard_rate_active'] / hr_multiplier)
+        attributes['hazard_rate_dormant'] = (
+            attributes['hazard_rate_dormant'] / hr_multiplier)
+        attributes['hazard_rate_software'] = (
+            attributes['hazard_rate_software'] / hr_multiplier)
+
+        attributes = HardwareBoMDataModel._do_calculate_reliability_metrics(
+            attributes)
+        attributes = HardwareBoMDataModel._do_calculate_cost_metrics(
+            attributes)
+        attributes = HardwareBoMDataModel._do_calculate_metric_variances(
+            attributes)
+
+        return attributes
+
     @staticmethod
     def _do_calculate_cost_metrics(attributes):
         """
@@ -581,10 +1179,32 @@ class HardwareBoMDataModel(RAMSTKDataModel):
 
         return attributes
 
+    def do_set_dirty(self, node_id):
+        """
+        Mark a hardware item and all of its parents as needing recalculation.
+
+        This must be called whenever the attributes of a hardware item change
+        so the next call to do_calculate_all() recalculates the hardware item
+        and re-sums its parent assemblies.  All other hardware items reuse the
+        results of their last calculation.
+
+        :param int node_id: the ID of the hardware item that changed.
+        :return: None
+        :rtype: None
+        """
+        _node = self.tree.get_node(node_id)
+        while _node is not None:
+            self._dic_cum_results.pop(_node.identifier, None)
+            _node = self.tree.get_node(_node.bpointer)
+
     def do_calculate_all(self, **kwargs):
         """
         Calculate all items in the system.
 
+        Only the hardware items marked dirty by do_set_dirty(), or never
+        calculated, are recalculated.  Every other hardware item returns the
+        cumulative results of its last calculation.
+
         :param float hr_multiplier: the hazard rate multiplier.  This is used
                                     to allow the hazard rates to be entered and
                                     displayed in more human readable numbers,
@@ -594,6 +1214,11 @@ class HardwareBoMDataModel(RAMSTKDataModel):
                                     failures/million hours.
         :param int node_id: the ID of the treelib Tree() node to start the
                             calculation at.
+        :keyword int n_workers: the number of worker processes to calculate
+                                the piece parts with.  The assemblies are
+                                always summed in this process.  Default value
+                                is 1 which calculates the piece parts in this
+                                process over the attribute columns.
         :return: _cum_results; the list of cumulative results.  The list order
                  is:
 
@@ -608,58 +1233,287 @@ class HardwareBoMDataModel(RAMSTKDataModel):
         """
         _hr_multiplier = kwargs['hr_multiplier']
         _node_id = kwargs['node_id']
-        _cum_results = [0.0, 0.0, 0.0, 0.0, 0, 0.0]
 
-        # Check if there are children nodes of the node passed.
-        if self.tree.get_node(_node_id).fpointer:
+        # Every cached result depends on the hazard rate multiplier.
+        if _hr_multiplier != self._hr_multiplier:
+            self._dic_cum_results = {}
+            self._hr_multiplier = _hr_multiplier
+
+        if int(kwargs.get('n_workers', 1)) > 1:
+            self._do_calculate_parts_parallel(_node_id, _hr_multiplier,
+                                              int(kwargs['n_workers']))
+        else:
+            self._do_calculate_parts_batch(_node_id, _hr_multiplier)
+
+        # Roll up the dirty hardware items with every child before its
+        # parent.  The clean items keep their cached results.  The piece
+        # parts were calculated on a copy of their attributes so only the
+        # hardware items rolled up here have changed attributes.
+        self._lst_calculated = self._do_select_dirty(_node_id)
+        for _dirty_id in reversed(self._lst_calculated):
+            self._dic_cum_results[_dirty_id] = self._do_roll_up(
+                _dirty_id, _hr_multiplier)
+
+        return list(self._dic_cum_results[_node_id])
+
+    def do_set_calculated(self, node_ids):
+        """
+        Set the calculated attributes of hardware items in their records.
+
+        The calculation only changes the general and reliability attributes
+        and they are already in the attribute store.  A record in its data
+        model tree is set now.  A record that isn't is not read; the hardware
+        item is added to the unsaved set of the table and the record is set
+        when it is next read.
+
+        :param list node_ids: the IDs of the hardware items to set.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = ''
+
+        for _node_id in node_ids:
             _attributes = self.tree.get_node(_node_id).data
+            if _attributes is None:
+                continue
+            for _table, _set_unsaved in self._dic_unsaved.items():
+                _entity = self._dic_tables[_table][0].do_select(_node_id)
+                if _entity is None:
+                    _set_unsaved.add(_node_id)
+                else:
+                    _code, _message = _entity.set_attributes(_attributes)
+                    if _code != 0:
+                        _error_code = _code
+                        _msg = _msg + _message + '\n'
+
+        if _error_code == 0:
+            _msg = ("RAMSTK SUCCESS: Setting the calculated attributes of "
+                    "the hardware bill of materials.")
+
+        return _error_code, _msg
+
+    def do_select_calculated(self):
+        """
+        Retrieve the hardware items changed by the last do_calculate_all().
+
+        :return: the IDs of the hardware items whose attributes were changed
+                 by the last call to do_calculate_all().
+        :rtype: list
+        """
+        return list(self._lst_calculated)
+
+    def _do_select_dirty(self, node_id):
+        """
+        Select the hardware items below a node that need recalculation.
+
+        The subtree is walked with each parent before its children and the
+        subtree of every clean hardware item is skipped, so only the dirty
+        items and their children are visited.
+
+        :param int node_id: the ID of the treelib Tree() node at the top of
+                            the subtree.
+        :return: _lst_dirty; the IDs of the dirty hardware items with each
+                 parent before its children.
+        :rtype: list
+        """
+        _lst_node_id, _lst_size = self.do_get_post_order(node_id)
+        _lst_dirty = []
+
+        _index = len(_lst_node_id) - 1
+        while _index >= 0:
+            if _lst_node_id[_index] in self._dic_cum_results:
+                _index -= _lst_size[_index]
+            else:
+                _lst_dirty.append(_lst_node_id[_index])
+                _index -= 1
+
+        return _lst_dirty
+
+    def _do_roll_up(self, node_id, hr_multiplier):
+        """
+        Calculate a hardware item and add the cached results of its children.
+
+        :param int node_id: the ID of the hardware item to calculate.
+        :param float hr_multiplier: the hazard rate multiplier.
+        :return: _cum_results; the list of cumulative results in the same
+                 order as do_calculate_all().
+        :rtype: list
+        """
+        _node = self.tree.get_node(node_id)
+        _cum_results = [0.0, 0.0, 0.0, 0.0, 0, 0.0]
 
-            # If there are children, calculate each of them first.
-            for _subnode_id in self.tree.get_node(_node_id).fpointer:
-                _results = self.do_calculate_all(
-                    node_id=_subnode_id, hr_multiplier=_hr_multiplier)
-                _cum_results[0] += _results[0]
-                _cum_results[1] += _results[1]
-                _cum_results[2] += _results[2]
-                _cum_results[3] += _results[3]
-                _cum_results[4] += int(_results[4])
-                _cum_results[5] += _results[5]
-            # Then calculate the parent node.
+        for _child_id in _node.fpointer:
+            _results = self._dic_cum_results[_child_id]
+            _cum_results[0] += _results[0]
+            _cum_results[1] += _results[1]
+            _cum_results[2] += _results[2]
+            _cum_results[3] += _results[3]
+            _cum_results[4] += int(_results[4])
+            _cum_results[5] += _results[5]
+
+        if _node.data is not None:
             _attributes = self.do_calculate(
-                _node_id, hr_multiplier=_hr_multiplier)
-            if _attributes is not None:
-                _cum_results[0] += _attributes['hazard_rate_active']
-                _cum_results[1] += _attributes['hazard_rate_dormant']
-                _cum_results[2] += _attributes['hazard_rate_software']
-                _cum_results[3] += _attributes['total_cost']
-                _cum_results[4] += int(_attributes['total_part_count'])
-                _cum_results[5] += _attributes['total_power_dissipation']
-        else:
-            if self.tree.get_node(_node_id).data is not None:
-                _attributes = self.do_calculate(
-                    _node_id, hr_multiplier=_hr_multiplier)
-                _cum_results[0] += _attributes['hazard_rate_active']
-                _cum_results[1] += _attributes['hazard_rate_dormant']
-                _cum_results[2] += _attributes['hazard_rate_software']
-                _cum_results[3] += _attributes['total_cost']
-                _cum_results[4] += int(_attributes['total_part_count'])
-                _cum_results[5] += _attributes['total_power_dissipation']
-
-        if self.tree.get_node(
-                _node_id).data is not None and _attributes['part'] == 0:
-            _attributes['hazard_rate_active'] = _cum_results[0]
-            _attributes['hazard_rate_dormant'] = _cum_results[1]
-            _attributes['hazard_rate_software'] = _cum_results[2]
-            _attributes['total_cost'] = _cum_results[3]
-            _attributes['total_part_count'] = int(_cum_results[4])
-            _attributes['total_power_dissipation'] = _cum_results[5]
-
-            _attributes = self._do_calculate_reliability_metrics(_attributes)
-            _attributes = self._do_calculate_cost_metrics(_attributes)
-            _attributes = self._do_calculate_metric_variances(_attributes)
+                node_id, hr_multiplier=hr_multiplier)
+            _cum_results[0] += _attributes['hazard_rate_active']
+            _cum_results[1] += _attributes['hazard_rate_dormant']
+            _cum_results[2] += _attributes['hazard_rate_software']
+            _cum_results[3] += _attributes['total_cost']
+            _cum_results[4] += int(_attributes['total_part_count'])
+            _cum_results[5] += _attributes['total_power_dissipation']
+
+            if _attributes['part'] == 0:
+                _attributes['hazard_rate_active'] = _cum_results[0]
+                _attributes['hazard_rate_dormant'] = _cum_results[1]
+                _attributes['hazard_rate_software'] = _cum_results[2]
+                _attributes['total_cost'] = _cum_results[3]
+                _attributes['total_part_count'] = int(_cum_results[4])
+                _attributes['total_power_dissipation'] = _cum_results[5]
+
+                _attributes = self._do_calculate_reliability_metrics(
+                    _attributes)
+                _attributes = self._do_calculate_cost_metrics(_attributes)
+                _attributes = self._do_calculate_metric_variances(
+                    _attributes)
 
         return _cum_results
 
+    def _do_select_dirty_parts(self, node_id):
+        """
+        Select the dirty piece parts below a node.
+
+        Assemblies update their tree attributes in place so only the piece
+        parts, which are calculated on a copy, are selected.
+
+        :param int node_id: the ID of the treelib Tree() node at the top of
+                            the subtree.
+        :return: _lst_node_id; the IDs of the dirty piece parts in tree order.
+        :rtype: list
+        """
+        _lst_node_id = []
+        for _node_id in self._do_select_dirty(node_id):
+            _node = self.tree.get_node(_node_id)
+            if (not _node.fpointer and _node.data is not None
+                    and _node.data['category_id'] > 0):
+                _lst_node_id.append(_node_id)
+
+        return _lst_node_id
+
+    def _do_calculate_parts_batch(self, node_id, hr_multiplier):
+        """
+        Calculate the dirty piece parts below a node over attribute columns.
+
+        The piece parts are copied out of the attribute store and calculated
+        with Component.calculate_batch().  The hazard rate, cost, and part
+        count adjustments of _do_calculate_attributes() are then applied to
+        the columns.  The results are stored as each part's cumulative results
+        the same as _do_calculate_parts_parallel().
+
+        :param int node_id: the ID of the treelib Tree() node to start the
+                            calculation at.
+        :param float hr_multiplier: the hazard rate multiplier.
+        :return: None
+        :rtype: None
+        """
+        _lst_node_id = self._do_select_dirty_parts(node_id)
+        if not _lst_node_id:
+            return
+
+        try:
+            _parts = self._attribute_store.do_select_rows(_lst_node_id)
+        except KeyError:
+            # The hardware items were added to the tree without adding them
+            # to the attribute store.
+            _store = RAMSTKAttributeStore()
+            _store.do_load((_node_id, self.tree.get_node(_node_id).data)
+                           for _node_id in _lst_node_id)
+            _parts = _store.do_select_rows(_lst_node_id)
+        _parts, __ = Component.calculate_batch(_parts)
+        _hr_multiplier = float(hr_multiplier)
+
+        _hazard_rate_type_id = _parts.get_column('hazard_rate_type_id')
+        _hazard_rate_active = np.where(
+            _hazard_rate_type_id == 2,
+            _parts.get_column('hazard_rate_specified'),
+            _parts.get_column('hazard_rate_active') / _hr_multiplier)
+        _is_mtbf = _hazard_rate_type_id == 3
+        _hazard_rate_active[_is_mtbf] = [
+            1.0 / _mtbf
+            for _mtbf in _parts.get_column('mtbf_specified')[_is_mtbf].tolist()
+        ]
+        _hazard_rate_active = (
+            _hazard_rate_active +
+            _parts.get_column('add_adj_factor')) * _parts.get_column(
+                'mult_adj_factor')
+
+        _quantity = _parts.get_column('quantity')
+        _total_cost = np.where(
+            _parts.get_column('cost_type_id') == 1,
+            _parts.get_column('cost') * _quantity,
+            _parts.get_column('total_cost'))
+        _total_part_count = np.where(
+            _parts.get_column('part') == 1, _quantity,
+            _parts.get_column('total_part_count'))
+
+        for _node_id, _result in zip(
+                _lst_node_id,
+                zip(_hazard_rate_active.tolist(),
+                    (_parts.get_column('hazard_rate_dormant') /
+                     _hr_multiplier).tolist(),
+                    (_parts.get_column('hazard_rate_software') /
+                     _hr_multiplier).tolist(), _total_cost.tolist(),
+                    _total_part_count.tolist(),
+                    _parts.get_column('total_power_dissipation').tolist())):
+            self._dic_cum_results[_node_id] = [
+                0.0 + _result[0], 0.0 + _result[1], 0.0 + _result[2],
+                0.0 + _result[3],
+                int(_result[4]), 0.0 + _result[5]
+            ]
+
+    def _do_calculate_parts_parallel(self, node_id, hr_multiplier, n_workers):
+        """
+        Calculate the dirty piece parts below a node with a pool of processes.
+
+        The piece parts are split into contiguous chunks in tree order and the
+        results are stored as each part's cumulative results.  The roll-up in
+        do_calculate_all() then uses them the same as any other cached result
+        so the totals are summed in the same order as a serial calculation.
+
+        :param int node_id: the ID of the treelib Tree() node to start the
+                            calculation at.
+        :param float hr_multiplier: the hazard rate multiplier.
+        :param int n_workers: the number of worker processes to use.
+        :return: None
+        :rtype: None
+        """
+        _lst_node_id = self._do_select_dirty_parts(node_id)
+        self.do_prefetch(_lst_node_id)
+        _lst_attributes = [
+            self.tree.get_node(_node_id).data.copy()
+            for _node_id in _lst_node_id
+        ]
+
+        if not _lst_attributes:
+            return
+
+        _chunk_size = -(-len(_lst_attributes) // (n_workers * 4))
+        _lst_chunks = [(float(hr_multiplier),
+                        _lst_attributes[_index:_index + _chunk_size])
+                       for _index in range(0, len(_lst_attributes),
+                                           _chunk_size)]
+
+        _pool = Pool(processes=n_workers)
+        try:
+            _lst_results = _pool.map(_do_calculate_parts, _lst_chunks)
+        finally:
+            _pool.close()
+            _pool.join()
+
+        _lst_results = [_result for _chunk in _lst_results
+                        for _result in _chunk]
+        for _node_id, _result in zip(_lst_node_id, _lst_results):
+            self._dic_cum_results[_node_id] = _result
+
 
 class HardwareDataModel(RAMSTKDataModel):
     """
@@ -701,15 +1555,32 @@ class HardwareDataModel(RAMSTKDataModel):
         connected RAMSTK Program database.  It then add each to the Hardware data
         model treelib.Tree().
 
+        :param int hardware_id: the ID of the Hardware item to retrieve the
+                                record for.
         :param int revision_id: the Revision ID to select the hardware for.
+                                When passed, the records for every Hardware
+                                item in the Revision are retrieved and
+                                hardware_id is ignored.
         :return: tree; the Tree() of RAMSTKHardware data models.
         :rtype: :class:`treelib.Tree`
         """
-        _revision_id = kwargs['revision_id']
-        _session = RAMSTKDataModel.do_select_all(self)
+        # When selecting a single hardware item, don't use the
+        # RAMSTKDataModel.do_select_all() method because we don't want to clear
+        # the tree or we'll only be left with the last hardware ID passed.
+        # The parent of a single hardware item may not be in the tree so it
+        # is added to the top of the tree.
+        _revision_id = kwargs.get('revision_id', None)
+        if _revision_id is None:
+            _session = self.dao.RAMSTK_SESSION(
+                bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+            _lst_hardware = _do_select_by_hardware(
+                _session, RAMSTKHardware, hardware_id=kwargs['hardware_id'])
+        else:
+            _session = RAMSTKDataModel.do_select_all(self)
+            _lst_hardware = _session.query(RAMSTKHardware).filter(
+                RAMSTKHardware.revision_id == _revision_id).all()
 
-        for _hardware in _session.query(RAMSTKHardware).filter(
-                RAMSTKHardware.revision_id == _revision_id).all():
+        for _hardware in _lst_hardware:
             # We get and then set the attributes to replace any None values
             # (NULL fields in the database) with their default value.
             _attributes = _hardware.get_attributes()
@@ -718,7 +1589,8 @@ class HardwareDataModel(RAMSTKDataModel):
                 self.tree.create_node(
                     _hardware.comp_ref_des,
                     _hardware.hardware_id,
-                    parent=_hardware.parent_id,
+                    parent=(_hardware.parent_id
+                            if _revision_id is not None else 0),
                     data=_hardware)
 
                 # pylint: disable=attribute-defined-outside-init
@@ -806,24 +1678,15 @@ class HardwareDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more records in the hardware table "
-                    "did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = (
                 "RAMSTK SUCCESS: Updating all records in the hardware table.")
+        else:
+            _msg = (
+                "RAMSTK ERROR: One or more records in the hardware table "
+                "did not update.")
 
         return _error_code, _msg
 
@@ -891,20 +1754,28 @@ class DesignElectricDataModel(RAMSTKDataModel):
         in the connected RAMSTK Program database.  It then add each to the
         Design Electric data model treelib.Tree().
 
+        :param int hardware_id: the ID of the Hardware item to retrieve the
+                                record for.
+        :param int revision_id: the ID of the Revision to retrieve the records
+                                for.  When passed, the records for every
+                                Hardware item in the Revision are retrieved
+                                and hardware_id is ignored.
         :return: tree; the treelib Tree() of RAMSTKDesignElectric data models that
                  comprise the DesignElectric tree.
         :rtype: :class:`treelib.Tree`
         """
-        _hardware_id = kwargs['hardware_id']
-
-        # Don't use the RAMSTKDataModel.do_select_all() method because we don't
-        # want to clear the tree or we'll only be left with the last hardware
-        # ID passed.
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        # When selecting a single hardware item, don't use the
+        # RAMSTKDataModel.do_select_all() method because we don't want to clear
+        # the tree or we'll only be left with the last hardware ID passed.
+        # When selecting an entire revision, the tree is rebuilt.
+        if kwargs.get('revision_id', None) is None:
+            _session = self.dao.RAMSTK_SESSION(
+                bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        else:
+            _session = RAMSTKDataModel.do_select_all(self)
 
-        for _design in _session.query(RAMSTKDesignElectric).\
-                filter(RAMSTKDesignElectric.hardware_id == _hardware_id).all():
+        for _design in _do_select_by_hardware(
+                _session, RAMSTKDesignElectric, **kwargs):
             try:
                 self.tree.create_node(
                     _design.hardware_id,
@@ -997,24 +1868,15 @@ class DesignElectricDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more line items in the electrical "
-                    "design table did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = ("RAMSTK SUCCESS: Updating all records in the electrical "
                     "design table.")
+        else:
+            _msg = (
+                "RAMSTK ERROR: One or more line items in the electrical "
+                "design table did not update.")
 
         return _error_code, _msg
 
@@ -1054,20 +1916,28 @@ class DesignMechanicDataModel(RAMSTKDataModel):
         in the connected RAMSTK Program database.  It then add each to the
         Mechanical Design parameter data model treelib.Tree().
 
+        :param int hardware_id: the ID of the Hardware item to retrieve the
+                                record for.
+        :param int revision_id: the ID of the Revision to retrieve the records
+                                for.  When passed, the records for every
+                                Hardware item in the Revision are retrieved
+                                and hardware_id is ignored.
         :return: tree; the treelib Tree() of RAMSTKDesignMechanic data models that
                  comprise the DesignMechanic tree.
         :rtype: :class:`treelib.Tree`
         """
-        _hardware_id = kwargs['hardware_id']
-
-        # Don't use the RAMSTKDataModel.do_select_all() method because we don't
-        # want to clear the tree or we'll only be left with the last hardware
-        # ID passed.
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        # When selecting a single hardware item, don't use the
+        # RAMSTKDataModel.do_select_all() method because we don't want to clear
+        # the tree or we'll only be left with the last hardware ID passed.
+        # When selecting an entire revision, the tree is rebuilt.
+        if kwargs.get('revision_id', None) is None:
+            _session = self.dao.RAMSTK_SESSION(
+                bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        else:
+            _session = RAMSTKDataModel.do_select_all(self)
 
-        for _design in _session.query(RAMSTKDesignMechanic).\
-                filter(RAMSTKDesignMechanic.hardware_id == _hardware_id).all():
+        for _design in _do_select_by_hardware(
+                _session, RAMSTKDesignMechanic, **kwargs):
             try:
                 self.tree.create_node(
                     _design.hardware_id,
@@ -1160,24 +2030,15 @@ class DesignMechanicDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more line items in the mechanical "
-                    "design table did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = ("RAMSTK SUCCESS: Updating all records in the mechanical "
                     "design table.")
+        else:
+            _msg = (
+                "RAMSTK ERROR: One or more line items in the mechanical "
+                "design table did not update.")
 
         return _error_code, _msg
 
@@ -1217,20 +2078,28 @@ class MilHdbkFDataModel(RAMSTKDataModel):
         in the connected RAMSTK Program database.  It then add each to the
         MIL-HDBK-217F data model treelib.Tree().
 
+        :param int hardware_id: the ID of the Hardware item to retrieve the
+                                record for.
+        :param int revision_id: the ID of the Revision to retrieve the records
+                                for.  When passed, the records for every
+                                Hardware item in the Revision are retrieved
+                                and hardware_id is ignored.
         :return: tree; the treelib Tree() of RAMSTKMilHdbkF data models that
                  comprise the MilHdbkF tree.
         :rtype: :class:`treelib.Tree`
         """
-        _hardware_id = kwargs['hardware_id']
-
-        # Don't use the RAMSTKDataModel.do_select_all() method because we don't
-        # want to clear the tree or we'll only be left with the last hardware
-        # ID passed.
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        # When selecting a single hardware item, don't use the
+        # RAMSTKDataModel.do_select_all() method because we don't want to clear
+        # the tree or we'll only be left with the last hardware ID passed.
+        # When selecting an entire revision, the tree is rebuilt.
+        if kwargs.get('revision_id', None) is None:
+            _session = self.dao.RAMSTK_SESSION(
+                bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        else:
+            _session = RAMSTKDataModel.do_select_all(self)
 
-        for _milhdbkf in _session.query(RAMSTKMilHdbkF).\
-                filter(RAMSTKMilHdbkF.hardware_id == _hardware_id).all():
+        for _milhdbkf in _do_select_by_hardware(
+                _session, RAMSTKMilHdbkF, **kwargs):
             try:
                 self.tree.create_node(
                     _milhdbkf.hardware_id,
@@ -1323,24 +2192,15 @@ class MilHdbkFDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more records in the MIL-HDBK-217 "
-                    "table did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = ("RAMSTK SUCCESS: Updating all records in the MIL-HDBK-217 "
                     "table.")
+        else:
+            _msg = (
+                "RAMSTK ERROR: One or more records in the MIL-HDBK-217 "
+                "table did not update.")
 
         return _error_code, _msg
 
@@ -1380,20 +2240,28 @@ class NSWCDataModel(RAMSTKDataModel):
         in the connected RAMSTK Program database.  It then add each to the
         NSWC data model treelib.Tree().
 
+        :param int hardware_id: the ID of the Hardware item to retrieve the
+                                record for.
+        :param int revision_id: the ID of the Revision to retrieve the records
+                                for.  When passed, the records for every
+                                Hardware item in the Revision are retrieved
+                                and hardware_id is ignored.
         :return: tree; the treelib Tree() of RAMSTKNSWC data models that
                  comprise the NSWC tree.
         :rtype: :class:`treelib.Tree`
         """
-        _hardware_id = kwargs['hardware_id']
-
-        # Don't use the RAMSTKDataModel.do_select_all() method because we don't
-        # want to clear the tree or we'll only be left with the last hardware
-        # ID passed.
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        # When selecting a single hardware item, don't use the
+        # RAMSTKDataModel.do_select_all() method because we don't want to clear
+        # the tree or we'll only be left with the last hardware ID passed.
+        # When selecting an entire revision, the tree is rebuilt.
+        if kwargs.get('revision_id', None) is None:
+            _session = self.dao.RAMSTK_SESSION(
+                bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        else:
+            _session = RAMSTKDataModel.do_select_all(self)
 
-        for _nswc in _session.query(RAMSTKNSWC).\
-                filter(RAMSTKNSWC.hardware_id == _hardware_id).all():
+        for _nswc in _do_select_by_hardware(
+                _session, RAMSTKNSWC, **kwargs):
             try:
                 self.tree.create_node(
                     _nswc.hardware_id, _nswc.hardware_id, parent=0, data=_nswc)
@@ -1480,22 +2348,13 @@ class NSWCDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the NSWC table "
-                        "did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = ("RAMSTK SUCCESS: Updating all records in the NSWC table.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more records in the NSWC table "
+                    "did not update.")
 
         return _error_code, _msg
 
@@ -1536,21 +2395,27 @@ class ReliabilityDataModel(RAMSTKDataModel):
         Reliability data model treelib.Tree().
 
         :param int hardware_id: the ID of the Hardware item to retrieve the
-                                Reliability parameters for.
+                                record for.
+        :param int revision_id: the ID of the Revision to retrieve the records
+                                for.  When passed, the records for every
+                                Hardware item in the Revision are retrieved
+                                and hardware_id is ignored.
         :return: tree; the treelib Tree() of RAMSTKReliability data models that
                  comprise the Reliability tree.
         :rtype: :class:`treelib.Tree`
         """
-        _hardware_id = kwargs['hardware_id']
-
-        # Don't use the RAMSTKDataModel.do_select_all() method because we don't
-        # want to clear the tree or we'll only be left with the last hardware
-        # ID passed.
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        # When selecting a single hardware item, don't use the
+        # RAMSTKDataModel.do_select_all() method because we don't want to clear
+        # the tree or we'll only be left with the last hardware ID passed.
+        # When selecting an entire revision, the tree is rebuilt.
+        if kwargs.get('revision_id', None) is None:
+            _session = self.dao.RAMSTK_SESSION(
+                bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        else:
+            _session = RAMSTKDataModel.do_select_all(self)
 
-        for _reliability in _session.query(RAMSTKReliability).\
-                filter(RAMSTKReliability.hardware_id == _hardware_id).all():
+        for _reliability in _do_select_by_hardware(
+                _session, RAMSTKReliability, **kwargs):
             try:
                 self.tree.create_node(
                     _reliability.hardware_id,
@@ -1643,22 +2508,13 @@ class ReliabilityDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the reliability "
-                        "table did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = ("RAMSTK SUCCESS: Updating all records in the reliability "
                     "table.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more records in the reliability "
+                    "table did not update.")
 
         return _error_code, _msg
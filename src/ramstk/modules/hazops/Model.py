@@ -189,25 +189,21 @@ class HazardAnalysisDataModel(RAMSTKDataModel):
         :rtype: bool
         """
         _hardware_id = kwargs['hardware_id']
-        _error_code = 0
-        _msg = ''
 
-        for _node in self.do_select_children(_hardware_id).all_nodes()[1:]:
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-                _msg = _msg + _debug_msg + '\n'
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more records in the HazOps table "
-                    "for Hardware ID {0:d} did not "
-                    "update.").format(_hardware_id)
-            except NodeIDAbsentError:
-                pass
+        try:
+            _lst_hazards = self.do_select_modified(_hardware_id)
+        except NodeIDAbsentError:
+            _lst_hazards = []
+
+        _error_code, _msg = self.do_update_many(_lst_hazards)
 
         if _error_code == 0:
             _msg = ("RAMSTK SUCCESS: Updating all records in the HazOps table "
                     "for Hardware ID {0:d}.").format(_hardware_id)
+        else:
+            _msg = (
+                "RAMSTK ERROR: One or more records in the HazOps table "
+                "for Hardware ID {0:d} did not update.").format(_hardware_id)
 
         return _error_code, _msg
 
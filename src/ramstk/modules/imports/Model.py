@@ -300,7 +300,8 @@ class ImportDataModel(RAMSTKDataModel):
                 _entities.append(_entity)
                 _revision_id = _entity.revision_id
 
-        _error_code, _msg = RAMSTKDataModel.do_insert(self, entities=_entities)
+        _error_code, _msg = RAMSTKDataModel.do_insert(
+            self, entities=_entities, copy=True)
 
         if _error_code == 0:
             _count = len(_entities)
@@ -6,6 +6,8 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Physics of Failure Package Data Controller."""
 
+from pubsub import pub
+
 # Import other RAMSTK modules.
 from ramstk.modules import RAMSTKDataController
 from . import dtmPoF
@@ -45,6 +47,31 @@ class PhysicsOfFailureDataController(RAMSTKDataController):
 
         # Initialize public scalar attributes.
 
+        pub.subscribe(self._on_edit_fmea, 'editedFMEA')
+        pub.subscribe(self._on_select_revision, 'selectedRevision')
+
+    def _on_edit_fmea(self):
+        """
+        Discard the prefetched PoF when the (D)FME(C)A is changed.
+
+        The modes and mechanisms of the PoF are edited in the (D)FME(C)A so
+        any prefetched PoF may no longer match the RAMSTK Program database.
+
+        :return: None
+        :rtype: None
+        """
+        return self._dtm_data_model.do_clear_prefetch()
+
+    def _on_select_revision(self, module_id):
+        """
+        Discard the prefetched PoF when a Revision is selected.
+
+        :return: None
+        :rtype: None
+        """
+        # pylint: disable=unused-argument
+        return self._dtm_data_model.do_clear_prefetch()
+
     def request_do_select_all(self, **kwargs):
         """
         Load the entire PoF for a failure Mode.
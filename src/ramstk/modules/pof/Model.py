@@ -6,12 +6,15 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Physics of Failure Data Model."""
 
+from collections import OrderedDict
+
 from treelib import tree
 
 # Import other RAMSTK modules.
 from ramstk.modules import RAMSTKDataModel
 from ramstk.modules.fmea import dtmMode, dtmMechanism
-from ramstk.dao import RAMSTKOpLoad, RAMSTKOpStress, RAMSTKTestMethod
+from ramstk.dao import (RAMSTKMechanism, RAMSTKMode, RAMSTKOpLoad,
+                        RAMSTKOpStress, RAMSTKTestMethod)
 
 
 class OpLoadDataModel(RAMSTKDataModel):
@@ -147,25 +150,16 @@ class OpLoadDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.data.load_id)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more operating loads in the damage "
-                    "modeling worksheet did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = (
                 "RAMSTK SUCCESS: Updating all operating loads in the damage "
                 "modeling worksheet.")
+        else:
+            _msg = (
+                "RAMSTK ERROR: One or more operating loads in the damage "
+                "modeling worksheet did not update.")
 
         return _error_code, _msg
 
@@ -309,23 +303,14 @@ class OpStressDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.data.stress_id)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more operating stresses in the "
-                        "damage modeling worksheet did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = ("RAMSTK SUCCESS: Updating all operating stresses in the "
                     "damage modeling worksheet.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more operating stresses in the "
+                    "damage modeling worksheet did not update.")
 
         return _error_code, _msg
 
@@ -469,23 +454,14 @@ class TestMethodDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.data.load_id)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more test methods in the damage "
-                        "modeling worksheet did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = ("RAMSTK SUCCESS: Updating all test methods in the damage "
                     "modeling worksheet.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more test methods in the damage "
+                    "modeling worksheet did not update.")
 
         return _error_code, _msg
 
@@ -514,10 +490,15 @@ class PhysicsOfFailureDataModel(RAMSTKDataModel):
                   |_Stress 1.1.2.1s
                   |_Stress 1.1.2.2s
                   |_Test 1.1.2.1t
+
+    :cvar int prefetch_size: the maximum number of prefetched Hardware IDs
+                             held until they are selected.
     """
 
     _tag = 'PhysicsOfFailure'
 
+    prefetch_size = 100
+
     def __init__(self, dao):
         """
         Initialize a PhysicsOfFailure data model instance.
@@ -529,11 +510,13 @@ class PhysicsOfFailureDataModel(RAMSTKDataModel):
         RAMSTKDataModel.__init__(self, dao)
 
         # Initialize private dictionary attributes.
+        self._dic_prefetch = OrderedDict()
 
         # Initialize private list attributes.
 
         # Initialize private scalar attributes.
         self._functional = False
+        self._revision_id = None
 
         # Initialize public dictionary attributes.
 
@@ -550,134 +533,194 @@ class PhysicsOfFailureDataModel(RAMSTKDataModel):
         """
         Retrieve and build the Physics of Failure tree for Hardware ID.
 
+        The Physics of Failure for any Hardware ID passed in the prefetch
+        list is loaded at the same time and held until that Hardware ID is
+        selected.  Prefetched items are used once and then discarded so a
+        later selection of the same Hardware ID is read fresh from the
+        database.  At most prefetch_size Hardware IDs are held; the oldest
+        are discarded first and only the first prefetch_size Hardware IDs
+        in the prefetch list are read.  The held items are also discarded
+        when the PoF is changed or a different Revision is selected.
+
         :param str parent_id: the Hardware ID to retrieve the Physics of
                               Failure information and build trees for.
+        :keyword list prefetch: the list of Hardware IDs to load along with
+                                parent_id.
+        :keyword int revision_id: the ID of the Revision the Hardware ID is
+                                  associated with.
         :return: tree; the PhysicsOfFailure treelib Tree().
         :rtype: :class:`treelib.Tree`
         """
-        _mode_id = kwargs['parent_id']
-        RAMSTKDataModel.do_select_all(self)
+        _hardware_id = kwargs['parent_id']
+        _prefetch = kwargs.get('prefetch', [])
+        _revision_id = kwargs.get('revision_id', self._revision_id)
 
-        _modes = self.dtm_mode.do_select_all(
-            parent_id=_mode_id, functional=False).nodes
-        for _key in _modes:
-            _mode = _modes[_key].data
-            if _mode is not None:
-                _node_id = '0.{0:d}'.format(_mode.mode_id)
-                self.tree.create_node(
-                    tag=_mode.description,
-                    identifier=_node_id,
-                    parent=0,
-                    data=_mode)
+        RAMSTKDataModel.do_select_all(self)
 
-                self._do_add_mechanisms(_mode.mode_id, _node_id)
+        if _revision_id != self._revision_id:
+            self.do_clear_prefetch()
+            self._revision_id = _revision_id
+
+        # Hardware IDs past prefetch_size would be discarded as soon as they
+        # were read so they aren't read.  This also keeps the number of bound
+        # parameters in the query under SQLite's limit.
+        _lst_hardware_id = []
+        for _id in [_hardware_id] + list(_prefetch)[:self.prefetch_size]:
+            if _id not in self._dic_prefetch and _id not in _lst_hardware_id:
+                _lst_hardware_id.append(_id)
+        _dic_nodes = {}
+        if _lst_hardware_id:
+            _dic_nodes = self._do_select_nodes(_lst_hardware_id)
+            for _id in _lst_hardware_id:
+                if _id != _hardware_id:
+                    self._dic_prefetch[_id] = _dic_nodes[_id]
+            while len(self._dic_prefetch) > self.prefetch_size:
+                self._dic_prefetch.popitem(last=False)
+
+        _nodes = _dic_nodes.get(_hardware_id)
+        if _nodes is None:
+            _nodes = self._dic_prefetch.pop(_hardware_id, [])
+
+        for _tag, _node_id, _parent_id, _entity in _nodes:
+            self.tree.create_node(
+                tag=_tag, identifier=_node_id, parent=_parent_id, data=_entity)
 
         return self.tree
 
-    def _do_add_mechanisms(self, mode_id, parent_id):
+    def _do_select_nodes(self, hardware_ids):
         """
-        Add the failure mechanisms to Physics of Failure tree for Mode ID.
+        Retrieve the Physics of Failure nodes for a list of Hardware IDs.
+
+        Each level of the Physics of Failure is retrieved with a single query
+        filtered on the IDs of the level above it.  The nodes are then linked
+        in memory.
 
-        :param int mechanism_id: the Mechanism ID to add the operating loads
-                                 to.
-        :param str parent_id: the Node ID to add the operating loads to.
-        :return: False if successful or True if an error is encountered.
-        :rtype: bool
+        :param list hardware_ids: the Hardware IDs to retrieve the Physics of
+                                  Failure nodes for.
+        :return: _dic_nodes; a dict with the Hardware ID as key and a list of
+                 (tag, Node ID, parent Node ID, entity) tuples as values.  The
+                 list is ordered so each parent precedes its children.
+        :rtype: dict
         """
-        _mechanisms = self.dtm_mechanism.do_select_all(
-            parent_id=mode_id, pof=True).nodes
-        for _key in _mechanisms:
-            _mechanism = _mechanisms[_key].data
-            if _mechanism is not None and _mechanism.pof_include:
-                _node_id = '{0:s}.{1:d}'.format(parent_id,
-                                                _mechanism.mechanism_id)
-                self.tree.create_node(
-                    tag=_mechanism.description,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_mechanism)
+        _dic_nodes = dict((_id, []) for _id in hardware_ids)
 
-                self._do_add_oploads(_mechanism.mechanism_id, _node_id)
+        _session = self.dao.RAMSTK_SESSION(
+            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
 
-        return self.tree
+        _qry_modes = _session.query(RAMSTKMode).filter(
+            RAMSTKMode.hardware_id.in_(hardware_ids))
+        _qry_mechanisms = _session.query(RAMSTKMechanism).filter(
+            RAMSTKMechanism.mode_id.in_(
+                _qry_modes.with_entities(RAMSTKMode.mode_id)))
+        _qry_oploads = _session.query(RAMSTKOpLoad).filter(
+            RAMSTKOpLoad.mechanism_id.in_(
+                _qry_mechanisms.with_entities(RAMSTKMechanism.mechanism_id)))
+        _load_ids = _qry_oploads.with_entities(RAMSTKOpLoad.load_id)
 
-    def _do_add_oploads(self, mechanism_id, parent_id):
-        """
-        Add the operating loads to Physics of Failure tree for Mechanism ID.
+        _modes = _qry_modes.order_by(RAMSTKMode.mode_id).all()
+        _mechanisms = _qry_mechanisms.order_by(
+            RAMSTKMechanism.mechanism_id).all()
+        _oploads = _qry_oploads.order_by(RAMSTKOpLoad.load_id).all()
+        _opstresses = _session.query(RAMSTKOpStress).filter(
+            RAMSTKOpStress.load_id.in_(_load_ids)).order_by(
+                RAMSTKOpStress.stress_id).all()
+        _methods = _session.query(RAMSTKTestMethod).filter(
+            RAMSTKTestMethod.load_id.in_(_load_ids)).order_by(
+                RAMSTKTestMethod.test_id).all()
 
-        :param int mechanism_id: the Mechanism ID to add the operating loads
-                                 to.
-        :param str parent_id: the Node ID to add the operating loads to.
-        :return: False if successful or True if an error is encountered.
-        :rtype: bool
-        """
-        _return = False
+        _session.close()
 
-        _oploads = self.dtm_opload.do_select_all(parent_id=mechanism_id).nodes
-        for _key in _oploads:
-            _opload = _oploads[_key].data
-            if _opload is not None:
-                _node_id = '{0:s}.{1:d}'.format(parent_id, _opload.load_id)
-                self.tree.create_node(
-                    tag=_opload.description,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_opload)
+        # Each of these maps a database ID to the (Hardware ID, Node ID) of
+        # the entity.  Children whose parent isn't in the map (e.g., the
+        # children of a mechanism not included in the PoF) are skipped.
+        _dic_mode = {}
+        for _mode in _modes:
+            _node_id = '0.{0:d}'.format(_mode.mode_id)
+            _dic_nodes[_mode.hardware_id].append(
+                self._do_make_node(_mode, _node_id, 0))
+            _dic_mode[_mode.mode_id] = (_mode.hardware_id, _node_id)
+
+        _dic_mechanism = {}
+        for _mechanism in _mechanisms:
+            _hardware_id, _parent_id = _dic_mode[_mechanism.mode_id]
+            _node = self._do_make_node(
+                _mechanism, '{0:s}.{1:d}'.format(_parent_id,
+                                                 _mechanism.mechanism_id),
+                _parent_id)
+            if _mechanism.pof_include:
+                _dic_nodes[_hardware_id].append(_node)
+                _dic_mechanism[_mechanism.mechanism_id] = (_hardware_id,
+                                                           _node[1])
+
+        _dic_opload = {}
+        for _opload in _oploads:
+            if _opload.mechanism_id in _dic_mechanism:
+                _hardware_id, _parent_id = _dic_mechanism[
+                    _opload.mechanism_id]
+                _node = self._do_make_node(
+                    _opload, '{0:s}.{1:d}'.format(_parent_id,
+                                                  _opload.load_id),
+                    _parent_id)
+                _dic_nodes[_hardware_id].append(_node)
+                _dic_opload[_opload.load_id] = (_hardware_id, _node[1])
 
-                self._do_add_opstress(_opload.load_id, _node_id)
-                self._do_add_test_methods(_opload.load_id, _node_id)
+        for _opstress in _opstresses:
+            if _opstress.load_id in _dic_opload:
+                _hardware_id, _parent_id = _dic_opload[_opstress.load_id]
+                _dic_nodes[_hardware_id].append(
+                    self._do_make_node(
+                        _opstress, '{0:s}.{1:d}s'.format(
+                            _parent_id, _opstress.stress_id), _parent_id))
 
-        return _return
+        for _method in _methods:
+            if _method.load_id in _dic_opload:
+                _hardware_id, _parent_id = _dic_opload[_method.load_id]
+                _dic_nodes[_hardware_id].append(
+                    self._do_make_node(
+                        _method, '{0:s}.{1:d}t'.format(
+                            _parent_id, _method.test_id), _parent_id))
 
-    def _do_add_opstress(self, load_id, parent_id):
-        """
-        Add the operating stresses to the PhysicsOfFailure tree for Load ID.
+        # pylint: disable=attribute-defined-outside-init
+        # It is defined in RAMSTKDataModel.__init__
+        for _dtm, _entities, _key in [
+            (self.dtm_mode, _modes, 'mode_id'),
+            (self.dtm_mechanism, _mechanisms, 'mechanism_id'),
+            (self.dtm_opload, _oploads, 'load_id'),
+            (self.dtm_opstress, _opstresses, 'stress_id'),
+            (self.dtm_testmethod, _methods, 'test_id')]:
+            for _entity in _entities:
+                _dtm.last_id = max(_dtm.last_id, getattr(_entity, _key))
 
-        :param int load_id: the Load ID to add the operating stresses to.
-        :param str parent_id: the Node ID to add the operating stresses to.
-        :return: False if successful or True if an error is encountered.
-        :rtype: bool
-        """
-        _return = False
+        return _dic_nodes
 
-        _opstresses = self.dtm_opstress.do_select_all(parent_id=load_id).nodes
+    def do_clear_prefetch(self):
+        """
+        Discard the prefetched Physics of Failure items.
 
-        for _key in _opstresses:
-            _opstress = _opstresses[_key].data
-            if _opstress is not None:
-                _node_id = '{0:s}.{1:d}s'.format(parent_id,
-                                                 _opstress.stress_id)
-                self.tree.create_node(
-                    tag=_opstress.description,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_opstress)
+        :return: None
+        :rtype: None
+        """
+        self._dic_prefetch.clear()
 
-        return _return
+        return None
 
-    def _do_add_test_methods(self, load_id, parent_id):
+    @staticmethod
+    def _do_make_node(entity, node_id, parent_id):
         """
-        Add the test methods to the PhysicsOfFailure tree for Stress ID.
+        Prepare an entity retrieved from the database for the PoF tree.
 
-        :param int load_id: the Operating Load ID to add the test method to.
-        :param str parent_id: the Node ID to add the test method to.
-        :return: False if successful or True if an error is encountered.
-        :rtype: bool
+        :param entity: the RAMSTK<MODULE> entity to add to the PoF tree.
+        :param str node_id: the Node ID to add the entity as.
+        :param parent_id: the Node ID of the parent node.
+        :return: (tag, node_id, parent_id, entity)
+        :rtype: tuple
         """
-        _return = False
+        # We get and then set the attributes to replace any None values
+        # (NULL fields in the database) with their default value.
+        _attributes = entity.get_attributes()
+        entity.set_attributes(_attributes)
 
-        _methods = self.dtm_testmethod.do_select_all(parent_id=load_id).nodes
-        for _key in _methods:
-            _method = _methods[_key].data
-            if _method is not None:
-                _node_id = '{0:s}.{1:d}t'.format(parent_id, _method.test_id)
-                self.tree.create_node(
-                    tag=_method.description,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_method)
-
-        return _return
+        return entity.description, node_id, parent_id, entity
 
     def do_insert(self, **kwargs):
         """
@@ -706,6 +749,8 @@ class PhysicsOfFailureDataModel(RAMSTKDataModel):
         _parent_id = str(kwargs['parent_id'])  # Parent Node ID in Tree.
         _level = kwargs['level']
 
+        self.do_clear_prefetch()
+
         if _level == 'opload':
             _error_code, _msg = self.dtm_opload.do_insert(
                 mechanism_id=_entity_id)
@@ -753,6 +798,8 @@ class PhysicsOfFailureDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
+        self.do_clear_prefetch()
+
         _error_code, _msg = RAMSTKDataModel.do_delete(self, node_id)
 
         if _error_code != 0:
@@ -787,22 +834,15 @@ class PhysicsOfFailureDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
+        self.do_clear_prefetch()
 
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more line items in the damage "
-                        "modeling worksheet did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = ("RAMSTK SUCCESS: Updating all line items in the damage "
                     "modeling worksheet.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more line items in the damage "
+                    "modeling worksheet did not update.")
 
         return _error_code, _msg
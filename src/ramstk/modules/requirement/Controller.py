@@ -10,7 +10,7 @@ from pubsub import pub
 
 # Import other RAMSTK modules.
 from ramstk.modules import RAMSTKDataController
-from ramstk.modules import RAMSTKDataMatrix
+from ramstk.modules import RAMSTKDataMatrix, RAMSTKSparseDataMatrix
 from ramstk.dao import RAMSTKRequirement, RAMSTKHardware, RAMSTKSoftware, RAMSTKValidation
 from . import dtmRequirement
 
@@ -46,8 +46,8 @@ class RequirementDataController(RAMSTKDataController):
         # Initialize private list attributes.
 
         # Initialize private scalar attributes.
-        self._dmx_rqmt_hw_matrix = RAMSTKDataMatrix(dao, RAMSTKRequirement,
-                                                    RAMSTKHardware)
+        self._dmx_rqmt_hw_matrix = RAMSTKSparseDataMatrix(
+            dao, RAMSTKRequirement, RAMSTKHardware)
         self._dmx_rqmt_sw_matrix = RAMSTKDataMatrix(dao, RAMSTKRequirement,
                                                     RAMSTKSoftware)
         self._dmx_rqmt_val_matrix = RAMSTKDataMatrix(dao, RAMSTKRequirement,
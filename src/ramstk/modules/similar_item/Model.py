@@ -170,24 +170,15 @@ class SimilarItemDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more line items in the similar "
-                        "item analysis worksheet did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = (
                 "RAMSTK SUCCESS: Updating all line items in the similar item "
                 "analysis worksheet.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more line items in the similar "
+                    "item analysis worksheet did not update.")
 
         return _error_code, _msg
 
@@ -224,9 +215,9 @@ class SimilarItemDataModel(RAMSTKDataModel):
         _return = False
 
         # Calculate all Similar Items, skipping the top node in the tree.
-        for _node in self.tree.all_nodes():
-            if _node.identifier != 0:
-                self.do_calculate(_node.identifier, **kwargs)
+        _lst_node_id, __ = self.do_get_post_order(0)
+        for _node_id in _lst_node_id[:-1]:
+            self.do_calculate(_node_id, **kwargs)
 
         return _return
 
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.modules.survival.Controller.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Survival Package Data Controller Module."""
+
+from pubsub import pub
+
+# Import other RAMSTK modules.
+from ramstk.modules import RAMSTKDataController
+from . import dtmSurvival
+
+
+class SurvivalDataController(RAMSTKDataController):
+    """
+    Provide an interface between Survival data models and RAMSTK views.
+
+    A single Survival data controller can manage one or more Survival data
+    models.
+    """
+
+    def __init__(self, dao, configuration, **kwargs):
+        """
+        Initialize a Survival data controller instance.
+
+        :param dao: the data access object used to communicate with the
+                    connected RAMSTK Program database.
+        :type dao: :py:class:`ramstk.dao.DAO.DAO`
+        :param configuration: the RAMSTK configuration instance.
+        :type configuration: :py:class:`ramstk.Configuration.Configuration`
+        """
+        RAMSTKDataController.__init__(
+            self,
+            configuration,
+            model=dtmSurvival(dao),
+            ramstk_module='survival',
+            **kwargs)
+
+        # Initialize private dictionary attributes.
+
+        # Initialize private list attributes.
+
+        # Initialize private scalar attributes.
+
+        # Initialize public dictionary attributes.
+
+        # Initialize public list attributes.
+
+        # Initialize public scalar attributes.
+
+    def request_do_insert(self, **kwargs):
+        """
+        Request to add an RAMSTKSurvival table record.
+
+        :param int revision_id: the Revision ID this Survival analysis will be
+                                associated with.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _revision_id = kwargs['revision_id']
+        _error_code, _msg = self._dtm_data_model.do_insert(
+            revision_id=_revision_id)
+
+        if _error_code == 0:
+            self._configuration.RAMSTK_USER_LOG.info(_msg)
+
+            if not self._test:
+                pub.sendMessage('insertedSurvival')
+        else:
+            _msg = _msg + '  Failed to add a new Survival analysis to the ' \
+                          'RAMSTK Program database.'
+            self._configuration.RAMSTK_DEBUG_LOG.error(_msg)
+
+        return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
+                                                      None)
+
+    def request_do_delete(self, node_id):
+        """
+        Request to delete an RAMSTKSurvival table record.
+
+        :param int node_id: the PyPubSub Tree() ID of the Survival analysis to
+                            delete.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _error_code, _msg = self._dtm_data_model.do_delete(node_id)
+
+        return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
+                                                      'deletedSurvival')
+
+    def request_do_update(self, node_id):
+        """
+        Request to update an RAMSTKSurvival table record.
+
+        :param int node_id: the PyPubSub Tree() ID of the Survival analysis to
+                            update.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _error_code, _msg = self._dtm_data_model.do_update(node_id)
+
+        return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
+                                                      'savedSurvival')
+
+    def request_do_update_all(self, **kwargs):
+        """
+        Request to update all records in the RAMSTKSurvival table.
+
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _error_code, _msg = self._dtm_data_model.do_update_all(**kwargs)
+
+        return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
+                                                      None)
+
+    def request_do_calculate(self, node_id, **kwargs):
+        """
+        Request the distribution of a Survival analysis be fit to its records.
+
+        :param int node_id: the PyPubSub Tree() ID of the Survival analysis to
+                            calculate.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        _error_code, _msg = self._dtm_data_model.do_calculate(
+            node_id, **kwargs)
+
+        return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
+                                                      'calculatedSurvival')
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.modules.survival.Model.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Survival Package Data Model Module."""
+
+import numpy as np  # pylint: disable=E0401
+from sqlalchemy import select  # pylint: disable=E0401
+
+# Import other RAMSTK modules.
+from ramstk.modules import RAMSTKDataModel
+from ramstk.dao import RAMSTKSurvival, RAMSTKSurvivalData
+from ramstk.statistics.Bounds import calculate_fisher_bounds
+from ramstk.statistics.Distributions import (
+    do_group_data, get_counts, maximum_likelihood_estimate)
+from ramstk.statistics.NonParametric import (
+    KAPLAN_MEIER, MCF, do_merge_tables, do_tabulate_data, kaplan_meier,
+    mean_cumulative_function)
+
+
+class SurvivalDataModel(RAMSTKDataModel):
+    """
+    Contain the attributes and methods of a Survival analysis.
+
+    The Survival data model contains the attributes and methods of a survival
+    analysis.  A Revision will contain zero or more survival analyses.  Each
+    analysis fits a distribution to its RAMSTKSurvivalData records.
+
+    :cvar int chunk_size: the number of RAMSTKSurvivalData records read from
+                          the RAMSTK Program database at a time.
+    """
+
+    _tag = 'Survivals'
+
+    chunk_size = 50000
+
+    def __init__(self, dao):
+        """
+        Initialize a Survival data model instance.
+
+        :param dao: the data access object for communicating with the RAMSTK
+                    Program database.
+        :type dao: :class:`ramstk.dao.DAO.DAO`
+        """
+        RAMSTKDataModel.__init__(self, dao)
+
+        # Initialize private dictionary attributes.
+
+        # Initialize private list attributes.
+
+        # Initialize private scalar attributes.
+
+        # Initialize public dictionary attributes.
+        self.dic_curves = {}
+
+        # Initialize public list attributes.
+
+        # Initialize public scalar attributes.
+
+    def do_select_all(self, **kwargs):
+        """
+        Retrieve all the Survival analyses from the RAMSTK Program database.
+
+        This method retrieves all the records from the RAMSTKSurvival table
+        in the connected RAMSTK Program database.  It then adds each to the
+        Survival data model treelib.Tree().  The RAMSTKSurvivalData records
+        are not loaded; they are streamed by do_select_data() when needed.
+
+        :return: tree; the treelib Tree() of RAMSTKSurvival data models.
+        :rtype: :py:class:`treelib.Tree`
+        """
+        _revision_id = kwargs['revision_id']
+        _session = RAMSTKDataModel.do_select_all(self)
+
+        for _survival in _session.query(RAMSTKSurvival).filter(
+                RAMSTKSurvival.revision_id == _revision_id).all():
+            self.tree.create_node(
+                _survival.description,
+                _survival.survival_id,
+                parent=0,
+                data=_survival)
+
+            # pylint: disable=attribute-defined-outside-init
+            # It is defined in RAMSTKDataModel.__init__
+            self.last_id = max(self.last_id, _survival.survival_id)
+
+        _session.close()
+
+        return self.tree
+
+    def do_select_data(self, node_id, **kwargs):
+        """
+        Stream the RAMSTKSurvivalData records of a Survival analysis.
+
+        The records are read chunk_size at a time so the records of an
+        analysis never need to be loaded as RAMSTKSurvivalData instances.
+
+        :param int node_id: the ID of the Survival analysis whose records are
+                            to be read.
+        :keyword int chunk_size: the number of records to read at a time.
+                                 Default is the class chunk_size.
+        :keyword bool ordered: whether to read the records in ascending order
+                               of their right interval.  Default is False.
+        :return: a generator of (left, right, status, quantity) arrays with
+                 one element per record.
+        :rtype: generator
+        """
+        _chunk_size = kwargs.get('chunk_size', self.chunk_size)
+
+        _query = select([
+            RAMSTKSurvivalData.left_interval,
+            RAMSTKSurvivalData.right_interval,
+            RAMSTKSurvivalData.status_id,
+            RAMSTKSurvivalData.quantity,
+        ]).where(RAMSTKSurvivalData.survival_id == node_id)
+        if kwargs.get('ordered', False):
+            _query = _query.order_by(RAMSTKSurvivalData.right_interval)
+
+        _session = self.dao.RAMSTK_SESSION(
+            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        _result = _session.execute(_query)
+
+        # Fetch from the DB-API cursor so each chunk is a list of plain tuples
+        # rather than SQLAlchemy RowProxy instances; converting RowProxy rows
+        # to an array is several times slower than reading them.
+        _cursor = _result.cursor
+        try:
+            while True:
+                _rows = _cursor.fetchmany(_chunk_size)
+                if not _rows:
+                    break
+                _records = np.array(_rows, dtype=float)
+                yield (_records[:, 0], _records[:, 1], _records[:, 2],
+                       _records[:, 3])
+        finally:
+            _result.close()
+            _session.close()
+
+    def do_insert(self, **kwargs):
+        """
+        Add a record to the RAMSTKSurvival table.
+
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _revision_id = kwargs['revision_id']
+        _survival = RAMSTKSurvival()
+        _survival.revision_id = _revision_id
+        _error_code, _msg = RAMSTKDataModel.do_insert(
+            self, entities=[
+                _survival,
+            ])
+
+        if _error_code == 0:
+            self.tree.create_node(
+                _survival.description,
+                _survival.survival_id,
+                parent=0,
+                data=_survival)
+            self.last_id = _survival.survival_id
+
+        return _error_code, _msg
+
+    def do_delete(self, node_id):
+        """
+        Remove a record from the RAMSTKSurvival table.
+
+        :param int node_id: the ID of the Survival analysis to be removed.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code, _msg = RAMSTKDataModel.do_delete(self, node_id)
+
+        # pylint: disable=attribute-defined-outside-init
+        # It is defined in RAMSTKDataModel.__init__
+        if _error_code != 0:
+            _error_code = 2005
+            _msg = _msg + '  RAMSTK ERROR: Attempted to delete non-existent ' \
+                          'Survival ID {0:d}.'.format(node_id)
+        else:
+            self.last_id = max(self.tree.nodes.keys())
+
+        return _error_code, _msg
+
+    def do_update(self, node_id):
+        """
+        Update the record in the RAMSTKSurvival table.
+
+        :param int node_id: the Survival ID to save to the RAMSTK Program
+                            database.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code, _msg = RAMSTKDataModel.do_update(self, node_id)
+
+        if _error_code != 0:
+            _error_code = 2207
+            _msg = 'RAMSTK ERROR: Attempted to save non-existent Survival ' \
+                   'ID {0:d}.'.format(node_id)
+
+        return _error_code, _msg
+
+    def do_update_all(self, **kwargs):  # pylint: disable=unused-argument
+        """
+        Update all RAMSTKSurvival records.
+
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
+
+        if _error_code == 0:
+            _msg = ("RAMSTK SUCCESS: Updating all records in the survival "
+                    "table.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more records in the survival "
+                    "table did not update.")
+
+        return _error_code, _msg
+
+    def _do_calculate_nonparametric(self, survival):
+        """
+        Estimate the survival or MCF curve of a Survival analysis.
+
+        The records are streamed in time order and tabulated a chunk at a
+        time, so only the distinct times are held in memory.
+
+        :param survival: the RAMSTKSurvival to calculate.
+        :type survival: :class:`ramstk.dao.programdb.RAMSTKSurvival`
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _tables = [
+            do_tabulate_data(_chunk[1], _chunk[2], _chunk[3])
+            for _chunk in self.do_select_data(
+                survival.survival_id, ordered=True)
+        ]
+        if not _tables:
+            return 2105, ('RAMSTK ERROR: Survival ID {0:d} has no records to '
+                          'calculate.').format(survival.survival_id)
+
+        _times, _n_failures, _n_suspensions = do_merge_tables(_tables)
+
+        if survival.distribution_id == MCF:
+            _estimator = mean_cumulative_function
+        else:
+            _estimator = kaplan_meier
+        self.dic_curves[survival.survival_id] = _estimator(
+            _times, _n_failures, _n_suspensions, survival.confidence)
+
+        survival.n_failures = int(_n_failures.sum())
+        survival.n_suspension = int(_n_suspensions.sum())
+
+        return 0, 'RAMSTK SUCCESS: Calculating Survival ID {0:d}.'.format(
+            survival.survival_id)
+
+    def _do_calculate_parametric(self, survival):
+        """
+        Fit the parametric distribution of a Survival analysis.
+
+        The records are streamed and grouped a chunk at a time, then the
+        distribution is fit by maximum likelihood.  The parameters, their
+        Fisher bounds at the analysis' confidence, the variances and
+        covariance, and the goodness of fit are set on the RAMSTKSurvival.
+
+        :param survival: the RAMSTKSurvival to calculate.
+        :type survival: :class:`ramstk.dao.programdb.RAMSTKSurvival`
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _node_id = survival.survival_id
+
+        # Group each chunk as it is read so only the distinct records are
+        # held in memory.
+        _lst_left = []
+        _lst_right = []
+        _lst_status = []
+        _lst_quantity = []
+        for _chunk in self.do_select_data(_node_id):
+            _left, _right, _status, _quantity = do_group_data(*_chunk)
+            _lst_left.append(_left)
+            _lst_right.append(_right)
+            _lst_status.append(_status)
+            _lst_quantity.append(_quantity)
+
+        if not _lst_quantity:
+            return 2105, ('RAMSTK ERROR: Survival ID {0:d} has no records to '
+                          'calculate.').format(_node_id)
+
+        _left, _right, _status, _quantity = do_group_data(
+            np.concatenate(_lst_left), np.concatenate(_lst_right),
+            np.concatenate(_lst_status), np.concatenate(_lst_quantity))
+
+        try:
+            _parameters, _var_covar, _fit = maximum_likelihood_estimate(
+                survival.distribution_id, _left, _right, _status, _quantity)
+        except KeyError:
+            return 2105, ('RAMSTK ERROR: Survival ID {0:d} distribution ID '
+                          '{1:d} is not a supported distribution.').format(
+                              _node_id, survival.distribution_id)
+        except ValueError as _error:
+            return 2105, ('RAMSTK ERROR: Calculating Survival ID {0:d}: '
+                          '{1:s}').format(_node_id, _error.message)
+
+        _lower, _upper = calculate_fisher_bounds(
+            _parameters, np.diag(_var_covar), survival.confidence)
+
+        (survival.n_failures, survival.n_suspension) = [
+            int(_count) for _count in get_counts(_status, _quantity)
+        ]
+        (survival.scale_ll, survival.shape_ll) = _lower.tolist()
+        (survival.scale, survival.shape) = _parameters.tolist()
+        (survival.scale_ul, survival.shape_ul) = _upper.tolist()
+        survival.variance_1 = float(_var_covar[0][0])
+        survival.variance_2 = float(_var_covar[1][1])
+        survival.covariance_1 = float(_var_covar[0][1])
+        (survival.mle, survival.aic, survival.bic) = _fit.tolist()
+
+        return 0, 'RAMSTK SUCCESS: Calculating Survival ID {0:d}.'.format(
+            _node_id)
+
+    def do_calculate(self, node_id, **kwargs):
+        """
+        Calculate a Survival analysis from its records.
+
+        The MCF and Kaplan-Meier analyses estimate a curve which is stored in
+        dic_curves by the analysis' ID; the curve has a row per distinct time
+        of (time, number at risk, lower bound, estimate, upper bound).  Every
+        other analysis fits its distribution by maximum likelihood.  The
+        number of failures and suspensions are set on the RAMSTKSurvival
+        either way.
+
+        :param int node_id: the ID of the Survival analysis to calculate.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        # pylint: disable=unused-argument
+        _survival = self.do_select(node_id)
+        if _survival is None:
+            return 2105, ('RAMSTK ERROR: Attempted to calculate non-existent '
+                          'Survival ID {0:s}.').format(str(node_id))
+
+        if _survival.distribution_id in [MCF, KAPLAN_MEIER]:
+            return self._do_calculate_nonparametric(_survival)
+
+        return self._do_calculate_parametric(_survival)
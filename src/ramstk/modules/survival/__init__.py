@@ -0,0 +1,2 @@
+from .Model import SurvivalDataModel as dtmSurvival
+from .Controller import SurvivalDataController as dtcSurvival
@@ -52,6 +52,25 @@ class UsageProfileDataController(RAMSTKDataController):
 
         # Initialize public scalar attributes.
 
+    def request_do_select_all(self, **kwargs):
+        """
+        Retrieve the Usage Profile treelib Tree() from the Data Model.
+
+        The entities left out of the Usage Profile because their IDs can't be
+        packed into a Node ID are written to the debug log.
+
+        :param int revision_id: the Revision ID to retrieve the Usage Profile
+                                for.
+        :return: tree; the treelib Tree() of the Usage Profile.
+        :rtype: :class:`treelib.Tree`
+        """
+        _tree = self._dtm_data_model.do_select_all(**kwargs)
+
+        for _msg in self._dtm_data_model.lst_skipped:
+            self._configuration.RAMSTK_DEBUG_LOG.error(_msg)
+
+        return _tree
+
     def request_do_insert(self, **kwargs):
         """
         Request to add a RAMSTKMission, RAMSTKMissionPhase, or RAMSTKEnvironment record.
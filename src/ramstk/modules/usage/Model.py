@@ -7,9 +7,13 @@
 """Usage Profile Package Data Models."""
 
 # Import other RAMSTK modules.
+from ramstk.Utilities import OutOfRangeError, pack_node_id
 from ramstk.modules import RAMSTKDataModel
 from ramstk.dao import RAMSTKEnvironment, RAMSTKMission, RAMSTKMissionPhase
 
+# The number of bits each database ID occupies in a Usage Profile Node ID.
+_ID_BITS = 21
+
 
 class UsageProfileDataModel(RAMSTKDataModel):
     """
@@ -20,17 +24,20 @@ class UsageProfileDataModel(RAMSTKDataModel):
     relationship, such as:
 
         * Mission 1
-            - Mission Phase 11
-                + Environment 111
-                + Environment 112
-                + Environment 113
-            - Mission Phase 12
-                + Environment 121
-                + Environment 122
+            - Mission Phase 1.1
+                + Environment 1.1.1
+                + Environment 1.1.2
+                + Environment 1.1.3
+            - Mission Phase 1.2
+                + Environment 1.2.1
+                + Environment 1.2.2
         * Mission 2
-            - Mission Phase 21
-                + Environment 211
-                + Environment 212
+            - Mission Phase 2.1
+                + Environment 2.1.1
+                + Environment 2.1.2
+
+    The Node ID of each entity packs the Mission ID, Phase ID, and Environment
+    ID into a single integer (see do_make_node_id()).
     """
 
     _tag = 'Usage Profiles'
@@ -54,6 +61,10 @@ class UsageProfileDataModel(RAMSTKDataModel):
         # Initialize public dictionary attributes.
 
         # Initialize public list attributes.
+        # The messages of the entities left out of the Usage Profile by the
+        # last do_select_all() because their IDs can't be packed into a Node
+        # ID.
+        self.lst_skipped = []
 
         # Initialize public scalar attributes.
         self.dtm_mission = MissionDataModel(dao)
@@ -64,68 +75,121 @@ class UsageProfileDataModel(RAMSTKDataModel):
         """
         Retrieve and build the Usage Profile tree for Revision ID.
 
+        The Missions, Mission Phases, and Environments are each retrieved with
+        a single query and then linked in memory.  An entity whose ID can't be
+        packed into a Node ID is left out of the tree with its children and
+        the reason is added to lst_skipped.
+
         :param int revision_id: the Revision ID to retrieve the Usage Profile
                                 and build trees for.
         :return: tree; the Usage Profile treelib Tree().
         :rtype: :py:class:`treelib.Tree`
         """
         _revision_id = kwargs['revision_id']
-        RAMSTKDataModel.do_select_all(self, **kwargs)
-
-        # Build the tree.  We concatenate the Mission ID and the Phase ID to
-        # create the Node() identifier for Mission Phases.  This prevents the
-        # likely case when the first Mission and Phase have the same ID (1) in
-        # the database from causing problems when building the tree.  Do the
-        # same for the environment by concatenating the Environment ID with the
-        # Mission ID and Phase ID.
-        _missions = self.dtm_mission.do_select_all(
-            revision_id=_revision_id).nodes
-
-        # pylint: disable=too-many-nested-blocks
-        for _mkey in _missions:
-            _mission = _missions[_mkey].data
-            if _mission is not None:
-                self.tree.create_node(
-                    tag=_mission.description,
-                    identifier=_mission.mission_id,
-                    parent=0,
-                    data=_mission)
-
-                # Add the phases, if any, to the mission.
-                _phases = self.dtm_phase.do_select_all(
-                    mission_id=_mission.mission_id).nodes
-                for _pkey in _phases:
-                    _phase = _phases[_pkey].data
-                    if _phase is not None:
-                        _phase_id = int(
-                            str(_mission.mission_id) + str(_phase.phase_id))
-                        self.tree.create_node(
-                            tag=_phase.description,
-                            identifier=_phase_id,
-                            parent=_mission.mission_id,
-                            data=_phase)
-
-                        # Add the environments, if any, to the phase.
-                        _environments = self.dtm_environment.do_select_all(
-                            phase_id=_phase.phase_id).nodes
-                        for _ekey in _environments:
-                            _environment = _environments[_ekey].data
-                            if _environment is not None:
-                                _env_id = int(
-                                    str(_mission.mission_id) +
-                                    str(_phase.phase_id) +
-                                    str(_environment.environment_id))
-                                # The parent must be the concatenated phase ID
-                                # used in the tree above, not the Phase ID
-                                # attribute of the RAMSTKPhase object.
-                                self.tree.create_node(
-                                    tag=_environment.name,
-                                    identifier=_env_id,
-                                    parent=_phase_id,
-                                    data=_environment)
+        _session = RAMSTKDataModel.do_select_all(self, **kwargs)
+
+        _qry_missions = _session.query(RAMSTKMission).filter(
+            RAMSTKMission.revision_id == _revision_id)
+        _qry_phases = _session.query(RAMSTKMissionPhase).filter(
+            RAMSTKMissionPhase.mission_id.in_(
+                _qry_missions.with_entities(RAMSTKMission.mission_id)))
+
+        _missions = _qry_missions.order_by(RAMSTKMission.mission_id).all()
+        _phases = _qry_phases.order_by(RAMSTKMissionPhase.phase_id).all()
+        _environments = _session.query(RAMSTKEnvironment).filter(
+            RAMSTKEnvironment.phase_id.in_(
+                _qry_phases.with_entities(RAMSTKMissionPhase.phase_id))).\
+            order_by(RAMSTKEnvironment.environment_id).all()
+
+        _session.close()
+
+        # Build the tree.  The Mission ID, Phase ID, and Environment ID are
+        # packed into the Node() identifier of Mission Phases and Environments
+        # by do_make_node_id().  This prevents the likely case when the first
+        # Mission and Phase have the same ID (1) in the database from causing
+        # problems when building the tree.
+        # An entity left out because its ID can't be packed leaves out its
+        # children too.
+        # pylint: disable=attribute-defined-outside-init
+        # It is defined in RAMSTKDataModel.__init__
+        self.lst_skipped = []
+        _set_mission_node = set()
+        for _mission in _missions:
+            try:
+                _mission_id = self.do_make_node_id(_mission.mission_id)
+            except OutOfRangeError as _error:
+                self.lst_skipped.append(_error.message)
+                continue
+            self.tree.create_node(
+                tag=_mission.description,
+                identifier=_mission_id,
+                parent=0,
+                data=_mission)
+            _set_mission_node.add(_mission_id)
+            self.dtm_mission.last_id = max(self.dtm_mission.last_id,
+                                           _mission.mission_id)
+
+        _dic_phase_node = {}
+        for _phase in _phases:
+            if _phase.mission_id not in _set_mission_node:
+                continue
+            try:
+                _phase_id = self.do_make_node_id(_phase.mission_id,
+                                                 _phase.phase_id)
+            except OutOfRangeError as _error:
+                self.lst_skipped.append(_error.message)
+                continue
+            self.tree.create_node(
+                tag=_phase.description,
+                identifier=_phase_id,
+                parent=_phase.mission_id,
+                data=_phase)
+            _dic_phase_node[_phase.phase_id] = _phase_id
+            self.dtm_phase.last_id = max(self.dtm_phase.last_id,
+                                         _phase.phase_id)
+
+        for _environment in _environments:
+            # The parent must be the packed phase ID used in the tree above,
+            # not the Phase ID attribute of the RAMSTKEnvironment object.
+            if _environment.phase_id not in _dic_phase_node:
+                continue
+            _phase_id = _dic_phase_node[_environment.phase_id]
+            try:
+                _environment_id = _phase_id + self.do_make_node_id(
+                    0, environment_id=_environment.environment_id)
+            except OutOfRangeError as _error:
+                self.lst_skipped.append(_error.message)
+                continue
+            self.tree.create_node(
+                tag=_environment.name,
+                identifier=_environment_id,
+                parent=_phase_id,
+                data=_environment)
+            self.dtm_environment.last_id = max(self.dtm_environment.last_id,
+                                               _environment.environment_id)
 
         return self.tree
 
+    @staticmethod
+    def do_make_node_id(mission_id, phase_id=0, environment_id=0):
+        """
+        Pack the Mission, Phase, and Environment IDs into a Node ID.
+
+        Each ID occupies its own 21 bits of the Node ID so the Node ID of a
+        Mission is the Mission ID and the Node IDs of Mission Phases and
+        Environments can't collide (e.g., Mission 1/Phase 12 and Mission
+        11/Phase 2).
+
+        :param int mission_id: the Mission ID.
+        :param int phase_id: the Mission Phase ID.
+        :param int environment_id: the Environment ID.
+        :return: _node_id; the Node ID in the Usage Profile tree.
+        :rtype: int
+        :raise: OutOfRangeError if an ID doesn't fit in 21 bits.
+        """
+        return pack_node_id([mission_id, phase_id, environment_id],
+                            bits=_ID_BITS)
+
     def do_insert(self, **kwargs):
         """
         Add an entity to the Usage Profile and RAMSTK Program database..
@@ -163,25 +227,39 @@ class UsageProfileDataModel(RAMSTKDataModel):
         else:
             _entity = None
 
-        _error_code, _msg = RAMSTKDataModel.do_insert(
-            self, entities=[
-                _entity,
-            ])
-
-        if _level == 'mission':
-            _tag = _entity.description
-            _node_id = _entity.mission_id
-        elif _level == 'phase':
-            _tag = _entity.name
-            _node_id = int(str(_parent_id) + str(_entity.phase_id))
-        elif _level == 'environment':
-            _tag = _entity.name
-            _node_id = int(str(_parent_id) + str(_entity.environment_id))
-
-        if _error_code == 0:
+        # The entity is added in a unit of work so it can be deleted before
+        # it is committed if its ID can't be packed into a Node ID.
+        _session = self.dao.db_begin()
+        try:
+            _error_code, _msg = RAMSTKDataModel.do_insert(
+                self, entities=[
+                    _entity,
+                ])
+
+            if _error_code == 0 and _level == 'mission':
+                _tag = _entity.description
+                _node_id = self.do_make_node_id(_entity.mission_id)
+            elif _error_code == 0 and _level == 'phase':
+                _tag = _entity.name
+                _node_id = self.do_make_node_id(_parent_id, _entity.phase_id)
+            elif _error_code == 0 and _level == 'environment':
+                _tag = _entity.name
+                _node_id = _parent_id + self.do_make_node_id(
+                    0, environment_id=_entity.environment_id)
+        except OutOfRangeError as _error:
+            self.dao.db_delete(_entity, _session)
+            _error_code = 2105
+            _msg = _error.message
+        finally:
+            _code, _commit_msg = self.dao.db_commit()
+
+        if _error_code == 0 and _code != 0:
+            _error_code = _code
+            _msg = _commit_msg
+        elif _error_code == 0:
             self.tree.create_node(
                 _tag, _node_id, parent=_parent_id, data=_entity)
-        else:
+        elif _error_code != 2105:
             _error_code = 2105
             _msg = 'RAMSTK ERROR: Attempted to add an item to the Usage ' \
                    'Profile with an undefined indenture level.  Level {0:s} ' \
@@ -237,22 +315,14 @@ class UsageProfileDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more line items in the usage "
-                        "profile did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = ("RAMSTK SUCCESS: Updating all line items in the usage "
                     "profile.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more line items in the usage "
+                    "profile did not update.")
 
         return _error_code, _msg
 
@@ -397,25 +467,16 @@ class MissionDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more records in the usage profile "
-                    "mission table did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = (
                 "RAMSTK SUCCESS: Updating all records in the usage profile "
                 "mission table.")
+        else:
+            _msg = (
+                "RAMSTK ERROR: One or more records in the usage profile "
+                "mission table did not update.")
 
         return _error_code, _msg
 
@@ -552,25 +613,16 @@ class MissionPhaseDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more records in the usage profile "
-                    "mission phase table did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = (
                 "RAMSTK SUCCESS: Updating all records in the usage profile "
                 "mission phase table.")
+        else:
+            _msg = (
+                "RAMSTK ERROR: One or more records in the usage profile "
+                "mission phase table did not update.")
 
         return _error_code, _msg
 
@@ -712,24 +764,15 @@ class EnvironmentDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more records in the usage profile "
-                    "environment table did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = (
                 "RAMSTK SUCCESS: Updating all records in the usage profile "
                 "environment table.")
+        else:
+            _msg = (
+                "RAMSTK ERROR: One or more records in the usage profile "
+                "environment table did not update.")
 
         return _error_code, _msg
@@ -203,23 +203,14 @@ class ValidationDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the validation "
-                        "table did not update.")
+        _error_code, _msg = RAMSTKDataModel.do_update_all(self)
 
         if _error_code == 0:
             _msg = ("RAMSTK SUCCESS: Updating all records in the validation "
                     "table.")
+        else:
+            _msg = ("RAMSTK ERROR: One or more records in the validation "
+                    "table did not update.")
 
         return _error_code, _msg
 
@@ -235,11 +226,8 @@ class ValidationDataModel(RAMSTKDataModel):
 
         _node_id = date_to_ordinal(date.today())
 
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine,
-            autoflush=True,
-            autocommit=False,
-            expire_on_commit=False)
+        _session = self.dao.db_get_session(
+            autoflush=True, autocommit=False, expire_on_commit=False)
 
         try:
             _entity = self.status_tree.get_node(_node_id).data
@@ -251,7 +239,7 @@ class ValidationDataModel(RAMSTKDataModel):
             _msg = 'RAMSTK ERROR: Attempted to save non-existent Program ' \
                    'Status for date {0:s}.'.format(str(_node_id))
 
-        _session.close()
+        self.dao.db_close_session(_session)
 
         return _error_code, _msg
 
@@ -310,12 +298,13 @@ class ValidationDataModel(RAMSTKDataModel):
 
         _status.time_remaining = _time_remaining
 
-        (_cost_ll, _cost_mean, _cost_ul, __) = calculate_beta_bounds(
-            _cost_minimum, _cost_average, _cost_maximum, 0.95)
-        (_time_ll, _time_mean, _time_ul, __) = calculate_beta_bounds(
-            _time_minimum, _time_average, _time_maximum, 0.95)
+        # The program cost and time bounds are calculated together.
+        (_lst_ll, _lst_mean, _lst_ul, __) = calculate_beta_bounds(
+            [_cost_minimum, _time_minimum], [_cost_average, _time_average],
+            [_cost_maximum, _time_maximum], 0.95)
 
-        return (_cost_ll, _cost_mean, _cost_ul, _time_ll, _time_mean, _time_ul)
+        return (_lst_ll[0], _lst_mean[0], _lst_ul[0], _lst_ll[1], _lst_mean[1],
+                _lst_ul[1])
 
     def get_assessment_points(self):
         """
@@ -10,9 +10,7 @@
 import gettext
 
 # Import mathematical functions.
-from math import exp, log, sqrt
 import numpy as np  # pylint: disable=E0401
-from numpy.linalg import inv  # pylint: disable=E0401
 from scipy.stats import chi2, norm  # pylint: disable=E0401,E0611
 
 __author__ = 'Doyle Rowland'
@@ -22,6 +20,116 @@ __copyright__ = 'Copyright 2007 - 2015 Doyle "weibullguy" Rowland'
 
 _ = gettext.gettext
 
+# The standard normal quantiles already calculated.  Key is the probability.
+_NORM_QUANTILES = {}
+
+# The chi-square quantiles already calculated.  Key is the tuple
+# (probability, degrees of freedom).
+_CHI2_QUANTILES = {}
+
+
+def _get_quantiles(cache, ppf, *args):
+    """
+    Retrieve the quantiles of a distribution, calculating only the new ones.
+
+    Each distinct combination of arguments is calculated with the scipy ppf
+    once and then kept in the cache.
+
+    :param dict cache: the quantiles already calculated.  Key is the tuple of
+                       arguments.
+    :param ppf: the scipy percent point function of the distribution.
+    :param args: the probabilities and distribution parameters.  Each may be
+                 a scalar or an array; they are broadcast together.
+    :return: the quantile of each combination of arguments.
+    :rtype: float or :class:`numpy.ndarray`
+    """
+    _args = np.broadcast_arrays(*[np.asarray(_arg, dtype=float)
+                                  for _arg in args])
+    _shape = _args[0].shape
+
+    if _shape == ():
+        _key = tuple(float(_arg) for _arg in _args)
+        try:
+            return cache[_key]
+        except KeyError:
+            cache[_key] = float(ppf(*_key))
+            return cache[_key]
+
+    _keys, _index = np.unique(
+        np.column_stack([_arg.ravel() for _arg in _args]),
+        axis=0,
+        return_inverse=True)
+    _quantiles = np.empty(len(_keys))
+    for _idx, _key in enumerate(_keys):
+        _key = tuple(_key)
+        try:
+            _quantiles[_idx] = cache[_key]
+        except KeyError:
+            cache[_key] = float(ppf(*_key))
+            _quantiles[_idx] = cache[_key]
+
+    return _quantiles[_index].reshape(_shape)
+
+
+def _get_result(value):
+    """
+    Convert a calculated value to a float when it is not an array of values.
+
+    :param value: the calculated value.
+    :type value: :class:`numpy.ndarray`
+    :return: the value.
+    :rtype: float or :class:`numpy.ndarray`
+    """
+    if np.ndim(value) == 0:
+        return float(value)
+
+    return value
+
+
+def get_confidence(alpha):
+    """
+    Function to express a confidence level as a decimal.
+
+    :param alpha: the confidence level as a decimal or a percentage.
+    :type alpha: float or :class:`numpy.ndarray`
+    :return: the confidence level as a decimal.
+    :rtype: float or :class:`numpy.ndarray`
+    """
+    _alpha = np.asarray(alpha, dtype=float)
+
+    return _get_result(np.where(_alpha > 1.0, _alpha / 100.0, _alpha))
+
+
+def get_norm_quantile(probability):
+    """
+    Function to retrieve the standard normal quantile of a probability.
+
+    The quantile of each probability is calculated once and then cached.
+
+    :param probability: the probability to find the quantile of.
+    :type probability: float or :class:`numpy.ndarray`
+    :return: the standard normal quantile.
+    :rtype: float or :class:`numpy.ndarray`
+    """
+    return _get_quantiles(_NORM_QUANTILES, norm.ppf, probability)
+
+
+def get_chi2_quantile(probability, dof):
+    """
+    Function to retrieve the chi-square quantile of a probability.
+
+    The quantile of each (probability, degrees of freedom) is calculated once
+    and then cached.
+
+    :param probability: the probability to find the quantile of.
+    :type probability: float or :class:`numpy.ndarray`
+    :param dof: the degrees of freedom of the chi-square distribution.
+    :type dof: float or :class:`numpy.ndarray`
+    :return: the chi-square quantile.
+    :rtype: float or :class:`numpy.ndarray`
+    """
+    return _get_quantiles(_CHI2_QUANTILES, chi2.ppf, probability, dof)
+
 
 def calculate_variance_covariance(n_failures, max_time, alpha, beta):
     """
@@ -30,6 +138,9 @@ def calculate_variance_covariance(n_failures, max_time, alpha, beta):
         * NHPP - Power Law model parameters
         * Crow-AMSAA model model parameters
 
+    Each argument may also be an array; a matrix is then returned for each
+    element of the broadcast arrays.
+
     :param int n_failures: total number of failures in the data set.
     :param float max_time: total observation time or maximum failure time.
     :param float alpha: the point estimate of the alpha (scale) parameter.
@@ -38,25 +149,37 @@ def calculate_variance_covariance(n_failures, max_time, alpha, beta):
              form:
                     [[Var(alpha), Cov(alpha, beta)],
                      [Cov(alpha, beta), Var(beta)]]
-    :rtype: list of lists
+             and the matrices are stacked along the leading axes when arrays
+             are passed.  The elements of a singular matrix are nan.
+    :rtype: :class:`numpy.ndarray`
     """
-
-    try:
-        _del_alpha = -n_failures / alpha**2.0
-    except ZeroDivisionError:
-        _del_alpha = 1.0
-
-    try:
-        _del_beta = -n_failures / (
-            beta**2.0 - alpha * max_time**beta * log(max_time)**2.0)
-    except ZeroDivisionError:
-        _del_beta = 1.0
-
-    _del_beta_alpha = -max_time**beta * log(max_time)
-
-    _var_covar = inv(
-        np.array([[-_del_alpha, -_del_beta_alpha],
-                  [-_del_beta_alpha, -_del_beta]]))
+    n_failures, max_time, alpha, beta = np.broadcast_arrays(
+        *[np.asarray(_arg, dtype=float)
+          for _arg in [n_failures, max_time, alpha, beta]])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        _del_alpha = np.where(alpha == 0.0, 1.0, -n_failures / alpha**2.0)
+
+        _denominator = beta**2.0 - alpha * max_time**beta * np.log(
+            max_time)**2.0
+        _del_beta = np.where(_denominator == 0.0, 1.0,
+                             -n_failures / _denominator)
+
+    _del_beta_alpha = -max_time**beta * np.log(max_time)
+
+    # Invert each 2x2 Fisher matrix in closed form rather than with
+    # numpy.linalg.inv().  A singular matrix has no inverse, so its variances
+    # and covariance are nan instead of raising for the whole stack.
+    _determinant = _del_alpha * _del_beta - _del_beta_alpha**2.0
+    _singular = (_determinant == 0.0) | ~np.isfinite(_determinant)
+    with np.errstate(divide='ignore'):
+        _reciprocal = np.where(_singular, np.nan, 1.0 / _determinant)
+
+    _var_covar = np.empty(alpha.shape + (2, 2))
+    _var_covar[..., 0, 0] = -_del_beta * _reciprocal
+    _var_covar[..., 0, 1] = _del_beta_alpha * _reciprocal
+    _var_covar[..., 1, 0] = _var_covar[..., 0, 1]
+    _var_covar[..., 1, 1] = -_del_alpha * _reciprocal
 
     return _var_covar
 
@@ -68,6 +191,9 @@ def calculate_nhpp_mean_variance(n_failures, max_time, alpha, beta, metric=1):
         * NHPP - Power Law model cumulative or instantaneous means
         * Crow-AMSAA model
 
+    Each argument except the metric may also be an array; an array of
+    variances is then returned.
+
     :param int n_failures: total number of failures in the data set.
     :param float max_time: total observation time or maximum failure time.
     :param float alpha: the point estimate of the alpha (scale) parameter.
@@ -76,27 +202,31 @@ def calculate_nhpp_mean_variance(n_failures, max_time, alpha, beta, metric=1):
                        - 1 = Cumulative MTBF.
                        - 2 = Instantaneous MTBF.
     :return: the variance of the selected mean.
-    :rtype: float
+    :rtype: float or :class:`numpy.ndarray`
     """
+    n_failures, max_time, alpha, beta = np.broadcast_arrays(
+        *[np.asarray(_arg, dtype=float)
+          for _arg in [n_failures, max_time, alpha, beta]])
 
     _var_covar = calculate_variance_covariance(n_failures, max_time, alpha,
                                                beta)
 
     if metric == 1:
         _del_mean_beta = (-(1.0 / alpha) * max_time**(1.0 - beta) *
-                          log(max_time))
+                          np.log(max_time))
         _del_mean_alpha = -(1.0 / alpha**2.0) * max_time**(1.0 - beta)
     elif metric == 2:
         _del_mean_beta = (-(1.0 / (alpha * beta**2.0)) *
                           max_time**(1.0 - beta) - (1.0 / (alpha * beta)) *
-                          max_time**(1.0 - beta) * log(max_time))
+                          max_time**(1.0 - beta) * np.log(max_time))
         _del_mean_alpha = -(1.0 / (alpha**2.0 * beta)) * max_time**(1.0 - beta)
 
-    _variance = (_del_mean_beta**2.0 * _var_covar[1][1] +
-                 _del_mean_alpha**2.0 * _var_covar[0][0] +
-                 2.0 * _del_mean_beta * _del_mean_alpha * _var_covar[0][1])
+    _variance = (_del_mean_beta**2.0 * _var_covar[..., 1, 1] +
+                 _del_mean_alpha**2.0 * _var_covar[..., 0, 0] +
+                 2.0 * _del_mean_beta * _del_mean_alpha *
+                 _var_covar[..., 0, 1])
 
-    return _variance
+    return _get_result(_variance)
 
 
 def calculate_fisher_bounds(metric, variance, alpha):
@@ -104,28 +234,29 @@ def calculate_fisher_bounds(metric, variance, alpha):
     Function to calculate the Fisher Information Matrix based confidence
     bounds.
 
+    The metric and variance may also be arrays; arrays of bounds are then
+    returned.
+
     :param float metric: the point estimate of the metric to calculate bounds
                          for.
     :param float variance: the variance of the metric to calculate bounds for.
     :param float alpha: the confidence level of the calculated bounds.
     :return: _fisher_l, _fisher_u; the lower and upper Fisher bounds.
-    :rtype: tuple of floats
+    :rtype: tuple of floats or tuple of :class:`numpy.ndarray`
     """
+    metric = np.asarray(metric, dtype=float)
+    variance = np.asarray(variance, dtype=float)
 
     # Ensure the confidence level is expressed as a decimal, then find the
     # standard normal value for constructing the confidence bounds.
-    if alpha > 1.0:
-        alpha = alpha / 100.0
-    _z_norm = norm.ppf(alpha)
+    _z_norm = get_norm_quantile(get_confidence(alpha))
 
-    if metric == 0.0:
-        _fisher_l = 0.0
-        _fisher_u = 0.0
-    else:
-        _fisher_l = metric * exp(-_z_norm * sqrt(variance) / metric)
-        _fisher_u = metric * exp(_z_norm * sqrt(variance) / metric)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        _exponent = _z_norm * np.sqrt(variance) / metric
+        _fisher_l = np.where(metric == 0.0, 0.0, metric * np.exp(-_exponent))
+        _fisher_u = np.where(metric == 0.0, 0.0, metric * np.exp(_exponent))
 
-    return _fisher_l, _fisher_u
+    return _get_result(_fisher_l), _get_result(_fisher_u)
 
 
 def calculate_crow_bounds(n_failures,
@@ -138,6 +269,9 @@ def calculate_crow_bounds(n_failures,
     """
     Function to calculate confidence bounds based on Dr. Larry Crow's methods.
 
+    The number of failures, termination time, and parameters may also be
+    arrays; arrays of bounds are then returned.
+
     :param int n_failures: the total number of failures in the data set.
     :param float t_star: termination time.
     :param float _lambda: the estimated scale parameter.
@@ -153,69 +287,77 @@ def calculate_crow_bounds(n_failures,
                         1 = Type I or time terminated test
                         2 = Type II or failure terminated test (default)
     :return: _crow_l, _crow_u; the lower and upper bound on the metric.
-    :rtype: tuple of floats
+    :rtype: tuple of floats or tuple of :class:`numpy.ndarray`
     """
     # WARNING: Refactor calculate_crow_bounds; current McCabe Complexity metric=11.
+    n_failures, t_star, _lambda, beta = np.broadcast_arrays(
+        *[np.asarray(_arg, dtype=float)
+          for _arg in [n_failures, t_star, _lambda, beta]])
+
     # Set default values so a value is returned in case something goes wrong.
-    _crow_l = 1.0
-    _crow_u = 1.0
+    _crow_l = np.ones(n_failures.shape)
+    _crow_u = np.ones(n_failures.shape)
 
     # Ensure the confidence level is expressed as a decimal.
-    if alpha > 1.0:
-        alpha = alpha / 100.0
+    alpha = get_confidence(alpha)
 
     _alpha_l = (1.0 - alpha) / 2.0  # For lower bounds.
     _alpha_u = 1.0 - _alpha_l  # For upper bounds.
 
-    if metric == 1:  # Shape
-        if data == 1:
-            _chi2 = chi2.ppf(_alpha_l, 2.0 * n_failures)
-            _crow_l = beta * (_chi2 / (2.0 * (n_failures - 1)))
-
-            _chi2 = chi2.ppf(_alpha_u, 2.0 * n_failures)
-            _crow_u = beta * (_chi2 / (2.0 * (n_failures - 1)))
-
-        elif data == 2:
-            _chi2 = chi2.ppf(_alpha_l, 2.0 * (n_failures - 1))
-            _crow_l = beta * ((n_failures * _chi2) / (2.0 * (n_failures - 1) *
-                                                      (n_failures - 2)))
-
-            _chi2 = chi2.ppf(_alpha_u, 2.0 * (n_failures - 1))
-            _crow_u = beta * ((n_failures * _chi2) / (2.0 * (n_failures - 1) *
-                                                      (n_failures - 2)))
-
-    elif metric == 2:  # Scale
-        # Calculate the lower bound.  It is the same regardless of the type.
-        _chi2 = chi2.ppf(_alpha_l, 2.0 * n_failures)
-        _crow_l = _chi2 / (2.0 * t_star**beta)
-
-        if data == 1:
-            _chi2 = chi2.ppf(_alpha_u, 2.0 * (n_failures + 2))
-            _crow_u = _chi2 / (2.0 * t_star**beta)
-        elif data == 2:
-            _chi2 = chi2.ppf(_alpha_u, 2.0 * n_failures)
-            _crow_u = _chi2 / (2.0 * t_star**beta)
-
-    elif metric == 3:  # Cum. failure intensity
-        # Calculate the lower bound.  It is the same regardless of the type.
-        _chi2 = chi2.ppf(_alpha_l, 2.0 * n_failures)
-        _crow_l = _chi2 / (2.0 * t_star)
-
-        if data == 1:
-            _chi2 = chi2.ppf(_alpha_u, 2.0 * (n_failures + 2))
-            _crow_u = _chi2 / (2.0 * t_star)
-        elif data == 2:
-            _chi2 = chi2.ppf(_alpha_u, 2.0 * n_failures)
-            _crow_u = _chi2 / (2.0 * t_star)
-
-    return _crow_l, _crow_u
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if metric == 1:  # Shape
+            if data == 1:
+                _chi2 = get_chi2_quantile(_alpha_l, 2.0 * n_failures)
+                _crow_l = beta * (_chi2 / (2.0 * (n_failures - 1)))
+
+                _chi2 = get_chi2_quantile(_alpha_u, 2.0 * n_failures)
+                _crow_u = beta * (_chi2 / (2.0 * (n_failures - 1)))
+
+            elif data == 2:
+                _chi2 = get_chi2_quantile(_alpha_l, 2.0 * (n_failures - 1))
+                _crow_l = beta * ((n_failures * _chi2) /
+                                  (2.0 * (n_failures - 1) * (n_failures - 2)))
+
+                _chi2 = get_chi2_quantile(_alpha_u, 2.0 * (n_failures - 1))
+                _crow_u = beta * ((n_failures * _chi2) /
+                                  (2.0 * (n_failures - 1) * (n_failures - 2)))
+
+        elif metric == 2:  # Scale
+            # Calculate the lower bound.  It is the same regardless of the
+            # type.
+            _chi2 = get_chi2_quantile(_alpha_l, 2.0 * n_failures)
+            _crow_l = _chi2 / (2.0 * t_star**beta)
+
+            if data == 1:
+                _chi2 = get_chi2_quantile(_alpha_u, 2.0 * (n_failures + 2))
+                _crow_u = _chi2 / (2.0 * t_star**beta)
+            elif data == 2:
+                _chi2 = get_chi2_quantile(_alpha_u, 2.0 * n_failures)
+                _crow_u = _chi2 / (2.0 * t_star**beta)
+
+        elif metric == 3:  # Cum. failure intensity
+            # Calculate the lower bound.  It is the same regardless of the
+            # type.
+            _chi2 = get_chi2_quantile(_alpha_l, 2.0 * n_failures)
+            _crow_l = _chi2 / (2.0 * t_star)
+
+            if data == 1:
+                _chi2 = get_chi2_quantile(_alpha_u, 2.0 * (n_failures + 2))
+                _crow_u = _chi2 / (2.0 * t_star)
+            elif data == 2:
+                _chi2 = get_chi2_quantile(_alpha_u, 2.0 * n_failures)
+                _crow_u = _chi2 / (2.0 * t_star)
+
+    return _get_result(_crow_l), _get_result(_crow_u)
 
 
 def calculate_beta_bounds(a, m, b, alpha):  # pylint: disable=C0103
     """
     Calculate the mean, standard error, and bounds of the beta distribution.
 
-    These are the project management estimators, not exact calculations.
+    These are the project management estimators, not exact calculations.  The
+    minimum, most likely, and maximum values may also be arrays; arrays of
+    results are then returned.
 
     :param float a: the minimum expected value.
     :param float m: most likely value.
@@ -223,12 +365,13 @@ def calculate_beta_bounds(a, m, b, alpha):  # pylint: disable=C0103
     :param float alpha: the desired confidence level.
     :return: _meanll, _mean, _meanul, _sd; the calculated mean, bounds, and
                                            standard error.
-    :rtype: tuple of floats
+    :rtype: tuple of floats or tuple of :class:`numpy.ndarray`
     """
-    if alpha > 1.0:
-        _z_norm = norm.ppf(1.0 - ((1.0 - alpha / 100.0) / 2.0))
-    else:
-        _z_norm = norm.ppf(1.0 - ((1.0 - alpha) / 2.0))
+    a = np.asarray(a, dtype=float)
+    m = np.asarray(m, dtype=float)
+    b = np.asarray(b, dtype=float)
+
+    _z_norm = get_norm_quantile(1.0 - ((1.0 - get_confidence(alpha)) / 2.0))
 
     _mean = (a + 4.0 * m + b) / 6.0
     _sd = (b - a) / 6.0
@@ -236,4 +379,5 @@ def calculate_beta_bounds(a, m, b, alpha):  # pylint: disable=C0103
     _meanll = _mean - _z_norm * _sd
     _meanul = _mean + _z_norm * _sd
 
-    return _meanll, _mean, _meanul, _sd
+    return (_get_result(_meanll), _get_result(_mean), _get_result(_meanul),
+            _get_result(_sd))
@@ -0,0 +1,416 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.statistics.Distributions.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Functions for fitting parametric distributions to survival data."""
+
+# Add NLS support.
+import gettext
+
+# Import mathematical functions.
+import numpy as np  # pylint: disable=E0401
+from numpy.linalg import LinAlgError, inv  # pylint: disable=E0401
+from scipy.optimize import minimize  # pylint: disable=E0401,E0611
+from scipy.stats import norm  # pylint: disable=E0401,E0611
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
+
+_ = gettext.gettext
+
+# The RAMSTKSurvival distribution IDs of the parametric distributions.
+EXPONENTIAL = 5
+LOGNORMAL = 6
+GAUSSIAN = 7
+WEIBULL = 8
+
+# The RAMSTKSurvivalData status IDs of the censored records.  A record with
+# any other status is an exact failure time.
+RIGHT_CENSORED = 2
+LEFT_CENSORED = 3
+INTERVAL_CENSORED = 4
+
+
+def _sev_logpdf(z):
+    """Return the log density of the standard smallest extreme value."""
+    return z - np.exp(z)
+
+
+def _sev_logcdf(z):
+    """Return the log probability of the standard smallest extreme value."""
+    return np.log(-np.expm1(-np.exp(z)))
+
+
+def _sev_logsf(z):
+    """Return the log survival of the standard smallest extreme value."""
+    return -np.exp(z)
+
+
+def _sev_dlogpdf(z):
+    """Return the derivative of the smallest extreme value log density."""
+    return 1.0 - np.exp(z)
+
+
+def _norm_dlogpdf(z):
+    """Return the derivative of the standard normal log density."""
+    return -z
+
+
+# The (log pdf, log cdf, log survival, derivative of the log pdf) of the
+# standard distribution of each distribution's log-location-scale form.  The
+# Weibull and exponential are smallest extreme value in log time, the
+# lognormal is normal in log time, and the Gaussian is normal in time.
+_STANDARD = {
+    EXPONENTIAL: (_sev_logpdf, _sev_logcdf, _sev_logsf, _sev_dlogpdf),
+    LOGNORMAL: (norm.logpdf, norm.logcdf, norm.logsf, _norm_dlogpdf),
+    GAUSSIAN: (norm.logpdf, norm.logcdf, norm.logsf, _norm_dlogpdf),
+    WEIBULL: (_sev_logpdf, _sev_logcdf, _sev_logsf, _sev_dlogpdf),
+}
+
+
+def do_group_data(left, right, status, quantity):
+    """
+    Function to group identical survival records.
+
+    Records with the same interval and status are combined into one record
+    whose quantity is the sum of their quantities.  A quantity less than one
+    (the RAMSTKSurvivalData default is zero) is counted as one record.
+
+    :param left: the left of the interval of each record.
+    :type left: :class:`numpy.ndarray`
+    :param right: the right of the interval (failure or censoring time) of
+                  each record.
+    :type right: :class:`numpy.ndarray`
+    :param status: the status ID of each record.
+    :type status: :class:`numpy.ndarray`
+    :param quantity: the number of items each record represents.
+    :type quantity: :class:`numpy.ndarray`
+    :return: _left, _right, _status, _quantity; the grouped records.
+    :rtype: tuple of :class:`numpy.ndarray`
+    """
+    _quantity = np.asarray(quantity, dtype=float)
+    _quantity = np.where(_quantity < 1.0, 1.0, _quantity)
+
+    if _quantity.size == 0:
+        return (np.asarray(left, dtype=float), np.asarray(right, dtype=float),
+                np.asarray(status, dtype=float), _quantity)
+
+    _records, _index = np.unique(
+        np.column_stack([
+            np.asarray(left, dtype=float),
+            np.asarray(right, dtype=float),
+            np.asarray(status, dtype=float)
+        ]),
+        axis=0,
+        return_inverse=True)
+
+    return (_records[:, 0], _records[:, 1], _records[:, 2],
+            np.bincount(_index, weights=_quantity))
+
+
+def get_counts(status, quantity):
+    """
+    Function to count the failures and suspensions in a set of records.
+
+    :param status: the status ID of each record.
+    :type status: :class:`numpy.ndarray`
+    :param quantity: the number of items each record represents.
+    :type quantity: :class:`numpy.ndarray`
+    :return: _n_failures, _n_suspensions; the number of failures and the
+             number of right censored items.
+    :rtype: tuple of floats
+    """
+    _status = np.asarray(status)
+    _quantity = np.asarray(quantity, dtype=float)
+    _quantity = np.where(_quantity < 1.0, 1.0, _quantity)
+
+    _n_suspensions = float(_quantity[_status == RIGHT_CENSORED].sum())
+
+    return float(_quantity.sum()) - _n_suspensions, _n_suspensions
+
+
+def _do_split_data(distribution_id, left, right, status, quantity):
+    """
+    Split the records into exact, right, left, and interval censored sets.
+
+    The times are transformed to the scale of the distribution's
+    location-scale form.  Interval censored records starting at zero are left
+    censored in log time and intervals of zero width are exact.  Records
+    ending at or before zero can not be fit in log time and are left out.
+
+    :return: {set: (times, weights)}, the location-scale times of each set and
+             the log jacobian of the exact times.
+    :rtype: (dict, float)
+    """
+    _exact = ~np.in1d(status, [RIGHT_CENSORED, LEFT_CENSORED,
+                               INTERVAL_CENSORED])
+    _interval = (status == INTERVAL_CENSORED) & (left < right)
+    _exact = _exact | ((status == INTERVAL_CENSORED) & (left >= right))
+    _left = status == LEFT_CENSORED
+    _right = status == RIGHT_CENSORED
+
+    if distribution_id == GAUSSIAN:
+        _transform = np.asarray
+        _jacobian = 0.0
+    else:
+        _transform = np.log
+        _positive = right > 0.0
+        _exact = _exact & _positive
+        _right = _right & _positive
+        _left = (_left | (_interval & (left <= 0.0))) & _positive
+        _interval = _interval & (left > 0.0)
+        _jacobian = float(np.sum(quantity[_exact] * np.log(right[_exact])))
+
+    _dic_data = {
+        'exact': (_transform(right[_exact]), quantity[_exact]),
+        'right': (_transform(right[_right]), quantity[_right]),
+        'left': (_transform(right[_left]), quantity[_left]),
+        'interval': (_transform(left[_interval]), _transform(
+            right[_interval]), quantity[_interval]),
+    }
+
+    return _dic_data, _jacobian
+
+
+def _get_log_likelihood(params, data, standard, fixed_scale=False):
+    """
+    Calculate the log-likelihood and its gradient.
+
+    The parameters are the location and the log of the scale of the
+    distribution's location-scale form.
+
+    :param params: the (location, log scale) or (location, ) when the scale
+                   is fixed at one.
+    :param dict data: the location-scale times and weights of each set of
+                      records.
+    :param tuple standard: the functions of the standard distribution.
+    :keyword bool fixed_scale: whether the scale is fixed at one.
+    :return: _loglik, _gradient; the log-likelihood and its gradient with
+             respect to the parameters.
+    :rtype: (float, :class:`numpy.ndarray`)
+    """
+    _logpdf, _logcdf, _logsf, _dlogpdf = standard
+    _mu = params[0]
+    _sigma = 1.0 if fixed_scale else np.exp(params[1])
+
+    _loglik = 0.0
+    _del_mu = 0.0
+    _del_sigma = 0.0
+
+    # Exact failure times contribute the density.
+    _y, _w = data['exact']
+    if _y.size:
+        _z = (_y - _mu) / _sigma
+        _g = _dlogpdf(_z)
+        _loglik += np.dot(_w, _logpdf(_z)) - _w.sum() * np.log(_sigma)
+        _del_mu -= np.dot(_w, _g) / _sigma
+        _del_sigma -= (np.dot(_w, _g * _z) + _w.sum()) / _sigma
+
+    # Right censored times contribute the survival.
+    _y, _w = data['right']
+    if _y.size:
+        _z = (_y - _mu) / _sigma
+        _logs = _logsf(_z)
+        _h = _w * np.exp(_logpdf(_z) - _logs)
+        _loglik += np.dot(_w, _logs)
+        _del_mu += _h.sum() / _sigma
+        _del_sigma += np.dot(_h, _z) / _sigma
+
+    # Left censored times contribute the unreliability.
+    _y, _w = data['left']
+    if _y.size:
+        _z = (_y - _mu) / _sigma
+        _logf = _logcdf(_z)
+        _q = _w * np.exp(_logpdf(_z) - _logf)
+        _loglik += np.dot(_w, _logf)
+        _del_mu -= _q.sum() / _sigma
+        _del_sigma -= np.dot(_q, _z) / _sigma
+
+    # Interval censored times contribute the probability of the interval.
+    # It is found from the upper tail when the interval is in the upper tail
+    # so the difference does not lose precision.
+    _y_left, _y_right, _w = data['interval']
+    if _y_left.size:
+        _z_left = (_y_left - _mu) / _sigma
+        _z_right = (_y_right - _mu) / _sigma
+        _logf_left = _logcdf(_z_left)
+        _logf_right = _logcdf(_z_right)
+        _logs_left = _logsf(_z_left)
+        _logs_right = _logsf(_z_right)
+        _logp = np.where(
+            _z_left > 0.0,
+            _logs_left + np.log1p(-np.exp(_logs_right - _logs_left)),
+            _logf_right + np.log1p(-np.exp(_logf_left - _logf_right)))
+        _q_left = _w * np.exp(_logpdf(_z_left) - _logp)
+        _q_right = _w * np.exp(_logpdf(_z_right) - _logp)
+        _loglik += np.dot(_w, _logp)
+        _del_mu -= (_q_right.sum() - _q_left.sum()) / _sigma
+        _del_sigma -= (np.dot(_q_right, _z_right) -
+                       np.dot(_q_left, _z_left)) / _sigma
+
+    if fixed_scale:
+        _gradient = np.array([_del_mu])
+    else:
+        _gradient = np.array([_del_mu, _del_sigma * _sigma])
+
+    return _loglik, _gradient
+
+
+def _get_negative_log_likelihood(params, data, standard, fixed_scale,
+                                 n_items):
+    """Return the negative log-likelihood per item and its gradient."""
+    _loglik, _gradient = _get_log_likelihood(params, data, standard,
+                                             fixed_scale)
+
+    return -_loglik / n_items, -_gradient / n_items
+
+
+def _get_start(distribution_id, data, fixed_scale):
+    """
+    Estimate starting values from the weighted moments of the times.
+
+    :return: the starting (location, log scale) or (location, ).
+    :rtype: :class:`numpy.ndarray`
+    """
+    _y = np.concatenate([
+        data['exact'][0], data['right'][0], data['left'][0],
+        (data['interval'][0] + data['interval'][1]) / 2.0
+    ])
+    _w = np.concatenate([
+        data['exact'][1], data['right'][1], data['left'][1],
+        data['interval'][2]
+    ])
+
+    _mu = np.average(_y, weights=_w)
+    _sigma = np.sqrt(np.average((_y - _mu)**2.0, weights=_w))
+
+    if fixed_scale:
+        return np.array([_mu])
+    if distribution_id == WEIBULL:
+        # The smallest extreme value location is above the mean.
+        _mu = _mu + 0.5772 * _sigma
+
+    return np.array([_mu, np.log(_sigma if _sigma > 0.0 else 1.0)])
+
+
+def _get_hessian(params, data, standard, fixed_scale):
+    """
+    Calculate the Hessian of the log-likelihood from its gradient.
+
+    :return: the matrix of second partial derivatives.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _n_params = len(params)
+    _hessian = np.zeros((_n_params, _n_params))
+    for _idx in range(_n_params):
+        _step = 1.0E-5 * max(1.0, abs(params[_idx]))
+        _upper = np.array(params, dtype=float)
+        _lower = np.array(params, dtype=float)
+        _upper[_idx] += _step
+        _lower[_idx] -= _step
+        _hessian[_idx] = (
+            _get_log_likelihood(_upper, data, standard, fixed_scale)[1] -
+            _get_log_likelihood(_lower, data, standard, fixed_scale)[1]) / (
+                2.0 * _step)
+
+    return (_hessian + _hessian.T) / 2.0
+
+
+def maximum_likelihood_estimate(distribution_id, left, right, status,
+                                quantity):
+    """
+    Function to fit a parametric distribution by maximum likelihood.
+
+    The records may be exact, right, left, or interval censored and each is
+    weighted by its quantity so grouped data is never expanded.  The
+    estimated parameters are:
+
+        * Exponential: scale is the failure rate.
+        * Lognormal: scale is the mean and shape the standard deviation of
+          the log times.
+        * Gaussian: scale is the mean and shape the standard deviation.
+        * Weibull: scale is the characteristic life and shape the shape.
+
+    :param int distribution_id: the RAMSTKSurvival distribution ID to fit.
+    :param left: the left of the interval of each record.
+    :type left: :class:`numpy.ndarray`
+    :param right: the right of the interval (failure or censoring time) of
+                  each record.
+    :type right: :class:`numpy.ndarray`
+    :param status: the status ID of each record.
+    :type status: :class:`numpy.ndarray`
+    :param quantity: the number of items each record represents.
+    :type quantity: :class:`numpy.ndarray`
+    :return: _parameters, _var_covar, _fit; the (scale, shape), the
+             variance-covariance matrix of the (scale, shape), and the
+             (log-likelihood, AIC, BIC).
+    :rtype: tuple of :class:`numpy.ndarray`
+    :raise: KeyError if the distribution ID is not a parametric distribution.
+    :raise: ValueError if there are no failures or the fit does not
+            converge.
+    """
+    _standard = _STANDARD[distribution_id]
+    _fixed_scale = distribution_id == EXPONENTIAL
+
+    (_left, _right, _status, _quantity) = do_group_data(
+        left, right, status, quantity)
+
+    with np.errstate(all='ignore'):
+        _data, _jacobian = _do_split_data(distribution_id, _left, _right,
+                                          _status, _quantity)
+        _n_failures = (_data['exact'][1].sum() + _data['left'][1].sum() +
+                       _data['interval'][2].sum())
+        _n_items = _n_failures + _data['right'][1].sum()
+        if _n_failures <= 0.0:
+            raise ValueError(_(u"There are no failures to fit."))
+
+        _result = minimize(
+            _get_negative_log_likelihood,
+            _get_start(distribution_id, _data, _fixed_scale),
+            args=(_data, _standard, _fixed_scale, _n_items),
+            jac=True,
+            method='BFGS',
+            options={'gtol': 1.0E-10,
+                     'maxiter': 500})
+        _params = _result.x
+        _loglik = _get_log_likelihood(_params, _data, _standard,
+                                      _fixed_scale)[0] - _jacobian
+        _hessian = _get_hessian(_params, _data, _standard, _fixed_scale)
+
+    if not np.all(np.isfinite(_params)) or not np.isfinite(_loglik):
+        raise ValueError(_(u"The maximum likelihood estimate did not "
+                           u"converge."))
+
+    try:
+        _covariance = inv(-_hessian)
+    except LinAlgError:
+        _covariance = np.zeros(_hessian.shape)
+
+    # Convert the (location, log scale) estimates and covariance to the
+    # (scale, shape) of the distribution with the delta method.
+    _mu = _params[0]
+    if _fixed_scale:
+        _parameters = np.array([np.exp(-_mu), 0.0])
+        _jacobian = np.array([[-_parameters[0]], [0.0]])
+    else:
+        _sigma = np.exp(_params[1])
+        if distribution_id == WEIBULL:
+            _parameters = np.array([np.exp(_mu), 1.0 / _sigma])
+            _jacobian = np.array([[_parameters[0], 0.0],
+                                  [0.0, -1.0 / _sigma]])
+        else:
+            _parameters = np.array([_mu, _sigma])
+            _jacobian = np.array([[1.0, 0.0], [0.0, _sigma]])
+    _var_covar = _jacobian.dot(_covariance).dot(_jacobian.T)
+
+    _n_params = len(_params)
+    _fit = np.array([
+        _loglik, -2.0 * _loglik + 2.0 * _n_params,
+        -2.0 * _loglik + _n_params * np.log(_n_items)
+    ])
+
+    return _parameters, _var_covar, _fit
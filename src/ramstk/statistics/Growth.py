@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.statistics.Growth.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Functions for planning and assessing reliability growth tests."""
+
+# Import mathematical functions.
+import numpy as np  # pylint: disable=E0401
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
+
+# The bracket of the Crow-AMSAA shape parameter searched for the grouped data
+# estimate and the number of bisections, which narrows the bracket below the
+# precision of a float.
+_SHAPE_BRACKET = (1.0E-3, 1.0E2)
+_N_BISECTIONS = 64
+
+
+def _get_valid(value, valid):
+    """Replace the invalid and non-finite elements of an array with 0.0."""
+    return np.where(valid & np.isfinite(value), value, 0.0)
+
+
+def calculate_planned_growth(growth_rate, mtbf_initial, t1, phase_times):
+    """
+    Calculate the idealized growth of each phase of a growth test.
+
+    The idealized growth curve holds the MTBF at the initial MTBF for the
+    first t1 hours of testing, then grows the instantaneous MTBF as:
+
+        M(t) = M_I / (1 - alpha) * (t / t1)**alpha
+
+    The phase test times are along the last axis and the other arguments
+    broadcast against them, so a growth rate per phase plans each phase at its
+    own rate and a column of growth rates plans every phase at each rate.
+    Phases with an initial MTBF or t1 that isn't positive, or a growth rate
+    that isn't less than one, return 0.0.
+
+    :param growth_rate: the growth rate (alpha).
+    :type growth_rate: float or :class:`numpy.ndarray`
+    :param mtbf_initial: the MTBF over the first t1 hours of testing.
+    :type mtbf_initial: float or :class:`numpy.ndarray`
+    :param t1: the length of the initial test period.
+    :type t1: float or :class:`numpy.ndarray`
+    :param phase_times: the test time of each phase.
+    :type phase_times: :class:`numpy.ndarray`
+    :return: (_n_failures, _mtbf_i, _mtbf_f, _mtbf_a); the expected number of
+             failures, the MTBF at the start and end of the phase, and the
+             average MTBF of each phase.
+    :rtype: tuple of :class:`numpy.ndarray`
+    """
+    _phase_times = np.asarray(phase_times, dtype=float)
+    _end = np.cumsum(_phase_times, axis=-1)
+    _start = _end - _phase_times
+
+    (_growth_rate, _mtbf_initial, _t1, _start, _end) = np.broadcast_arrays(
+        *[np.asarray(_arg, dtype=float)
+          for _arg in [growth_rate, mtbf_initial, t1, _start, _end]])
+    _valid = (_mtbf_initial > 0.0) & (_t1 > 0.0) & (_growth_rate < 1.0)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        _lst_failures = []
+        _lst_mtbf = []
+        for _time in [_start, _end]:
+            _ratio = _time / _t1
+            _lst_failures.append(
+                np.where(_ratio <= 1.0, _time / _mtbf_initial,
+                         _t1 / _mtbf_initial * _ratio**(1.0 - _growth_rate)))
+            _lst_mtbf.append(
+                np.where(_ratio < 1.0, _mtbf_initial, _mtbf_initial /
+                         (1.0 - _growth_rate) * _ratio**_growth_rate))
+
+        _n_failures = _lst_failures[1] - _lst_failures[0]
+        _mtbf_a = (_end - _start) / _n_failures
+
+    return (_get_valid(_n_failures, _valid), _get_valid(_lst_mtbf[0], _valid),
+            _get_valid(_lst_mtbf[1], _valid), _get_valid(_mtbf_a, _valid))
+
+
+def calculate_growth_rate(mtbf_initial, mtbf_final, total_time, t1):
+    """
+    Calculate the growth rate needed to grow from the initial to final MTBF.
+
+    This is the closed form approximation of the growth rate of the
+    idealized growth curve.  Arguments which aren't positive return 0.0.
+
+    :param mtbf_initial: the MTBF over the first t1 hours of testing.
+    :type mtbf_initial: float or :class:`numpy.ndarray`
+    :param mtbf_final: the MTBF at the end of testing.
+    :type mtbf_final: float or :class:`numpy.ndarray`
+    :param total_time: the total test time.
+    :type total_time: float or :class:`numpy.ndarray`
+    :param t1: the length of the initial test period.
+    :type t1: float or :class:`numpy.ndarray`
+    :return: the growth rate (alpha).
+    :rtype: :class:`numpy.ndarray`
+    """
+    (_mtbf_initial, _mtbf_final, _total_time, _t1) = np.broadcast_arrays(
+        *[np.asarray(_arg, dtype=float)
+          for _arg in [mtbf_initial, mtbf_final, total_time, t1]])
+    _valid = ((_mtbf_initial > 0.0) & (_mtbf_final > 0.0) &
+              (_total_time > 0.0) & (_t1 > 0.0))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        _log_time = np.log(_total_time / _t1)
+        _growth_rate = (-_log_time - 1.0 + np.sqrt(
+            (1.0 + _log_time)**2.0 +
+            2.0 * np.log(_mtbf_final / _mtbf_initial)))
+
+    return _get_valid(_growth_rate, _valid)
+
+
+def calculate_total_time(growth_rate, mtbf_initial, mtbf_final, t1):
+    """
+    Calculate the test time needed to grow from the initial to final MTBF.
+
+    Arguments which aren't positive, or a growth rate that isn't less than
+    one, return 0.0.
+
+    :param growth_rate: the growth rate (alpha).
+    :type growth_rate: float or :class:`numpy.ndarray`
+    :param mtbf_initial: the MTBF over the first t1 hours of testing.
+    :type mtbf_initial: float or :class:`numpy.ndarray`
+    :param mtbf_final: the MTBF at the end of testing.
+    :type mtbf_final: float or :class:`numpy.ndarray`
+    :param t1: the length of the initial test period.
+    :type t1: float or :class:`numpy.ndarray`
+    :return: the total test time.
+    :rtype: :class:`numpy.ndarray`
+    """
+    (_growth_rate, _mtbf_initial, _mtbf_final, _t1) = np.broadcast_arrays(
+        *[np.asarray(_arg, dtype=float)
+          for _arg in [growth_rate, mtbf_initial, mtbf_final, t1]])
+    _valid = ((_growth_rate > 0.0) & (_growth_rate < 1.0) &
+              (_mtbf_initial > 0.0) & (_mtbf_final > 0.0) & (_t1 > 0.0))
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        _total_time = _t1 * (_mtbf_final * (1.0 - _growth_rate) /
+                             _mtbf_initial)**(1.0 / _growth_rate)
+
+    return _get_valid(_total_time, _valid)
+
+
+def calculate_duane_parameters(times, n_failures):
+    """
+    Estimate the Duane model parameters by least squares.
+
+    The cumulative MTBF is modelled as b * T**alpha and fit by linear
+    regression of log cumulative MTBF on log cumulative time.  The times are
+    along the last axis, so each row of a 2-D array is fit independently.
+
+    :param times: the cumulative test time at each failure or phase end.
+    :type times: :class:`numpy.ndarray`
+    :param n_failures: the number of failures at each time.
+    :type n_failures: :class:`numpy.ndarray`
+    :return: (_b, _alpha); the Duane scale and growth rate.
+    :rtype: tuple of :class:`numpy.ndarray`
+    """
+    _times = np.asarray(times, dtype=float)
+    _n_failures = np.cumsum(np.asarray(n_failures, dtype=float), axis=-1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        _x = np.log(_times)
+        _y = np.log(_times / _n_failures)
+        _x_bar = _x.mean(axis=-1)
+        _y_bar = _y.mean(axis=-1)
+        _alpha = (((_x - _x_bar[..., None]) * (_y - _y_bar[..., None])).sum(
+            axis=-1) / ((_x - _x_bar[..., None])**2.0).sum(axis=-1))
+        _b = np.exp(_y_bar - _alpha * _x_bar)
+
+    return _b, _alpha
+
+
+def calculate_crow_amsaa_parameters(times, n_failures, end_time=None):
+    """
+    Estimate the Crow-AMSAA parameters from exact failure times.
+
+    The maximum likelihood estimates have the closed form:
+
+        beta = N / sum(n_i * ln(T / t_i))
+        lambda = N / T**beta
+
+    The failure times are along the last axis, so each row of a 2-D array is
+    a separate test.
+
+    :param times: the cumulative test time at each failure.
+    :type times: :class:`numpy.ndarray`
+    :param n_failures: the number of failures at each time.
+    :type n_failures: :class:`numpy.ndarray`
+    :param end_time: the time a time terminated test ended.  Default is the
+                     last failure time, for a failure terminated test.
+    :type end_time: float or :class:`numpy.ndarray`
+    :return: (_lambda, _beta); the scale and shape parameters.
+    :rtype: tuple of :class:`numpy.ndarray`
+    """
+    _times = np.asarray(times, dtype=float)
+    _n_failures = np.asarray(n_failures, dtype=float)
+    if end_time is None:
+        _end_time = _times.max(axis=-1)
+    else:
+        _end_time = np.asarray(end_time, dtype=float)
+
+    _n_total = _n_failures.sum(axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        _beta = _n_total / (_n_failures * np.log(
+            _end_time[..., None] / _times)).sum(axis=-1)
+        _lambda = _n_total / _end_time**_beta
+
+    return _lambda, _beta
+
+
+def _get_grouped_score(beta, fractions, n_failures):
+    """
+    Calculate the profile score of the grouped Crow-AMSAA shape parameter.
+
+    :param beta: the shape parameter of each test.
+    :param fractions: the (start, end) of each interval as a fraction of the
+                      total test time.
+    :param n_failures: the number of failures in each interval.
+    :return: the derivative of the profile log likelihood.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _start, _end = fractions
+    _beta = beta[..., None]
+
+    # Dividing the interval's terms by end**beta keeps them from underflowing
+    # at large beta.  start**beta * ln(start) is zero when start is zero.
+    _exponent = _beta * np.log(_start / _end)
+    _numerator = np.log(_end) - np.where(
+        _start > 0.0, np.exp(_exponent) * np.log(_start), 0.0)
+
+    _terms = np.where(n_failures > 0.0,
+                      n_failures * _numerator / -np.expm1(_exponent), 0.0)
+
+    return _terms.sum(axis=-1)
+
+
+def calculate_crow_amsaa_grouped(times, n_failures):
+    """
+    Estimate the Crow-AMSAA parameters from failures grouped by interval.
+
+    The shape parameter of grouped data has no closed form estimate, so it
+    is found by bisecting the profile score of every test at once; the scale
+    parameter is then N / T**beta.  The interval end times are along the last
+    axis, so each row of a 2-D array is a separate test or what-if scenario.
+    A test without failures in at least two intervals has no estimate and
+    returns nan.
+
+    :param times: the cumulative test time at the end of each interval.
+    :type times: :class:`numpy.ndarray`
+    :param n_failures: the number of failures in each interval.
+    :type n_failures: :class:`numpy.ndarray`
+    :return: (_lambda, _beta); the scale and shape parameters.
+    :rtype: tuple of :class:`numpy.ndarray`
+    """
+    _times = np.asarray(times, dtype=float)
+    _n_failures = np.asarray(n_failures, dtype=float)
+
+    # Working in fractions of the total test time removes the log of the
+    # total time from the score.
+    _end_time = _times[..., -1]
+    _end = _times / _end_time[..., None]
+    _start = np.concatenate(
+        (np.zeros(_end.shape[:-1] + (1, )), _end[..., :-1]), axis=-1)
+    _fractions = (_start, _end)
+
+    _shape = _end_time.shape
+    _log_lower = np.full(_shape, np.log(_SHAPE_BRACKET[0]))
+    _log_upper = np.full(_shape, np.log(_SHAPE_BRACKET[1]))
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        _score_lower = _get_grouped_score(
+            np.exp(_log_lower), _fractions, _n_failures)
+        _score_upper = _get_grouped_score(
+            np.exp(_log_upper), _fractions, _n_failures)
+        _bracketed = ((_score_lower > 0.0) & (_score_upper < 0.0)) | \
+                     ((_score_lower < 0.0) & (_score_upper > 0.0))
+
+        for __ in range(_N_BISECTIONS):
+            _log_beta = (_log_lower + _log_upper) / 2.0
+            _score = _get_grouped_score(
+                np.exp(_log_beta), _fractions, _n_failures)
+            _lower_side = np.sign(_score) == np.sign(_score_lower)
+            _log_lower = np.where(_lower_side, _log_beta, _log_lower)
+            _log_upper = np.where(_lower_side, _log_upper, _log_beta)
+
+        _beta = np.where(_bracketed, np.exp((_log_lower + _log_upper) / 2.0),
+                         np.nan)
+        _lambda = _n_failures.sum(axis=-1) / _end_time**_beta
+
+    return _lambda, _beta
+
+
+def calculate_crow_amsaa_mean(time, scale, shape):
+    """
+    Calculate the Crow-AMSAA cumulative and instantaneous MTBF.
+
+    :param time: the cumulative test time.
+    :type time: float or :class:`numpy.ndarray`
+    :param scale: the scale parameter (lambda).
+    :type scale: float or :class:`numpy.ndarray`
+    :param shape: the shape parameter (beta).
+    :type shape: float or :class:`numpy.ndarray`
+    :return: (_cum_mean, _inst_mean); the cumulative and instantaneous MTBF.
+    :rtype: tuple of :class:`numpy.ndarray`
+    """
+    _time, _scale, _shape = np.broadcast_arrays(
+        *[np.asarray(_arg, dtype=float) for _arg in [time, scale, shape]])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        _cum_mean = _time**(1.0 - _shape) / _scale
+        _inst_mean = _cum_mean / _shape
+
+    return _cum_mean, _inst_mean
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.statistics.NonParametric.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Functions for the non-parametric estimation of survival data."""
+
+# Import mathematical functions.
+import numpy as np  # pylint: disable=E0401
+
+# Import other RAMSTK modules.
+from ramstk.statistics.Bounds import get_confidence, get_norm_quantile
+from ramstk.statistics.Distributions import RIGHT_CENSORED
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
+
+# The RAMSTKSurvival distribution IDs of the non-parametric estimators.
+MCF = 1
+KAPLAN_MEIER = 2
+
+
+def _do_reduce(times, n_failures, n_suspensions):
+    """
+    Sum the failures and suspensions at each distinct time.
+
+    The times are sorted first if they are not already in order, so times
+    read in order are reduced in a single pass.
+
+    :return: (times, n_failures, n_suspensions) with one element per
+             distinct time.
+    :rtype: tuple of :class:`numpy.ndarray`
+    """
+    if times.size > 1 and np.any(times[1:] < times[:-1]):
+        _order = np.argsort(times, kind='mergesort')
+        times = times[_order]
+        n_failures = n_failures[_order]
+        n_suspensions = n_suspensions[_order]
+
+    if times.size == 0:
+        return times, n_failures, n_suspensions
+
+    _starts = np.concatenate(([0], np.flatnonzero(times[1:] != times[:-1]) +
+                              1))
+
+    return (times[_starts], np.add.reduceat(n_failures, _starts),
+            np.add.reduceat(n_suspensions, _starts))
+
+
+def do_tabulate_data(times, status, quantity):
+    """
+    Count the failures and suspensions at each distinct time.
+
+    Right censored records are suspensions; every other record is counted as
+    a failure at its time.  Each record is weighted by its quantity and a
+    quantity less than one counts as a single record.
+
+    :param times: the time of each record.
+    :type times: :class:`numpy.ndarray`
+    :param status: the RAMSTKSurvivalData status ID of each record.
+    :type status: :class:`numpy.ndarray`
+    :param quantity: the number of items each record represents.
+    :type quantity: :class:`numpy.ndarray`
+    :return: (times, n_failures, n_suspensions) with one element per distinct
+             time in ascending order.
+    :rtype: tuple of :class:`numpy.ndarray`
+    """
+    _quantity = np.maximum(np.asarray(quantity, dtype=float), 1.0)
+    _n_failures = np.where(
+        np.asarray(status) == RIGHT_CENSORED, 0.0, _quantity)
+
+    return _do_reduce(
+        np.asarray(times, dtype=float), _n_failures, _quantity - _n_failures)
+
+
+def do_merge_tables(tables):
+    """
+    Combine the tables of do_tabulate_data() into a single table.
+
+    When the tables are from records read in time order only the times shared
+    at the boundary of two tables need to be combined.
+
+    :param list tables: the (times, n_failures, n_suspensions) tuples to
+                        combine.
+    :return: (times, n_failures, n_suspensions) with one element per distinct
+             time in ascending order.
+    :rtype: tuple of :class:`numpy.ndarray`
+    """
+    if not tables:
+        return np.zeros(0), np.zeros(0), np.zeros(0)
+
+    return _do_reduce(*[np.concatenate(_column) for _column in zip(*tables)])
+
+
+def _get_bounds(estimate, variance, confidence, upper_limit):
+    """
+    Calculate the two-sided normal bounds of an estimate.
+
+    :return: (lower, upper); the bounds limited to [0, upper_limit].
+    :rtype: tuple of :class:`numpy.ndarray`
+    """
+    _z_norm = get_norm_quantile(1.0 - (1.0 - get_confidence(confidence)) / 2.0)
+    _delta = _z_norm * np.sqrt(variance)
+
+    return (np.clip(estimate - _delta, 0.0, upper_limit),
+            np.clip(estimate + _delta, 0.0, upper_limit))
+
+
+def kaplan_meier(times, n_failures, n_suspensions, confidence=0.75):
+    """
+    Calculate the Kaplan-Meier product limit estimate of survival.
+
+    The items suspended at a failure time are at risk at that time.  The
+    bounds are the two-sided normal bounds using Greenwood's variance.
+
+    :param times: the distinct times in ascending order.
+    :type times: :class:`numpy.ndarray`
+    :param n_failures: the number of failures at each time.
+    :type n_failures: :class:`numpy.ndarray`
+    :param n_suspensions: the number of suspensions at each time.
+    :type n_suspensions: :class:`numpy.ndarray`
+    :param float confidence: the confidence level of the bounds as a decimal
+                             or a percentage.
+    :return: an array with a row per time of (time, number at risk, lower
+             bound, survival, upper bound).
+    :rtype: :class:`numpy.ndarray`
+    """
+    _times = np.asarray(times, dtype=float)
+    _n_failures = np.asarray(n_failures, dtype=float)
+    _n_removed = _n_failures + np.asarray(n_suspensions, dtype=float)
+
+    # The number at risk is everything not removed before the time.
+    _n_at_risk = _n_removed[::-1].cumsum()[::-1]
+
+    _survival = np.cumprod(1.0 - _n_failures / _n_at_risk)
+
+    # Greenwood's sum is undefined once every item at risk has failed, but
+    # the survival and its variance are zero from then on.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        _terms = np.where(_n_at_risk > _n_failures, _n_failures /
+                          (_n_at_risk * (_n_at_risk - _n_failures)), 0.0)
+    _variance = _survival**2.0 * np.cumsum(_terms)
+
+    _lower, _upper = _get_bounds(_survival, _variance, confidence, 1.0)
+
+    return np.column_stack((_times, _n_at_risk, _lower, _survival, _upper))
+
+
+def mean_cumulative_function(times, n_failures, n_suspensions,
+                             confidence=0.75):
+    """
+    Calculate the Nelson mean cumulative function of recurrent failures.
+
+    The failures are recurrences of repairable units and each unit has one
+    suspension at the end of its observation.  A unit is at risk until its
+    suspension, including at a failure time equal to its suspension time.
+    The bounds are the two-sided normal bounds using the Nelson-Aalen
+    variance.
+
+    :param times: the distinct times in ascending order.
+    :type times: :class:`numpy.ndarray`
+    :param n_failures: the number of failures at each time.
+    :type n_failures: :class:`numpy.ndarray`
+    :param n_suspensions: the number of units whose observation ends at each
+                          time.
+    :type n_suspensions: :class:`numpy.ndarray`
+    :param float confidence: the confidence level of the bounds as a decimal
+                             or a percentage.
+    :return: an array with a row per time of (time, number at risk, lower
+             bound, MCF, upper bound).
+    :rtype: :class:`numpy.ndarray`
+    """
+    _times = np.asarray(times, dtype=float)
+    _n_failures = np.asarray(n_failures, dtype=float)
+    _n_suspensions = np.asarray(n_suspensions, dtype=float)
+
+    _n_at_risk = _n_suspensions[::-1].cumsum()[::-1]
+
+    # Failures after every unit's observation ended can't be attributed to a
+    # unit at risk so they are ignored.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        _rate = np.where(_n_at_risk > 0.0, _n_failures / _n_at_risk, 0.0)
+        _mcf = np.cumsum(_rate)
+        _variance = np.cumsum(
+            np.where(_n_at_risk > 0.0, _rate / _n_at_risk, 0.0))
+
+    _lower, _upper = _get_bounds(_mcf, _variance, confidence, np.inf)
+
+    return np.column_stack((_times, _n_at_risk, _lower, _mcf, _upper))
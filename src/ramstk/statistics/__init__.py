@@ -1 +1,4 @@
 from Bounds import *
+from Distributions import *
+from NonParametric import *
+from Growth import *
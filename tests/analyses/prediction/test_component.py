@@ -11,6 +11,7 @@ import pytest
 
 from ramstk.analyses.data import HARDWARE_ATTRIBUTES, DORMANT_MULT
 from ramstk.analyses.prediction import Component
+from ramstk.modules import RAMSTKAttributeStore
 
 __author__ = 'Doyle Rowland'
 __email__ = 'doyle.rowland@reliaqual.com'
@@ -20,6 +21,29 @@ __copyright__ = 'Copyright 2014 Doyle "weibullguy" Rowland'
 ATTRIBUTES = HARDWARE_ATTRIBUTES.copy()
 
 
+def _make_batch_parts(hazard_rate_method_id):
+    """Build a list of hardware attribute dicts covering every category."""
+    _lst_parts = []
+    for _category_id in [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]:
+        for _subcategory_id in [1, 2, 3, 4]:
+            for _environment_active_id in [1, 4, 13]:
+                _attributes = HARDWARE_ATTRIBUTES.copy()
+                _attributes['hardware_id'] = len(_lst_parts) + 1
+                _attributes['hazard_rate_method_id'] = hazard_rate_method_id
+                _attributes['category_id'] = _category_id
+                _attributes['subcategory_id'] = _subcategory_id
+                _attributes['environment_active_id'] = _environment_active_id
+                _attributes['environment_dormant_id'] = 2
+                for _key in ['application_id', 'construction_id',
+                             'contact_rating_id', 'quality_id',
+                             'specification_id', 'type_id']:
+                    _attributes[_key] = 1
+                _attributes['n_active_pins'] = 10
+                _lst_parts.append(_attributes)
+
+    return _lst_parts
+
+
 @pytest.mark.unit
 @pytest.mark.calculation
 @pytest.mark.parametrize("category_id", [1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
@@ -167,3 +191,84 @@ def test_calculate_zero_quantity():
     assert isinstance(_attributes, dict)
     assert _msg == ("RAMSTK WARNING: Quantity is less than 1 when calculating "
                     "hardware item, hardware ID: 6.\n")
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+@pytest.mark.parametrize("hazard_rate_method_id", [1, 2])
+def test_calculate_batch(hazard_rate_method_id):
+    """calculate_batch() should return the same values as calculate() for each hardware item."""
+    _lst_parts = _make_batch_parts(hazard_rate_method_id)
+
+    _lst_scalar = []
+    _scalar_msg = ''
+    for _part in _lst_parts:
+        _attributes, _msg = Component.calculate(**_part.copy())
+        _lst_scalar.append(_attributes)
+        _scalar_msg = _scalar_msg + _msg
+
+    _lst_batch, _batch_msg = Component.calculate_batch(
+        [_part.copy() for _part in _lst_parts])
+
+    assert len(_lst_batch) == len(_lst_scalar)
+    assert _batch_msg == _scalar_msg
+    for _batch, _scalar in zip(_lst_batch, _lst_scalar):
+        assert _batch == _scalar
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+@pytest.mark.parametrize("hazard_rate_method_id", [1, 2])
+def test_calculate_batch_columns(hazard_rate_method_id):
+    """calculate_batch() should return the same values for attribute store rows as for attribute dicts."""
+    _lst_parts = _make_batch_parts(hazard_rate_method_id)
+    _store = RAMSTKAttributeStore()
+    _store.do_load((_part['hardware_id'], _part.copy())
+                   for _part in _lst_parts)
+
+    _lst_batch, _batch_msg = Component.calculate_batch(
+        [_part.copy() for _part in _lst_parts])
+    _rows, _rows_msg = Component.calculate_batch(
+        _store.do_select_rows(
+            [_part['hardware_id'] for _part in _lst_parts]))
+
+    assert _rows_msg == _batch_msg
+    for _batch, _row in zip(_lst_batch, _rows):
+        assert _row == _batch
+    assert _store.get_row(1) == _lst_parts[0]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_batch_empty():
+    """calculate_batch() should return an empty list when passed an empty list."""
+    _lst_parts, _msg = Component.calculate_batch([])
+
+    assert _lst_parts == []
+    assert _msg == ''
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_batch_zero_quantity():
+    """calculate_batch() should return an error message for each hardware item with a quantity < 1."""
+    _lst_parts = []
+    for _hardware_id in [1, 2]:
+        _attributes = HARDWARE_ATTRIBUTES.copy()
+        _attributes['hardware_id'] = _hardware_id
+        _attributes['hazard_rate_method_id'] = 1
+        _attributes['category_id'] = 1
+        _attributes['environment_active_id'] = 4
+        _attributes['environment_dormant_id'] = 3
+        _attributes['mult_adj_factor'] = 1.0
+        _attributes['duty_cycle'] = 100.0
+        _attributes['quantity'] = 0
+        _lst_parts.append(_attributes)
+
+    _lst_parts, _msg = Component.calculate_batch(_lst_parts)
+
+    assert _msg == ("RAMSTK WARNING: Quantity is less than 1 when calculating "
+                    "hardware item, hardware ID: 1.\n"
+                    "RAMSTK WARNING: Quantity is less than 1 when calculating "
+                    "hardware item, hardware ID: 2.\n")
+    assert _lst_parts[0]['hazard_rate_active'] == 0.0
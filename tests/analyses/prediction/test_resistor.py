@@ -153,6 +153,21 @@ def test_calculate_mil_hdbk_217f_part_count(subcategory_id, specification_id,
     assert _attributes['hazard_rate_active'] == lambda_b * piQ
 
 
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_part_count_lambda_b_precompiled():
+    """PART_COUNT_LAMBDA_B should be built once at import with immutable environment rows."""
+    for _subcategory_id, _rates in PART_COUNT_LAMBDA_B.items():
+        if isinstance(_rates, dict):
+            for _specification_id, _spec_rates in _rates.items():
+                assert Resistor.PART_COUNT_LAMBDA_B[_subcategory_id][
+                    _specification_id] == tuple(_spec_rates)
+        else:
+            assert Resistor.PART_COUNT_LAMBDA_B[_subcategory_id] == tuple(
+                _rates)
+    assert Resistor.PART_COUNT_PI_Q == tuple(PART_COUNT_PIQ)
+
+
 @pytest.mark.unit
 @pytest.mark.calculation
 def test_calculate_mil_hdbk_217f_part_count_missing_subcategory():
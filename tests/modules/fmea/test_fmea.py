@@ -7,6 +7,7 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Test class for testing the FMEA class."""
 
+from sqlalchemy import event
 from treelib import Tree
 
 import pytest
@@ -56,6 +57,29 @@ def test_do_select_all_hardware(test_dao):
     assert isinstance(_tree, Tree)
 
 
+@pytest.mark.integration
+@pytest.mark.parametrize("functional, n_queries", [(True, 4), (False, 5)])
+def test_do_select_all_query_count(test_dao, functional, n_queries):
+    """ do_select_all() should load the entire FMEA with one query per level. """
+    _statements = []
+
+    def _do_count(conn, cursor, statement, parameters, context, executemany):
+        _statements.append(statement)
+
+    event.listen(test_dao.engine, 'before_cursor_execute', _do_count)
+    try:
+        DUT = dtmFMEA(test_dao)
+        _tree = DUT.do_select_all(parent_id=1, functional=functional)
+    finally:
+        event.remove(test_dao.engine, 'before_cursor_execute', _do_count)
+
+    assert len(_statements) == n_queries
+    for _node in _tree.all_nodes():
+        if _node.identifier != 0:
+            _parent = _tree.parent(_node.identifier).identifier
+            assert str(_node.identifier).startswith(str(_parent) + '.')
+
+
 @pytest.mark.integration
 def test_do_select_all_non_existent_hardware_id(test_dao):
     """ do_select_all() should return an empty Tree() when passed a Hardware ID that doesn't exist. """
@@ -7,8 +7,10 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Test class for testing Hardware BoM module algorithms and models. """
 
+from collections import Mapping
 from datetime import date
 import pandas as pd
+from sqlalchemy import event, exc
 from treelib import Tree
 
 import pytest
@@ -16,7 +18,7 @@ import pytest
 from ramstk.modules.hardware import (
     dtmHardware, dtmDesignElectric, dtmDesignMechanic, dtmMilHdbkF, dtmNSWC,
     dtmReliability, dtmHardwareBoM, dtcHardwareBoM)
-from ramstk.dao import DAO, RAMSTKHardware
+from ramstk.dao import DAO, RAMSTKDesignElectric, RAMSTKHardware
 
 __author__ = 'Doyle Rowland'
 __email__ = 'doyle.rowland@reliaqual.com'
@@ -318,7 +320,7 @@ def test_do_select_all(test_dao):
     _tree = DUT.do_select_all(revision_id=1)
 
     assert isinstance(_tree, Tree)
-    assert isinstance(_tree.get_node(1).data, dict)
+    assert isinstance(_tree.get_node(1).data, Mapping)
 
 
 @pytest.mark.integration
@@ -373,12 +375,61 @@ def test_do_insert_part(test_dao):
     """ do_insert() should return a zero error code on success when inserting a child Hardware piece part. """
     DUT = dtmHardwareBoM(test_dao)
     DUT.do_select_all(revision_id=1)
+    _lst_commits = []
 
+    def _on_commit(connection):  # pylint: disable=unused-argument
+        _lst_commits.append(connection)
+
+    event.listen(test_dao.engine, 'commit', _on_commit)
     _error_code, _msg = DUT.do_insert(revision_id=1, parent_id=1, part=1)
+    event.remove(test_dao.engine, 'commit', _on_commit)
 
     assert _error_code == 0
     assert _msg == ("RAMSTK SUCCESS: Adding a new hardware item to the RAMSTK "
                     "Program database.")
+    assert len(_lst_commits) == 1
+    assert DUT.dtm_reliability.do_select(DUT.last_id) is not None
+
+
+@pytest.mark.integration
+def test_do_insert_commit_fails(test_dao):
+    """ do_insert() should return a non-zero error code and leave no trace of the new hardware item when the commit fails. """
+    DUT = dtmHardwareBoM(test_dao)
+    DUT.do_select_all(revision_id=1)
+    _last_id = DUT.last_id
+    _size = DUT.tree.size()
+
+    def _on_commit(session):  # pylint: disable=unused-argument
+        raise exc.SQLAlchemyError('Commit failed')
+
+    event.listen(test_dao.RAMSTK_SESSION, 'before_commit', _on_commit)
+    _error_code, _msg = DUT.do_insert(revision_id=1, parent_id=1, part=1)
+    event.remove(test_dao.RAMSTK_SESSION, 'before_commit', _on_commit)
+    _hardware_id = DUT.dtm_hardware.last_id
+
+    assert _error_code == 1
+    assert _msg == 'RAMSTK ERROR: Updating the RAMSTK Program database.\n'
+    assert DUT.last_id == _last_id
+    assert DUT.tree.size() == _size
+    assert _hardware_id not in DUT._attribute_store
+    for _dtm, __ in DUT._dic_tables.values():
+        assert _dtm.do_select(_hardware_id) is None
+
+
+@pytest.mark.integration
+def test_do_insert_raises(test_dao):
+    """ do_insert() should end the transaction when one of the inserts raises an exception. """
+    DUT = dtmHardwareBoM(test_dao)
+    DUT.do_select_all(revision_id=1)
+
+    def _do_insert(**kwargs):  # pylint: disable=unused-argument
+        raise ValueError('Insert failed')
+
+    DUT.dtm_nswc.do_insert = _do_insert
+
+    with pytest.raises(ValueError):
+        DUT.do_insert(revision_id=1, parent_id=1, part=1)
+    assert test_dao._unit_of_work is None
 
 
 @pytest.mark.integration
@@ -454,6 +505,243 @@ def test_do_update_all(test_dao):
                     "of materials.")
 
 
+@pytest.mark.integration
+def test_do_update_all_modified(test_dao):
+    """ do_update_all() should save only the changed records of all six tables in one transaction. """
+    DUT = dtmHardwareBoM(test_dao)
+    DUT.do_select_all(revision_id=1)
+    _lst_commits = []
+
+    def _on_commit(connection):  # pylint: disable=unused-argument
+        _lst_commits.append(connection)
+
+    _hardware = DUT.do_select(2, table='general')
+    _hardware.remarks = 'Dirty hardware'
+    _mil_hdbk_f = DUT.do_select(2, table='mil_hdbk_f')
+    _mil_hdbk_f.piP = 2.5
+
+    assert DUT.do_select_modified() == [_hardware, _mil_hdbk_f]
+    assert DUT.do_select_modified(3) == []
+
+    event.listen(test_dao.engine, 'commit', _on_commit)
+    _error_code, _msg = DUT.do_update_all()
+    event.remove(test_dao.engine, 'commit', _on_commit)
+
+    assert _error_code == 0
+    assert len(_lst_commits) == 1
+    assert DUT.do_select_modified() == []
+
+
+@pytest.mark.integration
+def test_do_set_dirty(test_dao):
+    """ do_set_dirty() should mark the hardware item and all of its parents for recalculation. """
+    DUT = dtmHardwareBoM(test_dao)
+    DUT.do_select_all(revision_id=1)
+    DUT.do_calculate_all(node_id=1, hr_multiplier=1.0)
+
+    DUT.do_set_dirty(6)
+
+    assert 6 not in DUT._dic_cum_results
+    assert 2 not in DUT._dic_cum_results
+    assert 1 not in DUT._dic_cum_results
+    assert 3 in DUT._dic_cum_results
+    assert 7 in DUT._dic_cum_results
+
+
+@pytest.mark.integration
+def test_do_calculate_all_incremental(test_dao):
+    """ do_calculate_all() should return the same results when only the dirty hardware items are recalculated. """
+    DUT = dtmHardwareBoM(test_dao)
+    DUT.do_select_all(revision_id=1)
+    _cum_results = DUT.do_calculate_all(node_id=1, hr_multiplier=1.0)
+
+    DUT.do_set_dirty(6)
+
+    assert DUT.do_calculate_all(node_id=1, hr_multiplier=1.0) == _cum_results
+    assert 6 in DUT._dic_cum_results
+    assert 1 in DUT._dic_cum_results
+
+
+@pytest.mark.integration
+def test_do_select_calculated(test_dao):
+    """ do_select_calculated() should return the IDs of only the hardware items rolled up by the last do_calculate_all(). """
+    DUT = dtmHardwareBoM(test_dao)
+    DUT.do_select_all(revision_id=1)
+    DUT.do_calculate_all(node_id=1, hr_multiplier=1.0)
+
+    DUT.do_set_dirty(6)
+    DUT.do_calculate_all(node_id=1, hr_multiplier=1.0)
+
+    assert sorted(DUT.do_select_calculated()) == [1, 2, 6]
+
+    DUT.do_calculate_all(node_id=1, hr_multiplier=1.0)
+
+    assert DUT.do_select_calculated() == []
+
+
+@pytest.mark.integration
+def test_do_calculate_all_parallel(test_dao):
+    """ do_calculate_all() should return the same results when the piece parts are calculated by a pool of worker processes. """
+    DUT = dtmHardwareBoM(test_dao)
+    DUT.do_select_all(revision_id=1)
+    _cum_results = DUT.do_calculate_all(node_id=1, hr_multiplier=1.0)
+
+    DUT.do_select_all(revision_id=1)
+
+    assert DUT.do_calculate_all(
+        node_id=1, hr_multiplier=1.0, n_workers=2) == _cum_results
+
+
+@pytest.mark.integration
+def test_do_select_all_store_only(test_dao):
+    """ do_select_all() should keep only the attribute store and do_select() should keep no more than cache_size records that have not changed. """
+    DUT = dtmHardwareBoM(test_dao)
+    DUT.do_select_all(revision_id=1, cache_size=2)
+
+    for _dtm, __ in DUT._dic_tables.values():
+        assert _dtm.tree.size() == 1
+
+    _hardware = DUT.do_select(2, table='general')
+    _hardware.remarks = 'Evicted hardware'
+    for _node_id in [3, 4, 5]:
+        DUT.do_select(_node_id, table='reliability')
+
+    assert _hardware.hardware_id == 2
+    assert DUT.dtm_hardware.do_select(2) is _hardware
+    assert DUT.dtm_reliability.do_select(3) is None
+    assert sorted(DUT._dic_record_cache.keys()) == [4, 5]
+    assert DUT._set_modified == {2}
+    assert DUT.do_select_modified() == [_hardware]
+
+    assert DUT.do_update_all()[0] == 0
+    DUT.do_select(6, table='general')
+
+    assert DUT.dtm_hardware.do_select(2) is None
+    assert DUT._set_modified == set()
+    assert sorted(DUT._dic_record_cache.keys()) == [5, 6]
+
+
+@pytest.mark.integration
+def test_do_evict_records_saved_elsewhere(test_dao):
+    """ do_select() should remove the records in the modified set that were saved outside the Hardware BoM when the modified set grows. """
+    DUT = dtmHardwareBoM(test_dao)
+    DUT.do_select_all(revision_id=1, cache_size=1)
+
+    _hardware = DUT.do_select(2, table='general')
+    _hardware.remarks = 'Saved elsewhere'
+    _hardware = DUT.do_select(3, table='general')
+
+    assert DUT._set_modified == {2}
+
+    DUT.do_update_many(DUT.do_select_modified())
+    _hardware.remarks = 'Saved by the BoM'
+    DUT.do_select(4, table='general')
+
+    assert DUT._set_modified == {3}
+    assert DUT.dtm_hardware.do_select(2) is None
+    assert DUT.dtm_hardware.do_select(3) is _hardware
+    assert list(DUT._dic_record_cache.keys()) == [4]
+
+    assert DUT.do_update(3)[0] == 0
+    assert DUT._set_modified == set()
+    assert DUT.dtm_hardware.do_select(3) is None
+
+
+@pytest.mark.integration
+def test_do_select_all_lazy(test_dao):
+    """ do_select_all() should load the design attributes on first access when lazy=True. """
+    _eager = dtmHardwareBoM(test_dao)
+    _eager.do_select_all(revision_id=1)
+    DUT = dtmHardwareBoM(test_dao)
+
+    _tree = DUT.do_select_all(revision_id=1, lazy=True)
+
+    assert isinstance(_tree, Tree)
+    assert DUT.dtm_hardware.tree.size() == 1
+    assert DUT.dtm_reliability.tree.size() == 1
+    assert DUT.dtm_design_electric.tree.size() == 1
+    assert DUT.dtm_nswc.tree.size() == 1
+    assert (DUT.tree.get_node(2).data['voltage_ac_operating'] ==
+            _eager.tree.get_node(2).data['voltage_ac_operating'])
+    for _node_id in _eager.tree.nodes:
+        if _node_id != 0:
+            assert (DUT.tree.get_node(_node_id).data.copy() ==
+                    _eager.tree.get_node(_node_id).data.copy())
+
+
+@pytest.mark.integration
+def test_do_select_lazy(test_dao):
+    """ do_select() should read a design record on first access and keep no more than cache_size records that have not changed. """
+    DUT = dtmHardwareBoM(test_dao)
+    DUT.do_select_all(revision_id=1, lazy=True, cache_size=2)
+
+    _design = DUT.do_select(2, table='electrical_design')
+    _design.voltage_ac_operating = _design.voltage_ac_operating + 1.0
+    for _node_id in [3, 4, 5]:
+        DUT.do_select(_node_id, table='mechanical_design')
+
+    assert isinstance(_design, RAMSTKDesignElectric)
+    assert _design.hardware_id == 2
+    assert DUT.do_select(2, table='electrical_design') is _design
+    assert sorted(DUT._dic_record_cache.keys()) == [2, 5]
+    assert DUT.dtm_design_mechanic.tree.get_node(3) is None
+    assert DUT.do_select(100, table='electrical_design') is None
+
+    assert DUT.do_update(2)[0] == 0
+    DUT.do_select(3, table='nswc')
+    DUT.do_select(4, table='nswc')
+
+    assert DUT.dtm_design_electric.tree.get_node(2) is None
+    assert sorted(DUT._dic_record_cache.keys()) == [3, 4]
+
+
+@pytest.mark.integration
+def test_do_set_calculated(test_dao):
+    """ do_set_calculated() should set the calculated attributes in the records that are loaded and in the others when they are read. """
+    DUT = dtmHardwareBoM(test_dao)
+    DUT.do_select_all(revision_id=1)
+    _hardware = DUT.do_select(1, table='general')
+    DUT.do_calculate_all(node_id=1, hr_multiplier=1.0)
+    _lst_calculated = DUT.do_select_calculated()
+
+    _error_code, _msg = DUT.do_set_calculated(_lst_calculated)
+
+    assert _error_code == 0
+    assert _msg == ('RAMSTK SUCCESS: Setting the calculated attributes of '
+                    'the hardware bill of materials.')
+    assert (_hardware.total_part_count ==
+            DUT.tree.get_node(1).data['total_part_count'])
+    assert DUT._dic_unsaved['general'] == set(_lst_calculated) - {1}
+    assert DUT._dic_unsaved['reliability'] == set(_lst_calculated)
+    assert DUT.dtm_reliability.do_select(2) is None
+
+    _reliability = DUT.do_select(2, table='reliability')
+
+    assert (_reliability.hazard_rate_logistics ==
+            DUT.tree.get_node(2).data['hazard_rate_logistics'])
+    assert 2 not in DUT._dic_unsaved['reliability']
+
+    DUT.do_select_modified()
+
+    assert DUT._dic_unsaved == {'general': set(), 'reliability': set()}
+    for _node_id in _lst_calculated:
+        assert (DUT.dtm_reliability.do_select(_node_id).hazard_rate_logistics
+                == DUT.tree.get_node(_node_id).data['hazard_rate_logistics'])
+
+
+@pytest.mark.integration
+def test_do_calculate_all_lazy(test_dao):
+    """ do_calculate_all() should return the same results when the design records are loaded lazily. """
+    DUT = dtmHardwareBoM(test_dao)
+    DUT.do_select_all(revision_id=1)
+    _cum_results = DUT.do_calculate_all(node_id=1, hr_multiplier=1.0)
+
+    DUT.do_select_all(revision_id=1, lazy=True)
+
+    assert DUT.do_calculate_all(node_id=1, hr_multiplier=1.0) == _cum_results
+    assert DUT.dtm_design_electric.tree.size() == 1
+
+
 @pytest.mark.integration
 def test_data_controller_create(test_dao, test_configuration):
     """ __init__() should create an instance of a Hardware data controller. """
@@ -609,10 +897,28 @@ def test_request_get_attributes(test_dao, test_configuration):
 
     _attributes = DUT.request_get_attributes(1)
 
-    assert isinstance(_attributes, dict)
+    assert isinstance(_attributes, Mapping)
     assert _attributes['revision_id'] == 1
 
 
+@pytest.mark.integration
+def test_request_get_attributes_view(test_dao, test_configuration):
+    """ request_get_attributes() should return a view that reads and writes the Hardware BoM attribute columns. """
+    DUT = dtcHardwareBoM(test_dao, test_configuration, test=True)
+    DUT.request_do_select_all(revision_id=1)
+
+    _attributes = DUT.request_get_attributes(2)
+    _cost = _attributes['cost']
+    _attributes['cost'] = 12.5
+
+    assert DUT.request_get_attributes(2)['cost'] == 12.5
+    # pylint: disable=protected-access
+    assert (DUT._dtm_data_model._attribute_store.get_column(
+        'cost', [2]).tolist() == [12.5])
+
+    _attributes['cost'] = _cost
+
+
 @pytest.mark.integration
 def test_request_set_attributes(test_dao, test_configuration):
     """ request_set_attributes() should return False on success when setting the attributes. """
@@ -622,6 +928,26 @@ def test_request_set_attributes(test_dao, test_configuration):
     assert not DUT.request_set_attributes(1, ATTRIBUTES)
 
 
+@pytest.mark.integration
+def test_request_set_attributes_lazy(test_dao, test_configuration):
+    """ request_set_attributes() should return False on success when the design records are loaded lazily. """
+    DUT = dtcHardwareBoM(test_dao, test_configuration, test=True)
+    DUT.request_do_select_all(revision_id=1, lazy=True)
+    DUT.request_do_prefetch([1, 2])
+
+    _attributes = DUT.request_get_attributes(2).copy()
+    _attributes['piP'] = 2.5
+
+    assert not DUT.request_set_attributes(2, _attributes)
+    assert DUT.request_get_attributes(2)['piP'] == 2.5
+    assert DUT.request_do_select(2, table='mil_hdbk_f').piP == 2.5
+    assert not DUT.request_do_update(2)
+
+    DUT.request_do_select_all(revision_id=1, lazy=True)
+
+    assert DUT.request_get_attributes(2)['piP'] == 2.5
+
+
 @pytest.mark.integration
 def test_request_set_attributes_missing_design_electric(
         test_dao, test_configuration):
@@ -725,3 +1051,4 @@ def test_request_do_make_composite_reference_designator(
     assert _error_code == 0
     assert _msg == ''
     assert DUT.request_get_attributes(2)['comp_ref_des'] == 'S1:SS1'
+    assert DUT.request_do_select(2, table='general').comp_ref_des == 'S1:SS1'
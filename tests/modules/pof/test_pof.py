@@ -7,6 +7,8 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Test class for testing the Physics of Failure (PoF) class."""
 
+from pubsub import pub
+from sqlalchemy import event
 from treelib import Tree
 
 import pytest
@@ -45,6 +47,101 @@ def test_do_select_all(test_dao):
     assert isinstance(_tree, Tree)
 
 
+@pytest.mark.integration
+def test_do_select_all_prefetch(test_dao):
+    """ do_select_all() should load prefetched Hardware IDs with the selected Hardware ID and use them once. """
+    _statements = []
+
+    def _do_count(conn, cursor, statement, parameters, context, executemany):
+        _statements.append(statement)
+
+    DUT = dtmPoF(test_dao)
+
+    event.listen(test_dao.engine, 'before_cursor_execute', _do_count)
+    try:
+        DUT.do_select_all(parent_id=2, prefetch=[1, 3])
+        assert len(_statements) == 5
+        assert sorted(DUT._dic_prefetch.keys()) == [1, 3]
+
+        _tree = DUT.do_select_all(parent_id=1)
+        assert len(_statements) == 5
+        assert sorted(DUT._dic_prefetch.keys()) == [3]
+    finally:
+        event.remove(test_dao.engine, 'before_cursor_execute', _do_count)
+
+    assert isinstance(_tree.get_node('0.4').data, RAMSTKMode)
+
+
+@pytest.mark.integration
+def test_do_select_all_prefetch_limit(test_dao):
+    """ do_select_all() should hold at most prefetch_size prefetched Hardware IDs and discard the oldest first. """
+    DUT = dtmPoF(test_dao)
+    DUT.prefetch_size = 2
+
+    DUT.do_select_all(parent_id=1, prefetch=[2, 3, 4])
+
+    assert len(DUT._dic_prefetch) == 2
+
+    DUT.do_select_all(parent_id=1, prefetch=[5])
+
+    assert len(DUT._dic_prefetch) == 2
+    assert DUT._dic_prefetch.keys()[-1] == 5
+
+
+@pytest.mark.integration
+def test_do_select_all_prefetch_long_list(test_dao):
+    """ do_select_all() should read no more than prefetch_size prefetched Hardware IDs when the prefetch list is longer. """
+    _parameters = []
+
+    def _do_count(conn, cursor, statement, parameters, context, executemany):
+        _parameters.append(len(parameters))
+
+    DUT = dtmPoF(test_dao)
+
+    event.listen(test_dao.engine, 'before_cursor_execute', _do_count)
+    try:
+        _tree = DUT.do_select_all(parent_id=1, prefetch=range(2, 2002))
+    finally:
+        event.remove(test_dao.engine, 'before_cursor_execute', _do_count)
+
+    assert max(_parameters) <= DUT.prefetch_size + 1
+    assert DUT._dic_prefetch.keys() == range(2, DUT.prefetch_size + 2)
+    assert isinstance(_tree.get_node('0.4').data, RAMSTKMode)
+
+
+@pytest.mark.integration
+def test_do_select_all_prefetch_cleared(test_dao, test_configuration):
+    """ The prefetched Hardware IDs should be discarded when the PoF or FMEA changes or another Revision is selected. """
+    DUT = dtmPoF(test_dao)
+    DUT.do_select_all(parent_id=1, prefetch=[2, 3])
+
+    assert sorted(DUT._dic_prefetch.keys()) == [2, 3]
+
+    DUT.do_select_all(parent_id=1, prefetch=[2, 3], revision_id=2)
+
+    assert sorted(DUT._dic_prefetch.keys()) == [2, 3]
+
+    DUT.do_select_all(parent_id=1, revision_id=1)
+
+    assert DUT._dic_prefetch == {}
+
+    DUT.do_select_all(parent_id=1, prefetch=[2, 3], revision_id=1)
+    DUT.do_insert(entity_id=1, parent_id='0.4.1', level='opload')
+
+    assert DUT._dic_prefetch == {}
+
+    DUT = dtcPoF(test_dao, test_configuration, test=True)
+    DUT.request_do_select_all(parent_id=1, prefetch=[2, 3])
+    pub.sendMessage('editedFMEA')
+
+    assert DUT._dtm_data_model._dic_prefetch == {}
+
+    DUT.request_do_select_all(parent_id=1, prefetch=[2, 3])
+    pub.sendMessage('selectedRevision', module_id=1)
+
+    assert DUT._dtm_data_model._dic_prefetch == {}
+
+
 @pytest.mark.integration
 def test_do_select_all_non_existent_id(test_dao):
     """ do_select_all() should return an empty Tree() when passed a Mechanism ID that doesn't exist. """
@@ -274,6 +274,24 @@ def test_do_calculate_all(test_dao):
     assert not DUT.do_calculate_all()
 
 
+@pytest.mark.integration
+def test_do_get_post_order(test_dao):
+    """ do_get_post_order() should return the Node IDs with every child before its parent and the size of each subtree. """
+    DUT = dtmAllocation(test_dao)
+    DUT.do_select_all(revision_id=1)
+
+    _lst_node_id, _lst_size = DUT.do_get_post_order(0)
+
+    assert _lst_node_id[-1] == 0
+    assert _lst_size[-1] == len(DUT.tree.nodes)
+    assert sorted(_lst_node_id) == sorted(DUT.tree.nodes.keys())
+    for _index, _node_id in enumerate(_lst_node_id):
+        for _child in DUT.tree.children(_node_id):
+            assert _lst_node_id.index(_child.identifier) < _index
+        assert _lst_size[_index] == len(DUT.tree.subtree(_node_id).nodes)
+    assert DUT.do_get_post_order(0) == (_lst_node_id, _lst_size)
+
+
 @pytest.mark.integration
 def test_create_allocation_data_controller(test_dao, test_configuration):
     """ __init__() should return instance of Allocation data controller. """
@@ -11,9 +11,9 @@ import pytest
 from treelib import Tree
 import pandas as pd
 
-from ramstk.dao import DAO, RAMSTKFunction
+from ramstk.dao import DAO, RAMSTKFunction, RAMSTKHardware, RAMSTKMatrix
 from ramstk.modules.function import dtcFunction, dtmFunction
-from ramstk.modules import RAMSTKDataMatrix
+from ramstk.modules import RAMSTKDataMatrix, RAMSTKSparseDataMatrix
 
 __author__ = 'Doyle Rowland'
 __email__ = 'doyle.rowland@reliaqual.com'
@@ -373,6 +373,169 @@ def test_request_do_update_matrix(test_dao, test_configuration):
     assert not DUT.request_do_update_matrix(1, 'fnctn_hrdwr')
 
 
+@pytest.mark.integration
+def test_matrix_do_update_changed_cells_only(test_dao):
+    """ do_update() should only write the matrix cells that changed since the last save. """
+    DUT = RAMSTKDataMatrix(test_dao, RAMSTKFunction, RAMSTKHardware)
+    DUT.do_select_all(
+        1,
+        'fnctn_hrdwr',
+        rkey='function_id',
+        ckey='hardware_id',
+        rheader='function_code',
+        cheader='comp_ref_des')
+    DUT.do_update(1, 'fnctn_hrdwr')
+
+    _error_code, _msg = DUT.do_update(1, 'fnctn_hrdwr')
+
+    assert _error_code == 0
+    assert _msg == 'RAMSTK SUCCESS: Updating Matrix fnctn_hrdwr.  Wrote 0 ' \
+                   'cells.'
+
+    _column = DUT.dtf_matrix.columns[0]
+    _row = DUT.dtf_matrix.index[0]
+    DUT.dtf_matrix.loc[_row, _column] = DUT.dtf_matrix.loc[_row, _column] + 1
+
+    _error_code, _msg = DUT.do_update(1, 'fnctn_hrdwr')
+
+    assert _error_code == 0
+    assert _msg == 'RAMSTK SUCCESS: Updating Matrix fnctn_hrdwr.  Wrote 1 ' \
+                   'cells.'
+
+
+@pytest.mark.integration
+def test_sparse_matrix_do_select_all(test_dao):
+    """ do_select_all() should build a sparse matrix whose dense form matches the dense matrix. """
+    _dense = RAMSTKDataMatrix(test_dao, RAMSTKFunction, RAMSTKHardware)
+    _dense.do_select_all(
+        1,
+        'fnctn_hrdwr',
+        rkey='function_id',
+        ckey='hardware_id',
+        rheader='function_code',
+        cheader='comp_ref_des')
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKFunction, RAMSTKHardware)
+
+    assert DUT.dtf_matrix is None
+
+    DUT.do_select_all(
+        1,
+        'fnctn_hrdwr',
+        rkey='function_id',
+        ckey='hardware_id',
+        rheader='function_code',
+        cheader='comp_ref_des')
+
+    assert isinstance(DUT.dtf_matrix, pd.DataFrame)
+    assert (DUT.dtf_matrix.values == _dense.dtf_matrix.fillna(0).values).all()
+    assert 0 not in DUT.dic_cells.values()
+    assert DUT.do_select(1, 1) == _dense.do_select(1, 1)
+
+
+@pytest.mark.integration
+def test_sparse_matrix_do_insert_delete(test_dao):
+    """ do_insert() and do_delete() should add and remove rows and columns from a sparse matrix. """
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKFunction, RAMSTKHardware)
+    DUT.do_select_all(
+        1,
+        'fnctn_hrdwr',
+        rkey='function_id',
+        ckey='hardware_id',
+        rheader='function_code',
+        cheader='comp_ref_des')
+
+    _error_code, _msg = DUT.do_insert(40, 'FUNC-0040', row=True)
+    assert _error_code == 0
+    assert DUT.do_select(1, 40) == 0
+    assert DUT.dtf_matrix[1][40] == 0
+
+    _error_code, _msg = DUT.do_insert(40, 'FUNC-0040', row=True)
+    assert _error_code == 6
+
+    _error_code, _msg = DUT.do_delete(40, row=True)
+    assert _error_code == 0
+    assert 40 not in DUT.dtf_matrix.index
+
+    _error_code, _msg = DUT.do_delete(400, row=False)
+    assert _error_code == 6
+    assert _msg == ('RAMSTK ERROR: Attempted to drop non-existent column 400 '
+                    'from the matrix.')
+
+
+@pytest.mark.integration
+def test_sparse_matrix_do_update(test_dao):
+    """ do_update() should save changes made to the dense form of a sparse matrix. """
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKFunction, RAMSTKHardware)
+    DUT.do_select_all(
+        1,
+        'fnctn_hrdwr',
+        rkey='function_id',
+        ckey='hardware_id',
+        rheader='function_code',
+        cheader='comp_ref_des')
+    _value = DUT.do_select(1, 1)
+    DUT.dtf_matrix[1][1] = _value + 1
+
+    _error_code, _msg = DUT.do_update(1, 'fnctn_hrdwr')
+
+    assert _error_code == 0
+    assert _msg == 'RAMSTK SUCCESS: Updating Matrix fnctn_hrdwr.  Wrote 1 ' \
+                   'cells.'
+
+    DUT.do_select_all(
+        1,
+        'fnctn_hrdwr',
+        rkey='function_id',
+        ckey='hardware_id',
+        rheader='function_code',
+        cheader='comp_ref_des')
+
+    assert DUT.do_select(1, 1) == _value + 1
+
+
+@pytest.mark.integration
+def test_sparse_matrix_stores_non_zero_cells_only(test_dao):
+    """ do_create() and do_update() should only store the non-zero cells of a sparse matrix. """
+
+    def _count_cells():
+        _session = test_dao.RAMSTK_SESSION(
+            bind=test_dao.engine, autoflush=False, expire_on_commit=False)
+        _count = _session.query(RAMSTKMatrix).filter(
+            RAMSTKMatrix.matrix_type == 'fnctn_hrdwr_sparse').count()
+        _session.close()
+        return _count
+
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKFunction, RAMSTKHardware)
+    DUT.do_create(
+        1, 'fnctn_hrdwr_sparse', rkey='function_id', ckey='hardware_id')
+
+    assert _count_cells() == 0
+
+    DUT.do_select_all(
+        1,
+        'fnctn_hrdwr_sparse',
+        rkey='function_id',
+        ckey='hardware_id',
+        rheader='function_code',
+        cheader='comp_ref_des')
+
+    assert DUT.dtf_matrix.shape == (len(DUT.dic_row_hdrs),
+                                    len(DUT.dic_column_hdrs))
+    assert DUT.do_select(1, 1) == 0
+
+    DUT.dtf_matrix[1][1] = 1
+
+    assert DUT.do_update(1, 'fnctn_hrdwr_sparse')[1] == (
+        'RAMSTK SUCCESS: Updating Matrix fnctn_hrdwr_sparse.  Wrote 1 cells.')
+    assert _count_cells() == 1
+
+    DUT.dtf_matrix[1][1] = 0
+
+    assert DUT.do_update(1, 'fnctn_hrdwr_sparse')[1] == (
+        'RAMSTK SUCCESS: Updating Matrix fnctn_hrdwr_sparse.  Wrote 1 cells.')
+    assert _count_cells() == 0
+
+
 @pytest.mark.integration
 def test_request_do_update_non_existent_matrix(test_dao, test_configuration):
     """ request_do_update_matrix() should return True when attempting to update a non-existent matrix. """
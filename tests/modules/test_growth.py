@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.tests.modules.test_growth.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing Growth module algorithms and models."""
+
+import numpy as np
+from treelib import Tree
+
+import pytest
+
+from ramstk.Utilities import OutOfRangeError
+from ramstk.modules.growth import dtmGrowth, dtcGrowth
+from ramstk.dao import DAO, RAMSTKGrowthTest, RAMSTKTest
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
+
+# The (planned test time, observed test time, observed failures) of each
+# phase.
+PHASES = [(1000.0, 1000.0, 20), (1500.0, 1500.0, 18), (2500.0, 2500.0, 25),
+          (2000.0, 0.0, 0)]
+
+
+def _do_insert_test(DUT):
+    """Add a Growth test with the phases to the Growth data model."""
+    DUT.do_select_all(revision_id=1)
+    DUT.do_insert(revision_id=1)
+    _test_id = DUT.last_id
+    for __ in PHASES[1:]:
+        DUT.do_insert(test_id=_test_id)
+
+    _test = DUT.do_select(_test_id)
+    _test.avg_growth = 0.23
+    _test.confidence = 90.0
+    for _phase, (_p_time, _o_time, _o_fails) in zip(
+            DUT.do_select_phases(_test_id), PHASES):
+        _phase.p_test_time = _p_time
+        _phase.o_test_time = _o_time
+        _phase.o_num_fails = _o_fails
+    DUT.do_select_phases(_test_id)[0].p_mi = 50.0
+
+    return _test_id
+
+
+@pytest.mark.integration
+def test_create_data_model(test_dao):
+    """ __init__ should return instance of a Growth data model. """
+    DUT = dtmGrowth(test_dao)
+
+    assert isinstance(DUT, dtmGrowth)
+    assert isinstance(DUT.tree, Tree)
+    assert isinstance(DUT.dao, DAO)
+
+
+@pytest.mark.integration
+def test_do_insert_select_all(test_dao):
+    """ do_insert() should add a Growth test with its first phase and do_select_all() should load the tests and phases. """
+    DUT = dtmGrowth(test_dao)
+    _test_id = _do_insert_test(DUT)
+
+    assert isinstance(DUT.do_select(_test_id), RAMSTKTest)
+    assert DUT.do_select(_test_id).n_phases == 4
+    assert DUT.do_update_all()[0] == 0
+
+    DUT.do_select_all(revision_id=1)
+
+    _phases = DUT.do_select_phases(_test_id)
+    assert len(_phases) == 4
+    assert all(isinstance(_phase, RAMSTKGrowthTest) for _phase in _phases)
+    assert [_phase.p_test_time for _phase in _phases] == [
+        _phase[0] for _phase in PHASES
+    ]
+    assert DUT.do_select(
+        DUT.do_make_node_id(_test_id, _phases[1].phase_id)) is _phases[1]
+
+
+@pytest.mark.unit
+def test_do_make_node_id():
+    """ do_make_node_id() should pack the Test ID and Phase ID into their own 21 bits and raise an OutOfRangeError when an ID doesn't fit. """
+    assert dtmGrowth.do_make_node_id(3) == 3
+    assert dtmGrowth.do_make_node_id(1, 12) != dtmGrowth.do_make_node_id(
+        11, 2)
+
+    with pytest.raises(OutOfRangeError):
+        dtmGrowth.do_make_node_id(2**21)
+    with pytest.raises(OutOfRangeError):
+        dtmGrowth.do_make_node_id(1, 2**21)
+
+
+@pytest.mark.integration
+def test_do_insert_out_of_range(test_dao):
+    """ do_insert() should return a 2105 error code and not save a phase whose ID doesn't fit in its field of the Node ID. """
+    DUT = dtmGrowth(test_dao)
+    _test_id = _do_insert_test(DUT)
+    _phase = DUT.do_select_phases(_test_id)[-1]
+    _phase_id = _phase.phase_id
+    _phase.phase_id = 2**21 - 1
+    DUT.do_update(DUT.do_make_node_id(_test_id, _phase_id))
+
+    try:
+        _error_code, _msg = DUT.do_insert(test_id=_test_id)
+        _n_phases = test_dao.session.query(RAMSTKGrowthTest).filter(
+            RAMSTKGrowthTest.phase_id == 2**21).count()
+        DUT.do_select_all(revision_id=1)
+        _phase = DUT.do_select(DUT.do_make_node_id(_test_id, 2**21 - 1))
+    finally:
+        DUT.do_delete(_test_id)
+
+    assert _error_code == 2105
+    assert _msg == ('RAMSTK ERROR: ID 2097152 is outside the range 0 - '
+                    '2097151 that can be packed into a Node ID.')
+    assert _n_phases == 0
+    assert _phase.phase_id == 2**21 - 1
+    assert DUT.lst_skipped == []
+
+
+@pytest.mark.integration
+def test_do_delete(test_dao):
+    """ do_delete() should remove a phase or a Growth test with its phases. """
+    DUT = dtmGrowth(test_dao)
+    _test_id = _do_insert_test(DUT)
+    _phase = DUT.do_select_phases(_test_id)[-1]
+
+    assert DUT.do_delete(DUT.do_make_node_id(_test_id,
+                                             _phase.phase_id))[0] == 0
+    assert DUT.do_select(_test_id).n_phases == 3
+    assert DUT.do_delete(_test_id)[0] == 0
+    assert DUT.do_delete(_test_id)[0] == 2005
+
+    DUT.do_select_all(revision_id=1)
+
+    assert DUT.do_select(_test_id) is None
+
+
+@pytest.mark.integration
+def test_do_calculate_plan(test_dao):
+    """ do_calculate_plan() should set the idealized and planned growth of every phase. """
+    DUT = dtmGrowth(test_dao)
+    _test_id = _do_insert_test(DUT)
+    _phases = DUT.do_select_phases(_test_id)
+    _phases[3].p_growth_rate = 0.4
+
+    _error_code, _msg = DUT.do_calculate_plan(_test_id)
+
+    assert _error_code == 0
+    assert DUT.do_select(_test_id).ttt == 7000.0
+    assert [_phase.i_num_fails for _phase in _phases] == [20, 20, 29, 20]
+    assert _phases[2].i_mf == pytest.approx(94.0247917)
+    assert _phases[2].p_mf == pytest.approx(_phases[2].i_mf)
+    assert _phases[3].p_mf > _phases[3].i_mf
+    assert _phases[1].p_mi == pytest.approx(_phases[0].p_mf)
+
+    _phases[0].p_mi = 0.0
+
+    assert DUT.do_calculate_plan(_test_id)[0] == 2105
+    assert DUT.do_calculate_plan(100)[0] == 2105
+
+
+@pytest.mark.integration
+def test_do_calculate(test_dao):
+    """ do_calculate() should assess the observed phases with the Crow-AMSAA model. """
+    DUT = dtmGrowth(test_dao)
+    _test_id = _do_insert_test(DUT)
+    _test = DUT.do_select(_test_id)
+    _phases = DUT.do_select_phases(_test_id)
+
+    _error_code, _msg = DUT.do_calculate(_test_id)
+
+    assert _error_code == 0
+    assert _test.cum_time == 5000.0
+    assert _test.cum_failures == 63
+    assert 0.0 < _test.shape < 1.0
+    assert _test.scale == pytest.approx(63.0 / 5000.0**_test.shape)
+    assert _test.shape_ll < _test.shape < _test.shape_ul
+    assert _test.scale_ll < _test.scale < _test.scale_ul
+    assert _test.cum_mean == pytest.approx(5000.0 / 63.0)
+    assert _test.cum_mean_ll < _test.cum_mean < _test.cum_mean_ul
+    assert _test.inst_mean > _test.cum_mean
+    assert _phases[0].o_growth_rate == pytest.approx(1.0 - _test.shape)
+    assert _phases[1].o_mi == pytest.approx(_phases[0].o_mf)
+    assert _phases[2].o_mf == pytest.approx(_test.inst_mean)
+    assert _phases[2].o_ma == 100.0
+    assert _phases[3].o_mf == 0.0
+
+    _curve = DUT.dic_curves[_test_id]
+    assert _curve.shape == (3, 6)
+    assert _curve[:, 1].tolist() == [20.0, 38.0, 63.0]
+    assert (np.diff(_curve[:, 3]) > 0.0).all()
+
+
+@pytest.mark.integration
+def test_do_calculate_increasing_failure_intensity(test_dao):
+    """ do_calculate() should store a 0.0 initial MTBF for the first phase when the failure intensity is increasing. """
+    DUT = dtmGrowth(test_dao)
+    _test_id = _do_insert_test(DUT)
+    _phases = DUT.do_select_phases(_test_id)
+    for _phase, _o_fails in zip(_phases, [5, 20, 60]):
+        _phase.o_num_fails = _o_fails
+
+    _error_code, _msg = DUT.do_calculate(_test_id)
+
+    assert _error_code == 0
+    assert DUT.do_select(_test_id).shape > 1.0
+    assert _phases[0].o_mi == 0.0
+    assert np.isfinite(DUT.dic_curves[_test_id]).all()
+
+
+@pytest.mark.integration
+def test_do_calculate_errors(test_dao):
+    """ do_calculate() should return a non-zero error code when the test can't be assessed. """
+    DUT = dtmGrowth(test_dao)
+    _test_id = _do_insert_test(DUT)
+    for _phase in DUT.do_select_phases(_test_id)[1:]:
+        _phase.o_num_fails = 0
+
+    assert DUT.do_calculate(_test_id)[0] == 2105
+    assert DUT.do_calculate(100)[0] == 2105
+
+
+@pytest.mark.integration
+def test_request_do_calculate(test_dao, test_configuration):
+    """ request_do_calculate() should return False on success. """
+    DUT = dtcGrowth(test_dao, test_configuration, test=True)
+    _test_id = _do_insert_test(DUT._dtm_data_model)
+
+    assert not DUT.request_do_calculate_plan(_test_id)
+    assert not DUT.request_do_calculate(_test_id)
+    assert not DUT.request_do_update_all()
+    assert DUT.request_do_calculate(100)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python -O
+# -*- coding: utf-8 -*-
+#
+#       ramstk.tests.modules.test_ramstkattributestore.py is part of The RAMSTK
+#       Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing the RAMSTKAttributeStore class. """
+
+from collections import Mapping
+
+import numpy as np
+import pytest
+
+from ramstk.dao import RAMSTKHardware
+from ramstk.modules import (RAMSTKAttributes, RAMSTKAttributeRows,
+                            RAMSTKAttributeStore)
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
+
+RECORDS = [
+    (1, {'hardware_id': 1, 'quantity': 1, 'cost': 1.5, 'name': u'Board'}),
+    (2, {'hardware_id': 2, 'quantity': 2, 'cost': 2, 'name': u'Resistor'}),
+    (3, {'hardware_id': 3, 'quantity': 4, 'cost': 0.5, 'name': u'Resistor'}),
+]
+
+
+def _make_store():
+    """Build a RAMSTKAttributeStore() holding a copy of the RECORDS."""
+    DUT = RAMSTKAttributeStore(tables=(RAMSTKHardware, ))
+    DUT.do_load((_record_id, _attributes.copy())
+                for _record_id, _attributes in RECORDS)
+
+    return DUT
+
+
+@pytest.mark.unit
+def test_do_load():
+    """ do_load() should hold each record's attributes in typed columns. """
+    DUT = _make_store()
+
+    assert len(DUT) == 3
+    assert 2 in DUT
+    assert DUT.get_column('quantity').dtype == np.int64
+    assert DUT.get_column('cost').dtype == np.float64
+    for _record_id, _attributes in RECORDS:
+        assert DUT.get_row(_record_id) == _attributes
+    assert DUT.get_value(2, 'cost') == 2.0
+    assert isinstance(DUT.get_value(2, 'cost'), float)
+    assert isinstance(DUT.get_value(2, 'quantity'), int)
+    assert DUT.get_value(2, 'name') is DUT.get_value(3, 'name')
+
+
+@pytest.mark.unit
+def test_do_load_missing_attribute():
+    """ do_load() should leave out the attributes a record does not have. """
+    DUT = RAMSTKAttributeStore()
+    DUT.do_load([(1, {'hardware_id': 1}), (2, {'hardware_id': 2, 'x': 1.0})])
+
+    assert DUT.get_row(1) == {'hardware_id': 1}
+    assert DUT.get_row(2) == {'hardware_id': 2, 'x': 1.0}
+    with pytest.raises(KeyError):
+        DUT.get_value(1, 'x')
+
+
+@pytest.mark.unit
+def test_get_row():
+    """ get_row() should return a RAMSTKAttributes view that reads and writes the store. """
+    DUT = _make_store()
+
+    _row = DUT.get_row(1)
+    _row['cost'] = 3.0
+    _row.update({'quantity': 5, 'name': u'Card'})
+
+    assert isinstance(_row, RAMSTKAttributes)
+    assert isinstance(_row, Mapping)
+    assert DUT.get_value(1, 'cost') == 3.0
+    assert DUT.get_row(1) == {
+        'hardware_id': 1,
+        'quantity': 5,
+        'cost': 3.0,
+        'name': u'Card'
+    }
+    assert _row.copy() == dict(_row)
+    assert sorted(_row.keys()) == ['cost', 'hardware_id', 'name', 'quantity']
+
+    with pytest.raises(KeyError):
+        DUT.get_row(10)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("key, value", [
+    ('quantity', 2.5),
+    ('quantity', None),
+    ('cost', None),
+    ('cost', u'free'),
+    ('new', 1),
+])
+def test_set_value_promote(key, value):
+    """ set_value() should keep any value the column can not hold. """
+    DUT = _make_store()
+
+    DUT.set_value(2, key, value)
+
+    assert DUT.get_value(2, key) == value
+    assert DUT.get_value(3, 'quantity') == 4
+    assert DUT.get_value(3, 'cost') == 0.5
+
+
+@pytest.mark.unit
+def test_do_insert():
+    """ do_insert() should add a record and return its RAMSTKAttributes view. """
+    DUT = _make_store()
+
+    for _record_id in range(4, 40):
+        _row = DUT.do_insert(_record_id, {
+            'hardware_id': _record_id,
+            'quantity': 1,
+            'cost': 1.0
+        })
+
+    assert isinstance(_row, RAMSTKAttributes)
+    assert len(DUT) == 39
+    assert DUT.get_row(39) == {'hardware_id': 39, 'quantity': 1, 'cost': 1.0}
+    assert DUT.get_row(3) == RECORDS[2][1]
+
+
+@pytest.mark.unit
+def test_do_delete():
+    """ do_delete() should remove a record and keep the others as more records are removed. """
+    DUT = _make_store()
+    for _record_id in range(4, 200):
+        DUT.do_insert(_record_id, {'hardware_id': _record_id, 'cost': 1.0})
+    _row = DUT.get_row(3)
+
+    DUT.do_delete(2)
+    for _record_id in range(4, 200):
+        DUT.do_delete(_record_id)
+
+    assert len(DUT) == 2
+    assert 2 not in DUT
+    assert DUT._capacity < 200
+    assert _row == RECORDS[2][1]
+    assert DUT.get_column('hardware_id').tolist() == [1, 3]
+
+
+@pytest.mark.unit
+def test_get_set_column():
+    """ get_column() and set_column() should read and write one attribute of several records. """
+    DUT = _make_store()
+
+    assert DUT.get_column('cost', [3, 1]).tolist() == [0.5, 1.5]
+
+    DUT.set_column('cost', np.array([5.0, 6.0]), [3, 1])
+    DUT.set_column('quantity', np.array([0.5, 1.0, 2.0]))
+
+    assert DUT.get_column('cost').tolist() == [6.0, 2.0, 5.0]
+    assert DUT.get_column('quantity').tolist() == [0.5, 1.0, 2.0]
+    assert DUT.get_column('name').tolist() == [
+        u'Board', u'Resistor', u'Resistor'
+    ]
+
+
+@pytest.mark.unit
+def test_do_select_rows():
+    """ do_select_rows() should return copies of the records that do not change the store. """
+    DUT = _make_store()
+
+    _rows = DUT.do_select_rows([3, 1])
+    _rows[0]['name'] = u'Capacitor'
+    _rows.set_column('cost', _rows.get_column('cost') * 2.0)
+
+    assert isinstance(_rows, RAMSTKAttributeRows)
+    assert len(_rows) == 2
+    assert [_row['hardware_id'] for _row in _rows] == [3, 1]
+    assert _rows.get_column('cost').tolist() == [1.0, 3.0]
+    assert _rows[0]['name'] == u'Capacitor'
+    assert DUT.get_row(3) == RECORDS[2][1]
+    assert DUT.get_row(1) == RECORDS[0][1]
+
+
+@pytest.mark.unit
+def test_do_set_loader():
+    """ do_set_loader() should load the attributes of a record the first time one is read or written. """
+    DUT = _make_store()
+    _lst_loaded = []
+
+    def _loader(record_ids):
+        _lst_loaded.append(sorted(record_ids))
+        for _record_id in record_ids:
+            DUT.set_items(_record_id, [('cost', 10.0 * _record_id),
+                                       ('part_number', u'PN')])
+
+    DUT.do_set_loader(['cost', 'part_number'], _loader)
+
+    assert DUT.get_value(1, 'quantity') == 1
+    assert _lst_loaded == []
+    assert DUT.get_value(1, 'cost') == 10.0
+    assert DUT.get_row(1)['part_number'] == u'PN'
+    assert _lst_loaded == [[1]]
+
+    DUT.set_value(2, 'cost', 3.0)
+    DUT.do_fetch()
+
+    assert _lst_loaded == [[1], [2], [3]]
+    assert DUT.get_column('cost').tolist() == [10.0, 3.0, 30.0]
+    assert DUT.get_column('cost').dtype == np.float64
@@ -0,0 +1,292 @@
+#!/usr/bin/env python -O
+# -*- coding: utf-8 -*-
+#
+#       ramstk.tests.modules.test_ramstktree.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing the RAMSTKTree class. """
+
+import pytest
+
+from treelib import Tree
+from treelib.tree import (DuplicatedNodeIdError, LinkPastRootNodeError,
+                          LoopError, MultipleRootError, NodeIDAbsentError)
+
+from ramstk.modules import RAMSTKNode, RAMSTKTree
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
+
+
+def _make_trees():
+    """Build the same tree as a RAMSTKTree() and a treelib Tree()."""
+    _trees = (RAMSTKTree(), Tree())
+    for _tree in _trees:
+        _tree.create_node(tag='Root', identifier=0, parent=None)
+        _tree.create_node(tag='B', identifier=1, parent=0, data='one')
+        _tree.create_node(tag='A', identifier=2, parent=0, data='two')
+        _tree.create_node(tag='C', identifier=3, parent=1, data='three')
+        _tree.create_node(tag='D', identifier='1.4', parent=1, data='four')
+        _tree.create_node(tag='E', identifier=5, parent=3, data='five')
+
+    return _trees
+
+
+@pytest.mark.unit
+def test_create_tree():
+    """ __init__() should return an empty RAMSTKTree that is a treelib Tree. """
+    DUT = RAMSTKTree()
+
+    assert isinstance(DUT, RAMSTKTree)
+    assert isinstance(DUT, Tree)
+    assert DUT.root is None
+    assert DUT.size() == 0
+
+
+@pytest.mark.unit
+def test_create_node():
+    """ create_node() should return a RAMSTKNode with the same attributes a treelib Node would have. """
+    DUT, _treelib = _make_trees()
+
+    for _nid in _treelib.nodes:
+        _node = DUT.get_node(_nid)
+        assert isinstance(_node, RAMSTKNode)
+        assert _node.identifier == _treelib[_nid].identifier
+        assert _node.tag == _treelib[_nid].tag
+        assert _node.data == _treelib[_nid].data
+        assert _node.bpointer == _treelib[_nid].bpointer
+        assert _node.fpointer == _treelib[_nid].fpointer
+        assert _node.is_leaf() == _treelib[_nid].is_leaf()
+        assert _node.is_root() == _treelib[_nid].is_root()
+    assert DUT.root == 0
+    assert len(DUT) == len(_treelib)
+
+
+@pytest.mark.unit
+def test_create_node_default_tag():
+    """ create_node() should use the Node ID as the tag when no tag is passed. """
+    DUT = RAMSTKTree()
+
+    assert DUT.create_node(identifier=0).tag == 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("identifier, parent, error", [
+    (1, 0, DuplicatedNodeIdError),
+    (10, None, MultipleRootError),
+    (10, 100, NodeIDAbsentError),
+])
+def test_create_node_errors(identifier, parent, error):
+    """ create_node() should raise the same errors as treelib. """
+    DUT, _treelib = _make_trees()
+
+    with pytest.raises(error):
+        _treelib.create_node(identifier=identifier, parent=parent)
+    with pytest.raises(error):
+        DUT.create_node(identifier=identifier, parent=parent)
+
+
+@pytest.mark.unit
+def test_children_parent():
+    """ children() and parent() should return the same nodes as treelib. """
+    DUT, _treelib = _make_trees()
+
+    for _nid in _treelib.nodes:
+        assert ([_node.identifier for _node in DUT.children(_nid)] ==
+                [_node.identifier for _node in _treelib.children(_nid)])
+        assert DUT.is_branch(_nid) == _treelib.is_branch(_nid)
+    assert DUT.parent(0) is None
+    assert DUT.parent(5).identifier == 3
+
+    with pytest.raises(NodeIDAbsentError):
+        DUT.children(100)
+    with pytest.raises(NodeIDAbsentError):
+        DUT.parent(100)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("sorting", [True, False])
+def test_expand_tree(sorting):
+    """ expand_tree() should visit the nodes in the same order as treelib. """
+    DUT, _treelib = _make_trees()
+
+    assert (list(DUT.expand_tree(sorting=sorting)) == list(
+        _treelib.expand_tree(sorting=sorting)))
+    assert (list(DUT.expand_tree(1, sorting=sorting)) == list(
+        _treelib.expand_tree(1, sorting=sorting)))
+
+
+@pytest.mark.unit
+def test_inherited_methods():
+    """ The read-only treelib methods should work on a RAMSTKTree. """
+    DUT, _treelib = _make_trees()
+
+    assert DUT.depth() == _treelib.depth()
+    assert DUT.level(5) == _treelib.level(5)
+    assert (sorted(_node.identifier for _node in DUT.leaves()) == sorted(
+        _node.identifier for _node in _treelib.leaves()))
+    assert list(DUT.rsearch(5)) == list(_treelib.rsearch(5))
+    assert DUT.to_dict() == _treelib.to_dict()
+
+
+@pytest.mark.unit
+def test_remove_node():
+    """ remove_node() should remove the node and its successors. """
+    DUT = _make_trees()[0]
+
+    assert DUT.remove_node(1) == 4
+    assert sorted(DUT.nodes.keys()) == [0, 2]
+    assert DUT.is_branch(0) == [2]
+    assert DUT.remove_node(None) == 0
+
+    with pytest.raises(NodeIDAbsentError):
+        DUT.remove_node(1)
+
+
+@pytest.mark.unit
+def test_remove_node_compact():
+    """ remove_node() should reclaim the space of removed nodes as the tree is emptied and reloaded. """
+    DUT = RAMSTKTree()
+    DUT.create_node(tag='Root', identifier=0)
+
+    for _reload in range(5):
+        for _nid in range(1, 201):
+            DUT.create_node(identifier=_nid, parent=0 if _nid < 10 else 1)
+        for _node in DUT.children(0):
+            DUT.remove_node(_node.identifier)
+
+    DUT.create_node(identifier=1, parent=0)
+    DUT.create_node(identifier=2, parent=1)
+
+    assert len(DUT._lst_node) < 200
+    assert DUT.parent(2).identifier == 1
+    assert DUT.is_branch(0) == [1]
+
+
+@pytest.mark.unit
+def test_move_node():
+    """ move_node() should make the source node the last child of the destination node. """
+    DUT = _make_trees()[0]
+
+    DUT.move_node(3, 2)
+
+    assert DUT.is_branch(1) == ['1.4']
+    assert DUT.is_branch(2) == [3]
+    assert DUT.parent(3).identifier == 2
+    assert list(DUT.expand_tree(2, sorting=False)) == [2, 3, 5]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('source, destination', [(1, 5), (1, 1), (0, 2)])
+def test_move_node_loop(source, destination):
+    """ move_node() should raise a LoopError and leave the tree unchanged when the destination is the source or one of its successors. """
+    DUT = _make_trees()[0]
+
+    with pytest.raises(LoopError):
+        DUT.move_node(source, destination)
+
+    assert DUT.to_json(with_data=True) == _make_trees()[1].to_json(
+        with_data=True)
+
+
+@pytest.mark.unit
+def test_is_ancestor():
+    """ is_ancestor() should return the same result as treelib. """
+    _ramstk_tree, _treelib_tree = _make_trees()
+
+    for _ancestor in [0, 1, 2, 3, '1.4', 5]:
+        for _grandchild in [0, 1, 2, 3, '1.4', 5]:
+            assert (_ramstk_tree.is_ancestor(_ancestor, _grandchild) ==
+                    _treelib_tree.is_ancestor(_ancestor, _grandchild))
+
+
+@pytest.mark.unit
+def test_link_past_node():
+    """ link_past_node() should give the children of the node to its parent as treelib does. """
+    _ramstk_tree, _treelib_tree = _make_trees()
+    _ramstk_tree.link_past_node(1)
+    _treelib_tree.link_past_node(1)
+
+    assert _ramstk_tree.get_node(1) is None
+    assert _ramstk_tree.is_branch(0) == [2, 3, '1.4']
+    assert _ramstk_tree.parent(3).identifier == 0
+    assert _ramstk_tree.to_json(with_data=True) == _treelib_tree.to_json(
+        with_data=True)
+
+    with pytest.raises(LinkPastRootNodeError):
+        _ramstk_tree.link_past_node(0)
+    with pytest.raises(NodeIDAbsentError):
+        _ramstk_tree.link_past_node(1)
+
+
+@pytest.mark.unit
+def test_paste():
+    """ paste() should add the nodes of another tree under the node. """
+    for _new_tree in _make_trees():
+        DUT = RAMSTKTree()
+        DUT.create_node(tag='Top', identifier='top', parent=None)
+        DUT.create_node(tag='Z', identifier='z', parent='top')
+
+        DUT.paste('z', _new_tree, deep=True)
+
+        assert DUT.is_branch('z') == [0]
+        assert DUT.parent(0).identifier == 'z'
+        assert list(DUT.expand_tree(0, sorting=False)) == [
+            0, 1, 3, 5, '1.4', 2
+        ]
+        assert DUT.get_node(5).data == 'five'
+        assert DUT.get_node(5) is not _new_tree.get_node(5)
+
+        with pytest.raises(ValueError):
+            DUT.paste('top', _new_tree)
+        with pytest.raises(NodeIDAbsentError):
+            DUT.paste('missing', RAMSTKTree())
+
+
+@pytest.mark.unit
+def test_remove_subtree():
+    """ remove_subtree() should remove the subtree and return it as a new tree. """
+    _ramstk_tree, _treelib_tree = _make_trees()
+
+    _subtree = _ramstk_tree.remove_subtree(1)
+    _treelib_tree.remove_subtree(1)
+
+    assert isinstance(_subtree, RAMSTKTree)
+    assert _subtree.root == 1
+    assert sorted(_subtree.nodes.keys()) == [1, 3, 5, '1.4']
+    assert _ramstk_tree.is_branch(0) == [2]
+    assert _ramstk_tree.to_json(with_data=True) == _treelib_tree.to_json(
+        with_data=True)
+    assert _ramstk_tree.remove_subtree(None).size() == 0
+
+
+@pytest.mark.unit
+def test_subtree():
+    """ subtree() should return a new RAMSTKTree sharing the data of the nodes. """
+    DUT = _make_trees()[0]
+
+    _subtree = DUT.subtree(1)
+
+    assert isinstance(_subtree, RAMSTKTree)
+    assert _subtree.root == 1
+    assert sorted(_subtree.nodes.keys()) == [1, 3, 5, '1.4']
+    assert _subtree.get_node(5).data == 'five'
+    assert _subtree.parent(1) is None
+    assert DUT.parent(1).identifier == 0
+
+
+@pytest.mark.unit
+def test_update_node():
+    """ update_node() should change the identifier, tag, or data of the node. """
+    DUT = _make_trees()[0]
+
+    DUT.update_node(3, identifier=30, tag='F', data='thirty')
+
+    assert DUT.get_node(3) is None
+    assert DUT.get_node(30).tag == 'F'
+    assert DUT.get_node(30).data == 'thirty'
+    assert DUT.is_branch(1) == [30, '1.4']
+    assert DUT.parent(5).identifier == 30
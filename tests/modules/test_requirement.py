@@ -216,6 +216,29 @@ def test_do_update_all(test_dao):
                     "table.")
 
 
+@pytest.mark.integration
+def test_do_update_all_modified(test_dao):
+    """ do_update_all() should save only the records changed since they were last saved. """
+    DUT = dtmRequirement(test_dao)
+    DUT.do_select_all(revision_id=1)
+
+    assert DUT.do_select_modified() == []
+
+    _requirement = DUT.do_select(1)
+    _requirement.description = 'Dirty requirement'
+
+    assert DUT.do_select_modified() == [_requirement]
+
+    _error_code, _msg = DUT.do_update_all()
+
+    assert _error_code == 0
+    assert DUT.do_select_modified() == []
+
+    DUT.do_select_all(revision_id=1)
+
+    assert DUT.do_select(1).description == 'Dirty requirement'
+
+
 @pytest.mark.integration
 def test_data_controller_create(test_dao, test_configuration):
     """ __init__ should return a Requirement Data Controller. """
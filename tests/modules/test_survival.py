@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.tests.modules.test_survival.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing Survival module algorithms and models."""
+
+import numpy as np
+from treelib import Tree
+
+import pytest
+
+from ramstk.modules.survival import dtmSurvival, dtcSurvival
+from ramstk.dao import DAO, RAMSTKSurvival, RAMSTKSurvivalData
+from ramstk.statistics.Distributions import EXPONENTIAL, WEIBULL
+from ramstk.statistics.NonParametric import KAPLAN_MEIER, MCF
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
+
+# Cancerous mice data as (right, status, quantity).  Data is from Example 7.3
+# in Lee and Wang.
+MICE = [(4.0, 1, 1), (5.0, 1, 1), (8.0, 1, 1), (9.0, 1, 1), (10.0, 1, 1),
+        (10.0, 2, 5)]
+
+
+def _do_insert_survival(test_dao, records):
+    """Add a Survival analysis with the records to the test database."""
+    DUT = dtmSurvival(test_dao)
+    DUT.do_select_all(revision_id=1)
+    DUT.do_insert(revision_id=1)
+    _survival_id = DUT.last_id
+
+    _lst_records = []
+    for _right, _status, _quantity in records:
+        _record = RAMSTKSurvivalData()
+        _record.survival_id = _survival_id
+        _record.right_interval = _right
+        _record.status_id = _status
+        _record.quantity = _quantity
+        _lst_records.append(_record)
+    _session = test_dao.db_get_session(
+        autoflush=True, autocommit=False, expire_on_commit=False)
+    test_dao.db_add_many(_lst_records, _session)
+    test_dao.db_close_session(_session)
+
+    return DUT, _survival_id
+
+
+@pytest.mark.integration
+def test_create_data_model(test_dao):
+    """ __init__ should return instance of a Survival data model. """
+    DUT = dtmSurvival(test_dao)
+
+    assert isinstance(DUT, dtmSurvival)
+    assert isinstance(DUT.tree, Tree)
+    assert isinstance(DUT.dao, DAO)
+
+
+@pytest.mark.integration
+def test_do_insert(test_dao):
+    """ do_insert() should add a Survival analysis to the tree. """
+    DUT = dtmSurvival(test_dao)
+    DUT.do_select_all(revision_id=1)
+
+    _error_code, _msg = DUT.do_insert(revision_id=1)
+
+    assert _error_code == 0
+    assert isinstance(DUT.do_select(DUT.last_id), RAMSTKSurvival)
+    assert isinstance(
+        DUT.do_select_all(revision_id=1).get_node(DUT.last_id).data,
+        RAMSTKSurvival)
+
+
+@pytest.mark.integration
+def test_do_select_data(test_dao):
+    """ do_select_data() should stream the records of a Survival analysis in chunks. """
+    DUT, _survival_id = _do_insert_survival(test_dao, MICE)
+
+    _lst_chunks = list(DUT.do_select_data(_survival_id, chunk_size=4))
+
+    assert [len(_chunk[0]) for _chunk in _lst_chunks] == [4, 2]
+    assert np.concatenate([_chunk[1] for _chunk in _lst_chunks
+                           ]).tolist() == [4.0, 5.0, 8.0, 9.0, 10.0, 10.0]
+    assert _lst_chunks[1][3].tolist() == [1.0, 5.0]
+
+
+@pytest.mark.integration
+def test_do_select_data_ordered(test_dao):
+    """ do_select_data() should stream the records in time order when requested. """
+    DUT, _survival_id = _do_insert_survival(test_dao, MICE[::-1])
+
+    _lst_chunks = list(
+        DUT.do_select_data(_survival_id, chunk_size=4, ordered=True))
+
+    assert np.concatenate([_chunk[1] for _chunk in _lst_chunks
+                           ]).tolist() == [4.0, 5.0, 8.0, 9.0, 10.0, 10.0]
+
+
+@pytest.mark.integration
+def test_do_calculate(test_dao):
+    """ do_calculate() should fit the distribution and set the parameters, bounds, and goodness of fit. """
+    DUT, _survival_id = _do_insert_survival(test_dao, MICE)
+    _survival = DUT.do_select(_survival_id)
+    _survival.distribution_id = EXPONENTIAL
+    _survival.confidence = 90.0
+
+    _error_code, _msg = DUT.do_calculate(_survival_id)
+
+    assert _error_code == 0
+    assert _survival.n_failures == 5
+    assert _survival.n_suspension == 5
+    assert _survival.scale == pytest.approx(5.0 / 86.0)
+    assert _survival.scale_ll < _survival.scale < _survival.scale_ul
+    assert _survival.variance_1 == pytest.approx(_survival.scale**2.0 / 5.0)
+    assert _survival.mle < 0.0
+    assert _survival.aic == pytest.approx(-2.0 * _survival.mle + 2.0)
+
+    _survival.distribution_id = WEIBULL
+
+    assert DUT.do_calculate(_survival_id)[0] == 0
+    assert _survival.shape_ll < _survival.shape < _survival.shape_ul
+    assert DUT.do_update(_survival_id)[0] == 0
+
+
+@pytest.mark.integration
+def test_do_calculate_nonparametric(test_dao):
+    """ do_calculate() should estimate the Kaplan-Meier and MCF curves of the records. """
+    DUT, _survival_id = _do_insert_survival(test_dao, MICE)
+    DUT.chunk_size = 4
+    _survival = DUT.do_select(_survival_id)
+    _survival.distribution_id = KAPLAN_MEIER
+
+    _error_code, _msg = DUT.do_calculate(_survival_id)
+
+    assert _error_code == 0
+    assert _survival.n_failures == 5
+    assert _survival.n_suspension == 5
+    _curve = DUT.dic_curves[_survival_id]
+    assert _curve[:, 0].tolist() == [4.0, 5.0, 8.0, 9.0, 10.0]
+    assert _curve[:, 1].tolist() == [10.0, 9.0, 8.0, 7.0, 6.0]
+    assert _curve[-1, 3] == pytest.approx(0.5)
+
+    _survival.distribution_id = MCF
+
+    assert DUT.do_calculate(_survival_id)[0] == 0
+    assert DUT.dic_curves[_survival_id][-1, 3] == pytest.approx(1.0)
+
+
+@pytest.mark.integration
+def test_do_calculate_errors(test_dao):
+    """ do_calculate() should return a non-zero error code when the analysis can not be fit. """
+    DUT, _survival_id = _do_insert_survival(test_dao, [])
+
+    assert DUT.do_calculate(100)[0] == 2105
+    assert DUT.do_calculate(_survival_id)[0] == 2105
+
+    DUT, _survival_id = _do_insert_survival(test_dao, MICE)
+
+    assert DUT.do_calculate(_survival_id)[0] == 2105
+
+
+@pytest.mark.integration
+def test_request_do_calculate(test_dao, test_configuration):
+    """ request_do_calculate() should return False on success. """
+    _survival_id = _do_insert_survival(test_dao, MICE)[1]
+    DUT = dtcSurvival(test_dao, test_configuration, test=True)
+    DUT.request_do_select_all(revision_id=1)
+    DUT.request_do_select(_survival_id).distribution_id = WEIBULL
+
+    assert not DUT.request_do_calculate(_survival_id)
+    assert not DUT.request_do_update_all()
+    assert DUT.request_do_calculate(100)
@@ -11,6 +11,7 @@ from treelib import Tree
 
 import pytest
 
+from ramstk.Utilities import OutOfRangeError
 from ramstk.dao import (RAMSTKMission, RAMSTKMissionPhase, RAMSTKEnvironment)
 from ramstk.modules.usage import (dtmEnvironment, dtmMission, dtmMissionPhase,
                                dtmUsageProfile, dtcUsageProfile)
@@ -52,8 +53,66 @@ def test_do_select_all(test_dao):
     assert isinstance(_tree, Tree)
     assert _tree.get_node(0).tag == 'Usage Profiles'
     assert isinstance(_tree.get_node(1).data, RAMSTKMission)
-    assert isinstance(_tree.get_node(11).data, RAMSTKMissionPhase)
-    assert isinstance(_tree.get_node(111).data, RAMSTKEnvironment)
+    assert isinstance(
+        _tree.get_node(DUT.do_make_node_id(1, 1)).data, RAMSTKMissionPhase)
+    assert isinstance(
+        _tree.get_node(DUT.do_make_node_id(1, 1, 1)).data, RAMSTKEnvironment)
+
+
+@pytest.mark.unit
+def test_do_make_node_id():
+    """ do_make_node_id() should return a unique Node ID for each Mission, Mission Phase, and Environment. """
+    assert dtmUsageProfile.do_make_node_id(1) == 1
+    assert (dtmUsageProfile.do_make_node_id(1, 12) !=
+            dtmUsageProfile.do_make_node_id(11, 2))
+    assert (dtmUsageProfile.do_make_node_id(1, 1, 12) !=
+            dtmUsageProfile.do_make_node_id(1, 11, 2))
+    assert (dtmUsageProfile.do_make_node_id(1, 2) !=
+            dtmUsageProfile.do_make_node_id(2, 1))
+
+
+@pytest.mark.unit
+def test_do_make_node_id_out_of_range():
+    """ do_make_node_id() should raise an OutOfRangeError when an ID doesn't fit in its field of the Node ID. """
+    assert dtmUsageProfile.do_make_node_id(2**21 - 1) == 2**21 - 1
+
+    with pytest.raises(OutOfRangeError):
+        dtmUsageProfile.do_make_node_id(2**21)
+    with pytest.raises(OutOfRangeError):
+        dtmUsageProfile.do_make_node_id(1, 2**21)
+    with pytest.raises(OutOfRangeError):
+        dtmUsageProfile.do_make_node_id(1, 1, 2**21)
+
+
+def _do_add_mission(dao, mission_id):
+    """Add a Mission with the given ID to the RAMSTK Program test database."""
+    _mission = RAMSTKMission()
+    _mission.revision_id = 1
+    _mission.mission_id = mission_id
+    dao.session.add(_mission)
+    dao.session.commit()
+
+    return _mission
+
+
+@pytest.mark.integration
+def test_do_select_all_out_of_range(test_dao):
+    """ do_select_all() should leave out a Mission whose ID doesn't fit in its field of the Node ID and note it in lst_skipped. """
+    _mission = _do_add_mission(test_dao, 2**21)
+    DUT = dtmUsageProfile(test_dao)
+
+    try:
+        _tree = DUT.do_select_all(revision_id=1)
+    finally:
+        test_dao.session.delete(_mission)
+        test_dao.session.commit()
+
+    assert isinstance(_tree.get_node(1).data, RAMSTKMission)
+    assert _tree.get_node(2**21) is None
+    assert DUT.lst_skipped == [
+        'RAMSTK ERROR: ID 2097152 is outside the range 0 - 2097151 that '
+        'can be packed into a Node ID.'
+    ]
 
 
 @pytest.mark.integration
@@ -105,7 +164,9 @@ def test_do_insert_phase(test_dao):
     assert _error_code == 0
     assert _msg == ("RAMSTK SUCCESS: Adding one or more items to the RAMSTK Program "
                     "database.")
-    assert isinstance(DUT.do_select(12), RAMSTKMissionPhase)
+    _phase = DUT.tree.children(1)[-1]
+    assert isinstance(_phase.data, RAMSTKMissionPhase)
+    assert _phase.identifier == DUT.do_make_node_id(1, _phase.data.phase_id)
 
 
 @pytest.mark.integration
@@ -115,12 +176,16 @@ def test_do_insert_environment(test_dao):
     DUT.do_select_all(revision_id=1)
 
     _error_code, _msg = DUT.do_insert(
-        entity_id=2, parent_id=11, level='environment')
+        entity_id=2, parent_id=DUT.do_make_node_id(2, 2),
+        level='environment')
 
     assert _error_code == 0
     assert _msg == ("RAMSTK SUCCESS: Adding one or more items to the RAMSTK Program "
                     "database.")
-    assert isinstance(DUT.tree.get_node(112).data, RAMSTKEnvironment)
+    _environment = DUT.tree.children(DUT.do_make_node_id(2, 2))[-1]
+    assert isinstance(_environment.data, RAMSTKEnvironment)
+    assert _environment.identifier == DUT.do_make_node_id(
+        2, 2, _environment.data.environment_id)
 
 
 @pytest.mark.integration
@@ -139,13 +204,38 @@ def test_do_insert_non_existent_type(test_dao):
                     "environment.")
 
 
+@pytest.mark.integration
+def test_do_insert_out_of_range(test_dao):
+    """ do_insert() should return a 2105 error code and not save the Mission when its ID doesn't fit in its field of the Node ID. """
+    _mission = _do_add_mission(test_dao, 2**21 - 1)
+    DUT = dtmUsageProfile(test_dao)
+    DUT.do_select_all(revision_id=1)
+
+    try:
+        _error_code, _msg = DUT.do_insert(
+            entity_id=1, parent_id=0, level='mission')
+        _n_missions = test_dao.session.query(RAMSTKMission).filter(
+            RAMSTKMission.mission_id == 2**21).count()
+        _tree = DUT.do_select_all(revision_id=1)
+    finally:
+        test_dao.session.delete(_mission)
+        test_dao.session.commit()
+
+    assert _error_code == 2105
+    assert _msg == ('RAMSTK ERROR: ID 2097152 is outside the range 0 - '
+                    '2097151 that can be packed into a Node ID.')
+    assert _n_missions == 0
+    assert _tree.get_node(2**21 - 1).data.mission_id == 2**21 - 1
+    assert DUT.lst_skipped == []
+
+
 @pytest.mark.integration
 def test_do_delete_environment(test_dao):
     """ do_delete() should return a zero error code on success when removing an Environment. """
     DUT = dtmUsageProfile(test_dao)
     DUT.do_select_all(revision_id=1)
 
-    _error_code, _msg = DUT.do_delete(223)
+    _error_code, _msg = DUT.do_delete(DUT.do_make_node_id(2, 2, 3))
 
     assert _error_code == 0
     assert _msg == ("RAMSTK SUCCESS: Deleting an item from the RAMSTK Program "
@@ -220,6 +310,22 @@ def test_request_do_select_all(test_dao, test_configuration):
     assert isinstance(DUT.request_do_select_all(revision_id=1), Tree)
 
 
+@pytest.mark.integration
+def test_request_do_select_all_out_of_range(test_dao, test_configuration):
+    """ request_do_select_all() should return the Usage Profile without a Mission whose ID doesn't fit in its field of the Node ID. """
+    _mission = _do_add_mission(test_dao, 2**21)
+    DUT = dtcUsageProfile(test_dao, test_configuration, test=True)
+
+    try:
+        _tree = DUT.request_do_select_all(revision_id=1)
+    finally:
+        test_dao.session.delete(_mission)
+        test_dao.session.commit()
+
+    assert isinstance(_tree, Tree)
+    assert _tree.get_node(2**21) is None
+
+
 @pytest.mark.integration
 def test_request_do_insert_mission(test_dao, test_configuration):
     """ request_do_insert() should return False on success. """
@@ -244,7 +350,7 @@ def test_request_do_delete_non_existent_id(test_dao, test_configuration):
     DUT = dtcUsageProfile(test_dao, test_configuration, test=True)
     DUT.request_do_select_all(revision_id=1)
 
-    assert DUT.request_do_delete(222)
+    assert DUT.request_do_delete(dtmUsageProfile.do_make_node_id(2, 2, 2))
 
 
 @pytest.mark.integration
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+#
+#       tests.statistics.test_bounds.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing statistical bound algorithms and models."""
+
+import numpy as np
+import pytest
+
+from ramstk.statistics import Bounds
+from ramstk.statistics.Bounds import (
+    calculate_beta_bounds, calculate_crow_bounds, calculate_fisher_bounds,
+    calculate_nhpp_mean_variance, calculate_variance_covariance,
+    get_chi2_quantile, get_confidence, get_norm_quantile)
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("alpha, confidence", [(0.9, 0.9), (90.0, 0.9),
+                                               (1.0, 1.0)])
+def test_get_confidence(alpha, confidence):
+    """ get_confidence() should return the confidence level as a decimal. """
+    assert get_confidence(alpha) == pytest.approx(confidence)
+    assert get_confidence(np.array([alpha, 0.5])).tolist() == pytest.approx(
+        [confidence, 0.5])
+
+
+@pytest.mark.unit
+def test_get_quantiles_cached():
+    """ get_norm_quantile() and get_chi2_quantile() should calculate each quantile once. """
+    assert get_norm_quantile(0.975) == pytest.approx(1.959964)
+    assert (0.975, ) in Bounds._NORM_QUANTILES
+
+    _quantiles = get_chi2_quantile(0.05, np.array([44.0, 42.0, 44.0]))
+
+    assert isinstance(_quantiles, np.ndarray)
+    assert _quantiles[0] == _quantiles[2]
+    assert (0.05, 44.0) in Bounds._CHI2_QUANTILES
+    assert (0.05, 42.0) in Bounds._CHI2_QUANTILES
+    assert get_chi2_quantile(0.05, 42.0) == _quantiles[1]
+
+
+@pytest.mark.unit
+def test_calculate_variance_covariance():
+    """ calculate_variance_covariance() should return the 2x2 variance-covariance matrix. """
+    _var_covar = calculate_variance_covariance(22, 620.0, 0.4239, 0.6142)
+
+    assert _var_covar[0][0] == pytest.approx(2.17419692E-07)
+    assert _var_covar[0][1] == pytest.approx(2.99715662E-03)
+    assert _var_covar[1][1] == pytest.approx(-1.09983183E-03)
+    assert _var_covar[0][1] == pytest.approx(_var_covar[1][0])
+
+
+@pytest.mark.unit
+def test_calculate_variance_covariance_array():
+    """ calculate_variance_covariance() should return a stack of matrices when passed arrays. """
+    _alpha = np.array([0.4239, 0.0, 0.4239])
+    _beta = np.array([0.6142, 0.6142, 0.0])
+
+    _var_covar = calculate_variance_covariance(22, 620.0, _alpha, _beta)
+
+    assert _var_covar.shape == (3, 2, 2)
+    for _idx in range(3):
+        assert np.allclose(
+            _var_covar[_idx],
+            calculate_variance_covariance(22, 620.0, _alpha[_idx],
+                                          _beta[_idx]))
+    assert _var_covar[1][0][0] == pytest.approx(-0.0005236216, abs=1E-7)
+
+
+@pytest.mark.unit
+def test_calculate_variance_covariance_inverse():
+    """ calculate_variance_covariance() should give the same matrices as inverting the Fisher matrix. """
+    _alpha = np.linspace(0.05, 2.0, 40)[:, None]
+    _beta = np.linspace(0.2, 1.5, 40)[None, :]
+
+    _var_covar = calculate_variance_covariance(22, 620.0, _alpha, _beta)
+
+    _del_beta_alpha = -620.0**_beta * np.log(620.0)
+    _fisher = np.empty(_var_covar.shape)
+    _fisher[..., 0, 0] = 22.0 / _alpha**2.0
+    _fisher[..., 0, 1] = -_del_beta_alpha
+    _fisher[..., 1, 0] = -_del_beta_alpha
+    _fisher[..., 1, 1] = 22.0 / (
+        _beta**2.0 - _alpha * 620.0**_beta * np.log(620.0)**2.0)
+
+    np.testing.assert_allclose(_var_covar, np.linalg.inv(_fisher), rtol=1E-9)
+
+
+@pytest.mark.unit
+def test_calculate_variance_covariance_singular():
+    """ calculate_variance_covariance() should return nan for a singular Fisher matrix without affecting the others. """
+    _var_covar = calculate_variance_covariance([22, 0], [620.0, 1.0], 0.4239,
+                                               0.6142)
+
+    assert np.isnan(_var_covar[1]).all()
+    np.testing.assert_array_equal(
+        _var_covar[0], calculate_variance_covariance(22, 620.0, 0.4239,
+                                                     0.6142))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("metric, variance", [(1, 92.3410769),
+                                              (2, 233.4249776)])
+def test_calculate_nhpp_mean_variance(metric, variance):
+    """ calculate_nhpp_mean_variance() should return the variance of the cumulative or instantaneous mean. """
+    _mean_var = calculate_nhpp_mean_variance(46, 3000.0, 0.332, 0.616,
+                                             metric)
+    _lst_mean_var = calculate_nhpp_mean_variance(
+        np.array([46, 22]), np.array([3000.0, 620.0]),
+        np.array([0.332, 0.4239]), np.array([0.616, 0.6142]), metric)
+
+    assert isinstance(_mean_var, float)
+    assert _mean_var == pytest.approx(variance)
+    assert _lst_mean_var[0] == pytest.approx(_mean_var)
+    assert _lst_mean_var[1] == pytest.approx(
+        calculate_nhpp_mean_variance(22, 620.0, 0.4239, 0.6142, metric))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("alpha", [0.9, 90.0])
+def test_calculate_fisher_bounds(alpha):
+    """ calculate_fisher_bounds() should return the lower and upper Fisher bounds. """
+    _lower, _upper = calculate_fisher_bounds(0.03548, 0.00005721408, alpha)
+
+    assert isinstance(_lower, float)
+    assert _lower == pytest.approx(0.02699778)
+    assert _upper == pytest.approx(0.04662719)
+
+
+@pytest.mark.unit
+def test_calculate_fisher_bounds_array():
+    """ calculate_fisher_bounds() should return arrays of bounds when passed arrays. """
+    _lower, _upper = calculate_fisher_bounds(
+        np.array([0.03548, 0.0, 0.03548]),
+        np.array([0.00005721408, 0.1, 0.0]), 0.9)
+
+    assert _lower.tolist() == pytest.approx([0.02699778, 0.0, 0.03548])
+    assert _upper.tolist() == pytest.approx([0.04662719, 0.0, 0.03548])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("metric, data, bounds", [
+    (1, 1, (0.4356064, 0.8844610)),
+    (1, 2, (0.4527305, 0.9349943)),
+    (2, 1, (0.2870230, 0.6279656)),
+    (2, 2, (0.2870230, 0.5827754)),
+    (3, 1, (0.02402216, 0.05255707)),
+    (3, 2, (0.02402216, 0.04877491)),
+])
+def test_calculate_crow_bounds(metric, data, bounds):
+    """ calculate_crow_bounds() should return the lower and upper Crow bounds for scalars and arrays. """
+    _lower, _upper = calculate_crow_bounds(22, 620.0, 0.4239, 0.6142, 0.9,
+                                           metric, data)
+    _lst_lower, _lst_upper = calculate_crow_bounds(
+        np.array([22, 22, 46]), np.array([620.0, 620.0, 3000.0]), 0.4239,
+        np.array([0.6142, 0.6142, 0.616]), 90.0, metric, data)
+
+    assert (_lower, _upper) == pytest.approx(bounds, abs=1E-6)
+    assert _lst_lower[:2].tolist() == pytest.approx([_lower, _lower])
+    assert _lst_upper[:2].tolist() == pytest.approx([_upper, _upper])
+    assert (_lst_lower[2], _lst_upper[2]) == pytest.approx(
+        calculate_crow_bounds(46, 3000.0, 0.4239, 0.616, 0.9, metric, data))
+
+
+@pytest.mark.unit
+def test_calculate_crow_bounds_unknown_metric():
+    """ calculate_crow_bounds() should return bounds of one for an unknown metric. """
+    assert calculate_crow_bounds(22, 620.0, 0.4239, 0.6142, 0.9, 4) == (1.0,
+                                                                        1.0)
+    assert calculate_crow_bounds(
+        np.array([22, 46]), 620.0, 0.4239, 0.6142, 0.9,
+        4)[0].tolist() == [1.0, 1.0]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("alpha", [0.95, 95.0])
+def test_calculate_beta_bounds(alpha):
+    """ calculate_beta_bounds() should return the lower bound, mean, upper bound, and standard error. """
+    _meanll, _mean, _meanul, _sd = calculate_beta_bounds(10.0, 20.0, 40.0,
+                                                         alpha)
+
+    assert isinstance(_mean, float)
+    assert _mean == pytest.approx(21.6666667)
+    assert _sd == pytest.approx(5.0)
+    assert _meanll == pytest.approx(21.6666667 - 1.959964 * 5.0)
+    assert _meanul == pytest.approx(21.6666667 + 1.959964 * 5.0)
+
+
+@pytest.mark.unit
+def test_calculate_beta_bounds_array():
+    """ calculate_beta_bounds() should return arrays when passed arrays. """
+    _meanll, _mean, _meanul, _sd = calculate_beta_bounds(
+        [10.0, 0.0], [20.0, 0.0], [40.0, 0.0], np.array([0.95, 0.9]))
+
+    assert _mean.tolist() == pytest.approx([21.6666667, 0.0])
+    assert _sd.tolist() == pytest.approx([5.0, 0.0])
+    assert _meanll[0] == pytest.approx(
+        calculate_beta_bounds(10.0, 20.0, 40.0, 0.95)[0])
+    assert _meanul.tolist()[1] == 0.0
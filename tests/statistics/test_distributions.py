@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+#
+#       tests.statistics.test_distributions.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing the distribution fitting algorithms."""
+
+import numpy as np
+import pytest
+from scipy.stats import weibull_min
+
+from ramstk.statistics.Distributions import (
+    EXPONENTIAL, GAUSSIAN, LOGNORMAL, WEIBULL, do_group_data, get_counts,
+    maximum_likelihood_estimate)
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
+
+# Leukemia remission times.  Data is from Example 7.2 of Lee and Wang.
+LEUKEMIA = np.array([
+    1.0, 1.0, 2.0, 2.0, 3.0, 4.0, 4.0, 5.0, 5.0, 6.0, 8.0, 8.0, 9.0, 10.0,
+    10.0, 12.0, 14.0, 16.0, 20.0, 24.0, 34.0
+])
+
+# Danish AIDS patients as (left, right, quantity, status).  Data is from
+# Lindsey and Ryan.
+AIDS = np.array([[0.0, 24.0, 24, 4], [24.0, 39.0, 1, 4], [24.0, 113.0, 4, 4],
+                 [28.0, 88.0, 1, 4], [39.0, 113.0, 2, 4], [57.0, 113.0, 1, 4],
+                 [0.0, 39.0, 2, 4], [24.0, 57.0, 10, 4], [24.0, 28.0, 4, 4],
+                 [24.0, 88.0, 3, 4], [28.0, 39.0, 4, 4], [39.0, 57.0, 3, 4],
+                 [57.0, 88.0, 5, 4], [88.0, 113.0, 1, 4],
+                 [0.0, 88.0, 34, 2], [0.0, 24.0, 61, 2], [0.0, 28.0, 8, 2],
+                 [0.0, 39.0, 15, 2], [0.0, 57.0, 22, 2],
+                 [0.0, 113.0, 92, 2]])
+
+
+def _get_exact(times):
+    """Build the (left, right, status, quantity) of exact failure times."""
+    return times, times, np.ones(len(times)), np.ones(len(times))
+
+
+@pytest.mark.unit
+def test_do_group_data():
+    """ do_group_data() should combine identical records and sum their quantities. """
+    _left, _right, _status, _quantity = do_group_data(
+        [0.0, 0.0, 0.0, 1.0], [5.0, 5.0, 5.0, 5.0], [1, 1, 2, 1], [2, 0, 3, 1])
+
+    assert _left.tolist() == [0.0, 0.0, 1.0]
+    assert _right.tolist() == [5.0, 5.0, 5.0]
+    assert _status.tolist() == [1.0, 2.0, 1.0]
+    assert _quantity.tolist() == [3.0, 3.0, 1.0]
+
+
+@pytest.mark.unit
+def test_get_counts():
+    """ get_counts() should return the number of failures and suspensions. """
+    assert get_counts(AIDS[:, 3], AIDS[:, 2]) == (65.0, 232.0)
+
+
+@pytest.mark.unit
+def test_mle_exponential_exact():
+    """ maximum_likelihood_estimate() should return the closed form exponential estimates for exact times. """
+    _parameters, _var_covar, _fit = maximum_likelihood_estimate(
+        EXPONENTIAL, *_get_exact(LEUKEMIA))
+
+    _rate = 21.0 / LEUKEMIA.sum()
+    assert _parameters[0] == pytest.approx(_rate)
+    assert _var_covar[0][0] == pytest.approx(_rate**2.0 / 21.0)
+    assert _fit[0] == pytest.approx(21.0 * np.log(_rate) - 21.0)
+    assert _fit[1] == pytest.approx(-2.0 * _fit[0] + 2.0)
+    assert _fit[2] == pytest.approx(-2.0 * _fit[0] + np.log(21.0))
+
+
+@pytest.mark.unit
+def test_mle_exponential_right_censored():
+    """ maximum_likelihood_estimate() should count only the failures for right censored exponential data. """
+    _parameters, __, __ = maximum_likelihood_estimate(
+        EXPONENTIAL, np.zeros(6), np.array([4.0, 5.0, 8.0, 9.0, 10.0, 10.0]),
+        np.array([1, 1, 1, 1, 1, 2]), np.array([1, 1, 1, 1, 1, 5]))
+
+    assert _parameters[0] == pytest.approx(5.0 / 86.0)
+
+
+@pytest.mark.unit
+def test_mle_weibull_exact():
+    """ maximum_likelihood_estimate() should return the same Weibull estimates as scipy. """
+    _times = 1000.0 * np.random.RandomState(1).weibull(1.7, 500)
+
+    _parameters, _var_covar, _fit = maximum_likelihood_estimate(
+        WEIBULL, *_get_exact(_times))
+    _shape, __, _scale = weibull_min.fit(_times, floc=0.0)
+
+    assert _parameters[0] == pytest.approx(_scale, rel=1.0E-5)
+    assert _parameters[1] == pytest.approx(_shape, rel=1.0E-5)
+    assert _fit[0] == pytest.approx(
+        weibull_min.logpdf(_times, _shape, scale=_scale).sum())
+    assert _var_covar[0][0] > 0.0
+    assert _var_covar[1][1] > 0.0
+
+
+@pytest.mark.unit
+def test_mle_weibull_quantity():
+    """ maximum_likelihood_estimate() should give the same estimates for grouped and expanded records. """
+    _times = np.array([10.0, 20.0, 20.0, 20.0, 35.0, 50.0, 50.0, 80.0])
+    _status = np.array([1, 1, 1, 1, 1, 2, 2, 1])
+
+    _expanded = maximum_likelihood_estimate(WEIBULL, _times, _times, _status,
+                                            np.ones(8))
+    _grouped = maximum_likelihood_estimate(
+        WEIBULL, np.array([10.0, 20.0, 35.0, 50.0, 80.0]),
+        np.array([10.0, 20.0, 35.0, 50.0, 80.0]), np.array([1, 1, 1, 2, 1]),
+        np.array([1, 3, 1, 2, 1]))
+
+    for _idx in range(3):
+        np.testing.assert_allclose(_grouped[_idx], _expanded[_idx])
+
+
+@pytest.mark.unit
+def test_mle_interval_censored():
+    """ maximum_likelihood_estimate() should fit interval and right censored records. """
+    _parameters, _var_covar, _fit = maximum_likelihood_estimate(
+        EXPONENTIAL, AIDS[:, 0], AIDS[:, 1], AIDS[:, 3], AIDS[:, 2])
+
+    assert _parameters[0] == pytest.approx(0.0034, abs=5.0E-4)
+    assert _var_covar[0][0] > 0.0
+    assert _fit[0] < 0.0
+
+
+@pytest.mark.unit
+def test_mle_lognormal_gaussian_exact():
+    """ maximum_likelihood_estimate() should return the closed form normal estimates for exact times. """
+    _lognormal, __, __ = maximum_likelihood_estimate(LOGNORMAL,
+                                                     *_get_exact(LEUKEMIA))
+    _gaussian, _var_covar, __ = maximum_likelihood_estimate(
+        GAUSSIAN, *_get_exact(LEUKEMIA))
+
+    assert _lognormal[0] == pytest.approx(np.log(LEUKEMIA).mean(), rel=1.0E-6)
+    assert _lognormal[1] == pytest.approx(np.log(LEUKEMIA).std(), rel=1.0E-6)
+    assert _gaussian[0] == pytest.approx(LEUKEMIA.mean(), rel=1.0E-6)
+    assert _gaussian[1] == pytest.approx(LEUKEMIA.std(), rel=1.0E-6)
+    assert _var_covar[0][0] == pytest.approx(
+        LEUKEMIA.var() / 21.0, rel=1.0E-4)
+
+
+@pytest.mark.unit
+def test_mle_no_failures():
+    """ maximum_likelihood_estimate() should raise a ValueError when there are no failures. """
+    with pytest.raises(ValueError):
+        maximum_likelihood_estimate(WEIBULL, np.zeros(2),
+                                    np.array([10.0, 20.0]), np.array([2, 2]),
+                                    np.ones(2))
+
+
+@pytest.mark.unit
+def test_mle_unknown_distribution():
+    """ maximum_likelihood_estimate() should raise a KeyError for a non-parametric distribution ID. """
+    with pytest.raises(KeyError):
+        maximum_likelihood_estimate(2, *_get_exact(LEUKEMIA))
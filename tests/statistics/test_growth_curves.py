@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+#
+#       tests.statistics.test_growth_curves.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing the reliability growth algorithms."""
+
+import numpy as np
+import pytest
+from scipy.optimize import minimize_scalar
+
+from ramstk.statistics.Growth import (
+    calculate_crow_amsaa_grouped, calculate_crow_amsaa_mean,
+    calculate_crow_amsaa_parameters, calculate_duane_parameters,
+    calculate_growth_rate, calculate_planned_growth, calculate_total_time)
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
+
+# Failure times.  See http://reliawiki.org/index.php/Duane_Model.
+FAILURE_TIMES = np.array([
+    9.2, 25.0, 61.5, 260.0, 300.0, 710.0, 916.0, 1010.0, 1220.0, 2530.0,
+    3350.0, 4200.0, 4410.0, 4990.0, 5570.0, 8310.0, 8530.0, 9200.0, 10500.0,
+    12100.0, 13400.0, 14600.0, 22000.0
+])
+
+# The phase test times of a five phase program.
+PHASE_TIMES = np.array([1000.0, 1500.0, 2500.0, 2000.0, 3000.0])
+
+
+@pytest.mark.unit
+def test_calculate_planned_growth():
+    """ calculate_planned_growth() should return the idealized failures and MTBF of each phase. """
+    _n_failures, _mtbf_i, _mtbf_f, _mtbf_a = calculate_planned_growth(
+        0.23, 50.0, 1000.0, PHASE_TIMES)
+
+    np.testing.assert_allclose(
+        _n_failures, [20.0, 20.4989536, 28.5626882, 20.4244387, 28.2826505])
+    np.testing.assert_allclose(
+        _mtbf_f, [64.9350649, 80.1688181, 94.0247917, 101.5902031,
+                  110.2755618])
+    np.testing.assert_allclose(_mtbf_i[1:], _mtbf_f[:-1])
+    assert _mtbf_i[0] == 50.0
+    np.testing.assert_allclose(_mtbf_a, PHASE_TIMES / _n_failures)
+
+
+@pytest.mark.unit
+def test_calculate_planned_growth_what_if():
+    """ calculate_planned_growth() should plan every phase at each of a column of growth rates. """
+    _growth_rates = np.array([[0.1], [0.23], [0.4]])
+
+    _n_failures, __, _mtbf_f, __ = calculate_planned_growth(
+        _growth_rates, 50.0, 1000.0, PHASE_TIMES)
+
+    assert _mtbf_f.shape == (3, 5)
+    np.testing.assert_allclose(
+        _mtbf_f[1],
+        calculate_planned_growth(0.23, 50.0, 1000.0, PHASE_TIMES)[2])
+    assert (np.diff(_n_failures.sum(axis=1)) < 0.0).all()
+
+
+@pytest.mark.unit
+def test_calculate_planned_growth_invalid():
+    """ calculate_planned_growth() should return zeros for a non-positive initial MTBF or a growth rate of one. """
+    for _result in calculate_planned_growth([0.23, 1.0], [0.0, 50.0], 1000.0,
+                                            PHASE_TIMES[:2]):
+        assert _result.tolist() == [0.0, 0.0]
+
+
+@pytest.mark.unit
+def test_calculate_growth_rate_total_time():
+    """ calculate_growth_rate() and calculate_total_time() should return the growth rate and test time between two MTBF. """
+    assert calculate_growth_rate(50.0, 110.0, 10000.0, 1000.0) == \
+        pytest.approx(0.2306829)
+    assert calculate_growth_rate(0.0, 110.0, 10000.0, 1000.0) == 0.0
+    assert calculate_total_time(0.23, 50.0, 110.0, 1000.0) == \
+        pytest.approx(9891.808, rel=1.0E-6)
+    assert calculate_total_time(0.0, 50.0, 110.0, 1000.0) == 0.0
+
+
+@pytest.mark.unit
+def test_calculate_duane_parameters():
+    """ calculate_duane_parameters() should return the least squares Duane parameters. """
+    _b, _alpha = calculate_duane_parameters(FAILURE_TIMES, np.ones(23))
+
+    assert _b == pytest.approx(1.9456630)
+    assert _alpha == pytest.approx(0.6132337)
+
+
+@pytest.mark.unit
+def test_calculate_crow_amsaa_parameters():
+    """ calculate_crow_amsaa_parameters() should return the closed form Crow-AMSAA estimates. """
+    _lambda, _beta = calculate_crow_amsaa_parameters(FAILURE_TIMES,
+                                                     np.ones(23))
+
+    assert _beta == pytest.approx(
+        23.0 / np.log(22000.0 / FAILURE_TIMES).sum())
+    assert _lambda == pytest.approx(23.0 / 22000.0**_beta)
+
+    _lambda, _beta = calculate_crow_amsaa_parameters(
+        np.vstack((FAILURE_TIMES, FAILURE_TIMES)), np.ones((2, 23)),
+        end_time=np.array([22000.0, 25000.0]))
+
+    assert _beta[1] < _beta[0]
+
+
+@pytest.mark.unit
+def test_calculate_crow_amsaa_grouped():
+    """ calculate_crow_amsaa_grouped() should maximize the grouped data likelihood of every test at once. """
+    _times = np.cumsum(PHASE_TIMES)
+    _n_failures = np.array([[8.0, 2.0, 5.0, 5.0, 3.0], [20.0, 12.0, 10.0,
+                                                        6.0, 6.0]])
+
+    _lambda, _beta = calculate_crow_amsaa_grouped(_times, _n_failures)
+
+    for _idx in range(2):
+
+        def _get_negative_log_likelihood(beta):
+            _expected = (_n_failures[_idx].sum() *
+                         np.diff(np.concatenate(([0.0], _times))**beta) /
+                         _times[-1]**beta)
+            return -(_n_failures[_idx] * np.log(_expected) - _expected).sum()
+
+        _minimum = minimize_scalar(
+            _get_negative_log_likelihood,
+            bounds=(0.01, 5.0),
+            method='bounded',
+            options={'xatol': 1.0E-10})
+        assert _beta[_idx] == pytest.approx(_minimum.x, rel=1.0E-6)
+        assert _lambda[_idx] == pytest.approx(
+            _n_failures[_idx].sum() / _times[-1]**_beta[_idx])
+
+
+@pytest.mark.unit
+def test_calculate_crow_amsaa_grouped_no_estimate():
+    """ calculate_crow_amsaa_grouped() should return nan when the failures are all in one interval. """
+    _lambda, _beta = calculate_crow_amsaa_grouped(
+        np.cumsum(PHASE_TIMES[:2]), np.array([4.0, 0.0]))
+
+    assert np.isnan(_beta)
+    assert np.isnan(_lambda)
+
+
+@pytest.mark.unit
+def test_calculate_crow_amsaa_mean():
+    """ calculate_crow_amsaa_mean() should return the cumulative and instantaneous MTBF. """
+    _cum_mean, _inst_mean = calculate_crow_amsaa_mean(22000.0, 0.4, 0.6)
+
+    assert _cum_mean == pytest.approx(22000.0**0.4 / 0.4)
+    assert _inst_mean == pytest.approx(_cum_mean / 0.6)
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+#
+#       tests.statistics.test_nonparametric.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing the non-parametric estimation algorithms."""
+
+import numpy as np
+import pytest
+
+from ramstk.statistics.NonParametric import (
+    do_merge_tables, do_tabulate_data, kaplan_meier, mean_cumulative_function)
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
+
+# Remission times as (time, status).  Data is from Example 4.2 of Lee and
+# Wang.
+REMISSION = np.array([[3.0, 1], [4.0, 2], [5.7, 2], [6.5, 1], [6.5, 1],
+                      [8.4, 2], [10.0, 1], [10.0, 2], [12.0, 1], [15.0, 1]])
+
+# Recurrent failures and the end of observation of three repairable units as
+# (time, status).
+RECURRENCES = np.array([[5.0, 1], [10.0, 2], [5.0, 1], [20.0, 2], [15.0, 1],
+                        [25.0, 1], [30.0, 2]])
+
+
+@pytest.mark.unit
+def test_do_tabulate_data():
+    """ do_tabulate_data() should count the quantity weighted failures and suspensions at each distinct time. """
+    _times, _n_failures, _n_suspensions = do_tabulate_data(
+        [8.0, 2.0, 5.0, 5.0, 5.0], [1, 1, 1, 2, 1], [1, 3, 2, 4, 0])
+
+    assert _times.tolist() == [2.0, 5.0, 8.0]
+    assert _n_failures.tolist() == [3.0, 3.0, 1.0]
+    assert _n_suspensions.tolist() == [0.0, 4.0, 0.0]
+
+
+@pytest.mark.unit
+def test_do_merge_tables():
+    """ do_merge_tables() should combine the counts at times shared by two ordered tables. """
+    _times, _n_failures, _n_suspensions = do_merge_tables([
+        do_tabulate_data(REMISSION[:8, 0], REMISSION[:8, 1], np.ones(8)),
+        do_tabulate_data(REMISSION[7:, 0], REMISSION[7:, 1], np.ones(3))
+    ])
+
+    assert _times.tolist() == [3.0, 4.0, 5.7, 6.5, 8.4, 10.0, 12.0, 15.0]
+    assert _n_failures.tolist() == [1.0, 0.0, 0.0, 2.0, 0.0, 1.0, 1.0, 1.0]
+    assert _n_suspensions.tolist() == [0.0, 1.0, 1.0, 0.0, 1.0, 2.0, 0.0, 0.0]
+    assert do_merge_tables([])[0].size == 0
+
+
+@pytest.mark.unit
+def test_kaplan_meier():
+    """ kaplan_meier() should return the product limit survival and Greenwood bounds. """
+    _curve = kaplan_meier(*do_tabulate_data(REMISSION[:, 0], REMISSION[:, 1],
+                                            np.ones(10)), confidence=90.0)
+
+    assert _curve[:, 1].tolist() == [10.0, 9.0, 8.0, 7.0, 5.0, 4.0, 2.0, 1.0]
+    np.testing.assert_allclose(_curve[:, 3], [
+        0.9, 0.9, 0.9, 0.64285714, 0.64285714, 0.48214286, 0.24107143, 0.0
+    ])
+    assert _curve[0, 2] == pytest.approx(0.9 - 1.64485363 * np.sqrt(0.009))
+    assert _curve[0, 4] == 1.0
+    assert _curve[-1, 2] == 0.0
+    assert _curve[-1, 4] == 0.0
+
+
+@pytest.mark.unit
+def test_kaplan_meier_quantity():
+    """ kaplan_meier() should give the same survival for grouped and expanded records. """
+    _expanded = kaplan_meier(*do_tabulate_data(REMISSION[:, 0], REMISSION[:, 1],
+                                               np.ones(10)))
+    _grouped = kaplan_meier(*do_tabulate_data(
+        np.delete(REMISSION[:, 0], 4), np.delete(REMISSION[:, 1], 4),
+        [1, 1, 1, 2, 1, 1, 1, 1, 1]))
+
+    np.testing.assert_allclose(_grouped, _expanded)
+
+
+@pytest.mark.unit
+def test_mean_cumulative_function():
+    """ mean_cumulative_function() should return the Nelson MCF and its bounds. """
+    _curve = mean_cumulative_function(*do_tabulate_data(
+        RECURRENCES[:, 0], RECURRENCES[:, 1], np.ones(7)))
+
+    assert _curve[:, 0].tolist() == [5.0, 10.0, 15.0, 20.0, 25.0, 30.0]
+    assert _curve[:, 1].tolist() == [3.0, 3.0, 2.0, 2.0, 1.0, 1.0]
+    np.testing.assert_allclose(
+        _curve[:, 3],
+        [2.0 / 3.0, 2.0 / 3.0, 7.0 / 6.0, 7.0 / 6.0, 13.0 / 6.0, 13.0 / 6.0])
+    assert _curve[0, 4] - _curve[0, 3] == pytest.approx(
+        1.15034938 * np.sqrt(2.0 / 9.0))
+    assert (_curve[:, 2] >= 0.0).all()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+#       tests.test_calculate.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing the headless batch calculation command."""
+
+import os
+import shutil
+
+import pytest
+
+from ramstk.Calculate import MODULES, STEPS, BatchCalculator, main
+from ramstk.dao import DAO, RAMSTKValidation
+
+from conftest import LOG_DIR, TEMPDIR, TEST_PROGRAM_DB_PATH
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
+
+TEST_CALC_DB_PATH = TEMPDIR + '/_ramstk_calc_db.ramstk'
+
+
+@pytest.fixture
+def calc_program(test_dao):
+    """Copy the RAMSTK Program test database to calculate."""
+    # The test database is in WAL mode so the log is copied with it.
+    for _suffix in ['', '-wal', '-shm']:
+        if os.path.exists(TEST_CALC_DB_PATH + _suffix):
+            os.remove(TEST_CALC_DB_PATH + _suffix)
+    for _suffix in ['', '-wal']:
+        if os.path.exists(TEST_PROGRAM_DB_PATH + _suffix):
+            shutil.copyfile(TEST_PROGRAM_DB_PATH + _suffix,
+                            TEST_CALC_DB_PATH + _suffix)
+
+    yield TEST_CALC_DB_PATH
+
+
+@pytest.mark.integration
+def test_do_calculate(calc_program, test_configuration):
+    """ do_calculate() should calculate and save each module and time each step. """
+    DUT = BatchCalculator(test_configuration, n_workers=1)
+    DUT.do_open('sqlite:///' + calc_program)
+
+    # The test database allocations have the default reliability goal of one
+    # and the causes the default RPN occurrence of zero so the allocation and
+    # FMEA are expected to report an error.
+    assert DUT.do_calculate()
+    assert sorted(DUT.dic_timing.keys()) == sorted(MODULES)
+    for _module in MODULES:
+        assert sorted(DUT.dic_timing[_module].keys()) == sorted(STEPS)
+        assert DUT.dic_errors[_module] == (_module in ['allocation', 'fmea'])
+    assert 'Total' in DUT.get_report()
+
+    DUT.do_close()
+
+    _dao = DAO()
+    _dao.db_connect('sqlite:///' + calc_program)
+    _validation = _dao.session.query(RAMSTKValidation).first()
+    assert _validation.cost_mean >= 0.0
+    _dao.db_close()
+
+
+@pytest.mark.integration
+def test_do_calculate_selected(calc_program, test_configuration):
+    """ do_calculate() should only calculate the selected modules. """
+    DUT = BatchCalculator(test_configuration)
+    DUT.do_open('sqlite:///' + calc_program)
+
+    assert not DUT.do_calculate(['validation', 'hazops'])
+    assert sorted(DUT.dic_timing.keys()) == ['hazops', 'validation']
+
+    DUT.do_close()
+
+
+@pytest.mark.integration
+def test_main(calc_program, capsys):
+    """ main() should calculate each database and print the timing report. """
+    assert main([calc_program, '-m', 'hardware,hazops', '--log-dir',
+                 LOG_DIR]) == 0
+
+    _out = capsys.readouterr()[0]
+    assert 'hardware' in _out
+    assert 'hazops' in _out
+    assert 'allocation' not in _out
+
+
+@pytest.mark.unit
+def test_main_unknown_module(calc_program):
+    """ main() should exit with an error when asked for an unknown module. """
+    with pytest.raises(SystemExit):
+        main([calc_program, '-m', 'bogus'])
+
+
+@pytest.mark.integration
+def test_main_missing_database(calc_program, capsys):
+    """ main() should report a database that doesn't exist as an error without creating it and go on to the next database. """
+    _missing = TEMPDIR + '/_ramstk_calc_missing.ramstk'
+    if os.path.exists(_missing):
+        os.remove(_missing)
+
+    assert main([_missing, calc_program, '-m', 'hazops', '--log-dir',
+                 LOG_DIR]) == 1
+
+    _out = capsys.readouterr()[0]
+    assert not os.path.exists(_missing)
+    assert 'Status: ERROR (the database does not exist.)' in _out
+    assert 'Program: ' + calc_program in _out
+    assert 'hazops' in _out
+
+
+@pytest.mark.integration
+def test_main_bad_database(calc_program, capsys):
+    """ main() should report a database that can't be calculated as an error and go on to the next database. """
+    _empty = TEMPDIR + '/_ramstk_calc_empty.ramstk'
+    open(_empty, 'w').close()
+
+    assert main([_empty, calc_program, '-m', 'hazops', '--log-dir',
+                 LOG_DIR]) == 1
+
+    _out = capsys.readouterr()[0]
+    assert _out.count('Status: ERROR') == 1
+    assert 'no such table' in _out
+    assert _out.split('Program: ' + calc_program)[1].count('ERROR') == 0
+
+    os.remove(_empty)
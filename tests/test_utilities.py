@@ -17,7 +17,7 @@ import pytest
 from ramstk.Utilities import (create_logger, split_string, none_to_string,
                            string_to_boolean, date_to_ordinal, ordinal_to_date,
                            dir_exists, file_exists, none_to_default,
-                           error_handler)
+                           error_handler, pack_node_id, OutOfRangeError)
 
 TEMPDIR = tempfile.gettempdir()
 
@@ -152,6 +152,28 @@ def test_none_to_default_not_none():
     assert none_to_default(40, 10) == 40
 
 
+@pytest.mark.unit
+@pytest.mark.utilities
+def test_pack_node_id():
+    """ pack_node_id() should return the IDs packed into their own fields of bits with the first ID in the lowest bits. """
+    assert pack_node_id([7]) == 7
+    assert pack_node_id([1, 12]) == 1 + (12 << 21)
+    assert pack_node_id([11, 2]) == 11 + (2 << 21)
+    assert pack_node_id([1, 2, 3], bits=4) == 1 + (2 << 4) + (3 << 8)
+
+
+@pytest.mark.unit
+@pytest.mark.utilities
+def test_pack_node_id_out_of_range():
+    """ pack_node_id() should raise an OutOfRangeError when an ID doesn't fit in its field of bits. """
+    assert pack_node_id([2**21 - 1]) == 2**21 - 1
+
+    with pytest.raises(OutOfRangeError):
+        pack_node_id([1, 2**21])
+    with pytest.raises(OutOfRangeError):
+        pack_node_id([-1])
+
+
 def test_error_handler_type_error():
     """ error_handler() should return a 10 error code when passed a TypeError string. """
     _error_code = error_handler(